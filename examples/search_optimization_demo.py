@@ -165,8 +165,9 @@ async def indexing_demo():
     # 内容搜索
     content_results = indexer.search_content("search engine", limit=5)
     print(f"\n内容搜索 'search engine': 找到 {len(content_results)} 个结果")
-    for commit_hash, score in content_results[:3]:
-        print(f"  {commit_hash[:8]}: {score:.3f}")
+    for blob_sha, score in content_results[:3]:
+        for commit_hash, file_path in indexer.blob_locations(blob_sha)[:1]:
+            print(f"  {commit_hash[:8]} {file_path}: {score:.3f}")
 
     # 消息搜索
     message_results = indexer.search_messages("fix bug", limit=5)
@@ -366,7 +366,13 @@ class GitHound:
         """
         return asyncio.run(self.search_advanced(query, branch, max_results, enable_progress))
 
-    def analyze_blame(self, file_path: str, commit: str | None = None) -> FileBlameResult:
+    def analyze_blame(
+        self,
+        file_path: str,
+        commit: str | None = None,
+        use_cache: bool = True,
+        incremental: bool = False,
+    ) -> FileBlameResult:
         """Analyze file blame information with line-by-line authorship tracking.
 
         Performs Git blame analysis on the specified file, providing detailed
@@ -379,6 +385,9 @@ class GitHound:
                 a valid file that exists in the repository at the specified commit.
             commit: Specific commit hash to blame. If None, uses HEAD (latest commit).
                 Can be any valid Git reference (commit hash, branch name, tag).
+            use_cache: Reuse and store results in the repository's blame cache.
+            incremental: On a cache miss, re-blame only the lines changed since
+                the nearest ancestor with cached blame.
 
         Returns:
             FileBlameResult containing comprehensive blame information including:
@@ -391,7 +400,9 @@ class GitHound:
             GitCommandError: If blame analysis fails.
         """
         try:
-            return get_file_blame(self.repo, file_path, commit)
+            return get_file_blame(
+                self.repo, file_path, commit, use_cache=use_cache, incremental=incremental
+            )
         except Exception as e:
             raise GitCommandError(f"Blame analysis failed: {str(e)}") from e
 
@@ -0,0 +1,197 @@
+"""Persistent cache of blame results.
+
+Blame for a path at a given commit never changes, so results are stored
+on disk keyed by (commit SHA, path) and shared by every process working on
+the repository. Commits that didn't touch a path share the blame of the
+last commit that did; they are stored as small aliases of that entry.
+Once the stored results exceed ``max_size_mb``, the least recently read
+ones are evicted.
+"""
+
+import contextlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from .search_engine.cache_codec import CodecError, decode_value, encode_value
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blames (
+    commit_sha TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (commit_sha, path)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS aliases (
+    commit_sha TEXT NOT NULL,
+    path TEXT NOT NULL,
+    target TEXT NOT NULL,
+    PRIMARY KEY (commit_sha, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS blames_accessed ON blames (accessed_at);
+"""
+
+
+class BlameCache:
+    """Blame results stored in a single SQLite file.
+
+    Values are plain data stored with ``cache_codec``. Database errors are
+    logged and treated as misses, so a broken cache only costs the time
+    of blaming again.
+    """
+
+    # Where a repository's blame cache lives, relative to its working directory
+    REPO_PATH = Path(".githound") / "blame.sqlite3"
+
+    def __init__(self, path: Path | str, max_size_mb: int = 128, timeout: float = 10.0) -> None:
+        self.path = Path(path)
+        self.max_size_mb = max_size_mb
+        self.timeout = timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_repo(cls, repo_path: Path | str, **kwargs: Any) -> "BlameCache":
+        """The blame cache stored in a repository's ``.githound`` directory."""
+        path = Path(repo_path) / cls.REPO_PATH
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Keep cache and index files out of the repository's status
+            (path.parent / ".gitignore").write_text("*\n")
+        return cls(path, **kwargs)
+
+    @property
+    def max_bytes(self) -> int:
+        """Size limit of stored results in bytes."""
+        return self.max_size_mb * 1024 * 1024
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction that takes the database lock up front."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def get(self, commit_sha: str, path: str) -> Any | None:
+        """Stored blame for a path at a commit, following aliases."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT commit_sha, value FROM blames WHERE path = ? AND commit_sha ="
+                    " COALESCE((SELECT target FROM aliases WHERE commit_sha = ? AND path = ?), ?)",
+                    (path, commit_sha, path, commit_sha),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE blames SET accessed_at = ? WHERE commit_sha = ? AND path = ?",
+                    (time.time(), row[0], path),
+                )
+            return decode_value(row[1])
+        except (sqlite3.Error, OSError, CodecError) as e:
+            logger.debug(f"Blame cache read failed: {e}")
+            return None
+
+    def set(self, commit_sha: str, path: str, value: Any, aliases: Sequence[str] = ()) -> None:
+        """Store blame for a path at a commit, and for commits that share it."""
+        try:
+            data = encode_value(value)
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO blames (commit_sha, path, value, size, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (commit_sha, path, data, len(data), time.time()),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO aliases (commit_sha, path, target) VALUES (?, ?, ?)",
+                    [(alias, path, commit_sha) for alias in aliases if alias != commit_sha],
+                )
+                self._evict(conn)
+        except (sqlite3.Error, OSError, CodecError) as e:
+            logger.debug(f"Blame cache write failed: {e}")
+
+    def add_alias(self, commit_sha: str, path: str, target: str) -> None:
+        """Record that a path has the same blame at ``commit_sha`` as at ``target``."""
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO aliases (commit_sha, path, target) VALUES (?, ?, ?)",
+                    (commit_sha, path, target),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Blame cache write failed: {e}")
+
+    def nearest(self, path: str, commit_shas: Sequence[str]) -> str | None:
+        """The first of ``commit_shas`` with blame stored for a path."""
+        if not commit_shas:
+            return None
+        try:
+            with self._lock:
+                placeholders = ", ".join("?" * len(commit_shas))
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT commit_sha FROM blames WHERE path = ?"
+                        f" AND commit_sha IN ({placeholders})",
+                        (path, *commit_shas),
+                    )
+                    .fetchall()
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Blame cache read failed: {e}")
+            return None
+        stored = {row[0] for row in rows}
+        return next((sha for sha in commit_shas if sha in stored), None)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently read results until under the size limit."""
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM blames").fetchone()[0])
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        conn.execute(
+            "DELETE FROM blames WHERE (commit_sha, path) IN (SELECT commit_sha, path FROM ("
+            " SELECT commit_sha, path,"
+            " SUM(size) OVER (ORDER BY accessed_at, commit_sha, path) - size AS before"
+            " FROM blames) WHERE before < ?)",
+            (excess,),
+        )
+        conn.execute(
+            "DELETE FROM aliases WHERE NOT EXISTS (SELECT 1 FROM blames"
+            " WHERE blames.commit_sha = aliases.target AND blames.path = aliases.path)"
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -17,7 +17,8 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
 from rich.table import Table
 
-from githound.git_handler import get_repository, process_commit, walk_history
+from githound.blame_cache import BlameCache
+from githound.git_handler import create_blob_matcher, get_repository, process_commit, walk_history
 from githound.models import (
     GitHoundConfig,
     LegacyGitHoundConfig,
@@ -26,8 +27,10 @@ from githound.models import (
     SearchResult,
 )
 from githound.schemas import OutputFormat
-from githound.search_engine import create_search_orchestrator
-from githound.utils import ProgressManager
+from githound.search_engine import SearchCache, SQLiteCache, create_search_orchestrator
+from githound.search_engine.cache_keys import refs_digest, resolve_tip, result_cache_key
+from githound.search_engine.positional_query import parse_positional_query
+from githound.utils import CancellationToken, ProgressManager
 from githound.utils.export import ExportManager
 
 try:
@@ -183,6 +186,32 @@ def _analysis_to_serializable(result: Any) -> dict[str, Any]:
     return sanitized
 
 
+def _repo_cache(repo_path: Path | str) -> SQLiteCache | None:
+    """The repository's on-disk cache, or None if it cannot be created."""
+    try:
+        return SQLiteCache.for_repo(repo_path)
+    except OSError as e:
+        logger.debug(f"On-disk cache unavailable: {e}")
+        return None
+
+
+def _analysis_cache_key(repo_path: Path, *options: Any) -> str | None:
+    """Key for analysis output, which depends on every ref and the checked-out branch.
+
+    Returns None if the repository's refs cannot be read.
+    """
+    try:
+        repo = Repo(repo_path)
+        try:
+            head = repo.active_branch.name
+        except TypeError:
+            head = "HEAD"  # Detached
+        parts = [repo.working_dir, f"{head}@{resolve_tip(repo)}", refs_digest(repo), *options]
+    except Exception:
+        return None
+    return ":".join(["cli-analyze", *(str(part) for part in parts)])
+
+
 def _blame_to_serializable(blame_result: Any) -> dict[str, Any]:
     if blame_result is None:
         return {}
@@ -418,17 +447,39 @@ async def enhanced_search(
     branch: str | None = None,
     enable_progress: bool = True,
     max_results: int | None = None,
+    use_cache: bool = True,
 ) -> list[SearchResult]:
-    """Perform enhanced search using the new search engine."""
+    """Perform enhanced search using the new search engine.
+
+    With ``use_cache``, results are kept in the repository's on-disk cache
+    (see ``SQLiteCache.for_repo``) under the query and the commit the
+    searched branch points to, so repeating a search reuses them until the
+    branch moves.
+    """
 
     # Create orchestrator using factory for consistent configuration
     orchestrator = create_search_orchestrator(enable_advanced=query.has_advanced_analysis())
 
+    disk_cache = _repo_cache(Path(repo.working_dir)) if use_cache else None
+    cache: SearchCache | None = None
+    cache_key = ""
+    if disk_cache is not None:
+        cache = SearchCache(backend=disk_cache)
+        # Searchers that cache their own results share the disk cache too
+        orchestrator.set_cache(cache)
+        cache_key = result_cache_key("cli-search", repo, query, branch, max_results)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            await disk_cache.close()
+            return list(cached)
+
     results: list[Any] = []
+    cancellation_token = CancellationToken()
 
     # Set up enhanced progress reporting
     if enable_progress:
         with ProgressManager(console=console, enable_cancellation=True) as progress_manager:
+            cancellation_token = progress_manager.cancellation_token
             # Add main search task
             progress_manager.add_task("search", "Initializing search...", 100)
 
@@ -443,6 +494,7 @@ async def enhanced_search(
                     branch=branch,
                     progress_callback=progress_callback,
                     max_results=max_results,
+                    cancellation_token=cancellation_token,
                 ):
                     results.append(result)
 
@@ -455,10 +507,20 @@ async def enhanced_search(
     else:
         # Perform search without progress
         async for result in orchestrator.search(
-            repo=repo, query=query, branch=branch, max_results=max_results
+            repo=repo,
+            query=query,
+            branch=branch,
+            max_results=max_results,
+            cancellation_token=cancellation_token,
         ):
             results.append(result)
 
+    if cache is not None and disk_cache is not None:
+        # Results of an interrupted search are incomplete
+        if not cancellation_token.is_cancelled:
+            await cache.set(results, cache_key)
+        await disk_cache.close()
+
     return results
 
 
@@ -483,9 +545,13 @@ def legacy_search_and_print(config: LegacyGitHoundConfig) -> None:
 
         repo = get_repository(config.repo_path)  # [attr-defined]
         all_results: list[SearchResult] = []
+        # Each unique blob is read and searched once across the whole history
+        blob_results: dict[str, list[SearchResult]] = {}
+        # The pattern is compiled once for the whole search
+        matcher = create_blob_matcher(new_config)
 
         for commit in walk_history(repo, new_config):
-            commit_results = process_commit(commit, new_config)
+            commit_results = process_commit(commit, new_config, blob_results, matcher)
             all_results.extend(commit_results)
 
         if config.output_format == "json":  # [attr-defined]
@@ -508,6 +574,7 @@ async def search_and_print(
     show_details: bool = False,
     include_metadata: bool = False,
     max_results: int | None = None,
+    use_cache: bool = True,
 ) -> None:
     """Enhanced search function with new capabilities."""
     try:
@@ -520,6 +587,7 @@ async def search_and_print(
             branch=branch,
             enable_progress=enable_progress,
             max_results=max_results,
+            use_cache=use_cache,
         )
 
         # Output results using ExportManager
@@ -629,6 +697,11 @@ def search(
     # Content search
     content: str
     | None = typer.Option(None, "--content", "-c", help="Search for content pattern (regex)."),
+    phrase: bool = typer.Option(
+        False,
+        "--phrase",
+        help='Treat --content as a phrase/proximity query ("a b", a NEAR/5 b) instead of a regex.',
+    ),
     # Commit-based search
     commit_hash: str
     | None = typer.Option(None, "--commit", help="Search for specific commit hash."),
@@ -677,6 +750,9 @@ def search(
     max_results: int
     | None = typer.Option(None, "--max-results", help="Maximum number of results to return."),
     no_progress: bool = typer.Option(False, "--no-progress", help="Disable progress indicators."),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Search from scratch without the on-disk result cache."
+    ),
     # Repository options
     branch: str
     | None = typer.Option(None, "--branch", "-b", help="Branch to search (defaults to current)."),
@@ -701,6 +777,11 @@ def search(
     # Search commits in date range
     githound search --repo-path . --date-from 2023-01-01 --date-to 2023-12-31
 
+    \b
+    # Search for an exact phrase, or terms within 5 words of each other
+    githound search --repo-path . --content '"connection pool"' --phrase
+    githound search --repo-path . --content "retry NEAR/5 timeout" --phrase
+
     \b
     # Search Python files for specific pattern
     githound search --repo-path . --content "import os" --ext py
@@ -725,6 +806,16 @@ def search(
         console.print("Use --help to see available options.")
         raise typer.Exit(code=1)
 
+    if phrase:
+        if not content:
+            console.print("[red]Error: --phrase requires --content.[/red]")
+            raise typer.Exit(code=1)
+        try:
+            parse_positional_query(content)
+        except ValueError as e:
+            console.print(f"[red]Error: Invalid phrase query: {e}[/red]")
+            raise typer.Exit(code=1) from e
+
     # Parse dates
     parsed_date_from = None
     parsed_date_to = None
@@ -748,6 +839,7 @@ def search(
     # Create search query
     query = SearchQuery(
         content_pattern=content,
+        positional_query=phrase,
         commit_hash=commit_hash,
         author_pattern=author,
         message_pattern=message,
@@ -806,6 +898,7 @@ def search(
             show_details=show_details,
             include_metadata=include_metadata,
             max_results=max_results,
+            use_cache=not no_cache,
         )
     )
 
@@ -851,6 +944,9 @@ def analyze(
     include_author_stats: bool = typer.Option(
         True, "--author-stats/--no-author-stats", help="Include author statistics"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Analyze from scratch without the on-disk cache"
+    ),
 ) -> None:
     """Analyze repository metadata and statistics.
 
@@ -883,43 +979,63 @@ def analyze(
 
         console.print(f"[bold blue]🔍 Analyzing repository:[/bold blue] {repo_path}")
 
-        # Initialize GitHound
-        with console.status("[bold green]Initializing GitHound..."):
-            gh = GitHound(repo_path)
-        console.print("[green]✓[/green] GitHound initialized successfully")
+        # Reuse the output of an earlier run while no ref has moved
+        cache_key = (
+            None
+            if no_cache
+            else _analysis_cache_key(repo_path, include_detailed_stats, include_author_stats)
+        )
+        cache = _repo_cache(repo_path) if cache_key else None
+        analysis_output = asyncio.run(cache.get(cache_key)) if cache and cache_key else None
+        if analysis_output is not None:
+            console.print("[green]✓[/green] Using cached analysis")
+        else:
+            # Initialize GitHound
+            with console.status("[bold green]Initializing GitHound..."):
+                gh = GitHound(repo_path)
+            console.print("[green]✓[/green] GitHound initialized successfully")
 
-        author_stats_data: Any = None
+            author_stats_data: Any = None
 
-        # Perform analysis with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            # Main analysis
-            task1 = progress.add_task("Analyzing repository metadata...", total=None)
-            analysis_result = gh.analyze_repository(include_detailed_stats=include_detailed_stats)
-            progress.update(task1, completed=True, description="✓ Repository metadata analyzed")
-
-            # Author statistics (if requested)
-            if include_author_stats:
-                task2 = progress.add_task("Gathering author statistics...", total=None)
-                try:
-                    author_stats = gh.get_author_statistics()
-                    author_stats_data = _sanitize_data(dict(author_stats))
-                    progress.update(
-                        task2, completed=True, description="✓ Author statistics gathered"
-                    )
-                except Exception as e:
-                    progress.update(task2, completed=True, description="⚠ Author statistics failed")
-                    console.print(
-                        f"[yellow]⚠ Warning: Could not get author statistics: {e}[/yellow]"
-                    )
+            # Perform analysis with progress tracking
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                # Main analysis
+                task1 = progress.add_task("Analyzing repository metadata...", total=None)
+                analysis_result = gh.analyze_repository(
+                    include_detailed_stats=include_detailed_stats
+                )
+                progress.update(task1, completed=True, description="✓ Repository metadata analyzed")
+
+                # Author statistics (if requested)
+                if include_author_stats:
+                    task2 = progress.add_task("Gathering author statistics...", total=None)
+                    try:
+                        author_stats = gh.get_author_statistics()
+                        author_stats_data = _sanitize_data(dict(author_stats))
+                        progress.update(
+                            task2, completed=True, description="✓ Author statistics gathered"
+                        )
+                    except Exception as e:
+                        progress.update(
+                            task2, completed=True, description="⚠ Author statistics failed"
+                        )
+                        console.print(
+                            f"[yellow]⚠ Warning: Could not get author statistics: {e}[/yellow]"
+                        )
+
+            analysis_output = _analysis_to_serializable(analysis_result)
+            if author_stats_data:
+                analysis_output["author_statistics"] = author_stats_data
 
-        analysis_output = _analysis_to_serializable(analysis_result)
-        if author_stats_data:
-            analysis_output["author_statistics"] = author_stats_data
+            if cache and cache_key:
+                asyncio.run(cache.set(cache_key, analysis_output))
+        if cache:
+            asyncio.run(cache.close())
 
         # Output results
         if output_file:
@@ -1032,6 +1148,14 @@ def blame(
     show_line_numbers: bool = typer.Option(
         True, "--line-numbers/--no-line-numbers", help="Show line numbers"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Blame from scratch without the on-disk blame cache"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Re-blame only lines changed since the nearest ancestor with cached blame",
+    ),
 ) -> None:
     """Analyze file blame information.
 
@@ -1079,7 +1203,9 @@ def blame(
             transient=True,
         ) as progress:
             task = progress.add_task("Analyzing file blame...", total=None)
-            blame_result = gh.analyze_blame(file_path, commit)
+            blame_result = gh.analyze_blame(
+                file_path, commit, use_cache=not no_cache, incremental=incremental
+            )
             progress.update(task, completed=True, description="✓ File blame analysis complete")
 
         # Output results
@@ -1523,6 +1649,13 @@ def cleanup(
             if cache_dir.exists():
                 cleanup_targets.append(("Cache directory", cache_dir))
 
+        # On-disk result and blame caches and their write-ahead logs
+        for cache_file in (repo_path / SQLiteCache.REPO_PATH, repo_path / BlameCache.REPO_PATH):
+            for suffix in ("", "-wal", "-shm"):
+                path = cache_file.with_name(cache_file.name + suffix)
+                if path.exists():
+                    cleanup_targets.append(("Cache file", path))
+
         # Temporary files
         if not cache_only:
             temp_patterns = [
@@ -1,11 +1,28 @@
 """Git blame functionality for line-by-line authorship tracking."""
 
+import logging
+import re
+import threading
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from git import GitCommandError, Repo
 from pydantic import BaseModel, Field
 
+from .blame_cache import BlameCache
+
+logger = logging.getLogger(__name__)
+
+# Ancestors searched for a cached blame to update incrementally
+MAX_CACHED_ANCESTORS = 50
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+# Blame caches by repository root, shared by calls in this process
+_blame_caches: dict[str, BlameCache] = {}
+_blame_caches_lock = threading.Lock()
+
 
 class BlameInfo(BaseModel):
     """Information about a single line's authorship."""
@@ -30,14 +47,28 @@ class FileBlameResult(BaseModel):
     newest_line_date: datetime | None = Field(None, description="Date of the newest line")
 
 
-def get_file_blame(repo: Repo, file_path: str, commit: str | None = None) -> FileBlameResult:
+def get_file_blame(
+    repo: Repo,
+    file_path: str,
+    commit: str | None = None,
+    use_cache: bool = True,
+    incremental: bool = False,
+) -> FileBlameResult:
     """
     Get line-by-line authorship information for a file.
 
+    Results are kept in the repository's blame cache, keyed by commit and
+    path, so blaming the same file again costs a lookup.
+
     Args:
         repo: The Git repository object.
         file_path: Path to the file relative to repository root.
         commit: Specific commit to blame (defaults to HEAD).
+        use_cache: Read and store results in the repository's blame cache.
+        incremental: On a cache miss, update the blame cached for the nearest
+            ancestor that changed the file, blaming only the lines changed
+            since. Other lines keep the ancestor's attribution, so a line
+            removed and later restored unchanged keeps its older commit.
 
     Returns:
         FileBlameResult with complete blame information.
@@ -52,47 +83,180 @@ def get_file_blame(repo: Repo, file_path: str, commit: str | None = None) -> Fil
         else:
             commit_obj = repo.head.commit
 
-        # Get blame information
-        blame_data = repo.blame(commit_obj, file_path)
-
-        blame_info: list[BlameInfo] = []
-        contributors = set()
-        dates: list[Any] = []
-
-        line_number = 1
-        # GitPython blame data structure is complex, use type ignore for now
-        for commit_info, lines in blame_data:  # type: ignore[misc]
-            for line in lines:  # type: ignore[misc]
-                blame_entry = BlameInfo(
-                    line_number=line_number,
-                    content=str(line).rstrip("\n\r"),
-                    commit_hash=commit_info.hexsha,  # type: ignore
-                    author_name=commit_info.author.name,  # type: ignore
-                    author_email=commit_info.author.email,  # type: ignore
-                    commit_date=datetime.fromtimestamp(commit_info.committed_date),  # type: ignore
-                    commit_message=str(commit_info.message).strip(),  # type: ignore
-                )
-
-                blame_info.append(blame_entry)
-                contributors.add(
-                    f"{commit_info.author.name} <{commit_info.author.email}>"  # type: ignore
-                )
-                dates.append(blame_entry.commit_date)
-                line_number += 1
-
-        return FileBlameResult(
-            file_path=file_path,
-            total_lines=len(blame_info),
-            blame_info=blame_info,
-            contributors=list(contributors),
-            oldest_line_date=min(dates) if dates else None,
-            newest_line_date=max(dates) if dates else None,
-        )
+        cache = _blame_cache(repo) if use_cache else None
+        if cache is None:
+            data = _blame_data(repo, commit_obj.hexsha, file_path)
+        else:
+            data = _cached_blame_data(repo, cache, commit_obj.hexsha, file_path, incremental)
+        return _blame_result(file_path, data)
 
     except Exception as e:
         raise GitCommandError(f"Failed to get blame for '{file_path}': {str(e)}") from e
 
 
+def _blame_cache(repo: Repo) -> BlameCache | None:
+    """The repository's blame cache, shared within the process; None if unavailable."""
+    try:
+        root = str(Path(repo.working_tree_dir or repo.git_dir).resolve())
+        with _blame_caches_lock:
+            cache = _blame_caches.get(root)
+            if cache is None:
+                cache = _blame_caches[root] = BlameCache.for_repo(root)
+        return cache
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Blame cache unavailable: {e}")
+        return None
+
+
+def _blame_data(
+    repo: Repo, commit_sha: str, file_path: str, line_ranges: list[tuple[int, int]] | None = None
+) -> dict[str, Any]:
+    """Run git blame, optionally on ranges of lines, returning plain data to cache.
+
+    The data maps each blamed commit to its author name, email, commit time
+    and message, and lists each line as its commit and content.
+    """
+    kwargs: dict[str, Any] = {}
+    if line_ranges:
+        kwargs["L"] = [f"{start},{end}" for start, end in line_ranges]
+    blame_data = repo.blame(commit_sha, file_path, **kwargs) or []
+
+    commits: dict[str, list[Any]] = {}
+    lines: list[list[str]] = []
+    # GitPython blame data structure is complex, use type ignore for now
+    for commit_info, blamed_lines in blame_data:  # type: ignore[misc]
+        sha = commit_info.hexsha  # type: ignore
+        if sha not in commits:
+            commits[sha] = [
+                commit_info.author.name,  # type: ignore
+                commit_info.author.email,  # type: ignore
+                commit_info.committed_date,  # type: ignore
+                str(commit_info.message).strip(),  # type: ignore
+            ]
+        lines.extend([sha, str(line).rstrip("\n\r")] for line in blamed_lines)  # type: ignore
+    return {"commits": commits, "lines": lines}
+
+
+def _cached_blame_data(
+    repo: Repo, cache: BlameCache, commit_sha: str, file_path: str, incremental: bool
+) -> dict[str, Any]:
+    """Blame data from the cache, blaming and storing it on a miss."""
+    data = cache.get(commit_sha, file_path)
+    if isinstance(data, dict):
+        return data
+
+    # Commits that didn't change the file share the blame of the last one that did
+    last = repo.git.rev_list("-1", commit_sha, "--", file_path) or commit_sha
+    if last != commit_sha:
+        data = cache.get(last, file_path)
+        if isinstance(data, dict):
+            cache.add_alias(commit_sha, file_path, last)
+            return data
+
+    data = _incremental_blame_data(repo, cache, last, file_path) if incremental else None
+    if data is None:
+        data = _blame_data(repo, last, file_path)
+    cache.set(last, file_path, data, aliases=[commit_sha])
+    return data
+
+
+def _incremental_blame_data(
+    repo: Repo, cache: BlameCache, commit_sha: str, file_path: str
+) -> dict[str, Any] | None:
+    """Update the blame cached for the nearest ancestor that changed the file.
+
+    Lines outside the hunks changed since that ancestor keep their cached
+    attribution and only the changed lines are blamed again. Returns None
+    if no ancestor's blame is cached or the diff doesn't line up with it.
+    """
+    ancestors = [
+        ancestor.hexsha
+        for ancestor in repo.iter_commits(
+            commit_sha, paths=file_path, max_count=MAX_CACHED_ANCESTORS, skip=1
+        )
+    ]
+    base = cache.nearest(file_path, ancestors)
+    cached = cache.get(base, file_path) if base else None
+    if cached is None:
+        return None
+
+    diff = repo.git.diff(
+        base, commit_sha, "--", file_path, unified=0, text=True, no_color=True, no_ext_diff=True
+    )
+    old_lines: list[list[str]] = cached["lines"]
+    lines: list[list[str] | None] = []
+    changed: list[tuple[int, int]] = []
+    old_next = 1
+    for match in _HUNK_HEADER.finditer(diff):
+        old_start, old_count, new_start, new_count = (
+            1 if group is None else int(group) for group in match.groups()
+        )
+        if old_count == 0:
+            # Pure insertions come after line old_start
+            old_start += 1
+        lines.extend(old_lines[old_next - 1 : old_start - 1])
+        old_next = old_start + old_count
+        if new_count:
+            if new_start != len(lines) + 1:
+                return None
+            changed.append((new_start, new_start + new_count - 1))
+            lines.extend([None] * new_count)
+    if old_next - 1 > len(old_lines):
+        return None
+    lines.extend(old_lines[old_next - 1 :])
+
+    commits: dict[str, list[Any]] = dict(cached["commits"])
+    if changed:
+        fresh = _blame_data(repo, commit_sha, file_path, changed)
+        if len(fresh["lines"]) != lines.count(None):
+            return None
+        fresh_lines = iter(fresh["lines"])
+        lines = [next(fresh_lines) if line is None else line for line in lines]
+        commits.update(fresh["commits"])
+
+    used = {line[0] for line in lines if line is not None}
+    return {
+        "commits": {sha: info for sha, info in commits.items() if sha in used},
+        "lines": lines,
+    }
+
+
+def _blame_result(file_path: str, data: dict[str, Any]) -> FileBlameResult:
+    """Build the blame result for a file from blame data."""
+    commits = {
+        sha: (name, email, datetime.fromtimestamp(committed_date), message)
+        for sha, (name, email, committed_date, message) in data["commits"].items()
+    }
+
+    blame_info: list[BlameInfo] = []
+    contributors = set()
+    dates: list[Any] = []
+    for line_number, (sha, content) in enumerate(data["lines"], start=1):
+        author_name, author_email, commit_date, commit_message = commits[sha]
+        blame_info.append(
+            BlameInfo(
+                line_number=line_number,
+                content=content,
+                commit_hash=sha,
+                author_name=author_name,
+                author_email=author_email,
+                commit_date=commit_date,
+                commit_message=commit_message,
+            )
+        )
+        contributors.add(f"{author_name} <{author_email}>")
+        dates.append(commit_date)
+
+    return FileBlameResult(
+        file_path=file_path,
+        total_lines=len(blame_info),
+        blame_info=blame_info,
+        contributors=list(contributors),
+        oldest_line_date=min(dates) if dates else None,
+        newest_line_date=max(dates) if dates else None,
+    )
+
+
 def get_line_history(
     repo: Repo, file_path: str, line_number: int, max_commits: int | None = None
 ) -> list[dict[str, Any]]:
@@ -11,6 +11,7 @@ from git import Commit, GitCommandError, Repo
 
 # [attr-defined]
 from githound.models import CommitInfo, GitHoundConfig, SearchConfig, SearchResult
+from githound.search_engine.content_matcher import ContentMatcher, create_content_matcher
 from githound.searcher import search_blob_content
 
 
@@ -61,13 +62,65 @@ def walk_history(repo: Repo, config: GitHoundConfig) -> Generator[Commit, None,
         raise GitCommandError(f"Branch '{branch}' not found.") from e
 
 
-def process_commit(commit: Commit, config: GitHoundConfig) -> list[SearchResult]:
+def _blob_search_settings(config: GitHoundConfig) -> tuple[str, SearchConfig]:
+    """The content query and search settings blobs are searched with."""
+    # Convert search_query to string if it's a SearchQuery object
+    query_str = (
+        config.search_query  # [attr-defined]
+        if isinstance(config.search_query, str)  # [attr-defined]
+        # [attr-defined]
+        else config.search_query.content_pattern or ""
+    )
+    search_config = config.search_config or SearchConfig(  # [attr-defined]
+        include_globs=[],
+        exclude_globs=[],
+        case_sensitive=False,
+        max_results=None,
+        timeout_seconds=None,
+        enable_caching=True,
+        cache_ttl_seconds=3600,
+        enable_progress=True,
+        progress_callback=None,
+    )
+    return query_str, search_config
+
+
+def create_blob_matcher(config: GitHoundConfig) -> ContentMatcher:
+    """
+    Builds the content matcher for a search, to be shared by all its commits.
+
+    Args:
+        config: The search configuration.
+
+    Returns:
+        A matcher for the configured query and matching engine.
+
+    Raises:
+        re.error: If the pattern is invalid for the in-process engine.
+    """
+    query_str, search_config = _blob_search_settings(config)
+    return create_content_matcher(
+        query_str, search_config.case_sensitive, search_config.content_engine
+    )
+
+
+def process_commit(
+    commit: Commit,
+    config: GitHoundConfig,
+    blob_results: dict[str, list[SearchResult]] | None = None,
+    matcher: ContentMatcher | None = None,
+) -> list[SearchResult]:
     """
     Processes a single commit, searching for the query in its blobs.
 
     Args:
         commit: The commit to process.
         config: The search configuration.
+        blob_results: Optional memo of blob SHA -> search results shared across
+            the commits of one search. Blobs already in the memo are not re-read;
+            their results are re-attributed to this commit and path.
+        matcher: Optional matcher from ``create_blob_matcher()`` shared across
+            the commits of one search; built for this commit if not given.
 
     Returns:
         A list of search results found in the commit.
@@ -76,6 +129,13 @@ def process_commit(commit: Commit, config: GitHoundConfig) -> list[SearchResult]
     if not commit.parents:
         return results
 
+    query_str, search_config = _blob_search_settings(config)
+    if matcher is None:
+        matcher = create_blob_matcher(config)
+
+    # Merge commits show the same blob once per parent; search it once
+    seen_blobs: set[tuple[str, str]] = set()
+
     for parent in commit.parents:
         diffs = commit.diff(parent)
         for diff in diffs:
@@ -83,6 +143,10 @@ def process_commit(commit: Commit, config: GitHoundConfig) -> list[SearchResult]
                 continue
 
             file_path = diff.b_path
+            blob_sha = diff.b_blob.hexsha
+            if (file_path, blob_sha) in seen_blobs:
+                continue
+            seen_blobs.add((file_path, blob_sha))
             if (
                 config.search_config  # [attr-defined]
                 and config.search_config.include_globs  # [attr-defined]
@@ -105,38 +169,31 @@ def process_commit(commit: Commit, config: GitHoundConfig) -> list[SearchResult]
             ):
                 continue
 
-            try:
-                content = diff.b_blob.data_stream.read()
-                # Convert search_query to string if it's a SearchQuery object
-                query_str = (
-                    config.search_query  # [attr-defined]
-                    if isinstance(config.search_query, str)  # [attr-defined]
-                    # [attr-defined]
-                    else config.search_query.content_pattern or ""
-                )
-                search_config = config.search_config or SearchConfig(  # [attr-defined]
-                    include_globs=[],
-                    exclude_globs=[],
-                    case_sensitive=False,
-                    max_results=None,
-                    timeout_seconds=None,
-                    enable_caching=True,
-                    cache_ttl_seconds=3600,
-                    enable_progress=True,
-                    progress_callback=None,
-                )
-
+            if blob_results is not None and blob_sha in blob_results:
                 results.extend(
-                    search_blob_content(
-                        content,
-                        query_str,
-                        search_config,
-                        commit.hexsha,
-                        file_path,
+                    result.model_copy(
+                        update={"commit_hash": commit.hexsha, "file_path": Path(file_path)}
                     )
+                    for result in blob_results[blob_sha]
+                )
+                continue
+
+            try:
+                content = diff.b_blob.data_stream.read()
+                blob_matches = search_blob_content(
+                    content,
+                    query_str,
+                    search_config,
+                    commit.hexsha,
+                    file_path,
+                    matcher,
                 )
             except (UnicodeDecodeError, AttributeError):
                 continue
+
+            if blob_results is not None:
+                blob_results[blob_sha] = blob_matches
+            results.extend(blob_matches)
     return results
 
 
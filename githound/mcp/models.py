@@ -211,6 +211,10 @@ class AdvancedSearchInput(BaseModel):
 
     # Search criteria
     content_pattern: str | None = Field(None, description="Content pattern to search for")
+    positional_query: bool = Field(
+        False,
+        description='Treat content_pattern as a phrase/proximity query ("a b", a NEAR/k b)',
+    )
     commit_hash: str | None = Field(None, description="Specific commit hash")
     author_pattern: str | None = Field(None, description="Author name or email pattern")
     message_pattern: str | None = Field(None, description="Commit message pattern")
@@ -224,6 +228,9 @@ class AdvancedSearchInput(BaseModel):
     fuzzy_search: bool = Field(False, description="Enable fuzzy matching")
     fuzzy_threshold: float = Field(0.8, description="Fuzzy matching threshold (0.0-1.0)")
     max_results: int | None = Field(100, description="Maximum number of results")
+    timeout_seconds: int | None = Field(
+        None, ge=1, description="Stop searching and return partial results after this many seconds"
+    )
 
     # File filtering
     include_globs: list[str] | None = Field(None, description="Glob patterns to include")
@@ -422,7 +429,7 @@ class SearchEngineConfigInput(BaseModel):
     enable_fuzzy_search: bool = Field(True, description="Enable fuzzy search")
     enable_pattern_detection: bool = Field(True, description="Enable pattern detection")
     max_workers: int = Field(4, description="Maximum worker threads")
-    cache_backend: str = Field("memory", description="Cache backend (memory/redis)")
+    cache_backend: str = Field("memory", description="Cache backend (memory/redis/tiered/sqlite)")
     cache_ttl_seconds: int = Field(3600, description="Cache TTL in seconds")
 
 
@@ -127,6 +127,7 @@ async def advanced_search(
     max_file_size: int | None = None,
     min_commit_size: int | None = None,
     max_commit_size: int | None = None,
+    timeout_seconds: int | None = None,
     ctx: Context | None = None,
 ) -> Any:
     """Advanced multi-modal search across the repository."""
@@ -152,6 +153,7 @@ async def advanced_search(
         max_file_size=max_file_size,
         min_commit_size=min_commit_size,
         max_commit_size=max_commit_size,
+        timeout_seconds=timeout_seconds,
     )
     return await search_tools.advanced_search(input_data, ensure_context(ctx))
 
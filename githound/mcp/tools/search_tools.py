@@ -1,5 +1,6 @@
 """Search-related MCP tools for GitHound."""
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,7 @@ from ...search_engine import (
     create_search_orchestrator,
     get_global_registry,
 )
+from ...utils.progress import CancellationToken
 from ..models import (
     AdvancedSearchInput,
     BranchAnalysisInput,
@@ -51,6 +53,7 @@ async def advanced_search(input_data: AdvancedSearchInput, ctx: Context) -> dict
     file patterns, and more. Uses GitHound's powerful search engine with
     fuzzy matching and intelligent result ranking.
     """
+    cancellation_token = CancellationToken()
     try:
         await ctx.info(f"Starting advanced search in repository {input_data.repo_path}")
 
@@ -60,6 +63,7 @@ async def advanced_search(input_data: AdvancedSearchInput, ctx: Context) -> dict
         # Create SearchQuery from input
         query = SearchQuery(
             content_pattern=input_data.content_pattern,
+            positional_query=input_data.positional_query,
             commit_hash=input_data.commit_hash,
             author_pattern=input_data.author_pattern,
             message_pattern=input_data.message_pattern,
@@ -83,6 +87,7 @@ async def advanced_search(input_data: AdvancedSearchInput, ctx: Context) -> dict
             max_file_size=input_data.max_file_size,
             min_commit_size=input_data.min_commit_size,
             max_commit_size=input_data.max_commit_size,
+            timeout_seconds=input_data.timeout_seconds,
         )
 
         # Perform search with progress reporting
@@ -95,6 +100,7 @@ async def advanced_search(input_data: AdvancedSearchInput, ctx: Context) -> dict
             query=query,
             branch=input_data.branch,
             max_results=max_results,
+            cancellation_token=cancellation_token,
         ):
             results.append(
                 {
@@ -138,14 +144,22 @@ async def advanced_search(input_data: AdvancedSearchInput, ctx: Context) -> dict
 
         await ctx.info(f"Advanced search complete: {len(results)} results found")
 
-        return {
+        response = {
             "status": "success",
             "results": results,
             "total_count": len(results),
             "search_criteria": input_data.dict(),
             "search_timestamp": datetime.now().isoformat(),
         }
-
+        if cancellation_token.timed_out:
+            # Partial results: the search stopped at timeout_seconds
+            response["timed_out"] = True
+        return response
+
+    except asyncio.CancelledError:
+        # The client cancelled the request; stop searchers still walking history
+        cancellation_token.cancel("Search cancelled by client")
+        raise
     except GitCommandError as e:
         await ctx.error(f"Git error during advanced search: {str(e)}")
         return {"status": "error", "error": str(e)}
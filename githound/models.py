@@ -7,7 +7,14 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FieldSerializationInfo,
+    PrivateAttr,
+    field_serializer,
+)
 
 
 class SearchType(str, Enum):
@@ -51,6 +58,10 @@ class SearchQuery(BaseModel):
 
     # Content search
     content_pattern: str | None = Field(None, description="Regex pattern to search in file content")
+    positional_query: bool = Field(
+        False,
+        description='Treat content_pattern as a phrase/proximity query ("a b", a NEAR/k b)',
+    )
 
     # Commit-based search
     commit_hash: str | None = Field(None, description="Specific commit hash to search")
@@ -226,8 +237,21 @@ class SearchQuery(BaseModel):
         }
 
 
+# (files_changed, insertions, deletions) for a commit
+CommitStats = tuple[int, int, int]
+
+# CommitInfo fields that may be computed on first access (see CommitInfo.deferred)
+_DEFERRED_STATS_FIELDS = frozenset({"files_changed", "insertions", "deletions"})
+
+
 class CommitInfo(BaseModel):
-    """Detailed information about a Git commit."""
+    """Detailed information about a Git commit.
+
+    Computing diff statistics is the most expensive part of building a
+    CommitInfo, since ``commit.stats`` runs ``git diff --numstat``. Use
+    ``CommitInfo.deferred`` to postpone that work until ``files_changed``,
+    ``insertions`` or ``deletions`` is read, or the model is serialized.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -244,6 +268,61 @@ class CommitInfo(BaseModel):
     deletions: int = Field(0, description="Number of lines deleted")
     parents: list[str] = Field(default_factory=list, description="Parent commit hashes")
 
+    _stats_loader: Callable[[], CommitStats] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def deferred(cls, stats_loader: Callable[[], CommitStats], **fields: Any) -> "CommitInfo":
+        """Create a CommitInfo whose diff statistics are computed on demand.
+
+        Args:
+            stats_loader: Callable returning (files_changed, insertions, deletions).
+            **fields: The remaining CommitInfo fields.
+
+        Returns:
+            CommitInfo that calls ``stats_loader`` at most once, on first use.
+        """
+        info = cls(files_changed=0, **fields)
+        info._stats_loader = stats_loader
+        return info
+
+    @property
+    def stats_loaded(self) -> bool:
+        """Whether diff statistics have been computed."""
+        return self._stats_loader is None
+
+    def load_stats(self) -> None:
+        """Compute deferred diff statistics now, if still pending."""
+        loader = self._stats_loader
+        if loader is None:
+            return
+        self._stats_loader = None
+        files_changed, insertions, deletions = loader()
+        self.__dict__.update(
+            files_changed=files_changed, insertions=insertions, deletions=deletions
+        )
+
+    def __getattribute__(self, name: str) -> Any:
+        if name in _DEFERRED_STATS_FIELDS:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and private.get("_stats_loader") is not None:
+                object.__getattribute__(self, "load_stats")()
+        return super().__getattribute__(name)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # Loaders close over repositories and cannot be pickled
+        self.load_stats()
+        return super().__getstate__()
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "CommitInfo":
+        self.load_stats()
+        return super().__deepcopy__(memo)
+
+    @field_serializer("files_changed", "insertions", "deletions")
+    def _serialize_stats(self, value: int, info: FieldSerializationInfo) -> int:
+        """Serialize diff statistics, computing them first if deferred."""
+        resolved: int = getattr(self, info.field_name)
+        return resolved
+
 
 class SearchResult(BaseModel):
     """Enhanced search result with relevance scoring and metadata."""
@@ -293,6 +372,9 @@ class SearchConfig(BaseModel):
     include_globs: list[str] | None = Field(None, description="Glob patterns to include")
     exclude_globs: list[str] | None = Field(None, description="Glob patterns to exclude")
     case_sensitive: bool = Field(False, description="Whether search should be case sensitive")
+    content_engine: Literal["regex", "ripgrep"] = Field(
+        "regex", description="Content matching engine (in-process regex or ripgrep)"
+    )
 
     # Performance settings
     max_results: int | None = Field(None, description="Maximum number of results to return")
@@ -371,15 +453,49 @@ class SearchEngineConfig(BaseModel):
     # Performance settings
     max_workers: int = Field(4, description="Maximum number of parallel workers")
     enable_parallel_execution: bool = Field(True, description="Enable parallel searcher execution")
+    content_engine: Literal["regex", "ripgrep"] = Field(
+        "regex", description="Content matching engine (in-process regex or ripgrep)"
+    )
+    content_batch_size: int = Field(
+        256, ge=1, description="Blobs searched per ripgrep invocation when batching"
+    )
+    io_workers: int = Field(
+        0, ge=0, description="Worker threads for blocking git I/O and matching (0 = automatic)"
+    )
+    io_workers_per_search: int = Field(
+        1, ge=1, description="Maximum worker threads a single search may occupy at once"
+    )
+    content_processes: int = Field(
+        0,
+        ge=0,
+        description="Worker processes for content search by commit range (0 or 1 = in-process)",
+    )
     search_timeout_seconds: int = Field(300, description="Global search timeout in seconds")
     max_memory_mb: int = Field(1024, description="Maximum memory usage in MB")
 
     # Caching configuration
     enable_caching: bool = Field(True, description="Enable result caching")
-    cache_backend: Literal["memory", "redis"] = Field("memory", description="Cache backend type")
+    cache_backend: Literal["memory", "redis", "tiered", "sqlite"] = Field(
+        "memory", description="Cache backend type (tiered = memory in front of Redis)"
+    )
     cache_ttl_seconds: int = Field(3600, description="Default cache TTL in seconds")
     cache_max_size: int = Field(1000, description="Maximum cache entries (memory backend)")
+    cache_max_memory_mb: int | None = Field(
+        256, ge=1, description="Maximum memory held by cached results (memory backend)"
+    )
+    cache_admission: Literal["lru", "tinylfu"] = Field(
+        "lru", description="Which new entries may evict cached ones (memory backend)"
+    )
     redis_url: str = Field("redis://localhost:6379", description="Redis URL for caching")
+    cache_path: str | None = Field(None, description="Database file (sqlite backend)")
+    cache_max_disk_mb: int = Field(256, ge=1, description="Maximum size of the sqlite cache in MB")
+    cache_l1_ttl_seconds: int = Field(
+        60, ge=1, description="Maximum age of memory copies of Redis entries (tiered backend)"
+    )
+    cache_invalidation_channel: str | None = Field(
+        "githound:invalidate",
+        description="Redis channel keeping memory copies coherent (tiered backend)",
+    )
 
     # Result processing
     enable_ranking: bool = Field(True, description="Enable result ranking")
@@ -438,7 +554,13 @@ class SearchEngineConfig(BaseModel):
             "backend": self.cache_backend,
             "ttl_seconds": self.cache_ttl_seconds,
             "max_size": self.cache_max_size,
+            "max_memory_mb": self.cache_max_memory_mb,
+            "admission": self.cache_admission,
             "redis_url": self.redis_url,
+            "path": self.cache_path,
+            "max_disk_mb": self.cache_max_disk_mb,
+            "l1_ttl_seconds": self.cache_l1_ttl_seconds,
+            "invalidation_channel": self.cache_invalidation_channel,
         }
 
     def get_performance_config(self) -> dict[str, Any]:
@@ -446,6 +568,8 @@ class SearchEngineConfig(BaseModel):
         return {
             "max_workers": self.max_workers,
             "enable_parallel": self.enable_parallel_execution,
+            "content_engine": self.content_engine,
+            "content_batch_size": self.content_batch_size,
             "timeout_seconds": self.search_timeout_seconds,
             "max_memory_mb": self.max_memory_mb,
             "max_commits": self.max_commits_to_analyze,
@@ -1,10 +1,24 @@
 """Search engine package for GitHound."""
 
-from .base import BaseSearcher, CacheableSearcher, ParallelSearcher, SearchContext
+from .base import (
+    BaseSearcher,
+    CacheableSearcher,
+    CommitVisitor,
+    ParallelSearcher,
+    SearchContext,
+)
 from .branch_searcher import BranchSearcher
-from .cache import CacheBackend, MemoryCache, RedisCache, SearchCache
+from .cache import (
+    CacheBackend,
+    MemoryCache,
+    RedisCache,
+    SearchCache,
+    SQLiteCache,
+    TieredCache,
+)
 from .commit_searcher import AuthorSearcher, CommitHashSearcher, DateRangeSearcher, MessageSearcher
 from .diff_searcher import DiffSearcher
+from .executor import GitExecutor, SearchLane, get_git_executor
 
 # Enhanced components (optional imports for backward compatibility)
 try:
@@ -50,6 +64,7 @@ __all__ = [
     "SearchContext",
     "CacheableSearcher",
     "ParallelSearcher",
+    "CommitVisitor",
     # Core orchestration
     "SearchOrchestrator",
     # Basic searchers
@@ -75,7 +90,13 @@ __all__ = [
     "SearchCache",
     "MemoryCache",
     "RedisCache",
+    "SQLiteCache",
+    "TieredCache",
     "CacheBackend",
+    # Worker pool for blocking git I/O
+    "GitExecutor",
+    "SearchLane",
+    "get_git_executor",
     # Factory and configuration
     "SearchEngineFactory",
     "get_default_factory",
@@ -4,14 +4,17 @@ import asyncio
 import os
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Iterator
 
 # Forward declaration to avoid circular imports
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
 from ..models import SearchMetrics, SearchQuery, SearchResult
+from ..utils.progress import CancellationToken
+from .cache_keys import result_cache_key
+from .executor import SearchLane, run_blocking, take
 
 # Import SearchCache for runtime use in Pydantic models
 try:
@@ -19,6 +22,19 @@ try:
 except ImportError:
     SearchCache = None  # type: ignore[misc, assignment]
 
+# Commit loop iterations between yields to the event loop
+CHECKPOINT_INTERVAL = 100
+
+T = TypeVar("T")
+
+
+class _InterruptedSearch(Exception):
+    """Carries the partial results of a search cancelled while computing them."""
+
+    def __init__(self, results: list[SearchResult]) -> None:
+        super().__init__("search cancelled before it completed")
+        self.results = results
+
 
 class SearchContext(BaseModel):
     """Context information for search operations."""
@@ -32,11 +48,24 @@ class SearchContext(BaseModel):
     cache: dict[
         str, Any
     ] | Any | None = None  # Changed from "SearchCache" to Any to avoid forward ref issues
+    # Cooperative cancellation, checked by searchers inside their commit loops
+    cancellation_token: CancellationToken | None = None
+    # Share of the git worker pool for blocking calls; None runs them inline
+    executor: SearchLane | None = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether the search was cancelled or ran past its timeout."""
+        return self.cancellation_token is not None and self.cancellation_token.is_cancelled
 
 
 class BaseSearcher(ABC):
     """Abstract base class for all searchers."""
 
+    # Each result depends on its own commit alone, so results for newly added
+    # commits can be merged into those cached for their ancestors
+    per_commit_results = False
+
     def __init__(self, name: str) -> None:
         self.name = name
         self._metrics = SearchMetrics(
@@ -68,6 +97,61 @@ class BaseSearcher(ABC):
         """Estimate the amount of work this searcher will do (for progress reporting)."""
         return 1
 
+    def create_commit_visitor(self, context: SearchContext) -> "CommitVisitor | None":
+        """Create a visitor that lets this searcher join a shared history walk.
+
+        Searchers that return None are run on their own through ``search()``.
+        """
+        return None
+
+    async def _checkpoint(self, context: SearchContext, iteration: int) -> bool:
+        """Cooperative cancellation point for commit loops.
+
+        Yields to the event loop every ``CHECKPOINT_INTERVAL`` iterations so
+        cancellations and timeouts can be delivered while a searcher walks
+        history without producing results.
+
+        Returns:
+            True if the search was cancelled and the loop should stop.
+        """
+        if iteration % CHECKPOINT_INTERVAL == 0:
+            await asyncio.sleep(0)
+        return context.is_cancelled
+
+    async def _run_blocking(self, context: SearchContext, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking git I/O or matching on the search's worker lane.
+
+        Keeps the event loop free while GitPython or a ``git`` subprocess is
+        busy. Without an executor in the context the call runs inline.
+        """
+        return await run_blocking(context.executor, func, *args)
+
+    async def _iter_blocking(
+        self, context: SearchContext, items: Iterable[T], chunk_size: int = CHECKPOINT_INTERVAL
+    ) -> AsyncGenerator[T, None]:
+        """Iterate a blocking iterator, e.g. ``repo.iter_commits()``, off the event loop.
+
+        Items are pulled in chunks on the search's worker lane, so the pipe
+        reads behind the iterator never block the event loop.
+        """
+        iterator = iter(items)
+        exhausted = False
+        while not exhausted:
+            chunk, exhausted = await self._run_blocking(context, take, iterator, chunk_size)
+            for item in chunk:
+                yield item
+
+    async def _drive_visitor(
+        self, context: SearchContext, visitor: "CommitVisitor", commits: Iterable[Any]
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Feed commits to a visitor in chunks run on the search's worker lane."""
+        iterator = iter(commits)
+        exhausted = False
+        while not exhausted:
+            results, exhausted = await self._run_blocking(context, visitor.visit_chunk, iterator)
+            for result in results:
+                yield result
+
     def _report_progress(self, context: SearchContext, message: str, progress: float) -> None:
         """Report progress if callback is available."""
         if context.progress_callback:
@@ -90,19 +174,148 @@ class BaseSearcher(ABC):
         return (time.time() - start_time) * 1000
 
 
+class CommitVisitor(ABC):
+    """Per-search consumer of commits from a history walk.
+
+    A searcher that provides a visitor can take part in the orchestrator's
+    shared walk: history is traversed once and every commit is broadcast to
+    all participating visitors, instead of each searcher walking
+    ``repo.iter_commits()`` itself. Searchers also drive their own visitor
+    from ``search()`` so both paths share the matching logic.
+    """
+
+    # Whether match() needs full GitPython commits (diffs, blobs) rather than
+    # streamed commit metadata records
+    needs_full_commits: bool = False
+    # Report progress every N visited commits
+    progress_interval: int = 100
+    # Name used in the completion progress message
+    label: str = "Search"
+    # Commits visited per job on the git worker pool
+    chunk_size: int = CHECKPOINT_INTERVAL
+
+    def __init__(self, searcher: BaseSearcher, context: SearchContext) -> None:
+        self.searcher = searcher
+        self.context = context
+        self.start_time = time.time()
+        self.commits_searched = 0
+        self.results_found = 0
+        # Set once the visitor needs no further commits (e.g. result limit reached)
+        self.done = False
+        self.finished = False
+
+    def visit(self, commit: Any) -> list[SearchResult]:
+        """Process one commit and return any results it produced."""
+        self.commits_searched += 1
+        results = self.match(commit)
+        self.results_found += len(results)
+
+        if self.commits_searched % self.progress_interval == 0:
+            self.report_progress()
+        return results
+
+    def visit_chunk(self, commits: Iterator[Any]) -> tuple[list[SearchResult], bool]:
+        """Visit up to ``chunk_size`` commits from a blocking iterator.
+
+        Runs on a worker thread; cancellation is checked before every commit.
+
+        Returns:
+            The results and whether the walk is over (commits exhausted,
+            visitor done or search cancelled).
+        """
+        results: list[SearchResult] = []
+        for _ in range(self.chunk_size):
+            if self.done or self.context.is_cancelled:
+                return results, True
+            commit = next(commits, None)
+            if commit is None:
+                return results, True
+            results.extend(self.visit(commit))
+        return results, self.done
+
+    @abstractmethod
+    def match(self, commit: Any) -> list[SearchResult]:
+        """Match a single commit."""
+        pass
+
+    def flush(self) -> list[SearchResult]:
+        """Return results still buffered when the walk ends."""
+        return []
+
+    def finish(self) -> list[SearchResult]:
+        """End the walk: flush buffered results and record metrics.
+
+        Only the first call has an effect, so a walk that is abandoned part
+        way through can always finish its visitors.
+        """
+        if self.finished:
+            return []
+
+        results = self.flush()
+        self.results_found += len(results)
+        self.close()
+        return results
+
+    def close(self) -> None:
+        """End the walk without flushing, e.g. when it was abandoned.
+
+        Records metrics and reports completion; only the first call (or a
+        preceding ``finish()``) has an effect.
+        """
+        if self.finished:
+            return
+        self.finished = True
+        self.record_metrics()
+        self.searcher._report_progress(self.context, self.completion_message(), 1.0)
+
+    def record_metrics(self) -> None:
+        """Record the walk's totals in the searcher's metrics."""
+        self.searcher._update_metrics(
+            total_commits_searched=self.commits_searched, total_results_found=self.results_found
+        )
+
+    def completion_message(self) -> str:
+        """Progress message reported when the walk ends."""
+        return (
+            f"{self.label} completed: {self.results_found} matches "
+            f"in {self.commits_searched} commits"
+        )
+
+    def report_progress(self) -> None:
+        """Report periodic progress through the searcher."""
+        # Cap at 90% until done
+        progress = min(self.commits_searched / 1000, 0.9)
+        self.searcher._report_progress(
+            self.context,
+            f"Searched {self.commits_searched} commits, found {self.results_found} matches",
+            progress,
+        )
+
+
 class CacheableSearcher(BaseSearcher):
     """Base class for searchers that support caching."""
 
+    # Results depend on every branch and tag rather than only the searched ref
+    cache_all_refs = False
+
     def __init__(self, name: str, cache_prefix: str = "") -> None:
         super().__init__(name)
         self.cache_prefix = cache_prefix or name
 
     def _get_cache_key(self, context: SearchContext, suffix: str = "") -> str:
-        """Generate a cache key for the given context."""
-        repo_path = str(context.repo.working_dir)
-        query_hash = hash(str(context.query))
-        branch = context.branch or "HEAD"
-        return f"{self.cache_prefix}:{repo_path}:{branch}:{query_hash}:{suffix}"
+        """Generate a cache key for the given context.
+
+        The key is stable across processes and includes the commit the
+        searched ref points to, so entries stop matching once it moves.
+        """
+        return result_cache_key(
+            self.cache_prefix,
+            context.repo,
+            context.query,
+            context.branch,
+            suffix,
+            all_refs=self.cache_all_refs,
+        )
 
     async def _get_from_cache(self, context: SearchContext, key: str) -> Any | None:
         """Get value from cache if available."""
@@ -131,11 +344,61 @@ class CacheableSearcher(BaseSearcher):
             self._update_metrics(cache_misses=1)
             return None
 
+    async def _get_or_compute_cached(
+        self,
+        context: SearchContext,
+        key: str,
+        compute: Callable[[], Awaitable[list[SearchResult]]],
+        ttl: int = 3600,
+    ) -> tuple[list[SearchResult], bool]:
+        """Get results from cache, or compute and cache them.
+
+        With a ``SearchCache``, concurrent searches for the same key share
+        one computation instead of each running it. Results of a search
+        cancelled while computing them are returned but not cached.
+
+        Returns:
+            The results and whether they came from the cache
+        """
+        if SearchCache is None or not isinstance(context.cache, SearchCache):
+            # Plain dict caches
+            cached_results = await self._get_from_cache(context, key)
+            if cached_results is not None:
+                return cached_results, True
+            results = await compute()
+            await self._set_cache(context, key, results, ttl)
+            return results, False
+
+        computed = False
+
+        async def run() -> list[SearchResult]:
+            nonlocal computed
+            computed = True
+            results = await compute()
+            if context.is_cancelled:
+                # Raising keeps the partial results out of the cache
+                raise _InterruptedSearch(results)
+            return results
+
+        try:
+            results = await context.cache.get_or_compute(run, key, ttl=ttl)
+        except _InterruptedSearch as e:
+            if not computed:
+                # The computation this search waited on was cancelled
+                return await self._get_or_compute_cached(context, key, compute, ttl)
+            self._update_metrics(cache_misses=1)
+            return e.results, False
+        if computed:
+            self._update_metrics(cache_misses=1)
+        else:
+            self._update_metrics(cache_hits=1)
+        return results, not computed
+
     async def _set_cache(
         self, context: SearchContext, key: str, value: Any, ttl: int = 3600
     ) -> None:
-        """Set value in cache."""
-        if not context.cache:
+        """Set value in cache, unless the search was cancelled part-way."""
+        if not context.cache or context.is_cancelled:
             return
 
         try:
@@ -11,6 +11,9 @@ from .base import CacheableSearcher, SearchContext
 class BranchSearcher(CacheableSearcher):
     """Searcher for branch-specific operations and analysis."""
 
+    # Analyses span every branch and tag
+    cache_all_refs = True
+
     def __init__(self) -> None:
         super().__init__("branch", "branch")
 
@@ -38,15 +41,23 @@ class BranchSearcher(CacheableSearcher):
         """Perform branch analysis and search."""
         self._report_progress(context, "Starting branch analysis...", 0.0)
 
-        # Check cache first
+        # Concurrent searches for the same key share one analysis
         cache_key = self._get_cache_key(context, "branch_analysis")
-        cached_results = await self._get_from_cache(context, cache_key)
-        if cached_results:
+        results, cached = await self._get_or_compute_cached(
+            context, cache_key, lambda: self._run_branch_analysis(context)
+        )
+        if cached:
             self._report_progress(context, "Using cached branch results", 1.0)
-            for result in cached_results:
-                yield result
-            return
 
+        # Yield results
+        for result in results:
+            yield result
+
+        if not cached:
+            self._report_progress(context, "Branch analysis completed", 1.0)
+
+    async def _run_branch_analysis(self, context: SearchContext) -> list[SearchResult]:
+        """Run the full branch analysis."""
         # Perform branch analysis
         results: list[SearchResult] = []
 
@@ -65,14 +76,7 @@ class BranchSearcher(CacheableSearcher):
         activity_results = await self._analyze_branch_activity(context)
         results.extend(activity_results)
 
-        # Cache results
-        await self._set_cache(context, cache_key, results)
-
-        # Yield results
-        for result in results:
-            yield result
-
-        self._report_progress(context, "Branch analysis completed", 1.0)
+        return results
 
     async def _analyze_branches(self, context: SearchContext) -> list[SearchResult]:
         """Analyze branch structure and information."""
@@ -1,13 +1,25 @@
 """Enhanced caching system for GitHound search engine."""
 
+import asyncio
+import contextlib
+import dataclasses
 import hashlib
 import json
-import pickle
+import logging
+import sqlite3
 import sys
+import threading
 import time
-import zlib
+import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel
+
+from .cache_codec import CodecError, decode_value, encode_value
 
 if TYPE_CHECKING:
     import redis.asyncio as redis
@@ -22,10 +34,67 @@ except ImportError:
     HAS_REDIS = False
     redis = None  # type: ignore[assignment]
 
+logger = logging.getLogger(__name__)
+
+# Keys examined per SCAN call when listing or invalidating Redis keys
+SCAN_COUNT = 1000
+
+# Keys removed per UNLINK call
+DELETE_BATCH_SIZE = 500
+
+# Frequency sketch hashes are taken modulo 2**64
+_MASK_64 = (1 << 64) - 1
+
+
+class SingleFlight:
+    """Coalesces concurrent computations of the same key.
+
+    The first caller for a key runs the computation; callers arriving while
+    it runs await its outcome instead of starting their own. If the first
+    caller is cancelled, a waiting caller takes over the computation.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``compute`` for a key, or share the result of the run in progress."""
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # This caller was cancelled, not the computation
+
+        future = asyncio.get_running_loop().create_future()
+        # Outcomes nobody waited for are not reported as unretrieved
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._calls[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._calls[key]
+
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
 
+    def __init__(self) -> None:
+        # Concurrent get_or_compute() misses in flight, by key
+        self._flights = SingleFlight()
+
     @abstractmethod
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
@@ -56,51 +125,230 @@ class CacheBackend(ABC):
         """Get all keys matching pattern."""
         pass
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get the values of several keys; missing keys are left out."""
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> int:
+        """Set several values; returns how many were stored."""
+        stored = 0
+        for key, value in items.items():
+            if await self.set(key, value, ttl):
+                stored += 1
+        return stored
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete several keys; returns how many existed."""
+        deleted = 0
+        for key in keys:
+            if await self.delete(key):
+                deleted += 1
+        return deleted
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern; returns how many were deleted."""
+        return await self.delete_many(await self.keys(pattern))
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[Any]], ttl: int | None = None
+    ) -> Any:
+        """Get a value, computing and caching it on a miss.
+
+        Concurrent misses for the same key share a single computation.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def load() -> Any:
+            # A computation that just finished may have stored the value
+            value = await self.get(key)
+            if value is None:
+                value = await compute()
+                await self.set(key, value, ttl)
+            return value
+
+        return await self._flights.do(key, load)
+
+
+class FrequencySketch:
+    """Approximate access counts of keys for TinyLFU admission.
+
+    A count-min sketch of 4-bit counters: each key increments one counter
+    in each of four rows and its frequency is the smallest of them. After
+    ``10 * width`` increments every counter is halved, so old popularity
+    fades and recently popular keys can win admission.
+    """
+
+    _ROWS = 4
+    _MAX_COUNT = 15
+    _MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+
+    def __init__(self, capacity: int) -> None:
+        # Small caches still get enough counters to tell one-off keys from
+        # popular ones; a narrower sketch overestimates through collisions
+        width = 64
+        while width < capacity:
+            width *= 2
+        self._mask = width - 1
+        self._shift = 64 - (width.bit_length() - 1)
+        self._table = bytearray(width * self._ROWS)
+        self._sample_size = 10 * width
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & _MASK_64
+        width = self._mask + 1
+        # Multiplicative hashing with a different odd multiplier per row, so a
+        # collision in one row says nothing about the others
+        return [
+            row * width + (((h * multiplier) & _MASK_64) >> self._shift)
+            for row, multiplier in enumerate(self._MULTIPLIERS)
+        ]
+
+    def increment(self, key: str) -> None:
+        """Record one access to a key."""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < self._MAX_COUNT:
+                table[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(count >> 1 for count in table)
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        """Estimated recent accesses to a key."""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Estimate the memory held by a cached value, including what it contains.
+
+    Follows containers, dataclasses and pydantic model fields, counting each
+    object once. Other objects count as their shallow size, so references to
+    shared state (repositories, loaders) are not followed.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        try:
+            total += sys.getsizeof(item)
+        except TypeError:
+            total += 64
+
+        if isinstance(item, str | bytes | bytearray | int | float | bool) or item is None:
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset | deque):
+            stack.extend(item)
+        elif isinstance(item, BaseModel):
+            # Fields only; private attributes may reference shared state
+            stack.append(item.__dict__)
+            if item.__pydantic_extra__:
+                stack.append(item.__pydantic_extra__)
+        elif dataclasses.is_dataclass(item) and not isinstance(item, type):
+            stack.extend(getattr(item, field.name) for field in dataclasses.fields(item))
+    return total
+
 
 class MemoryCache(CacheBackend):
-    """In-memory cache backend with memory-aware eviction."""
+    """In-memory cache backend with memory-aware eviction.
+
+    Entries are kept in an ``OrderedDict`` in least-recently-used order, so
+    lookups, inserts and evictions are O(1). Entry sizes are measured deeply
+    (see ``deep_sizeof``) and ``max_memory_mb`` bounds their total.
+
+    With ``admission="tinylfu"``, a new entry only displaces the entries
+    that would be evicted for it if it has been requested more often
+    recently (as estimated by a ``FrequencySketch``); otherwise it is not
+    cached. That keeps one-off queries from flushing popular results.
+    """
 
     def __init__(
-        self, max_size: int = 1000, default_ttl: int = 3600, max_memory_mb: int | None = None
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        max_memory_mb: int | None = None,
+        admission: Literal["lru", "tinylfu"] = "lru",
     ) -> None:
+        if admission not in ("lru", "tinylfu"):
+            raise ValueError(f"Unknown admission policy: {admission}")
+        super().__init__()
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.max_memory_mb = max_memory_mb
-        self._cache: dict[str, dict[str, Any]] = {}
-        self._access_times: dict[str, float] = {}
-        self._size_estimates: dict[str, int] = {}  # Track approximate size of each entry
+        self.admission = admission
+        # Entries in least-recently-used order
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._size_estimates: dict[str, int] = {}  # Deep size of each entry
+        self._memory_bytes = 0
+        self._sketch = FrequencySketch(max_size) if admission == "tinylfu" else None
+        self.rejections = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory held by cached values."""
+        return self._memory_bytes
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
-        if key not in self._cache:
-            return None
+        if self._sketch is not None:
+            self._sketch.increment(key)
 
-        entry = self._cache[key]
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
         # Check if expired
         if entry.get("expires_at") and time.time() > entry["expires_at"]:
             await self.delete(key)
             return None
 
-        # Update access time
-        self._access_times[key] = time.time()
+        # Mark as most recently used
+        self._cache.move_to_end(key)
         return entry["value"]
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
-        """Set value in cache with optional TTL and memory-aware eviction."""
-        # Estimate size of the value
-        value_size = self._estimate_size(value)
+        """Set value in cache with optional TTL and memory-aware eviction.
 
-        # Check memory limit if configured
-        if self.max_memory_mb and key not in self._cache:
-            current_memory_mb = sum(self._size_estimates.values()) / (1024 * 1024)
-            if current_memory_mb + (value_size / (1024 * 1024)) > self.max_memory_mb:
-                # Evict until we have enough space
-                await self._evict_by_memory(value_size)
+        Returns:
+            False if the value was not admitted: it is larger than the memory
+            limit, or the admission policy kept the entries it would evict
+        """
+        if self._sketch is not None:
+            self._sketch.increment(key)
 
-        # Evict if at max size
-        if len(self._cache) >= self.max_size and key not in self._cache:
-            await self._evict_lru()
+        value_size = self._estimate_size(value)
+        max_bytes = self.max_memory_mb * 1024 * 1024 if self.max_memory_mb else None
+        if max_bytes is not None and value_size > max_bytes:
+            await self.delete(key)
+            self.rejections += 1
+            return False
+
+        # Replacing an entry frees its space, but a rejected update keeps it
+        victims = self._select_victims(key, value_size, max_bytes)
+        if victims and self._sketch is not None:
+            candidate = self._sketch.frequency(key)
+            if any(self._sketch.frequency(victim) >= candidate for victim in victims):
+                self.rejections += 1
+                return False
+        await self.delete(key)
+        for victim in victims:
+            await self.delete(victim)
 
         ttl = ttl or self.default_ttl
         expires_at = time.time() + ttl if ttl > 0 else None
@@ -110,16 +358,38 @@ class MemoryCache(CacheBackend):
             "created_at": time.time(),
             "expires_at": expires_at,
         }
-        self._access_times[key] = time.time()
         self._size_estimates[key] = value_size
+        self._memory_bytes += value_size
         return True
 
+    def _select_victims(self, new_key: str, needed_bytes: int, max_bytes: int | None) -> list[str]:
+        """Least recently used keys to evict to fit a new entry for ``new_key``.
+
+        An existing entry for ``new_key`` counts as freed, not as a victim.
+        """
+        victims: list[str] = []
+        count = len(self._cache)
+        memory = self._memory_bytes
+        if new_key in self._cache:
+            count -= 1
+            memory -= self._size_estimates.get(new_key, 0)
+        for key in self._cache:
+            if key == new_key:
+                continue
+            over_size = count >= self.max_size
+            over_memory = max_bytes is not None and memory + needed_bytes > max_bytes
+            if not (over_size or over_memory):
+                break
+            victims.append(key)
+            count -= 1
+            memory -= self._size_estimates.get(key, 0)
+        return victims
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         if key in self._cache:
             del self._cache[key]
-            self._access_times.pop(key, None)
-            self._size_estimates.pop(key, None)
+            self._memory_bytes -= self._size_estimates.pop(key, 0)
             return True
         return False
 
@@ -130,7 +400,8 @@ class MemoryCache(CacheBackend):
     async def clear(self) -> bool:
         """Clear all cache entries."""
         self._cache.clear()
-        self._access_times.clear()
+        self._size_estimates.clear()
+        self._memory_bytes = 0
         return True
 
     async def keys(self, pattern: str = "*") -> list[str]:
@@ -143,41 +414,9 @@ class MemoryCache(CacheBackend):
 
         return [key for key in self._cache.keys() if fnmatch.fnmatch(key, pattern)]
 
-    async def _evict_lru(self) -> None:
-        """Evict least recently used item."""
-        if not self._access_times:
-            return
-
-        lru_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-        await self.delete(lru_key)
-
-    async def _evict_by_memory(self, needed_bytes: int) -> None:
-        """Evict items until we have enough memory for the new item."""
-        if not self._size_estimates:
-            return
-
-        freed_bytes = 0
-        # Sort by access time (LRU) and evict oldest first
-        sorted_keys = sorted(self._access_times.keys(), key=lambda k: self._access_times[k])
-
-        for key in sorted_keys:
-            if freed_bytes >= needed_bytes:
-                break
-            freed_bytes += self._size_estimates.get(key, 0)
-            await self.delete(key)
-
     def _estimate_size(self, obj: Any) -> int:
-        """Estimate the size of an object in bytes.
-
-        This is a rough estimate for memory management purposes.
-        """
-        try:
-            # Use sys.getsizeof for a quick estimate
-            # This doesn't account for all nested objects but is fast
-            return sys.getsizeof(obj)
-        except (TypeError, AttributeError):
-            # Fallback for objects that don't support getsizeof
-            return 1024  # Assume 1KB as default
+        """Estimate the size of an object in bytes, including nested objects."""
+        return deep_sizeof(obj)
 
 
 class RedisCache(CacheBackend):
@@ -192,9 +431,12 @@ class RedisCache(CacheBackend):
         if not HAS_REDIS:
             raise ImportError("redis package is required for RedisCache")
 
+        super().__init__()
         self.url = url
         self.prefix = prefix
         self.default_ttl = default_ttl
+        self.scan_count = SCAN_COUNT
+        self.delete_batch_size = DELETE_BATCH_SIZE
         self._client: redis.Redis | None = None
 
     async def _get_client(self) -> "redis.Redis":
@@ -207,49 +449,38 @@ class RedisCache(CacheBackend):
         """Add prefix to key."""
         return f"{self.prefix}{key}"
 
-    async def get(self, key: str) -> Any | None:
-        """Get value from cache.
+    def _strip_key(self, key: bytes | str) -> str:
+        """Remove prefix from a stored key."""
+        text = key.decode() if isinstance(key, bytes) else key
+        return text[len(self.prefix) :]
 
-        Optimization: Handle decompression of compressed values.
-        """
-        client = await self._get_client()
+    def _decode(self, data: bytes | str | None) -> Any | None:
+        """Decode a stored value; values in unknown formats count as misses."""
+        # The client returns bytes; text only comes from decode_responses clients
+        if not isinstance(data, bytes):
+            return None
         try:
-            data = await client.get(self._make_key(key))
-            if data is None:
-                return None
+            return decode_value(data)
+        except CodecError:
+            return None
 
-            # Optimization: Check compression marker and decompress if needed
-            if len(data) > 0:
-                if data[0:1] == b"\x01":
-                    # Compressed data
-                    data = zlib.decompress(data[1:])
-                elif data[0:1] == b"\x00":
-                    # Uncompressed data
-                    data = data[1:]
-                # else: legacy data without marker, try to load as-is
-
-            return pickle.loads(data)
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache."""
+        client = await self._get_client()
+        try:
+            return self._decode(await client.get(self._make_key(key)))
         except Exception:
             return None
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in cache with optional TTL.
 
-        Optimization: Compress large values to reduce memory and network usage.
+        Values are stored with ``cache_codec``; values it cannot encode are
+        not cached.
         """
         client = await self._get_client()
         try:
-            data = pickle.dumps(value)
-
-            # Optimization: Compress if data is larger than 1KB
-            if len(data) > 1024:
-                data = zlib.compress(data, level=6)  # Level 6 is a good balance
-                # Prepend a marker to indicate compression
-                data = b"\x01" + data
-            else:
-                # Prepend marker for uncompressed data
-                data = b"\x00" + data
-
+            data = encode_value(value)
             ttl = ttl or self.default_ttl
             if ttl > 0:
                 await client.setex(self._make_key(key), ttl, data)
@@ -259,6 +490,43 @@ class RedisCache(CacheBackend):
         except Exception:
             return False
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values in one round trip."""
+        if not keys:
+            return {}
+        client = await self._get_client()
+        try:
+            stored = await client.mget([self._make_key(key) for key in keys])
+        except Exception:
+            return {}
+        values = {key: self._decode(data) for key, data in zip(keys, stored, strict=True)}
+        return {key: value for key, value in values.items() if value is not None}
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> int:
+        """Set several values in one pipelined round trip."""
+        encoded: dict[str, bytes] = {}
+        for key, value in items.items():
+            try:
+                encoded[key] = encode_value(value)
+            except CodecError:
+                continue
+        if not encoded:
+            return 0
+
+        client = await self._get_client()
+        ttl = ttl or self.default_ttl
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, data in encoded.items():
+                    if ttl > 0:
+                        pipe.setex(self._make_key(key), ttl, data)
+                    else:
+                        pipe.set(self._make_key(key), data)
+                await pipe.execute()
+            return len(encoded)
+        except Exception:
+            return 0
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         client = await self._get_client()
@@ -268,6 +536,18 @@ class RedisCache(CacheBackend):
         except Exception:
             return False
 
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete keys in batches with ``UNLINK``, which frees memory off the main thread."""
+        client = await self._get_client()
+        deleted = 0
+        try:
+            for start in range(0, len(keys), self.delete_batch_size):
+                batch = keys[start : start + self.delete_batch_size]
+                deleted += await client.unlink(*(self._make_key(key) for key in batch))
+        except Exception:
+            pass
+        return deleted
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         client = await self._get_client()
@@ -277,33 +557,510 @@ class RedisCache(CacheBackend):
         except Exception:
             return False
 
+    async def _scan(self, pattern: str) -> AsyncIterator[list[bytes]]:
+        """Yield batches of stored keys matching pattern, walking the keyspace with ``SCAN``."""
+        client = await self._get_client()
+        batch: list[bytes] = []
+        async for key in client.scan_iter(match=self._make_key(pattern), count=self.scan_count):
+            batch.append(key)
+            if len(batch) >= self.delete_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern without blocking the server.
+
+        Unlike ``KEYS``, ``SCAN`` visits the keyspace a little at a time, and
+        each batch of matches is unlinked as soon as it is found.
+        """
+        client = await self._get_client()
+        deleted = 0
+        try:
+            async for batch in self._scan(pattern):
+                deleted += await client.unlink(*batch)
+        except Exception:
+            pass
+        return deleted
+
     async def clear(self) -> bool:
         """Clear all cache entries."""
         client = await self._get_client()
         try:
-            keys = await client.keys(f"{self.prefix}*")
-            if keys:
-                await client.delete(*keys)
+            async for batch in self._scan("*"):
+                await client.unlink(*batch)
             return True
         except Exception:
             return False
 
     async def keys(self, pattern: str = "*") -> list[str]:
         """Get all keys matching pattern."""
-        client = await self._get_client()
         try:
-            keys = await client.keys(f"{self.prefix}{pattern}")
-            # Remove prefix from keys
-            return [key.decode().replace(self.prefix, "") for key in keys]
+            return [self._strip_key(key) async for batch in self._scan(pattern) for key in batch]
         except Exception:
             return []
 
+    async def publish(self, channel: str, message: str) -> bool:
+        """Publish a message to other processes subscribed to a channel."""
+        client = await self._get_client()
+        try:
+            await client.publish(channel, message)
+            return True
+        except Exception:
+            return False
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        """Yield messages published to a channel until the connection fails."""
+        client = await self._get_client()
+        pubsub = client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    data = message["data"]
+                    yield data.decode() if isinstance(data, bytes) else str(data)
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
     async def close(self) -> None:
         """Close Redis connection."""
         if self._client:
             await self._client.close()
 
 
+class TieredCache(CacheBackend):
+    """A per-process memory cache (L1) in front of a shared cache (L2).
+
+    Reads are served from L1 when possible and otherwise from L2, promoting
+    the value into L1. Writes and deletes go to both tiers. L1 entries live
+    at most ``l1_ttl`` seconds, which bounds how stale they can get.
+
+    With an ``invalidation_channel`` and a Redis L2, every write, delete and
+    clear is also published on that channel, and each process drops the
+    affected keys from its own L1 when it receives the message, so L1
+    copies in other processes stay coherent.
+    """
+
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: CacheBackend,
+        l1_ttl: int = 60,
+        invalidation_channel: str | None = None,
+    ) -> None:
+        if invalidation_channel and not isinstance(l2, RedisCache):
+            raise ValueError("Invalidation messages require a Redis L2 cache")
+        super().__init__()
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.invalidation_channel = invalidation_channel
+        # Identifies this process's messages, which need no action here
+        self._origin = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+
+    def _l1_ttl(self, ttl: int | None) -> int:
+        """TTL for an L1 copy of an entry with the given TTL."""
+        ttl = ttl or self.l2_default_ttl
+        return min(ttl, self.l1_ttl) if ttl > 0 else self.l1_ttl
+
+    @property
+    def l2_default_ttl(self) -> int:
+        """Default TTL of the L2 cache."""
+        return int(getattr(self.l2, "default_ttl", self.l1_ttl))
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from L1, falling back to L2."""
+        self._ensure_listener()
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+
+        value = await self.l2.get(key)
+        if value is not None:
+            await self.l1.set(key, value, self._l1_ttl(None))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in both tiers."""
+        self._ensure_listener()
+        stored = await self.l2.set(key, value, ttl)
+        cached = await self.l1.set(key, value, self._l1_ttl(ttl))
+        await self._publish("set", key)
+        return stored or cached
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from both tiers."""
+        self._ensure_listener()
+        deleted = await self.l1.delete(key)
+        deleted = await self.l2.delete(key) or deleted
+        await self._publish("delete", key)
+        return deleted
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values, fetching those not in L1 from L2 in one batch."""
+        self._ensure_listener()
+        values = await self.l1.get_many(keys)
+        missing = [key for key in keys if key not in values]
+        if missing:
+            found = await self.l2.get_many(missing)
+            for key, value in found.items():
+                await self.l1.set(key, value, self._l1_ttl(None))
+            values.update(found)
+        return values
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> int:
+        """Set several values in both tiers."""
+        self._ensure_listener()
+        stored = await self.l2.set_many(items, ttl)
+        for key, value in items.items():
+            await self.l1.set(key, value, self._l1_ttl(ttl))
+            await self._publish("set", key)
+        return stored
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete several keys from both tiers."""
+        self._ensure_listener()
+        await self.l1.delete_many(keys)
+        deleted = await self.l2.delete_many(keys)
+        for key in keys:
+            await self._publish("delete", key)
+        return deleted
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern from both tiers."""
+        self._ensure_listener()
+        await self.l1.delete_pattern(pattern)
+        deleted = await self.l2.delete_pattern(pattern)
+        await self._publish("delete_pattern", pattern)
+        return deleted
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in either tier."""
+        return await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def clear(self) -> bool:
+        """Clear both tiers."""
+        self._ensure_listener()
+        await self.l1.clear()
+        cleared = await self.l2.clear()
+        await self._publish("clear")
+        return cleared
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """Get all keys matching pattern in either tier."""
+        keys = set(await self.l2.keys(pattern))
+        keys.update(await self.l1.keys(pattern))
+        return sorted(keys)
+
+    async def _publish(self, operation: str, key: str = "") -> None:
+        """Tell other processes to drop a key (or everything) from their L1."""
+        if self.invalidation_channel and isinstance(self.l2, RedisCache):
+            message = f"{self._origin} {operation} {key}"
+            await self.l2.publish(self.invalidation_channel, message)
+
+    async def apply_invalidation(self, message: str) -> None:
+        """Drop the L1 entries named by an invalidation message."""
+        origin, operation, key = (message.split(" ", 2) + ["", ""])[:3]
+        if origin == self._origin:
+            return
+        if operation == "clear":
+            await self.l1.clear()
+        elif operation == "delete_pattern":
+            await self.l1.delete_pattern(key)
+        else:
+            await self.l1.delete(key)
+
+    def _ensure_listener(self) -> None:
+        """Start listening for invalidation messages if not already listening."""
+        if not self.invalidation_channel or (self._listener and not self._listener.done()):
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Apply invalidation messages until the subscription fails."""
+        assert isinstance(self.l2, RedisCache) and self.invalidation_channel
+        try:
+            async for message in self.l2.listen(self.invalidation_channel):
+                await self.apply_invalidation(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener stopped: {e}")
+        # Messages may have been missed; start over from L2
+        await self.l1.clear()
+
+    async def close(self) -> None:
+        """Stop listening for invalidations and close the L2 connection."""
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if isinstance(self.l2, RedisCache):
+            await self.l2.close()
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_access ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN UPDATE totals SET size = size + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries
+BEGIN UPDATE totals SET size = size - OLD.size + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN UPDATE totals SET size = size - OLD.size; END;
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """Disk cache backend in a single SQLite file.
+
+    Separate processes, such as repeated CLI invocations, share the file and
+    reuse each other's entries. The database runs in WAL mode, so readers
+    don't wait for writers, and writers wait up to ``timeout`` seconds for
+    each other. Values are stored with ``cache_codec``. Once the stored
+    values exceed ``max_size_mb``, the least recently read entries are
+    evicted.
+    """
+
+    # Where a repository's cache lives, relative to its working directory
+    REPO_PATH = Path(".githound") / "cache.sqlite3"
+
+    def __init__(
+        self,
+        path: Path | str,
+        default_ttl: int = 7 * 24 * 3600,
+        max_size_mb: int = 256,
+        timeout: float = 10.0,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self.max_size_mb = max_size_mb
+        self.timeout = timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_repo(cls, repo_path: Path | str, **kwargs: Any) -> "SQLiteCache":
+        """The cache stored in a repository's ``.githound`` directory."""
+        path = Path(repo_path) / cls.REPO_PATH
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Keep cache and index files out of the repository's status
+            (path.parent / ".gitignore").write_text("*\n")
+        return cls(path, **kwargs)
+
+    @property
+    def max_bytes(self) -> int:
+        """Size limit of stored values in bytes."""
+        return self.max_size_mb * 1024 * 1024
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SQLITE_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, operation: Callable[[sqlite3.Connection], Any], default: Any) -> Any:
+        """Run a database operation in a worker thread; errors return ``default``."""
+
+        def run() -> Any:
+            with self._lock:
+                return operation(self._connect())
+
+        try:
+            return await asyncio.to_thread(run)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"SQLite cache operation failed: {e}")
+            return default
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _write(conn: sqlite3.Connection) -> Iterator[None]:
+        """A write transaction that takes the database lock up front."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _expires_at(self, ttl: int | None) -> float | None:
+        """Expiry time of an entry written now."""
+        ttl = ttl or self.default_ttl
+        return time.time() + ttl if ttl > 0 else None
+
+    def _put(self, conn: sqlite3.Connection, key: str, data: bytes, ttl: int | None) -> None:
+        """Insert or replace an entry."""
+        conn.execute(
+            "INSERT INTO entries (key, value, size, expires_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET"
+            " value = excluded.value, size = excluded.size,"
+            " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+            (key, data, len(data), self._expires_at(ttl), time.time()),
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then least recently read ones, until under the size limit."""
+        if self._total(conn) <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        excess = self._total(conn) - self.max_bytes
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM ("
+                " SELECT key, SUM(size) OVER (ORDER BY accessed_at, key) - size AS before"
+                " FROM entries) WHERE before < ?)",
+                (excess,),
+            )
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        """Total size of the stored values, kept up to date by triggers."""
+        return int(conn.execute("SELECT size FROM totals").fetchone()[0])
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from cache."""
+
+        def get(conn: sqlite3.Connection) -> bytes | None:
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if row[1] is not None and row[1] <= now:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            # Recency only guides eviction; don't fail the read if a writer holds the lock
+            with contextlib.suppress(sqlite3.OperationalError):
+                conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+        data = await self._run(get, None)
+        if data is None:
+            return None
+        try:
+            return decode_value(data)
+        except CodecError:
+            return None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in cache with optional TTL."""
+        return await self.set_many({key: value}, ttl) == 1
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> int:
+        """Set several values in one transaction."""
+        encoded: dict[str, bytes] = {}
+        for key, value in items.items():
+            try:
+                data = encode_value(value)
+            except CodecError:
+                continue
+            if len(data) <= self.max_bytes:
+                encoded[key] = data
+        if not encoded:
+            return 0
+
+        def set_many(conn: sqlite3.Connection) -> int:
+            with self._write(conn):
+                for key, data in encoded.items():
+                    self._put(conn, key, data, ttl)
+                self._evict(conn)
+            return len(encoded)
+
+        return int(await self._run(set_many, 0))
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from cache."""
+        return await self.delete_many([key]) > 0
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete several keys in one transaction."""
+
+        def delete_many(conn: sqlite3.Connection) -> int:
+            with self._write(conn):
+                return sum(
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount
+                    for key in keys
+                )
+
+        return int(await self._run(delete_many, 0))
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching pattern."""
+
+        def delete_pattern(conn: sqlite3.Connection) -> int:
+            return conn.execute("DELETE FROM entries WHERE key GLOB ?", (pattern,)).rowcount
+
+        return int(await self._run(delete_pattern, 0))
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+
+        def exists(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT 1 FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+            return row is not None
+
+        return bool(await self._run(exists, False))
+
+    async def clear(self) -> bool:
+        """Clear all cache entries."""
+
+        def clear(conn: sqlite3.Connection) -> bool:
+            conn.execute("DELETE FROM entries")
+            return True
+
+        return bool(await self._run(clear, False))
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """Get all keys matching pattern."""
+
+        def keys(conn: sqlite3.Connection) -> list[str]:
+            rows = conn.execute(
+                "SELECT key FROM entries WHERE key GLOB ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (pattern, time.time()),
+            ).fetchall()
+            return [row[0] for row in rows]
+
+        return list(await self._run(keys, []))
+
+    async def size_bytes(self) -> int:
+        """Total size of the stored values."""
+        return int(await self._run(self._total, 0))
+
+    async def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class SearchCache:
     """Enhanced search cache with intelligent invalidation."""
 
@@ -366,6 +1123,29 @@ class SearchCache:
 
         return result
 
+    async def get_or_compute(
+        self, compute: Callable[[], Awaitable[Any]], *args: Any, ttl: int | None = None
+    ) -> Any:
+        """Get value from cache, computing and caching it on a miss.
+
+        Concurrent misses for the same arguments share a single computation.
+        """
+        key = self._make_cache_key(*args)
+        computed = False
+
+        async def run() -> Any:
+            nonlocal computed
+            computed = True
+            return await compute()
+
+        value = await self.backend.get_or_compute(key, run, ttl or self.default_ttl)
+        if computed:
+            self._stats["misses"] += 1
+            self._stats["sets"] += 1
+        else:
+            self._stats["hits"] += 1
+        return value
+
     async def delete(self, *args: Any) -> bool:
         """Delete value from cache."""
         key = self._make_cache_key(*args)
@@ -378,14 +1158,8 @@ class SearchCache:
 
     async def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching pattern."""
-        keys = await self.backend.keys(pattern)
-        count = 0
-
-        for key in keys:
-            if await self.backend.delete(key):
-                count += 1
-                self._stats["deletes"] += 1
-
+        count = await self.backend.delete_pattern(pattern)
+        self._stats["deletes"] += count
         return count
 
     async def clear(self) -> bool:
@@ -399,17 +1173,19 @@ class SearchCache:
 
         # Get backend-specific stats if available
         backend_stats = {}
-        if isinstance(self.backend, MemoryCache):
-            total_memory_bytes = sum(self.backend._size_estimates.values())
+        # For a tiered cache, report its memory tier
+        memory = self.backend.l1 if isinstance(self.backend, TieredCache) else self.backend
+        if isinstance(memory, MemoryCache):
+            total_memory_bytes = memory.memory_bytes
             backend_stats = {
-                "cache_size": len(self.backend._cache),
-                "max_size": self.backend.max_size,
+                "cache_size": len(memory._cache),
+                "max_size": memory.max_size,
                 "memory_usage_mb": total_memory_bytes / (1024 * 1024),
-                "max_memory_mb": self.backend.max_memory_mb,
+                "max_memory_mb": memory.max_memory_mb,
+                "admission": memory.admission,
+                "rejections": memory.rejections,
                 "avg_entry_size_kb": (
-                    total_memory_bytes / len(self.backend._cache) / 1024
-                    if self.backend._cache
-                    else 0
+                    total_memory_bytes / len(memory._cache) / 1024 if memory._cache else 0
                 ),
             }
 
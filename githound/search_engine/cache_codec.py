@@ -0,0 +1,172 @@
+"""Compact, versioned encoding of cached values for shared cache backends.
+
+Values are stored as JSON behind a one-byte header naming the format, so
+readers can reject data written by a format they do not know instead of
+misreading it. Nothing is pickled, so decoding cannot run arbitrary code:
+the only objects it builds besides JSON data are pydantic models defined
+in GitHound.
+
+Lists of ``SearchResult`` use a columnar layout: each field name is stored
+once with the values of all results, fields that are empty for every result
+are left out, and commit info shared by several results is stored once.
+"""
+
+import importlib
+import json
+import zlib
+from datetime import datetime
+from pathlib import Path, PurePath
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from ..models import CommitInfo, SearchResult
+
+# Header bytes. 0x00 and 0x01 marked pickled values in earlier releases.
+FORMAT_JSON = 0x02
+FORMAT_JSON_ZLIB = 0x03
+
+# Encoded values larger than this are compressed
+COMPRESS_THRESHOLD = 1024
+
+# Only models from these packages are rebuilt when decoding
+MODEL_PACKAGE = "githound."
+
+_RESULTS = TypeAdapter(list[SearchResult])
+
+
+class CodecError(ValueError):
+    """A value cannot be encoded, or stored data cannot be decoded."""
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode a value for storage.
+
+    Raises:
+        CodecError: If the value holds something other than JSON data,
+            datetimes, paths and GitHound models
+    """
+    try:
+        text = json.dumps(_encode(value), separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        raise CodecError(f"Cannot encode {type(value).__name__}: {e}") from e
+
+    data = text.encode("utf-8")
+    if len(data) > COMPRESS_THRESHOLD:
+        return bytes([FORMAT_JSON_ZLIB]) + zlib.compress(data, level=6)
+    return bytes([FORMAT_JSON]) + data
+
+
+def decode_value(data: bytes) -> Any:
+    """Decode stored data.
+
+    Raises:
+        CodecError: If the data is in an unknown format or is corrupt
+    """
+    if not data:
+        raise CodecError("Empty value")
+    header, payload = data[0], data[1:]
+    try:
+        if header == FORMAT_JSON_ZLIB:
+            payload = zlib.decompress(payload)
+        elif header != FORMAT_JSON:
+            raise CodecError(f"Unknown cache value format: {header:#04x}")
+        return _decode(json.loads(payload))
+    except CodecError:
+        raise
+    except Exception as e:
+        raise CodecError(f"Corrupt cache value: {e}") from e
+
+
+def _encode(value: Any) -> Any:
+    """Convert a value to JSON data, tagging what JSON cannot express."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, list) and value and all(type(v) is SearchResult for v in value):
+        return {"$results": _encode_results(value)}
+    if isinstance(value, list | tuple):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith("$") for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        return {"$dict": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, PurePath):
+        return {"$path": str(value)}
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        if not cls.__module__.startswith(MODEL_PACKAGE):
+            raise TypeError(f"{cls.__qualname__} is not a GitHound model")
+        return {
+            "$model": f"{cls.__module__}:{cls.__qualname__}",
+            "data": value.model_dump(mode="json"),
+        }
+    raise TypeError(f"{type(value).__name__} is not supported")
+
+
+def _decode(data: Any) -> Any:
+    """Rebuild a value from its JSON data."""
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "$results" in data:
+        return _decode_results(data["$results"])
+    if "$dict" in data:
+        return {_decode(key): _decode(item) for key, item in data["$dict"]}
+    if "$datetime" in data:
+        return datetime.fromisoformat(data["$datetime"])
+    if "$path" in data:
+        return Path(data["$path"])
+    if "$model" in data:
+        return _model_class(data["$model"]).model_validate(data["data"])
+    return {key: _decode(item) for key, item in data.items()}
+
+
+def _encode_results(results: list[SearchResult]) -> dict[str, Any]:
+    """Columnar layout of search results, with each commit's info stored once."""
+    rows = _RESULTS.dump_python(results, mode="json")
+    commits: list[dict[str, Any]] = []
+    commit_indexes: dict[str, int] = {}
+    for row in rows:
+        info = row["commit_info"]
+        if info is None:
+            continue
+        index = commit_indexes.get(info["hash"])
+        if index is None or commits[index] != info:
+            index = commit_indexes[info["hash"]] = len(commits)
+            commits.append(info)
+        row["commit_info"] = index
+
+    columns: dict[str, list[Any]] = {}
+    for field in rows[0]:
+        values = [row[field] for row in rows]
+        if any(value is not None for value in values):
+            columns[field] = values
+    return {"n": len(rows), "commits": commits, "columns": columns}
+
+
+def _decode_results(data: dict[str, Any]) -> list[SearchResult]:
+    """Rebuild search results from their columnar layout."""
+    commits = [CommitInfo.model_validate(info) for info in data["commits"]]
+    columns: dict[str, list[Any]] = data["columns"]
+    if "commit_info" in columns:
+        columns["commit_info"] = [
+            None if index is None else commits[index] for index in columns["commit_info"]
+        ]
+    rows = [{field: values[i] for field, values in columns.items()} for i in range(data["n"])]
+    return _RESULTS.validate_python(rows)
+
+
+def _model_class(name: str) -> type[BaseModel]:
+    """Look up a GitHound model class by ``module:qualname``."""
+    module_name, _, qualname = name.partition(":")
+    if not module_name.startswith(MODEL_PACKAGE):
+        raise CodecError(f"Refusing to load model {name}")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        raise CodecError(f"{name} is not a model")
+    return obj
@@ -0,0 +1,78 @@
+"""Stable, ref-aware cache keys for search results.
+
+A cached result is only valid for the history it was computed from, so
+result keys combine:
+
+- a digest of the query that is identical in every process (unlike
+  ``hash()``, which is salted per interpreter), so workers sharing a Redis
+  cache hit each other's entries, and
+- the commit SHA each searched ref points to, so when a ref moves its old
+  entries simply stop being looked up, while entries for other refs stay
+  valid. Stale entries are left for the cache's TTL or eviction to drop.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from ..models import SearchQuery
+
+# Query fields that change how a search runs, not what it finds
+EXECUTION_FIELDS = frozenset(
+    {"enable_caching", "cache_ttl_seconds", "enable_parallel", "max_workers", "timeout_seconds"}
+)
+
+# Stands in for the tip of a ref that does not resolve, e.g. in an empty repository
+UNRESOLVED_TIP = "unresolved"
+
+
+def query_digest(query: SearchQuery) -> str:
+    """Digest of everything in a query that affects its results."""
+    data = query.model_dump(mode="json", exclude=set(EXECUTION_FIELDS))
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def resolve_tip(repo: Any, ref: str | None = None) -> str:
+    """The commit SHA a ref (by default ``HEAD``) points to."""
+    try:
+        return str(repo.commit(ref or "HEAD").hexsha)
+    except Exception:
+        return UNRESOLVED_TIP
+
+
+def refs_digest(repo: Any) -> str:
+    """Digest of the tips of every branch and tag, for results that depend on all refs."""
+    try:
+        tips = sorted(f"{ref.path} {ref.object.hexsha}" for ref in repo.refs)
+    except Exception:
+        return UNRESOLVED_TIP
+    return hashlib.blake2b("\n".join(tips).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def result_cache_key(
+    namespace: str,
+    repo: Any,
+    query: SearchQuery,
+    branch: str | None = None,
+    *parts: Any,
+    all_refs: bool = False,
+    tip: str | None = None,
+) -> str:
+    """Key for results of a query over ``branch`` (default ``HEAD``).
+
+    Args:
+        namespace: Who caches the results, e.g. a searcher's cache prefix
+        repo: The searched repository
+        query: The search query
+        branch: The searched ref
+        parts: Anything else the results depend on
+        all_refs: The results depend on every branch and tag, not only
+            ``branch``, so any ref moving invalidates them
+        tip: The commit ``branch`` resolves to, if the caller already knows
+    """
+    ref = branch or "HEAD"
+    if tip is None:
+        tip = refs_digest(repo) if all_refs else resolve_tip(repo, branch)
+    key = f"{namespace}:{repo.working_dir}:{ref}@{tip}:{query_digest(query)}"
+    return ":".join([key, *(str(part) for part in parts)])
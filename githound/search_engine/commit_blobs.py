@@ -0,0 +1,346 @@
+"""Compact mapping from commits to the file versions they introduce.
+
+Content indexes are keyed by blob SHA, so a blob that appears in many
+commits is read and tokenized once. This map records, for every indexed
+commit, the ``(path, blob)`` pairs it changed, and lets an index hit on a
+blob be expanded to every commit and path where that blob was introduced.
+
+Commit and blob SHAs are interned as 20-byte binary IDs and paths are
+interned once each, so an entry costs three 32-bit integers in memory and
+on disk.
+
+The file is a sequence of chunks. Each save appends one chunk holding only
+what changed since the previous save: newly interned commits, blobs and
+paths, new entries, and the IDs of removed commits. Saving therefore costs
+time proportional to the change; ``compact`` rewrites the file without the
+entries of removed commits.
+"""
+
+import contextlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+
+MAGIC = b"GHBLOBMP"
+FORMAT_VERSION = 2
+
+# magic, version, new commits, new blobs, new paths, new entries, removed commits
+_CHUNK_HEADER = struct.Struct("<8sIQQQQQ")
+_PATH_LENGTH = struct.Struct("<I")
+_SHA_SIZE = 20
+
+
+def _read_shas(data: bytes, pos: int, count: int) -> list[bytes]:
+    shas = [data[pos + i * _SHA_SIZE : pos + (i + 1) * _SHA_SIZE] for i in range(count)]
+    if shas and len(shas[-1]) != _SHA_SIZE:
+        raise ValueError("truncated SHA table")
+    return shas
+
+
+def _to_little_endian(values: "array[int]") -> "array[int]":
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class CommitBlobMap:
+    """Maps commits to ``(path, blob)`` pairs and blobs back to their locations."""
+
+    def __init__(self) -> None:
+        self._commits: list[bytes] = []
+        self._commit_ids: dict[bytes, int] = {}
+        self._blobs: list[bytes] = []
+        self._blob_ids: dict[bytes, int] = {}
+        self._paths: list[str] = []
+        self._path_ids: dict[str, int] = {}
+        # Flat (commit_id, path_id, blob_id) triples
+        self._entries = array("I")
+        # IDs of commits whose entries no longer count
+        self._removed: set[int] = set()
+        # blob_id / commit_id -> entry numbers, built on first lookup
+        self._by_blob: dict[int, list[int]] | None = None
+        self._by_commit: dict[int, list[int]] | None = None
+
+        # What the file at _saved_path holds: table sizes, entries and removals
+        self._saved_path: Path | None = None
+        self._saved_size = 0
+        self._saved_counts = (0, 0, 0, 0)
+        self._saved_removed: set[int] = set()
+
+    def __len__(self) -> int:
+        """Number of live entries."""
+        if not self._removed:
+            return len(self._entries) // 3
+        entries = self._entries
+        return sum(1 for i in range(0, len(entries), 3) if entries[i] not in self._removed)
+
+    @property
+    def commit_count(self) -> int:
+        """Number of live commits with at least one recorded file."""
+        return len(self._commit_ids) - sum(
+            1 for commit_id in self._commit_ids.values() if commit_id in self._removed
+        )
+
+    @staticmethod
+    def _intern(value: bytes, table: list[bytes], ids: dict[bytes, int]) -> int:
+        item_id = ids.get(value)
+        if item_id is None:
+            item_id = len(table)
+            table.append(value)
+            ids[value] = item_id
+        return item_id
+
+    def add(self, commit_sha: str, path: str, blob_sha: str) -> None:
+        """Record that a commit introduced a blob at a path."""
+        commit = bytes.fromhex(commit_sha)
+        if self._commit_ids.get(commit) in self._removed:
+            # A removed commit is indexed again; its old entries stay removed
+            del self._commit_ids[commit]
+        commit_id = self._intern(commit, self._commits, self._commit_ids)
+        blob_id = self._intern(bytes.fromhex(blob_sha), self._blobs, self._blob_ids)
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._paths.append(path)
+            self._path_ids[path] = path_id
+
+        entry = len(self._entries) // 3
+        if self._by_blob is not None:
+            self._by_blob.setdefault(blob_id, []).append(entry)
+        if self._by_commit is not None:
+            self._by_commit.setdefault(commit_id, []).append(entry)
+        self._entries.extend((commit_id, path_id, blob_id))
+
+    def remove_commit(self, commit_sha: str) -> list[str]:
+        """Drop a commit's entries, e.g. after history was rewritten.
+
+        Returns:
+            SHAs of the blobs the commit introduced
+        """
+        blobs = [blob_sha for _, blob_sha in self.files(commit_sha)]
+        commit_id = self._commit_ids.get(bytes.fromhex(commit_sha))
+        if commit_id is not None:
+            self._removed.add(commit_id)
+        return blobs
+
+    def __contains__(self, blob_sha: str) -> bool:
+        """Check whether any live commit introduced a blob."""
+        return bool(self.locations(blob_sha))
+
+    def _entries_of(self, key: int, column: int) -> list[int]:
+        """Entry numbers whose blob (column 2) or commit (column 0) ID is ``key``."""
+        lookup = self._by_blob if column == 2 else self._by_commit
+        if lookup is None:
+            lookup = {}
+            entries = self._entries
+            for entry in range(len(entries) // 3):
+                lookup.setdefault(entries[entry * 3 + column], []).append(entry)
+            if column == 2:
+                self._by_blob = lookup
+            else:
+                self._by_commit = lookup
+        return lookup.get(key, [])
+
+    def locations(self, blob_sha: str) -> list[tuple[str, str]]:
+        """Every ``(commit_sha, path)`` at which a blob was introduced, in index order."""
+        blob_id = self._blob_ids.get(bytes.fromhex(blob_sha))
+        if blob_id is None:
+            return []
+
+        entries = self._entries
+        return [
+            (self._commits[entries[entry * 3]].hex(), self._paths[entries[entry * 3 + 1]])
+            for entry in self._entries_of(blob_id, 2)
+            if entries[entry * 3] not in self._removed
+        ]
+
+    def files(self, commit_sha: str) -> list[tuple[str, str]]:
+        """The ``(path, blob_sha)`` pairs a commit introduced."""
+        commit_id = self._commit_ids.get(bytes.fromhex(commit_sha))
+        if commit_id is None or commit_id in self._removed:
+            return []
+        entries = self._entries
+        return [
+            (self._paths[entries[entry * 3 + 1]], self._blobs[entries[entry * 3 + 2]].hex())
+            for entry in self._entries_of(commit_id, 0)
+        ]
+
+    def _chunk(self, counts: tuple[int, int, int, int], removed: list[int]) -> list[bytes]:
+        """Encode everything added after ``counts`` plus the given removals."""
+        commits, blobs, paths, entries = counts
+        parts = [
+            _CHUNK_HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                len(self._commits) - commits,
+                len(self._blobs) - blobs,
+                len(self._paths) - paths,
+                len(self._entries) // 3 - entries,
+                len(removed),
+            ),
+            b"".join(self._commits[commits:]),
+            b"".join(self._blobs[blobs:]),
+        ]
+        for file_path in self._paths[paths:]:
+            encoded = file_path.encode("utf-8", errors="surrogateescape")
+            parts.append(_PATH_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        parts.append(_to_little_endian(self._entries[entries * 3 :]).tobytes())
+        parts.append(_to_little_endian(array("I", removed)).tobytes())
+        return parts
+
+    def _counts(self) -> tuple[int, int, int, int]:
+        return len(self._commits), len(self._blobs), len(self._paths), len(self._entries) // 3
+
+    def save(self, path: Path) -> None:
+        """Append the changes since the last save, or write the whole map.
+
+        The whole map is written atomically when ``path`` is not the file
+        this map was loaded from or last saved to.
+        """
+        if self._saved_path != path or not path.exists():
+            self._write_full(path)
+            return
+
+        removed = sorted(self._removed - self._saved_removed)
+        if self._counts() == self._saved_counts and not removed:
+            return
+        data = b"".join(self._chunk(self._saved_counts, removed))
+        with open(path, "r+b") as f:
+            # Drop a partial chunk left behind by an interrupted save
+            f.truncate(self._saved_size)
+            f.seek(self._saved_size)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._mark_saved(path, self._saved_size + len(data))
+
+    def _write_full(self, path: Path) -> None:
+        data = b"".join(self._chunk((0, 0, 0, 0), sorted(self._removed)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
+        self._mark_saved(path, len(data))
+
+    def _mark_saved(self, path: Path, size: int) -> None:
+        self._saved_path = path
+        self._saved_size = size
+        self._saved_counts = self._counts()
+        self._saved_removed = set(self._removed)
+
+    @property
+    def saved_size(self) -> int:
+        """Size of the file as of the last save or load."""
+        return self._saved_size
+
+    def removed_ratio(self) -> float:
+        """Fraction of entries that belong to removed commits."""
+        total = len(self._entries) // 3
+        return 1.0 - len(self) / total if total else 0.0
+
+    def compact(self, path: Path) -> None:
+        """Rewrite the map without the entries of removed commits."""
+        live = CommitBlobMap()
+        entries = self._entries
+        for i in range(0, len(entries), 3):
+            if entries[i] not in self._removed:
+                live.add(
+                    self._commits[entries[i]].hex(),
+                    self._paths[entries[i + 1]],
+                    self._blobs[entries[i + 2]].hex(),
+                )
+        live._write_full(path)
+        self.__dict__.update(live.__dict__)
+
+    def load(self, path: Path, size: int | None = None) -> bool:
+        """Load a saved map, replacing the current contents.
+
+        A partial chunk at the end of the file, left by an interrupted save,
+        is ignored.
+
+        Args:
+            path: File the map was saved to
+            size: Read only this many bytes, ignoring chunks appended since
+                the map had this size (see ``saved_size``)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read() if size is None else f.read(size)
+        except OSError:
+            return False
+
+        loaded = CommitBlobMap()
+        pos = 0
+        while pos + _CHUNK_HEADER.size <= len(data):
+            end = loaded._read_chunk(data, pos)
+            if end is None:
+                break
+            pos = end
+        if pos == 0:
+            return False
+
+        loaded._mark_saved(path, pos)
+        self.__dict__.update(loaded.__dict__)
+        return True
+
+    def _read_chunk(self, data: bytes, pos: int) -> int | None:
+        """Apply one chunk at ``pos``, returning the position after it."""
+        magic, version, commits, blobs, paths, entries, removed = _CHUNK_HEADER.unpack_from(
+            data, pos
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        pos += _CHUNK_HEADER.size
+
+        try:
+            new_commits = _read_shas(data, pos, commits)
+            pos += commits * _SHA_SIZE
+            new_blobs = _read_shas(data, pos, blobs)
+            pos += blobs * _SHA_SIZE
+            new_paths: list[str] = []
+            for _ in range(paths):
+                (length,) = _PATH_LENGTH.unpack_from(data, pos)
+                pos += _PATH_LENGTH.size
+                encoded = data[pos : pos + length]
+                new_paths.append(encoded.decode("utf-8", errors="surrogateescape"))
+                pos += length
+            new_entries = array("I")
+            new_entries.frombytes(data[pos : pos + entries * 3 * new_entries.itemsize])
+            pos += entries * 3 * new_entries.itemsize
+            removed_ids = array("I")
+            removed_ids.frombytes(data[pos : pos + removed * removed_ids.itemsize])
+            pos += removed * removed_ids.itemsize
+        except (struct.error, ValueError):
+            return None
+        if pos > len(data) or len(new_entries) != entries * 3 or len(removed_ids) != removed:
+            return None
+
+        for commit in new_commits:
+            # A commit indexed again after removal gets a new ID
+            self._commit_ids[commit] = len(self._commits)
+            self._commits.append(commit)
+        for blob in new_blobs:
+            self._blob_ids[blob] = len(self._blobs)
+            self._blobs.append(blob)
+        for file_path in new_paths:
+            self._path_ids[file_path] = len(self._paths)
+            self._paths.append(file_path)
+        self._entries.extend(_to_little_endian(new_entries))
+        self._removed.update(_to_little_endian(removed_ids))
+        return pos
@@ -0,0 +1,147 @@
+"""Streaming commit metadata reader built on a single ``git log`` pipe.
+
+Walking ``repo.iter_commits()`` and reading ``commit.author`` or
+``commit.message`` makes GitPython parse every commit object separately.
+Metadata-only searchers do not need full commit objects, so this module
+streams NUL-delimited fields from one ``git log`` process and yields compact
+``CommitRecord`` objects instead.
+
+Records expose the read-only attributes searchers use on GitPython commits
+(``hexsha``, ``author.name``, ``author.email``, ``committer``, ``message``,
+``committed_date`` and ``parents[i].hexsha``), so they can be passed to code
+written against commits, such as ``build_commit_info``.
+"""
+
+import contextlib
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+# Fields emitted per commit, each terminated by a NUL byte
+_LOG_FIELDS = ("%H", "%an", "%ae", "%cn", "%ce", "%ct", "%P", "%B")
+_LOG_FORMAT = "".join(f"{field}%x00" for field in _LOG_FIELDS)
+_FIELD_COUNT = len(_LOG_FIELDS)
+
+# Bytes read from the git pipe per chunk
+_READ_SIZE = 1 << 16
+
+
+class Actor(NamedTuple):
+    """Author or committer identity."""
+
+    name: str
+    email: str
+
+
+class ParentRef(NamedTuple):
+    """Reference to a parent commit."""
+
+    hexsha: str
+
+
+@dataclass(frozen=True, slots=True)
+class CommitRecord:
+    """Compact commit metadata read from ``git log``."""
+
+    hexsha: str
+    author: Actor
+    committer: Actor
+    committed_date: int
+    parent_shas: tuple[str, ...]
+    message: str
+
+    @property
+    def parents(self) -> tuple[ParentRef, ...]:
+        """Parent references, mirroring ``git.Commit.parents``."""
+        return tuple(ParentRef(sha) for sha in self.parent_shas)
+
+    @classmethod
+    def from_commit(cls, commit: Any) -> "CommitRecord":
+        """Build a record from a GitPython commit object."""
+        return cls(
+            hexsha=commit.hexsha,
+            author=Actor(commit.author.name, commit.author.email),
+            committer=Actor(commit.committer.name, commit.committer.email),
+            committed_date=commit.committed_date,
+            parent_shas=tuple(parent.hexsha for parent in commit.parents),
+            message=commit.message,
+        )
+
+
+def _parse_record(fields: list[bytes]) -> CommitRecord:
+    """Build a record from the raw NUL-delimited fields of one commit."""
+    hexsha, author_name, author_email, committer_name, committer_email, date, parents, body = (
+        field.decode("utf-8", errors="replace") for field in fields
+    )
+    return CommitRecord(
+        # Commits after the first are preceded by git's record terminator
+        hexsha=hexsha.lstrip("\n"),
+        author=Actor(author_name, author_email),
+        committer=Actor(committer_name, committer_email),
+        committed_date=int(date),
+        parent_shas=tuple(parents.split()),
+        message=body,
+    )
+
+
+def iter_commit_records(
+    repo: Any, rev: str | None = None, max_count: int | None = None
+) -> Generator[CommitRecord, None, None]:
+    """Stream commit metadata for a revision with one ``git log`` process.
+
+    Repositories that cannot be read through the git command line (e.g.
+    test doubles) fall back to ``repo.iter_commits()``.
+
+    Args:
+        repo: The repository to read.
+        rev: Revision or branch to walk, defaults to HEAD.
+        max_count: Maximum number of commits to yield.
+
+    Yields:
+        CommitRecord objects in ``git log`` order.
+
+    Raises:
+        GitCommandError: If git fails, e.g. for an unknown revision.
+    """
+    args = [f"--format={_LOG_FORMAT}"]
+    if max_count is not None:
+        args.append(f"--max-count={max_count}")
+    args.extend([rev or "HEAD", "--"])
+
+    try:
+        process = repo.git.log(*args, as_process=True)
+        stream = process.stdout
+        chunk = stream.read(_READ_SIZE)
+    except (AttributeError, OSError, ValueError):
+        chunk = None
+
+    if not isinstance(chunk, bytes):
+        kwargs: dict[str, Any] = {} if max_count is None else {"max_count": max_count}
+        for commit in repo.iter_commits(rev, **kwargs):
+            yield CommitRecord.from_commit(commit)
+        return
+
+    completed = False
+    try:
+        buffer = b""
+        fields: list[bytes] = []
+        while chunk:
+            parts = (buffer + chunk).split(b"\x00")
+            # The last part is incomplete until the next NUL arrives
+            buffer = parts.pop()
+            for part in parts:
+                fields.append(part)
+                if len(fields) == _FIELD_COUNT:
+                    yield _parse_record(fields)
+                    fields = []
+            chunk = stream.read(_READ_SIZE)
+
+        completed = True
+        # Surfaces errors such as unknown revisions
+        process.wait()
+    finally:
+        if not completed:
+            # Stop git when the consumer stops early
+            with contextlib.suppress(Exception):
+                process.proc.kill()
+                process.proc.wait()
@@ -1,9 +1,9 @@
 """Commit-based searchers for GitHound."""
 
 import re
-import time
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from typing import Any
 
 try:
     from rapidfuzz import fuzz
@@ -17,8 +17,11 @@ except ImportError:
 
     fuzz = mock_rapidfuzz.fuzz  # type: ignore[assignment]
 
-from ..models import CommitInfo, SearchQuery, SearchResult, SearchType
-from .base import CacheableSearcher, SearchContext
+from ..models import SearchQuery, SearchResult, SearchType
+from .base import BaseSearcher, CacheableSearcher, CommitVisitor, SearchContext
+from .commit_reader import iter_commit_records
+from .commit_stats import CommitStatsBatch, build_commit_info
+from .executor import closing_on_lane
 
 
 class CommitHashSearcher(CacheableSearcher):
@@ -44,20 +47,7 @@ class CommitHashSearcher(CacheableSearcher):
             commit = context.repo.commit(commit_hash)
 
             # Create commit info
-            commit_info = CommitInfo(
-                hash=commit.hexsha,
-                short_hash=commit.hexsha[:8],
-                author_name=commit.author.name,
-                author_email=commit.author.email,
-                committer_name=commit.committer.name,
-                committer_email=commit.committer.email,
-                message=commit.message.strip(),
-                date=datetime.fromtimestamp(commit.committed_date),
-                files_changed=len(commit.stats.files),
-                insertions=commit.stats.total["insertions"],
-                deletions=commit.stats.total["deletions"],
-                parents=[parent.hexsha for parent in commit.parents],
-            )
+            commit_info = build_commit_info(commit)
 
             # Create search result
             result = SearchResult(
@@ -85,6 +75,8 @@ class CommitHashSearcher(CacheableSearcher):
 class AuthorSearcher(CacheableSearcher):
     """Searcher for author names and emails with fuzzy matching."""
 
+    per_commit_results = True
+
     def __init__(self) -> None:
         super().__init__("author", "author")
 
@@ -104,155 +96,130 @@ class AuthorSearcher(CacheableSearcher):
 
     async def search(self, context: SearchContext) -> AsyncGenerator[SearchResult, None]:
         """Search for commits by author."""
-        author_pattern = context.query.author_pattern
-        if not author_pattern:
+        visitor = self.create_commit_visitor(context)
+        if visitor is None:
             return
 
-        search_start_time = time.time()
-        self._report_progress(context, f"Searching for author '{author_pattern}'...", 0.0)
+        self._report_progress(
+            context, f"Searching for author '{context.query.author_pattern}'...", 0.0
+        )
 
         # Get branch to search
         branch = context.branch or context.repo.active_branch.name
 
+        try:
+            # Stream commit metadata from a single git log process, stopping
+            # it as soon as the search ends even when history remains
+            stream = iter_commit_records(context.repo, branch)
+            async with closing_on_lane(context.executor, stream) as commits:
+                async for result in self._drive_visitor(context, visitor, commits):
+                    yield result
+
+        except Exception as e:
+            self._report_progress(context, f"Error searching authors: {e}", 1.0)
+
+        finally:
+            visitor.finish()
+
+    def create_commit_visitor(self, context: SearchContext) -> CommitVisitor | None:
+        """Create the author-matching visitor, also used by the shared history walk."""
+        if not context.query.author_pattern:
+            return None
+        return _AuthorVisitor(self, context)
+
+
+class _AuthorVisitor(CommitVisitor):
+    """Matches commit authors by name or email."""
+
+    label = "Author search"
+
+    def __init__(self, searcher: BaseSearcher, context: SearchContext) -> None:
+        super().__init__(searcher, context)
+        self.author_pattern = context.query.author_pattern or ""
+
         # Compile regex pattern if not using fuzzy search
-        regex_pattern = None
+        self.regex_pattern: re.Pattern[str] | None = None
         if not context.query.fuzzy_search:
             try:
                 flags = 0 if context.query.case_sensitive else re.IGNORECASE
-                regex_pattern = re.compile(author_pattern, flags)
+                self.regex_pattern = re.compile(self.author_pattern, flags)
             except re.error:
                 # If regex is invalid, fall back to simple string matching
                 pass
 
-        commits_searched = 0
-        results_found = 0
-
-        try:
-            # Iterate through commits
-            for commit in context.repo.iter_commits(branch):
-                commits_searched += 1
-
-                # Check author name and email
-                author_name = commit.author.name
-                author_email = commit.author.email
-
-                match_score = 0.0
-                match_field = None
-
-                if context.query.fuzzy_search:
-                    # Use fuzzy matching
-                    name_score = (
-                        fuzz.ratio(
-                            author_pattern.lower() if author_pattern is not None else "",
-                            author_name.lower(),
-                        )
-                        / 100.0
-                    )
-                    email_score = (
-                        fuzz.ratio(
-                            author_pattern.lower() if author_pattern is not None else "",
-                            author_email.lower(),
-                        )
-                        / 100.0
-                    )
-
-                    if name_score >= context.query.fuzzy_threshold:
-                        match_score = name_score
-                        match_field = "name"
-                    elif email_score >= context.query.fuzzy_threshold:
-                        match_score = email_score
-                        match_field = "email"
-                else:
-                    # Use regex or string matching
-                    if regex_pattern:
-                        if regex_pattern.search(author_name) or regex_pattern.search(author_email):
-                            match_score = 1.0
-                            match_field = "name" if regex_pattern.search(author_name) else "email"
-                    else:
-                        # Simple string matching
-                        search_term = (
-                            author_pattern
-                            if context.query.case_sensitive
-                            else author_pattern.lower()
-                        )
-                        name_check = (
-                            author_name if context.query.case_sensitive else author_name.lower()
-                        )
-                        email_check = (
-                            author_email if context.query.case_sensitive else author_email.lower()
-                        )
-
-                        if search_term in name_check:
-                            match_score = 1.0
-                            match_field = "name"
-                        elif search_term in email_check:
-                            match_score = 1.0
-                            match_field = "email"
-
-                if match_score > 0:
-                    # Create commit info
-                    commit_info = CommitInfo(
-                        hash=commit.hexsha,
-                        short_hash=commit.hexsha[:8],
-                        author_name=author_name,
-                        author_email=author_email,
-                        committer_name=commit.committer.name,
-                        committer_email=commit.committer.email,
-                        message=commit.message.strip(),
-                        date=datetime.fromtimestamp(commit.committed_date),
-                        files_changed=len(commit.stats.files),
-                        insertions=commit.stats.total["insertions"],
-                        deletions=commit.stats.total["deletions"],
-                        parents=[parent.hexsha for parent in commit.parents],
-                    )
-
-                    # Create search result
-                    result = SearchResult(
-                        commit_hash=commit.hexsha,
-                        file_path=context.repo.working_dir,
-                        line_number=None,
-                        matching_line=None,
-                        search_type=SearchType.AUTHOR,
-                        relevance_score=match_score,
-                        commit_info=commit_info,
-                        match_context={
-                            "search_term": author_pattern,
-                            "matched_field": match_field,
-                            "matched_value": author_name if match_field == "name" else author_email,
-                        },
-                        search_time_ms=self._calculate_search_time_ms(search_start_time),
-                    )
-
-                    results_found += 1
-                    yield result
-
-                # Report progress every 100 commits
-                if commits_searched % 100 == 0:
-                    # Cap at 90% until done
-                    progress = min(commits_searched / 1000, 0.9)
-                    self._report_progress(
-                        context,
-                        f"Searched {commits_searched} commits, found {results_found} matches",
-                        progress,
-                    )
-
-        except Exception as e:
-            self._report_progress(context, f"Error searching authors: {e}", 1.0)
-
-        finally:
-            self._update_metrics(
-                total_commits_searched=commits_searched, total_results_found=results_found
-            )
-            self._report_progress(
-                context,
-                f"Author search completed: {results_found} matches in {commits_searched} commits",
-                1.0,
+        # Diff statistics of matching commits are resolved in bulk
+        self.stats_batch = CommitStatsBatch(context.repo)
+
+    def match(self, commit: Any) -> list[SearchResult]:
+        """Match the commit's author name and email."""
+        query = self.context.query
+        author_pattern = self.author_pattern
+        regex_pattern = self.regex_pattern
+
+        # Check author name and email
+        author_name = commit.author.name
+        author_email = commit.author.email
+
+        match_score = 0.0
+        match_field = None
+
+        if query.fuzzy_search:
+            # Use fuzzy matching
+            name_score = fuzz.ratio(author_pattern.lower(), author_name.lower()) / 100.0
+            email_score = fuzz.ratio(author_pattern.lower(), author_email.lower()) / 100.0
+
+            if name_score >= query.fuzzy_threshold:
+                match_score = name_score
+                match_field = "name"
+            elif email_score >= query.fuzzy_threshold:
+                match_score = email_score
+                match_field = "email"
+        else:
+            # Use regex or string matching
+            if regex_pattern:
+                if regex_pattern.search(author_name) or regex_pattern.search(author_email):
+                    match_score = 1.0
+                    match_field = "name" if regex_pattern.search(author_name) else "email"
+            else:
+                # Simple string matching
+                search_term = author_pattern if query.case_sensitive else author_pattern.lower()
+                name_check = author_name if query.case_sensitive else author_name.lower()
+                email_check = author_email if query.case_sensitive else author_email.lower()
+
+                if search_term in name_check:
+                    match_score = 1.0
+                    match_field = "name"
+                elif search_term in email_check:
+                    match_score = 1.0
+                    match_field = "email"
+
+        if match_score <= 0:
+            return []
+
+        return [
+            SearchResult(
+                commit_hash=commit.hexsha,
+                file_path=self.context.repo.working_dir,
+                line_number=None,
+                matching_line=None,
+                search_type=SearchType.AUTHOR,
+                relevance_score=match_score,
+                commit_info=build_commit_info(commit, self.stats_batch),
+                match_context={
+                    "search_term": author_pattern,
+                    "matched_field": match_field,
+                    "matched_value": author_name if match_field == "name" else author_email,
+                },
+                search_time_ms=self.searcher._calculate_search_time_ms(self.start_time),
             )
+        ]
 
 
 class MessageSearcher(CacheableSearcher):
     """Searcher for commit messages with regex and fuzzy matching."""
 
+    per_commit_results = True
+
     def __init__(self) -> None:
         super().__init__("message", "message")
 
@@ -274,116 +241,105 @@ class MessageSearcher(CacheableSearcher):
 
     async def search(self, context: SearchContext) -> AsyncGenerator[SearchResult, None]:
         """Search for commits by message content."""
-        message_pattern = context.query.message_pattern
-        if not message_pattern:
+        visitor = self.create_commit_visitor(context)
+        if visitor is None:
             return
 
-        search_start_time = time.time()
-        self._report_progress(context, f"Searching commit messages for '{message_pattern}'...", 0.0)
+        self._report_progress(
+            context, f"Searching commit messages for '{context.query.message_pattern}'...", 0.0
+        )
 
         branch = context.branch or context.repo.active_branch.name
 
-        # Compile regex pattern if not using fuzzy search
-        regex_pattern = None
-        if not context.query.fuzzy_search:
-            try:
-                flags = 0 if context.query.case_sensitive else re.IGNORECASE
-                regex_pattern = re.compile(message_pattern, flags)
-            except re.error:
-                pass
-
-        commits_searched = 0
-        results_found = 0
-
         try:
-            for commit in context.repo.iter_commits(branch):
-                commits_searched += 1
-
-                message = commit.message.strip()
-                match_score = 0.0
-
-                if context.query.fuzzy_search:
-                    # Use fuzzy matching
-                    score = (
-                        fuzz.partial_ratio(
-                            message_pattern.lower() if message_pattern is not None else "",
-                            message.lower(),
-                        )
-                        / 100.0
-                    )
-                    if score >= context.query.fuzzy_threshold:
-                        match_score = score
-                else:
-                    # Use regex or string matching
-                    if regex_pattern:
-                        if regex_pattern.search(message):
-                            match_score = 1.0
-                    else:
-                        search_term = (
-                            message_pattern
-                            if context.query.case_sensitive
-                            else message_pattern.lower()
-                        )
-                        message_check = message if context.query.case_sensitive else message.lower()
-                        if search_term in message_check:
-                            match_score = 1.0
-
-                if match_score > 0:
-                    commit_info = CommitInfo(
-                        hash=commit.hexsha,
-                        short_hash=commit.hexsha[:8],
-                        author_name=commit.author.name,
-                        author_email=commit.author.email,
-                        committer_name=commit.committer.name,
-                        committer_email=commit.committer.email,
-                        message=message,
-                        date=datetime.fromtimestamp(commit.committed_date),
-                        files_changed=len(commit.stats.files),
-                        insertions=commit.stats.total["insertions"],
-                        deletions=commit.stats.total["deletions"],
-                        parents=[parent.hexsha for parent in commit.parents],
-                    )
-
-                    result = SearchResult(
-                        commit_hash=commit.hexsha,
-                        file_path=context.repo.working_dir,
-                        line_number=None,
-                        matching_line=None,
-                        search_type=SearchType.MESSAGE,
-                        relevance_score=match_score,
-                        commit_info=commit_info,
-                        match_context={"search_term": message_pattern, "matched_message": message},
-                        search_time_ms=self._calculate_search_time_ms(search_start_time),
-                    )
-
-                    results_found += 1
+            # Stream commit metadata from a single git log process, stopping
+            # it as soon as the search ends even when history remains
+            stream = iter_commit_records(context.repo, branch)
+            async with closing_on_lane(context.executor, stream) as commits:
+                async for result in self._drive_visitor(context, visitor, commits):
                     yield result
 
-                if commits_searched % 100 == 0:
-                    progress = min(commits_searched / 1000, 0.9)
-                    self._report_progress(
-                        context,
-                        f"Searched {commits_searched} commits, found {results_found} matches",
-                        progress,
-                    )
-
         except Exception as e:
             self._report_progress(context, f"Error searching messages: {e}", 1.0)
 
         finally:
-            self._update_metrics(
-                total_commits_searched=commits_searched, total_results_found=results_found
-            )
-            self._report_progress(
-                context,
-                f"Message search completed: {results_found} matches in {commits_searched} commits",
-                1.0,
+            visitor.finish()
+
+    def create_commit_visitor(self, context: SearchContext) -> CommitVisitor | None:
+        """Create the message-matching visitor, also used by the shared history walk."""
+        if not context.query.message_pattern:
+            return None
+        return _MessageVisitor(self, context)
+
+
+class _MessageVisitor(CommitVisitor):
+    """Matches commit messages with regex, substring or fuzzy matching."""
+
+    label = "Message search"
+
+    def __init__(self, searcher: BaseSearcher, context: SearchContext) -> None:
+        super().__init__(searcher, context)
+        self.message_pattern = context.query.message_pattern or ""
+
+        # Compile regex pattern if not using fuzzy search
+        self.regex_pattern: re.Pattern[str] | None = None
+        if not context.query.fuzzy_search:
+            try:
+                flags = 0 if context.query.case_sensitive else re.IGNORECASE
+                self.regex_pattern = re.compile(self.message_pattern, flags)
+            except re.error:
+                pass
+
+        # Diff statistics of matching commits are resolved in bulk
+        self.stats_batch = CommitStatsBatch(context.repo)
+
+    def match(self, commit: Any) -> list[SearchResult]:
+        """Match the commit message."""
+        query = self.context.query
+        message_pattern = self.message_pattern
+
+        message = commit.message.strip()
+        match_score = 0.0
+
+        if query.fuzzy_search:
+            # Use fuzzy matching
+            score = fuzz.partial_ratio(message_pattern.lower(), message.lower()) / 100.0
+            if score >= query.fuzzy_threshold:
+                match_score = score
+        else:
+            # Use regex or string matching
+            if self.regex_pattern:
+                if self.regex_pattern.search(message):
+                    match_score = 1.0
+            else:
+                search_term = message_pattern if query.case_sensitive else message_pattern.lower()
+                message_check = message if query.case_sensitive else message.lower()
+                if search_term in message_check:
+                    match_score = 1.0
+
+        if match_score <= 0:
+            return []
+
+        return [
+            SearchResult(
+                commit_hash=commit.hexsha,
+                file_path=self.context.repo.working_dir,
+                line_number=None,
+                matching_line=None,
+                search_type=SearchType.MESSAGE,
+                relevance_score=match_score,
+                commit_info=build_commit_info(commit, self.stats_batch),
+                match_context={"search_term": message_pattern, "matched_message": message},
+                search_time_ms=self.searcher._calculate_search_time_ms(self.start_time),
             )
+        ]
 
 
 class DateRangeSearcher(CacheableSearcher):
     """Searcher for commits within a date range."""
 
+    per_commit_results = True
+
     def __init__(self) -> None:
         super().__init__("date_range", "date_range")
 
@@ -420,85 +376,71 @@ class DateRangeSearcher(CacheableSearcher):
 
     async def search(self, context: SearchContext) -> AsyncGenerator[SearchResult, None]:
         """Search for commits within date range."""
-        date_from = context.query.date_from
-        date_to = context.query.date_to
-
-        if not date_from and not date_to:
+        visitor = self.create_commit_visitor(context)
+        if visitor is None:
             return
 
-        search_start_time = time.time()
         self._report_progress(context, "Searching commits by date range...", 0.0)
 
         branch = context.branch or context.repo.active_branch.name
 
-        commits_searched = 0
-        results_found = 0
-
         try:
-            for commit in context.repo.iter_commits(branch):
-                commits_searched += 1
-
-                commit_date = datetime.fromtimestamp(commit.committed_date)
-
-                # Check date range
-                in_range = True
-                if date_from and commit_date < date_from:
-                    in_range = False
-                if date_to and commit_date > date_to:
-                    in_range = False
-
-                if in_range:
-                    commit_info = CommitInfo(
-                        hash=commit.hexsha,
-                        short_hash=commit.hexsha[:8],
-                        author_name=commit.author.name,
-                        author_email=commit.author.email,
-                        committer_name=commit.committer.name,
-                        committer_email=commit.committer.email,
-                        message=commit.message.strip(),
-                        date=commit_date,
-                        files_changed=len(commit.stats.files),
-                        insertions=commit.stats.total["insertions"],
-                        deletions=commit.stats.total["deletions"],
-                        parents=[parent.hexsha for parent in commit.parents],
-                    )
-
-                    result = SearchResult(
-                        commit_hash=commit.hexsha,
-                        file_path=context.repo.working_dir,
-                        line_number=None,
-                        matching_line=None,
-                        search_type=SearchType.DATE_RANGE,
-                        relevance_score=1.0,  # All matches in range are equally relevant
-                        commit_info=commit_info,
-                        match_context={
-                            "date_from": date_from.isoformat() if date_from else None,
-                            "date_to": date_to.isoformat() if date_to else None,
-                            "commit_date": commit_date.isoformat(),
-                        },
-                        search_time_ms=self._calculate_search_time_ms(search_start_time),
-                    )
-
-                    results_found += 1
+            # Stream commit metadata from a single git log process, stopping
+            # it as soon as the search ends even when history remains
+            stream = iter_commit_records(context.repo, branch)
+            async with closing_on_lane(context.executor, stream) as commits:
+                async for result in self._drive_visitor(context, visitor, commits):
                     yield result
 
-                if commits_searched % 100 == 0:
-                    progress = min(commits_searched / 1000, 0.9)
-                    self._report_progress(
-                        context,
-                        f"Searched {commits_searched} commits, found {results_found} matches",
-                        progress,
-                    )
-
         except Exception as e:
             self._report_progress(context, f"Error searching by date: {e}", 1.0)
 
         finally:
-            self._update_metrics(
-                total_commits_searched=commits_searched, total_results_found=results_found
-            )
-            self._report_progress(
-                context,
-                f"Date range search completed: {results_found} matches in {commits_searched} commits",
-                1.0,
+            visitor.finish()
+
+    def create_commit_visitor(self, context: SearchContext) -> CommitVisitor | None:
+        """Create the date-range visitor, also used by the shared history walk."""
+        if not context.query.date_from and not context.query.date_to:
+            return None
+        return _DateRangeVisitor(self, context)
+
+
+class _DateRangeVisitor(CommitVisitor):
+    """Matches commits whose commit date falls within the query's range."""
+
+    label = "Date range search"
+
+    def __init__(self, searcher: BaseSearcher, context: SearchContext) -> None:
+        super().__init__(searcher, context)
+        # Diff statistics of matching commits are resolved in bulk
+        self.stats_batch = CommitStatsBatch(context.repo)
+
+    def match(self, commit: Any) -> list[SearchResult]:
+        """Match the commit date against the range."""
+        date_from = self.context.query.date_from
+        date_to = self.context.query.date_to
+        commit_date = datetime.fromtimestamp(commit.committed_date)
+
+        # Check date range
+        if date_from and commit_date < date_from:
+            return []
+        if date_to and commit_date > date_to:
+            return []
+
+        return [
+            SearchResult(
+                commit_hash=commit.hexsha,
+                file_path=self.context.repo.working_dir,
+                line_number=None,
+                matching_line=None,
+                search_type=SearchType.DATE_RANGE,
+                relevance_score=1.0,  # All matches in range are equally relevant
+                commit_info=build_commit_info(commit, self.stats_batch),
+                match_context={
+                    "date_from": date_from.isoformat() if date_from else None,
+                    "date_to": date_to.isoformat() if date_to else None,
+                    "commit_date": commit_date.isoformat(),
+                },
+                search_time_ms=self.searcher._calculate_search_time_ms(self.start_time),
             )
+        ]
@@ -0,0 +1,188 @@
+"""Deferred and batched commit statistics.
+
+``commit.stats`` runs one ``git diff --numstat`` per commit, which dominates
+the cost of building ``CommitInfo`` objects for large result sets even though
+most callers never look at the statistics. This module builds CommitInfo with
+deferred statistics and resolves them in bulk with a single
+``git log --no-walk --numstat`` call per batch of commits.
+
+Statistics match GitPython's ``commit.stats``: merge commits are diffed
+against their first parent, root commits against the empty tree, and
+renames are not detected.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from git import GitCommandError
+
+from ..models import CommitInfo, CommitStats
+
+# Commits resolved per ``git log`` invocation
+DEFAULT_STATS_BATCH_SIZE = 200
+
+# Separates commits in the batched ``git log`` output
+_COMMIT_MARKER = "\x00"
+
+
+def stats_from_commit(commit: Any) -> CommitStats:
+    """Compute (files_changed, insertions, deletions) with GitPython's ``commit.stats``."""
+    stats = commit.stats
+    return (
+        len(stats.files),
+        stats.total.get("insertions", 0),
+        stats.total.get("deletions", 0),
+    )
+
+
+def parse_numstat_log(output: str) -> dict[str, CommitStats]:
+    """Parse ``git log --format=%x00%H --numstat`` output into per-commit stats."""
+    results: dict[str, CommitStats] = {}
+    for chunk in output.split(_COMMIT_MARKER):
+        lines = chunk.strip().splitlines()
+        if not lines:
+            continue
+
+        files_changed = insertions = deletions = 0
+        for line in lines[1:]:
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            files_changed += 1
+            # Binary files report "-" for both counts
+            insertions += int(parts[0]) if parts[0].isdigit() else 0
+            deletions += int(parts[1]) if parts[1].isdigit() else 0
+
+        results[lines[0].strip()] = (files_changed, insertions, deletions)
+    return results
+
+
+def load_commit_stats(
+    repo: Any, shas: Iterable[str], batch_size: int = DEFAULT_STATS_BATCH_SIZE
+) -> dict[str, CommitStats]:
+    """Compute statistics for many commits with one ``git log`` call per batch.
+
+    Commits that cannot be resolved this way (for example when the git
+    command fails) are simply absent from the result.
+
+    Args:
+        repo: The repository the commits belong to.
+        shas: Commit hashes to resolve.
+        batch_size: Maximum number of commits per ``git log`` invocation.
+
+    Returns:
+        Mapping of commit hash to (files_changed, insertions, deletions).
+    """
+    unique_shas = list(dict.fromkeys(shas))
+    results: dict[str, CommitStats] = {}
+
+    for offset in range(0, len(unique_shas), batch_size):
+        batch = unique_shas[offset : offset + batch_size]
+        try:
+            output = repo.git.log(
+                "--no-walk=unsorted",
+                "--numstat",
+                "--no-renames",
+                "-m",
+                "--first-parent",
+                "--format=%x00%H",
+                *batch,
+            )
+        except (GitCommandError, OSError, ValueError):
+            continue
+
+        if isinstance(output, str):
+            results.update(parse_numstat_log(output))
+
+    return results
+
+
+def resolve_commit_stats(repo: Any, commits: Iterable[Any]) -> dict[str, CommitStats]:
+    """Resolve statistics for commits in bulk, falling back to ``commit.stats``."""
+    commit_list = list(commits)
+    results = load_commit_stats(repo, [commit.hexsha for commit in commit_list])
+
+    for commit in commit_list:
+        if commit.hexsha not in results:
+            try:
+                # Streamed commit records carry no stats; load the full commit
+                if not hasattr(commit, "stats"):
+                    commit = repo.commit(commit.hexsha)
+                results[commit.hexsha] = stats_from_commit(commit)
+            except (AttributeError, KeyError, TypeError, ValueError, GitCommandError):
+                results[commit.hexsha] = (0, 0, 0)
+    return results
+
+
+class CommitStatsBatch:
+    """Resolves deferred commit statistics for one search in batches.
+
+    Commits are registered when their CommitInfo is built. The first time
+    any registered commit's statistics are needed, up to ``batch_size``
+    pending commits are resolved together with a single ``git log`` call.
+    """
+
+    def __init__(self, repo: Any, batch_size: int = DEFAULT_STATS_BATCH_SIZE) -> None:
+        self.repo = repo
+        self.batch_size = max(1, batch_size)
+        self._pending: dict[str, Any] = {}
+        self._stats: dict[str, CommitStats] = {}
+
+    def register(self, commit: Any) -> None:
+        """Queue a commit for batched statistics resolution."""
+        if commit.hexsha not in self._stats:
+            self._pending[commit.hexsha] = commit
+
+    def get(self, sha: str) -> CommitStats:
+        """Get statistics for a registered commit, resolving a batch if needed."""
+        stats = self._stats.get(sha)
+        if stats is not None:
+            return stats
+
+        commit = self._pending.get(sha)
+        if commit is None:
+            return (0, 0, 0)
+
+        # Resolve the requested commit together with the next pending ones
+        others = (pending for pending_sha, pending in self._pending.items() if pending_sha != sha)
+        batch = [commit, *islice(others, self.batch_size - 1)]
+        self._stats.update(resolve_commit_stats(self.repo, batch))
+        for resolved in batch:
+            self._pending.pop(resolved.hexsha, None)
+
+        return self._stats[sha]
+
+
+def build_commit_info(commit: Any, stats_batch: CommitStatsBatch | None = None) -> CommitInfo:
+    """Build a CommitInfo for a git commit with deferred diff statistics.
+
+    Args:
+        commit: GitPython commit object or streamed ``CommitRecord``.
+        stats_batch: Optional per-search batch used to resolve statistics for
+            many commits at once. Without it, ``commit.stats`` is used on demand,
+            which requires a full GitPython commit.
+
+    Returns:
+        CommitInfo whose files_changed/insertions/deletions are computed lazily.
+    """
+    if stats_batch is not None:
+        stats_batch.register(commit)
+        loader = partial(stats_batch.get, commit.hexsha)
+    else:
+        loader = partial(stats_from_commit, commit)
+
+    return CommitInfo.deferred(
+        loader,
+        hash=commit.hexsha,
+        short_hash=commit.hexsha[:8],
+        author_name=commit.author.name,
+        author_email=commit.author.email,
+        committer_name=commit.committer.name,
+        committer_email=commit.committer.email,
+        message=commit.message.strip(),
+        date=datetime.fromtimestamp(commit.committed_date),
+        parents=[parent.hexsha for parent in commit.parents],
+    )
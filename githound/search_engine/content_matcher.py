@@ -0,0 +1,402 @@
+"""Pluggable content matching engines for blob content search.
+
+Content search used to fork one ``rg --json`` process per blob, which makes
+process spawning the dominant cost on large histories. This module provides
+an in-process engine (the default) built on a precompiled byte-level regex
+with a literal fast path, and keeps ripgrep available as an opt-in backend.
+Engines can also search a batch of blobs at once; ripgrep uses this to scan
+hundreds of blobs per process instead of forking once per blob.
+
+Every engine returns the same match dictionaries::
+
+    {"line_number": int, "text": str, "column_start": int, "column_end": int}
+
+``line_number`` is 1-based, ``text`` is the stripped matching line and the
+column offsets are byte offsets of the first match within that line, exactly
+as reported in ripgrep's ``submatches``.
+"""
+
+import json
+import re
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .positional_query import parse_positional_query, tokenize_spans
+
+# Engine names accepted by create_content_matcher()
+REGEX_ENGINE = "regex"
+RIPGREP_ENGINE = "ripgrep"
+CONTENT_ENGINES = (REGEX_ENGINE, RIPGREP_ENGINE)
+DEFAULT_CONTENT_ENGINE = REGEX_ENGINE
+
+# Default number of blobs handed to a batching engine per invocation
+DEFAULT_BATCH_SIZE = 256
+
+# Characters that make a pattern a regex rather than a plain literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Same heuristic git uses: a NUL byte in the first 8000 bytes means binary
+_BINARY_SNIFF_BYTES = 8000
+
+# Returns the (start, end) byte span of the first hit at or after a position
+_HitFinder = Callable[[int], tuple[int, int] | None]
+
+
+class ContentMatcher(ABC):
+    """Abstract base class for content matching engines."""
+
+    name: str = ""
+    # Whether search_batch() is cheaper than calling search() per blob
+    supports_batching: bool = False
+
+    def __init__(self, pattern: str, case_sensitive: bool = False) -> None:
+        self.pattern = pattern
+        self.case_sensitive = case_sensitive
+
+    @abstractmethod
+    def search(self, content: bytes) -> list[dict[str, Any]]:
+        """Search blob content and return one match dictionary per matching line."""
+        pass
+
+    def search_batch(self, blobs: list[bytes]) -> list[list[dict[str, Any]]]:
+        """Search several blobs and return the matches for each, in input order."""
+        return [self.search(content) for content in blobs]
+
+
+class RegexContentMatcher(ContentMatcher):
+    """In-process matcher using a precompiled byte-level regex.
+
+    The pattern is compiled once per search and applied directly to the raw
+    blob bytes. Plain literals skip the regex engine entirely and use
+    ``bytes.find``. Line boundaries and line numbers are only computed around
+    hits, so non-matching blobs are never split into lines.
+    """
+
+    name = REGEX_ENGINE
+
+    def __init__(self, pattern: str, case_sensitive: bool = False) -> None:
+        """Compile the pattern.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
+        """
+        super().__init__(pattern, case_sensitive)
+        encoded = pattern.encode("utf-8")
+
+        self.is_literal = bool(encoded) and not any(
+            char in _REGEX_METACHARACTERS for char in pattern
+        )
+        # bytes.lower() only folds ASCII, which matches re.IGNORECASE on bytes
+        self._literal = encoded if case_sensitive else encoded.lower()
+
+        flags = re.MULTILINE
+        if not case_sensitive:
+            flags |= re.IGNORECASE
+        self._regex: re.Pattern[bytes] = re.compile(encoded, flags)
+
+    def search(self, content: bytes) -> list[dict[str, Any]]:
+        """Search blob content in-process."""
+        if b"\x00" in content[:_BINARY_SNIFF_BYTES]:
+            # Binary blob, ripgrep suppresses these as well
+            return []
+
+        if self.is_literal:
+            haystack = content if self.case_sensitive else content.lower()
+            return self._collect(content, self._find_literal(haystack))
+        return self._collect(content, self._find_regex(content))
+
+    def _find_literal(self, haystack: bytes) -> _HitFinder:
+        """Build a hit finder backed by ``bytes.find``."""
+        needle = self._literal
+        needle_len = len(needle)
+
+        def find(pos: int) -> tuple[int, int] | None:
+            start = haystack.find(needle, pos)
+            if start == -1:
+                return None
+            return start, start + needle_len
+
+        return find
+
+    def _find_regex(self, content: bytes) -> _HitFinder:
+        """Build a hit finder backed by the compiled regex."""
+        regex_search = self._regex.search
+
+        def find(pos: int) -> tuple[int, int] | None:
+            match = regex_search(content, pos)
+            if match is None:
+                return None
+            return match.start(), match.end()
+
+        return find
+
+    @staticmethod
+    def _collect(content: bytes, find: _HitFinder) -> list[dict[str, Any]]:
+        """Expand hits into per-line match dictionaries."""
+        results: list[dict[str, Any]] = []
+        content_len = len(content)
+        line_number = 1
+        counted_upto = 0
+        pos = 0
+
+        while pos <= content_len:
+            hit = find(pos)
+            if hit is None:
+                break
+            start, end = hit
+
+            line_start = content.rfind(b"\n", 0, start) + 1
+            line_end = content.find(b"\n", start)
+            if line_end == -1:
+                line_end = content_len
+
+            # An empty match past the final newline is not on a real line
+            if start == content_len and (content_len == 0 or content.endswith(b"\n")):
+                break
+
+            line_number += content.count(b"\n", counted_upto, line_start)
+            counted_upto = line_start
+
+            line = content[line_start:line_end]
+            results.append(
+                {
+                    "line_number": line_number,
+                    "text": line.decode("utf-8", errors="replace").strip(),
+                    "column_start": start - line_start,
+                    "column_end": min(end, line_end) - line_start,
+                }
+            )
+
+            # Only the first hit per line is reported; resume on the next line
+            pos = line_end + 1
+
+        return results
+
+
+class PositionalContentMatcher(ContentMatcher):
+    """Matcher for phrase and proximity queries (see ``positional_query``).
+
+    Blobs are tokenized like the inverted index tokenizes them, so matching
+    is always case-insensitive and agrees with the index's positional
+    search. A match is reported on the line of its first token, with
+    columns spanning up to its last token on that line.
+    """
+
+    name = "positional"
+
+    def __init__(self, pattern: str, case_sensitive: bool = False) -> None:
+        """Parse the query.
+
+        Raises:
+            ValueError: If the query is malformed.
+        """
+        super().__init__(pattern, case_sensitive)
+        self.query = parse_positional_query(pattern)
+        self._terms = set(self.query.terms)
+
+    def search(self, content: bytes) -> list[dict[str, Any]]:
+        """Search blob content for the query."""
+        if b"\x00" in content[:_BINARY_SNIFF_BYTES]:
+            return []
+
+        text = content.decode("utf-8", errors="replace")
+        tokens = tokenize_spans(text)
+        positions: dict[str, list[int]] = {}
+        for position, (token, _, _) in enumerate(tokens):
+            if token in self._terms:
+                positions.setdefault(token, []).append(position)
+        if len(positions) < len(self._terms):
+            return []
+
+        results: list[dict[str, Any]] = []
+        line_number = 1
+        counted_upto = 0
+        last_line_start = -1
+        for first, last in self.query.matches(positions):
+            start = tokens[first][1]
+            end = tokens[last][2]
+            line_start = text.rfind("\n", 0, start) + 1
+            if line_start == last_line_start:
+                # Only the first match per line is reported
+                continue
+            last_line_start = line_start
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+
+            line_number += text.count("\n", counted_upto, line_start)
+            counted_upto = line_start
+            line = text[line_start:line_end]
+            results.append(
+                {
+                    "line_number": line_number,
+                    "text": line.strip(),
+                    "column_start": len(text[line_start:start].encode("utf-8")),
+                    "column_end": len(text[line_start : min(end, line_end)].encode("utf-8")),
+                }
+            )
+        return results
+
+
+class RipgrepContentMatcher(ContentMatcher):
+    """Matcher that runs blobs through an ``rg --json`` subprocess.
+
+    ``search`` pipes a single blob through stdin. ``search_batch`` writes a
+    whole batch of blobs into a temporary directory, named by their index,
+    and scans it with one ripgrep invocation, mapping each reported path
+    back to the blob it came from.
+    """
+
+    name = RIPGREP_ENGINE
+    supports_batching = True
+
+    def search(self, content: bytes) -> list[dict[str, Any]]:
+        """Search blob content with ripgrep.
+
+        Returns an empty list when ripgrep finds nothing or is not installed.
+
+        Raises:
+            subprocess.CalledProcessError: If ripgrep fails (e.g. invalid pattern).
+        """
+        rg_args = ["rg", "--json", self.pattern, "-"]
+        if not self.case_sensitive:
+            rg_args.append("-i")
+
+        try:
+            # Blob content is raw bytes, so the pipe must stay in binary mode
+            process = subprocess.run(rg_args, input=content, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            # ripgrep exit code 1 means no matches found, which is not an error
+            if e.returncode == 1:
+                return []
+            raise
+        except FileNotFoundError:
+            # ripgrep not found
+            return []
+
+        return parse_ripgrep_json(_decode_output(process.stdout))
+
+    def search_batch(self, blobs: list[bytes]) -> list[list[dict[str, Any]]]:
+        """Search a batch of blobs with a single ripgrep process.
+
+        Raises:
+            subprocess.CalledProcessError: If ripgrep fails (e.g. invalid pattern).
+        """
+        results: list[list[dict[str, Any]]] = [[] for _ in blobs]
+        if not blobs:
+            return results
+
+        with tempfile.TemporaryDirectory(prefix="githound-rg-") as batch_dir:
+            batch_root = Path(batch_dir)
+            for index, content in enumerate(blobs):
+                (batch_root / str(index)).write_bytes(content)
+
+            rg_args = [
+                "rg",
+                "--json",
+                "--no-config",
+                "--no-ignore",
+                "--hidden",
+                "-e",
+                self.pattern,
+            ]
+            if not self.case_sensitive:
+                rg_args.append("-i")
+            rg_args.append(batch_dir)
+
+            try:
+                process = subprocess.run(rg_args, capture_output=True, check=False)
+            except FileNotFoundError:
+                # ripgrep not found
+                return results
+
+        # Exit code 1 means no matches; 2 with output means some files were unreadable
+        if process.returncode not in (0, 1) and not process.stdout:
+            raise subprocess.CalledProcessError(
+                process.returncode, rg_args, process.stdout, process.stderr
+            )
+
+        for path, match in _iter_ripgrep_matches(_decode_output(process.stdout)):
+            try:
+                results[int(Path(path).name)].append(match)
+            except (ValueError, IndexError):
+                continue
+
+        return results
+
+
+def _decode_output(output: bytes | str) -> str:
+    """Decode ripgrep output captured in binary mode."""
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+def _iter_ripgrep_matches(output: str) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (path, match dictionary) pairs from ``rg --json`` output."""
+    for line in output.strip().split("\n"):
+        if not line:
+            continue
+
+        try:
+            match = json.loads(line)
+            if match["type"] == "match":
+                data = match["data"]
+                submatches = data.get("submatches") or [{}]
+                path = (data.get("path") or {}).get("text", "-")
+                yield path, {
+                    "line_number": data["line_number"],
+                    "text": data["lines"]["text"].strip(),
+                    "column_start": submatches[0].get("start", 0),
+                    "column_end": submatches[0].get("end", 0),
+                }
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            continue
+
+
+def parse_ripgrep_json(output: str) -> list[dict[str, Any]]:
+    """Parse ``rg --json`` output into match dictionaries, skipping invalid lines."""
+    return [match for _, match in _iter_ripgrep_matches(output)]
+
+
+_MATCHER_CLASSES: dict[str, type[ContentMatcher]] = {
+    REGEX_ENGINE: RegexContentMatcher,
+    RIPGREP_ENGINE: RipgrepContentMatcher,
+}
+
+
+def create_content_matcher(
+    pattern: str,
+    case_sensitive: bool = False,
+    engine: str = DEFAULT_CONTENT_ENGINE,
+    positional: bool = False,
+) -> ContentMatcher:
+    """Create a content matcher for the given engine.
+
+    Args:
+        pattern: Regex pattern to search for.
+        case_sensitive: Whether matching is case sensitive.
+        engine: Engine name, one of ``CONTENT_ENGINES``.
+        positional: Treat ``pattern`` as a phrase/proximity query instead
+            of a regex; every engine then uses ``PositionalContentMatcher``.
+
+    Returns:
+        A ready-to-use ContentMatcher.
+
+    Raises:
+        ValueError: If the engine name is unknown or a positional query is
+            malformed.
+        re.error: If the in-process engine is given an invalid pattern.
+    """
+    if positional:
+        return PositionalContentMatcher(pattern, case_sensitive)
+    matcher_class = _MATCHER_CLASSES.get(engine)
+    if matcher_class is None:
+        raise ValueError(
+            f"Unknown content engine '{engine}', expected one of: {', '.join(CONTENT_ENGINES)}"
+        )
+    return matcher_class(pattern, case_sensitive)
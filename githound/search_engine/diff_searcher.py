@@ -56,15 +56,23 @@ class DiffSearcher(CacheableSearcher):
         """Perform diff analysis."""
         self._report_progress(context, "Starting diff analysis...", 0.0)
 
-        # Check cache first
+        # Concurrent searches for the same key share one analysis
         cache_key = self._get_cache_key(context, "diff_analysis")
-        cached_results = await self._get_from_cache(context, cache_key)
-        if cached_results:
+        results, cached = await self._get_or_compute_cached(
+            context, cache_key, lambda: self._run_diff_analysis(context)
+        )
+        if cached:
             self._report_progress(context, "Using cached diff results", 1.0)
-            for result in cached_results:
-                yield result
-            return
 
+        # Yield results
+        for result in results:
+            yield result
+
+        if not cached:
+            self._report_progress(context, "Diff analysis completed", 1.0)
+
+    async def _run_diff_analysis(self, context: SearchContext) -> list[SearchResult]:
+        """Run the full diff analysis."""
         # Perform diff analysis
         results: list[SearchResult] = []
 
@@ -83,14 +91,7 @@ class DiffSearcher(CacheableSearcher):
         evolution_results = await self._analyze_file_evolution(context)
         results.extend(evolution_results)
 
-        # Cache results
-        await self._set_cache(context, cache_key, results)
-
-        # Yield results
-        for result in results:
-            yield result
-
-        self._report_progress(context, "Diff analysis completed", 1.0)
+        return results
 
     async def _analyze_recent_changes(self, context: SearchContext) -> list[SearchResult]:
         """Analyze recent changes in the repository."""
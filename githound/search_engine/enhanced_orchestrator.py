@@ -4,8 +4,6 @@ This module extends the base orchestrator with performance monitoring,
 query optimization, and intelligent result caching.
 """
 
-import hashlib
-import json
 import time
 from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
@@ -13,7 +11,13 @@ from typing import Any
 
 from git import Repo
 
-from ..models import SearchQuery, SearchResult
+from ..models import CommitInfo, SearchQuery, SearchResult, SearchType
+from ..utils.progress import CancellationToken
+from .cache_keys import UNRESOLVED_TIP, query_digest, resolve_tip, result_cache_key
+from .commit_stats import CommitStatsBatch, build_commit_info
+from .content_matcher import create_content_matcher
+from .executor import get_git_executor
+from .file_searcher import ContentSearcher
 from .indexer import IncrementalIndexer
 from .orchestrator import SearchOrchestrator
 from .performance_monitor import BottleneckDetector, PerformanceMonitor, SearchProfiler
@@ -50,6 +54,8 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
         # Result cache
         self.result_cache: dict[str, list[SearchResult]] = {}
         self.cache_max_size = 100
+        # Tip of the latest results cached for each query over a ref
+        self._cached_tips: dict[str, str] = {}
 
     def initialize_indexer(self, repo_path: Path, cache_dir: Path | None = None) -> None:
         """Initialize the incremental indexer.
@@ -87,23 +93,78 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
 
         return {"status": "indexing_disabled"}
 
-    def _make_cache_key(self, query: SearchQuery, branch: str | None) -> str:
-        """Create a cache key for a query."""
-        # Serialize query to JSON for consistent hashing
-        query_dict = {
-            "commit_hash": query.commit_hash,
-            "author_pattern": query.author_pattern,
-            "message_pattern": query.message_pattern,
-            "content_pattern": query.content_pattern,
-            "file_path_pattern": query.file_path_pattern,
-            "file_extensions": query.file_extensions,
-            "date_after": query.date_after.isoformat() if query.date_after else None,
-            "date_before": query.date_before.isoformat() if query.date_before else None,
-            "branch": branch,
-        }
+    def _make_cache_key(
+        self,
+        repo: Repo,
+        query: SearchQuery,
+        branch: str | None,
+        max_results: int | None,
+        tip: str | None = None,
+    ) -> str:
+        """Create a cache key for a query over the current tip of ``branch``."""
+        return result_cache_key("enhanced", repo, query, branch, max_results, tip=tip)
+
+    @staticmethod
+    def _scope_key(
+        repo: Repo, query: SearchQuery, branch: str | None, max_results: int | None
+    ) -> str:
+        """Identify a query over a ref regardless of where the ref points."""
+        return f"{repo.working_dir}:{branch or 'HEAD'}:{query_digest(query)}:{max_results}"
+
+    async def _incremental_base(
+        self,
+        repo: Repo,
+        query: SearchQuery,
+        branch: str | None,
+        max_results: int | None,
+        tip: str,
+    ) -> tuple[str, list[SearchResult]] | None:
+        """Find cached results for an ancestor of ``tip`` to extend.
 
-        query_json = json.dumps(query_dict, sort_keys=True)
-        return hashlib.md5(query_json.encode()).hexdigest()
+        Results of commit-by-commit searches over an older tip are still
+        valid for that tip's history, so only the commits added since need
+        to be searched. Analyses spanning refs or whole histories (branch,
+        diff, pattern, statistical, temporal, tag) can't be extended, nor can
+        searchers that ignore the searched range or dedupe across history.
+
+        Returns:
+            The cached tip and its results, or None to search in full
+        """
+        if tip == UNRESOLVED_TIP or query.has_advanced_analysis():
+            return None
+        for searcher in self._searchers:
+            if not searcher.per_commit_results and await searcher.can_handle(query):
+                return None
+        base_tip = self._cached_tips.get(self._scope_key(repo, query, branch, max_results))
+        if base_tip is None or base_tip == tip:
+            return None
+        cached = self.result_cache.get(
+            self._make_cache_key(repo, query, branch, max_results, base_tip)
+        )
+        if cached is None:
+            return None
+        try:
+            if not repo.is_ancestor(repo.commit(base_tip), repo.commit(tip)):
+                return None
+        except Exception:
+            return None
+        return base_tip, cached
+
+    @staticmethod
+    def _merge_results(
+        cached: list[SearchResult], delta: list[SearchResult], max_results: int | None
+    ) -> list[SearchResult]:
+        """Re-rank cached results together with results from new commits."""
+        # Stable sort: on equal scores, newer commits come first as in a full search
+        ranked = sorted(delta + cached, key=lambda r: r.relevance_score, reverse=True)
+        merged: list[SearchResult] = []
+        seen: set[tuple[Any, ...]] = set()
+        for result in ranked:
+            key = (result.search_type, result.commit_hash, result.file_path, result.line_number)
+            if key not in seen:
+                seen.add(key)
+                merged.append(result)
+        return merged[:max_results] if max_results else merged
 
     async def search(
         self,
@@ -113,6 +174,9 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
         progress_callback: Callable[[str, float], None] | None = None,
         cache: dict[str, Any] | None = None,
         max_results: int | None = None,
+        stream: bool = False,
+        stop_score: float = 1.0,
+        cancellation_token: CancellationToken | None = None,
     ) -> AsyncGenerator[SearchResult, None]:
         """Enhanced search with optimization and monitoring.
 
@@ -123,6 +187,9 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
             progress_callback: Progress callback
             cache: Optional cache dictionary
             max_results: Maximum results to return
+            stream: Yield results in arrival order instead of ranking them
+            stop_score: Relevance score at which a full top-k stops the search
+            cancellation_token: Optional token used to cancel the search
 
         Yields:
             SearchResult objects
@@ -151,7 +218,8 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
                         self.profiler.add_stage("query_optimization", opt_time)
 
             # Check cache
-            cache_key = self._make_cache_key(optimized_query, branch)
+            tip = resolve_tip(repo, branch)
+            cache_key = self._make_cache_key(repo, optimized_query, branch, max_results, tip)
             if cache_key in self.result_cache:
                 if self.monitor:
                     self.monitor.increment_counter("cache_hits")
@@ -193,19 +261,69 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
                 if self.monitor:
                     self.monitor.stop_timer("index_search")
 
+            scope_key = self._scope_key(repo, optimized_query, branch, max_results)
+            # Own the token so a timeout set by the base search is visible here
+            token = cancellation_token or CancellationToken()
+
+            # The branch advanced from a cached tip: search only the new commits
+            base = await self._incremental_base(repo, optimized_query, branch, max_results, tip)
+            if base is not None:
+                base_tip, cached_results = base
+                if self.monitor:
+                    self.monitor.increment_counter("incremental_searches")
+                    self.monitor.start_timer("incremental_search")
+
+                delta = []
+                async for result in super().search(
+                    repo,
+                    optimized_query,
+                    f"{base_tip}..{tip}",
+                    progress_callback,
+                    cache,
+                    max_results,
+                    stream=stream,
+                    stop_score=stop_score,
+                    cancellation_token=token,
+                ):
+                    delta.append(result)
+                results_list = self._merge_results(cached_results, delta, max_results)
+                # A partial delta would leave new commits unsearched in the cache
+                if not token.is_cancelled:
+                    self._cache_results(cache_key, results_list, scope_key, tip)
+
+                if self.monitor:
+                    delta_time = self.monitor.stop_timer("incremental_search")
+                    if self.profiler:
+                        self.profiler.add_stage(
+                            "incremental_search", delta_time, {"new_results": len(delta)}
+                        )
+
+                for result in results_list:
+                    yield result
+                return
+
             # Fall back to regular search
             if self.monitor:
                 self.monitor.start_timer("regular_search")
 
             results_list = []
             async for result in super().search(
-                repo, optimized_query, branch, progress_callback, cache, max_results
+                repo,
+                optimized_query,
+                branch,
+                progress_callback,
+                cache,
+                max_results,
+                stream=stream,
+                stop_score=stop_score,
+                cancellation_token=token,
             ):
                 results_list.append(result)
                 yield result
 
-            # Cache results
-            self._cache_results(cache_key, results_list)
+            # Partial results of a cancelled or timed-out search are not cached
+            if not token.is_cancelled:
+                self._cache_results(cache_key, results_list, scope_key, tip)
 
             if self.monitor:
                 search_time = self.monitor.stop_timer("regular_search")
@@ -241,63 +359,198 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
     ) -> list[SearchResult] | None:
         """Search using the inverted index.
 
+        Content indexes are keyed by blob SHA. Phrase/proximity queries are
+        answered from the token index's positional postings. Content
+        patterns are answered from the trigram index when the pattern
+        contains literals to narrow the candidate blobs by; otherwise the
+        token index ranks blobs by term frequency. Either way, each hit is
+        expanded to every commit and path where its blob was introduced.
+
         Returns:
             List of results if index search was successful, None otherwise
         """
-        if not self.indexer:
+        if not self.indexer or not query.content_pattern:
             return None
 
-        results = []
+        # Pick up an index generation published by another process
+        self.indexer.refresh()
+        limit = max_results or 100
+        lane = (self._executor or get_git_executor()).lane()
+
+        if query.positional_query:
+            # Phrase/proximity matches from positional postings, reported per line
+            try:
+                matches = self.indexer.search_content_positional(query.content_pattern, limit)
+            except ValueError:
+                return None
+            results = await lane.run(
+                self._verify_candidates,
+                repo,
+                query,
+                self.indexer,
+                [blob_sha for blob_sha, _ in matches],
+                limit,
+                "positional_index",
+            )
+            return results if results else None
 
-        # Search content index
-        if query.content_pattern:
-            content_matches = self.indexer.search_content(
-                query.content_pattern, limit=max_results or 100
+        # Narrow regex candidates by trigrams and verify them with the real pattern
+        candidates = self.indexer.regex_candidates(query.content_pattern)
+        if candidates is not None:
+            results = await lane.run(
+                self._verify_candidates, repo, query, self.indexer, candidates, limit
             )
+            return results if results else None
+
+        # Search content index
+        content_matches = self.indexer.search_content(query.content_pattern, limit=limit)
+        results = await lane.run(
+            self._expand_blob_matches, repo, query, self.indexer, content_matches, limit
+        )
+        return results if results else None
 
-            # Convert index results to SearchResult objects
-            for commit_hash, score in content_matches[: max_results or 100]:
+    @staticmethod
+    def _expand_blob_matches(
+        repo: Repo,
+        query: SearchQuery,
+        indexer: IncrementalIndexer,
+        content_matches: list[tuple[str, float]],
+        limit: int,
+    ) -> list[SearchResult]:
+        """Turn ranked blob hits from the token index into per-commit results."""
+        # Reuse the content searcher's file filters
+        searcher = ContentSearcher()
+        # Diff statistics are deferred and resolved in bulk if anyone reads them
+        stats_batch = CommitStatsBatch(repo)
+        commit_infos: dict[str, CommitInfo] = {}
+
+        results: list[SearchResult] = []
+        for blob_sha, score in content_matches:
+            for commit_hash, file_path in indexer.blob_locations(blob_sha):
+                if not searcher._should_search_file(file_path, query):
+                    continue
                 try:
-                    commit = repo.commit(commit_hash)
-                    from datetime import datetime
-
-                    from ..models import CommitInfo, SearchType
-
-                    commit_info = CommitInfo(
-                        hash=commit.hexsha,
-                        short_hash=commit.hexsha[:8],
-                        author_name=commit.author.name,
-                        author_email=commit.author.email,
-                        committer_name=commit.committer.name,
-                        committer_email=commit.committer.email,
-                        message=commit.message.strip(),
-                        date=datetime.fromtimestamp(commit.committed_date),
-                        files_changed=len(commit.stats.files),
-                        insertions=commit.stats.total["insertions"],
-                        deletions=commit.stats.total["deletions"],
-                        parents=[p.hexsha for p in commit.parents],
-                    )
+                    commit_info = commit_infos.get(commit_hash)
+                    if commit_info is None:
+                        commit_info = build_commit_info(repo.commit(commit_hash), stats_batch)
+                        commit_infos[commit_hash] = commit_info
+                except Exception:
+                    continue
 
-                    result = SearchResult(
-                        commit_hash=commit.hexsha,
-                        file_path=Path(""),
+                results.append(
+                    SearchResult(
+                        commit_hash=commit_hash,
+                        file_path=Path(file_path),
                         line_number=None,
                         matching_line=query.content_pattern,
                         search_type=SearchType.CONTENT,
                         relevance_score=score,
                         commit_info=commit_info,
-                        match_context={"source": "inverted_index"},
+                        match_context={"source": "inverted_index", "blob": blob_sha},
                         search_time_ms=0.0,
                     )
+                )
+                if len(results) >= limit:
+                    return results
+        return results
 
-                    results.append(result)
+    @staticmethod
+    def _verify_candidates(
+        repo: Repo,
+        query: SearchQuery,
+        indexer: IncrementalIndexer,
+        candidates: list[str],
+        limit: int,
+        source: str = "trigram_index",
+    ) -> list[SearchResult]:
+        """Run the content pattern over candidate blobs from an index.
+
+        Each candidate blob is read and matched once; its matches are then
+        reported at every commit and path the blob was introduced at.
+
+        Returns:
+            The best ``limit`` matching lines, by relevance
+        """
+        content_pattern = query.content_pattern or ""
+        matcher = create_content_matcher(
+            content_pattern, query.case_sensitive, positional=query.positional_query
+        )
+        # Reuse the content searcher's file filters and scoring
+        searcher = ContentSearcher()
+        stats_batch = CommitStatsBatch(repo)
+        commit_infos: dict[str, CommitInfo] = {}
+        start_time = time.time()
+
+        results: list[SearchResult] = []
+        for blob_sha in candidates:
+            locations = [
+                (commit_hash, file_path)
+                for commit_hash, file_path in indexer.blob_locations(blob_sha)
+                if searcher._should_search_file(file_path, query)
+            ]
+            if not locations:
+                continue
+
+            try:
+                content = repo.odb.stream(bytes.fromhex(blob_sha)).read()
+            except Exception:
+                continue
+            if query.max_file_size and len(content) > query.max_file_size:
+                continue
+
+            matches = matcher.search(content)
+            if not matches:
+                continue
+
+            for commit_hash, file_path in locations:
+                try:
+                    commit_info = commit_infos.get(commit_hash)
+                    if commit_info is None:
+                        commit_info = build_commit_info(repo.commit(commit_hash), stats_batch)
+                        commit_infos[commit_hash] = commit_info
                 except Exception:
                     continue
 
-        return results if results else None
+                for match in matches:
+                    results.append(
+                        SearchResult(
+                            commit_hash=commit_hash,
+                            file_path=Path(file_path),
+                            line_number=match.get("line_number"),
+                            matching_line=match.get("text"),
+                            search_type=SearchType.CONTENT,
+                            relevance_score=searcher._calculate_relevance_score(
+                                match, content_pattern, file_path
+                            ),
+                            commit_info=commit_info,
+                            match_context={
+                                "source": source,
+                                "search_pattern": content_pattern,
+                                "file_path": file_path,
+                                "blob": blob_sha,
+                                "line_number": match.get("line_number"),
+                                "column_start": match.get("column_start"),
+                                "column_end": match.get("column_end"),
+                            },
+                            search_time_ms=(time.time() - start_time) * 1000,
+                        )
+                    )
+
+        results.sort(key=lambda result: result.relevance_score, reverse=True)
+        return results[:limit]
 
-    def _cache_results(self, cache_key: str, results: list[SearchResult]) -> None:
-        """Cache search results."""
+    def _cache_results(
+        self,
+        cache_key: str,
+        results: list[SearchResult],
+        scope_key: str | None = None,
+        tip: str | None = None,
+    ) -> None:
+        """Cache search results.
+
+        With ``scope_key`` and ``tip``, the results cover the whole history
+        of ``tip`` and can be extended once the ref advances.
+        """
         # Evict oldest entry if cache is full
         if len(self.result_cache) >= self.cache_max_size:
             oldest_key = next(iter(self.result_cache))
@@ -305,6 +558,12 @@ class EnhancedSearchOrchestrator(SearchOrchestrator):
 
         self.result_cache[cache_key] = results
 
+        if scope_key is not None and tip is not None:
+            self._cached_tips.pop(scope_key, None)
+            if len(self._cached_tips) >= self.cache_max_size:
+                del self._cached_tips[next(iter(self._cached_tips))]
+            self._cached_tips[scope_key] = tip
+
     def get_performance_report(self) -> str:
         """Get a performance report."""
         if not self.monitor:
@@ -0,0 +1,234 @@
+"""Worker pool for blocking git I/O and content matching.
+
+GitPython calls, ``git`` subprocess pipes and content matching all block the
+calling thread. Run directly inside searcher coroutines they stall the event
+loop, so a single long search freezes every other request served by the same
+process (e.g. the FastAPI server). Searchers hand that work to a shared
+thread pool through a per-search ``SearchLane`` instead.
+
+Fairness: a lane lets its search occupy at most ``per_search_limit`` pool
+workers at a time, and the pool runs queued jobs in FIFO order, so concurrent
+searches take turns on the pool rather than one search filling its queue.
+A ``git.Repo``'s persistent ``cat-file`` pipes are not thread-safe, so code
+that reads a repository both on the event loop and in pool jobs at the same
+time must give each side its own ``Repo`` (as the orchestrator does for its
+concurrent searchers).
+
+CPU-bound matching that outgrows one interpreter can use a shared process
+pool from ``get_process_pool()`` instead; its workers open their own
+repositories.
+"""
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+G = TypeVar("G", bound=Generator[Any, Any, Any])
+
+# Pool size when none is configured, matching ThreadPoolExecutor's own default
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Pool jobs a single search may have in flight
+DEFAULT_PER_SEARCH_WORKERS = 1
+
+
+class GitExecutor:
+    """Thread pool shared by searches for blocking git I/O and matching."""
+
+    def __init__(
+        self, max_workers: int = 0, per_search_limit: int = DEFAULT_PER_SEARCH_WORKERS
+    ) -> None:
+        """Create the executor; the pool itself is started on first use.
+
+        Args:
+            max_workers: Number of worker threads (0 or less picks a default
+                based on the CPU count).
+            per_search_limit: Maximum number of jobs one search may run at once.
+        """
+        self.max_workers = max_workers if max_workers > 0 else DEFAULT_IO_WORKERS
+        self.per_search_limit = max(1, per_search_limit)
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def lane(self) -> "SearchLane":
+        """Create the lane one search uses to submit work to this executor."""
+        return SearchLane(self, self.per_search_limit)
+
+    def submit(self, func: Callable[..., T], *args: Any) -> "Future[T]":
+        """Submit a blocking call to the pool."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="githound-git"
+                )
+            pool = self._pool
+        return pool.submit(func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; it is restarted if the executor is used again."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class SearchLane:
+    """One search's bounded share of a GitExecutor.
+
+    Must be used from the event loop running the search.
+    """
+
+    def __init__(self, executor: GitExecutor, limit: int) -> None:
+        self.executor = executor
+        self._semaphore = asyncio.Semaphore(max(1, limit))
+        self._pending: set[Future[Any]] = set()
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the pool and wait for its result.
+
+        The lane slot is held until the call has actually finished, even if
+        the awaiting coroutine is cancelled while the call is running.
+        """
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        def release(done: Future[Any]) -> None:
+            self._pending.discard(done)
+            # The loop may already be closed if the search was abandoned
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._semaphore.release)
+
+        self._pending.add(future)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def drain(self) -> None:
+        """Wait until every call submitted through this lane has finished.
+
+        Calls keep running when the search awaiting them is cancelled, so a
+        search drains its lane before handing the repository back to callers.
+        """
+        pending = list(self._pending)
+        if pending:
+            await asyncio.wait([asyncio.wrap_future(future) for future in pending])
+
+
+_shared_executors: dict[tuple[int, int], GitExecutor] = {}
+_shared_lock = threading.Lock()
+
+
+def get_git_executor(
+    max_workers: int = 0, per_search_limit: int = DEFAULT_PER_SEARCH_WORKERS
+) -> GitExecutor:
+    """Get the process-wide executor for the given sizes.
+
+    Orchestrators created with the same configuration share one pool, so
+    concurrent requests are bounded by a single set of worker threads.
+    """
+    key = (max_workers if max_workers > 0 else DEFAULT_IO_WORKERS, max(1, per_search_limit))
+    with _shared_lock:
+        executor = _shared_executors.get(key)
+        if executor is None:
+            executor = GitExecutor(*key)
+            _shared_executors[key] = executor
+        return executor
+
+
+_process_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def get_process_pool(processes: int) -> ProcessPoolExecutor:
+    """Get the process-wide pool of worker processes of the given size.
+
+    Workers are started with ``spawn`` so they never inherit the parent's
+    threads or open git pipes. The pool is created on first use and reused
+    by later searches, so the start-up cost is paid once per process.
+    """
+    processes = max(1, processes)
+    with _shared_lock:
+        pool = _process_pools.get(processes)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            _process_pools[processes] = pool
+        return pool
+
+
+async def run_blocking(lane: SearchLane | None, func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call through a search lane.
+
+    Without a lane the call runs inline, followed by a yield to the event
+    loop so cancellation can still be delivered between calls.
+    """
+    if lane is None:
+        result = func(*args)
+        await asyncio.sleep(0)
+        return result
+    return await lane.run(func, *args)
+
+
+@contextlib.asynccontextmanager
+async def closing_on_lane(lane: SearchLane | None, stream: G) -> AsyncIterator[G]:
+    """Close a generator read through a lane once no pool call is using it.
+
+    When the search reading it is cancelled, a worker may still be inside
+    ``next()`` on the generator; closing it from the loop then would fail
+    with "generator already executing" and leave the git process behind it
+    running. The lane is drained first, so the generator is closed only
+    after the in-flight chunk completes.
+    """
+    try:
+        yield stream
+    finally:
+        if lane is not None:
+            await lane.drain()
+        stream.close()
+
+
+def loop_threadsafe(callback: Callable[..., None]) -> Callable[..., None]:
+    """Wrap a callback so calls made on pool workers run on the current event loop.
+
+    Progress callbacks (rich progress bars, web search state) are not
+    thread-safe, but visitors report progress from the worker running them.
+    Calls from the loop's own thread still run immediately.
+
+    Must be called from the event loop running the search.
+    """
+    loop = asyncio.get_running_loop()
+    loop_thread = threading.get_ident()
+
+    def call(*args: Any) -> None:
+        if threading.get_ident() == loop_thread:
+            callback(*args)
+            return
+        # The loop may already be closed if the search was abandoned
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(callback, *args)
+
+    return call
+
+
+def take(items: Iterator[T], count: int) -> tuple[list[T], bool]:
+    """Pull up to ``count`` items from a blocking iterator.
+
+    Returns:
+        The items and whether the iterator is exhausted.
+    """
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= count:
+            return chunk, False
+    return chunk, True
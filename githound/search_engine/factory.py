@@ -6,7 +6,14 @@ from typing import Any
 from ..models import SearchEngineConfig, SearchQuery, SearchType
 from .base import BaseSearcher
 from .branch_searcher import BranchSearcher
-from .cache import CacheBackend, MemoryCache, RedisCache, SearchCache
+from .cache import (
+    CacheBackend,
+    MemoryCache,
+    RedisCache,
+    SearchCache,
+    SQLiteCache,
+    TieredCache,
+)
 
 # Import all searchers
 from .commit_searcher import AuthorSearcher, CommitHashSearcher, DateRangeSearcher, MessageSearcher
@@ -14,6 +21,7 @@ from .diff_searcher import DiffSearcher
 
 # Import enhanced components
 from .enhanced_orchestrator import EnhancedSearchOrchestrator
+from .executor import GitExecutor, get_git_executor
 from .file_searcher import ContentSearcher, FilePathSearcher, FileTypeSearcher
 from .fuzzy_searcher import FuzzySearcher
 from .history_searcher import HistorySearcher
@@ -83,6 +91,7 @@ class SearchEngineFactory:
 
         # Register searchers based on configuration
         self._register_searchers(orchestrator, use_advanced)
+        orchestrator.set_executor(self._get_executor())
 
         # Configure caching if enabled
         if use_caching:
@@ -126,7 +135,11 @@ class SearchEngineFactory:
             DateRangeSearcher(),
             FilePathSearcher(),
             FileTypeSearcher(),
-            ContentSearcher(),
+            ContentSearcher(
+                engine=self.config.content_engine,
+                batch_size=self.config.content_batch_size,
+                processes=self.config.content_processes,
+            ),
         ]
 
         # Add fuzzy searcher if enabled
@@ -154,30 +167,56 @@ class SearchEngineFactory:
 
         return searchers
 
+    def _get_executor(self) -> GitExecutor:
+        """Get the shared worker pool for the configured sizes."""
+        return get_git_executor(self.config.io_workers, self.config.io_workers_per_search)
+
     def _create_cache(self) -> SearchCache:
         """Create cache backend based on configuration."""
         cache_config = self.config.get_cache_config()
 
         backend: CacheBackend
-        if cache_config["backend"] == "redis":
+        if cache_config["backend"] in ("redis", "tiered"):
             try:
                 backend = RedisCache(
                     url=cache_config["redis_url"], default_ttl=cache_config["ttl_seconds"]
                 )
-                logger.info("Using Redis cache backend")
+                if cache_config["backend"] == "tiered":
+                    backend = TieredCache(
+                        self._create_memory_cache(cache_config),
+                        backend,
+                        l1_ttl=cache_config["l1_ttl_seconds"],
+                        invalidation_channel=cache_config["invalidation_channel"],
+                    )
+                logger.info(f"Using {cache_config['backend']} cache backend")
             except Exception as e:
                 logger.warning(f"Failed to create Redis cache, falling back to memory: {e}")
-                backend = MemoryCache(
-                    max_size=cache_config["max_size"], default_ttl=cache_config["ttl_seconds"]
-                )
-        else:
-            backend = MemoryCache(
-                max_size=cache_config["max_size"], default_ttl=cache_config["ttl_seconds"]
+                backend = self._create_memory_cache(cache_config)
+        elif cache_config["backend"] == "sqlite" and cache_config["path"]:
+            backend = SQLiteCache(
+                cache_config["path"],
+                default_ttl=cache_config["ttl_seconds"],
+                max_size_mb=cache_config["max_disk_mb"],
             )
+            logger.info(f"Using sqlite cache backend at {cache_config['path']}")
+        else:
+            if cache_config["backend"] == "sqlite":
+                logger.warning("The sqlite cache needs cache_path; using memory instead")
+            backend = self._create_memory_cache(cache_config)
             logger.info("Using memory cache backend")
 
         return SearchCache(backend=backend, default_ttl=cache_config["ttl_seconds"])
 
+    @staticmethod
+    def _create_memory_cache(cache_config: dict[str, Any]) -> MemoryCache:
+        """Create the in-memory cache backend."""
+        return MemoryCache(
+            max_size=cache_config["max_size"],
+            default_ttl=cache_config["ttl_seconds"],
+            max_memory_mb=cache_config["max_memory_mb"],
+            admission=cache_config["admission"],
+        )
+
     def _create_ranking_engine(self) -> RankingEngine:
         """Create ranking engine with configured weights."""
         ranking_engine = RankingEngine()
@@ -257,6 +296,8 @@ class SearchEngineFactory:
             else:
                 logger.warning(f"Unknown searcher: {name}")
 
+        orchestrator.set_executor(self._get_executor())
+
         # Always add caching and ranking if enabled
         if self.config.enable_caching:
             cache = self._create_cache()
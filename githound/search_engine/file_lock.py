@@ -0,0 +1,131 @@
+"""Advisory file locks shared by threads and processes.
+
+Index writers in different processes (the CLI, each web worker, the MCP
+server) serialize on one lock file per index. The lock is advisory: it
+only excludes other holders of the same lock, and readers never take it.
+
+POSIX systems use ``fcntl.flock``; Windows locks the first byte of the
+file with ``msvcrt.locking``. The operating system drops the lock when the
+holding process exits, so a crashed writer never leaves the index locked.
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLockTimeout(TimeoutError):
+    """Raised when a file lock is not acquired within the timeout."""
+
+
+def _try_lock(fd: int) -> bool:
+    """Take the lock on an open file without blocking."""
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    if sys.platform == "win32":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """An exclusive advisory lock on a file.
+
+    Reentrant within a thread; other threads of the same process wait as
+    they would for another process.
+    """
+
+    def __init__(
+        self, path: Path, timeout: float | None = None, poll_interval: float = 0.05
+    ) -> None:
+        """
+        Args:
+            path: Lock file, created if missing
+            timeout: Seconds to wait for the lock, or None to wait forever
+            poll_interval: Seconds between attempts while another process holds it
+        """
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: int | None = None
+
+    @property
+    def is_locked(self) -> bool:
+        """Whether this process holds the lock."""
+        return self._fd is not None
+
+    def acquire(self, timeout: float | None = None) -> None:
+        """Take the lock, waiting up to ``timeout`` (default ``self.timeout``) seconds.
+
+        Raises:
+            FileLockTimeout: If the lock was not acquired in time.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._thread_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise FileLockTimeout(f"Timed out waiting for {self.path}")
+
+        try:
+            if self._depth == 0:
+                self._fd = self._lock_file(deadline)
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def _lock_file(self, deadline: float | None) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        while not _try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                raise FileLockTimeout(f"Timed out waiting for {self.path}")
+            time.sleep(self.poll_interval)
+        return fd
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        if self._depth == 0:
+            raise RuntimeError(f"{self.path} is not locked")
+        self._depth -= 1
+        try:
+            if self._depth == 0 and self._fd is not None:
+                fd, self._fd = self._fd, None
+                try:
+                    _unlock(fd)
+                finally:
+                    os.close(fd)
+        finally:
+            self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
@@ -1,17 +1,35 @@
 """File-based searchers for GitHound."""
 
+import asyncio
 import fnmatch
-import json
 import re
 import subprocess
 import time
-from collections.abc import AsyncGenerator
-from datetime import datetime
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from git import Repo
+
 from ..models import CommitInfo, SearchQuery, SearchResult, SearchType
-from .base import CacheableSearcher, ParallelSearcher, SearchContext
+from .base import CacheableSearcher, CommitVisitor, ParallelSearcher, SearchContext
+from .commit_reader import CommitRecord
+from .commit_stats import CommitStatsBatch, build_commit_info
+from .content_matcher import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONTENT_ENGINE,
+    ContentMatcher,
+    create_content_matcher,
+)
+from .executor import get_process_pool
+
+# Commit ranges scheduled per worker process, so uneven ranges balance out
+RANGES_PER_PROCESS = 4
+
+# Smallest commit range worth shipping to a worker process
+MIN_RANGE_SIZE = 50
 
 
 class FilePathSearcher(CacheableSearcher):
@@ -33,25 +51,15 @@ class FilePathSearcher(CacheableSearcher):
         except Exception:
             return 100
 
-    def _create_commit_info(self, commit: Any) -> CommitInfo:
+    def _create_commit_info(
+        self, commit: Any, stats_batch: CommitStatsBatch | None = None
+    ) -> CommitInfo:
         """Helper method to create CommitInfo from a git commit object.
 
-        Optimization: Extracted to avoid code duplication.
+        Optimization: Extracted to avoid code duplication. Diff statistics are
+        deferred and resolved in bulk through ``stats_batch`` when given.
         """
-        return CommitInfo(
-            hash=commit.hexsha,
-            short_hash=commit.hexsha[:8],
-            author_name=commit.author.name,
-            author_email=commit.author.email,
-            committer_name=commit.committer.name,
-            committer_email=commit.committer.email,
-            message=commit.message.strip(),
-            date=datetime.fromtimestamp(commit.committed_date),
-            files_changed=len(commit.stats.files),
-            insertions=commit.stats.total["insertions"],
-            deletions=commit.stats.total["deletions"],
-            parents=[parent.hexsha for parent in commit.parents],
-        )
+        return build_commit_info(commit, stats_batch)
 
     async def search(self, context: SearchContext) -> AsyncGenerator[SearchResult, None]:
         """Search for files by path pattern."""
@@ -76,21 +84,25 @@ class FilePathSearcher(CacheableSearcher):
         commits_searched = 0
         results_found = 0
         seen_files = set()  # Track unique file paths
+        # Diff statistics of matching commits are resolved in bulk
+        stats_batch = CommitStatsBatch(context.repo)
 
         # Optimization: Get max_results from query for early termination
         max_results = context.query.max_results if context.query.max_results else float("inf")
 
         try:
-            for commit in context.repo.iter_commits(branch):
+            async for commit in self._iter_blocking(context, context.repo.iter_commits(branch)):
                 # Optimization: Early termination if max results reached
                 if results_found >= max_results:
                     break
 
                 commits_searched += 1
+                if await self._checkpoint(context, commits_searched):
+                    break
 
                 # Get files changed in this commit
                 for parent in commit.parents:
-                    diffs = commit.diff(parent)
+                    diffs = await self._run_blocking(context, commit.diff, parent)
                     for diff in diffs:
                         if diff.b_blob is None or diff.b_path is None:
                             continue
@@ -113,7 +125,7 @@ class FilePathSearcher(CacheableSearcher):
                             seen_files.add(file_path)
 
                             # Optimization: Use helper method to create commit info
-                            commit_info = self._create_commit_info(commit)
+                            commit_info = self._create_commit_info(commit, stats_batch)
 
                             result = SearchResult(
                                 commit_hash=commit.hexsha,
@@ -202,13 +214,17 @@ class FileTypeSearcher(CacheableSearcher):
         commits_searched = 0
         results_found = 0
         seen_files = set()
+        # Diff statistics of matching commits are resolved in bulk
+        stats_batch = CommitStatsBatch(context.repo)
 
         try:
-            for commit in context.repo.iter_commits(branch):
+            async for commit in self._iter_blocking(context, context.repo.iter_commits(branch)):
                 commits_searched += 1
+                if await self._checkpoint(context, commits_searched):
+                    break
 
                 for parent in commit.parents:
-                    diffs = commit.diff(parent)
+                    diffs = await self._run_blocking(context, commit.diff, parent)
                     for diff in diffs:
                         if diff.b_blob is None or diff.b_path is None:
                             continue
@@ -223,20 +239,7 @@ class FileTypeSearcher(CacheableSearcher):
                         if file_ext in normalized_extensions:
                             seen_files.add(file_path)
 
-                            commit_info = CommitInfo(
-                                hash=commit.hexsha,
-                                short_hash=commit.hexsha[:8],
-                                author_name=commit.author.name,
-                                author_email=commit.author.email,
-                                committer_name=commit.committer.name,
-                                committer_email=commit.committer.email,
-                                message=commit.message.strip(),
-                                date=commit.committed_date,
-                                files_changed=len(commit.stats.files),
-                                insertions=commit.stats.total["insertions"],
-                                deletions=commit.stats.total["deletions"],
-                                parents=[parent.hexsha for parent in commit.parents],
-                            )
+                            commit_info = build_commit_info(commit, stats_batch)
 
                             result = SearchResult(
                                 commit_hash=commit.hexsha,
@@ -282,33 +285,36 @@ class FileTypeSearcher(CacheableSearcher):
 class ContentSearcher(ParallelSearcher, CacheableSearcher):
     """Enhanced content searcher with ranking and performance optimizations."""
 
-    def __init__(self) -> None:
+    per_commit_results = True
+
+    def __init__(
+        self,
+        engine: str = DEFAULT_CONTENT_ENGINE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        processes: int = 0,
+    ) -> None:
         super().__init__("content", 4)  # Use 4 parallel workers
         self.cache_prefix = "content"
+        # Content matching engine ("regex" in-process, or "ripgrep")
+        self.engine = engine
+        # Blobs handed to a batching engine per invocation
+        self.batch_size = max(1, batch_size)
+        # Worker processes scanning commit ranges; 0 or 1 searches in-process
+        self.processes = processes
 
     async def can_handle(self, query: SearchQuery) -> bool:
         """Check if this searcher can handle the query."""
         return query.content_pattern is not None
 
-    def _create_commit_info(self, commit: Any) -> CommitInfo:
+    def _create_commit_info(
+        self, commit: Any, stats_batch: CommitStatsBatch | None = None
+    ) -> CommitInfo:
         """Helper method to create CommitInfo from a git commit object.
 
-        Optimization: Extracted to avoid code duplication.
+        Optimization: Extracted to avoid code duplication. Diff statistics are
+        deferred and resolved in bulk through ``stats_batch`` when given.
         """
-        return CommitInfo(
-            hash=commit.hexsha,
-            short_hash=commit.hexsha[:8],
-            author_name=commit.author.name,
-            author_email=commit.author.email,
-            committer_name=commit.committer.name,
-            committer_email=commit.committer.email,
-            message=commit.message.strip(),
-            date=datetime.fromtimestamp(commit.committed_date),
-            files_changed=len(commit.stats.files),
-            insertions=commit.stats.total["insertions"],
-            deletions=commit.stats.total["deletions"],
-            parents=[parent.hexsha for parent in commit.parents],
-        )
+        return build_commit_info(commit, stats_batch)
 
     async def estimate_work(self, context: SearchContext) -> int:
         """Estimate work based on repository size and file filters."""
@@ -320,7 +326,7 @@ class ContentSearcher(ParallelSearcher, CacheableSearcher):
             total_files = 0
             for commit in commits[:10]:  # Sample first 10 commits
                 for parent in commit.parents:
-                    diffs = commit.diff(parent)
+                    diffs = await self._run_blocking(context, commit.diff, parent)
                     total_files += len([d for d in diffs if d.b_blob is not None])
 
             avg_files_per_commit = max(total_files / 10, 1) if commits else 1
@@ -334,109 +340,107 @@ class ContentSearcher(ParallelSearcher, CacheableSearcher):
         if not content_pattern:
             return
 
-        search_start_time = time.time()
         self._report_progress(context, f"Searching file content for '{content_pattern}'...", 0.0)
 
         branch = context.branch or context.repo.active_branch.name
 
-        commits_searched = 0
-        files_searched = 0
-        results_found = 0
-        max_results = context.query.max_results or 100
-
-        try:
-            for commit in context.repo.iter_commits(branch):
-                # Early termination if we have enough results
-                if results_found >= max_results:
-                    self._report_progress(
-                        context, f"Reached max results limit ({max_results})", 1.0
-                    )
-                    break
+        if self.processes > 1:
+            async for result in self._search_partitioned(context, branch):
+                yield result
+            return
 
-                commits_searched += 1
+        visitor: _ContentVisitor | None = None
 
-                for parent in commit.parents:
-                    diffs = commit.diff(parent)
-                    for diff in diffs:
-                        if diff.b_blob is None or diff.b_path is None:
-                            continue
+        try:
+            visitor = _ContentVisitor(self, context)
 
-                        file_path = diff.b_path
-                        files_searched += 1
+            # Diffs, blob reads and matching run on the git worker pool; the
+            # walk ends early once enough results are found or on cancellation
+            commits = context.repo.iter_commits(branch)
+            async for result in self._drive_visitor(context, visitor, commits):
+                yield result
 
-                        # Apply file filters
-                        if not self._should_search_file(file_path, context.query):
-                            continue
+            # Flush the final partial batch
+            for result in await self._run_blocking(context, visitor.finish):
+                yield result
 
-                        try:
-                            # Optimize: Check file size before reading
-                            if diff.b_blob.size > 1024 * 1024:  # Skip files > 1MB
-                                continue
+        except Exception as e:
+            self._report_progress(context, f"Error searching content: {e}", 1.0)
+            if visitor is not None:
+                visitor.close()
+
+    def create_commit_visitor(self, context: SearchContext) -> CommitVisitor | None:
+        """Create the content-matching visitor, also used by the shared history walk."""
+        # Multi-process searches scan their own commit ranges instead
+        if not context.query.content_pattern or self.processes > 1:
+            return None
+        return _ContentVisitor(self, context)
+
+    async def _search_partitioned(
+        self, context: SearchContext, branch: str
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Search commit ranges in worker processes, merging results in history order.
+
+        The branch history is split into contiguous commit ranges. Each
+        worker process opens its own Repo and scans one range with the same
+        visitor as the in-process search, so the merged results match a
+        sequential search while regex scanning runs on several cores.
+        """
+        query = context.query
+        max_results = query.max_results or 100
+        commits_searched = 0
+        files_searched = 0
+        results_found = 0
+        # Diff statistics of matching commits are resolved in bulk
+        stats_batch = CommitStatsBatch(context.repo)
+        futures: list[Future[_RangeScan]] = []
 
-                            # Get file content
-                            content = diff.b_blob.data_stream.read()
+        try:
+            rev_list = await self._run_blocking(context, context.repo.git.rev_list, branch)
+            ranges = _split_commit_ranges(rev_list.split(), self.processes)
+
+            pool = get_process_pool(self.processes)
+            repo_path = str(context.repo.working_dir)
+            futures = [
+                pool.submit(
+                    _scan_commit_range, repo_path, shas, query, self.engine, self.batch_size
+                )
+                for shas in ranges
+            ]
 
-                            # Check file size limit from query
-                            if (
-                                context.query.max_file_size
-                                and len(content) > context.query.max_file_size
-                            ):
-                                continue
+            # Ranges finish in any order but are merged in history order
+            for index, future in enumerate(futures, 1):
+                scan = await asyncio.wrap_future(future)
+                commits_searched += scan.commits_searched
+                files_searched += scan.files_searched
 
-                            # Search content using ripgrep
-                            matches = await self._search_content_with_ripgrep(
-                                content, content_pattern, context.query
-                            )
+                for result in scan.results:
+                    if results_found >= max_results:
+                        break
+                    commit_info = build_commit_info(scan.commits[result.commit_hash], stats_batch)
+                    results_found += 1
+                    yield result.model_copy(update={"commit_info": commit_info})
 
-                            # Optimization: Create commit info once per file, not per match
-                            if matches:
-                                commit_info = self._create_commit_info(commit)
-
-                            for match in matches:
-                                # Calculate relevance score based on match quality
-                                relevance_score = self._calculate_relevance_score(
-                                    match, content_pattern, file_path
-                                )
-
-                                result = SearchResult(
-                                    commit_hash=commit.hexsha,
-                                    file_path=Path(file_path),
-                                    line_number=match.get("line_number"),
-                                    matching_line=match.get("text"),
-                                    search_type=SearchType.CONTENT,
-                                    relevance_score=relevance_score,
-                                    commit_info=commit_info,
-                                    match_context={
-                                        "search_pattern": content_pattern,
-                                        "file_path": file_path,
-                                        "line_number": match.get("line_number"),
-                                        "column_start": match.get("column_start"),
-                                        "column_end": match.get("column_end"),
-                                    },
-                                    search_time_ms=self._calculate_search_time_ms(
-                                        search_start_time
-                                    ),
-                                )
-
-                                results_found += 1
-                                yield result
-
-                        except (UnicodeDecodeError, AttributeError):
-                            # Skip binary files or files with encoding issues
-                            continue
-
-                if commits_searched % 20 == 0:
-                    progress = min(commits_searched / 200, 0.9)
+                if results_found >= max_results:
                     self._report_progress(
-                        context,
-                        f"Searched {commits_searched} commits, {files_searched} files, found {results_found} matches",
-                        progress,
+                        context, f"Reached max results limit ({max_results})", 1.0
                     )
+                    break
+                if context.is_cancelled:
+                    break
+                self._report_progress(
+                    context,
+                    f"Searched {index}/{len(futures)} commit ranges, found {results_found} matches",
+                    min(index / len(futures), 0.9),
+                )
 
         except Exception as e:
             self._report_progress(context, f"Error searching content: {e}", 1.0)
 
         finally:
+            # Drop ranges that are no longer needed
+            for future in futures:
+                future.cancel()
             self._update_metrics(
                 total_commits_searched=commits_searched,
                 total_files_searched=files_searched,
@@ -469,44 +473,87 @@ class ContentSearcher(ParallelSearcher, CacheableSearcher):
 
         return True
 
-    async def _search_content_with_ripgrep(
-        self, content: bytes, pattern: str, query: SearchQuery
-    ) -> list[dict[str, Any]]:
-        """Search content using ripgrep and return structured results."""
-        rg_args = ["rg", "--json", pattern, "-"]
-
-        if not query.case_sensitive:
-            rg_args.append("-i")
-
+    def _search_contents(
+        self, matcher: ContentMatcher, blobs: list[bytes]
+    ) -> list[list[dict[str, Any]]]:
+        """Search a batch of blobs with the configured engine, one match list per blob."""
         try:
-            process = subprocess.run(
-                rg_args, input=content, capture_output=True, check=True, text=True
-            )
-
-            results: list[Any] = []
-            for line in process.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                try:
-                    match = json.loads(line)
-                    if match["type"] == "match":
-                        data = match["data"]
-                        results.append(
-                            {
-                                "line_number": data["line_number"],
-                                "text": data["lines"]["text"].strip(),
-                                "column_start": data.get("submatches", [{}])[0].get("start", 0),
-                                "column_end": data.get("submatches", [{}])[0].get("end", 0),
-                            }
-                        )
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-            return results
-
+            return matcher.search_batch(blobs)
         except (subprocess.CalledProcessError, FileNotFoundError):
-            return []
+            return [[] for _ in blobs]
+
+    def _read_blob(self, blob: Any, query: SearchQuery) -> bytes | None:
+        """Read blob content, or return None if the blob should be skipped."""
+        try:
+            # Optimize: Check file size before reading
+            if blob.size > 1024 * 1024:  # Skip files > 1MB
+                return None
+
+            content: bytes = blob.data_stream.read()
+        except (UnicodeDecodeError, AttributeError):
+            # Skip binary files or files with encoding issues
+            return None
+
+        # Check file size limit from query
+        if query.max_file_size and len(content) > query.max_file_size:
+            return None
+        return content
+
+    def _match_batch(
+        self,
+        matcher: ContentMatcher,
+        pending: list[tuple[Any, str, str]],
+        unread: dict[str, bytes],
+        blob_matches: dict[str, list[dict[str, Any]]],
+        stats_batch: CommitStatsBatch,
+        content_pattern: str,
+        search_start_time: float,
+    ) -> Iterator[SearchResult]:
+        """Scan unread blobs, then build results for pending items in order.
+
+        Matches are memoized in ``blob_matches`` by blob SHA, so a blob that
+        appears in several commits is re-attributed without being re-read.
+        ``unread`` is drained in place.
+        """
+        if unread:
+            scanned = self._search_contents(matcher, list(unread.values()))
+            blob_matches.update(zip(unread, scanned, strict=False))
+            unread.clear()
+
+        commit_infos: dict[str, CommitInfo] = {}
+
+        for commit, file_path, blob_sha in pending:
+            matches = blob_matches.get(blob_sha)
+            if not matches:
+                continue
+
+            # Optimization: Create commit info once per commit, not per match
+            commit_info = commit_infos.get(commit.hexsha)
+            if commit_info is None:
+                commit_info = self._create_commit_info(commit, stats_batch)
+                commit_infos[commit.hexsha] = commit_info
+
+            for match in matches:
+                # Calculate relevance score based on match quality
+                relevance_score = self._calculate_relevance_score(match, content_pattern, file_path)
+
+                yield SearchResult(
+                    commit_hash=commit.hexsha,
+                    file_path=Path(file_path),
+                    line_number=match.get("line_number"),
+                    matching_line=match.get("text"),
+                    search_type=SearchType.CONTENT,
+                    relevance_score=relevance_score,
+                    commit_info=commit_info,
+                    match_context={
+                        "search_pattern": content_pattern,
+                        "file_path": file_path,
+                        "line_number": match.get("line_number"),
+                        "column_start": match.get("column_start"),
+                        "column_end": match.get("column_end"),
+                    },
+                    search_time_ms=self._calculate_search_time_ms(search_start_time),
+                )
 
     def _calculate_relevance_score(
         self, match: dict[str, Any], pattern: str, file_path: str
@@ -529,3 +576,183 @@ class ContentSearcher(ParallelSearcher, CacheableSearcher):
             score += 0.1
 
         return min(score, 1.0)
+
+
+class _ContentVisitor(CommitVisitor):
+    """Matches blob content of the files changed by each commit.
+
+    Blobs are read once per unique SHA and handed to the content matching
+    engine in batches, so results for a commit may be returned while later
+    commits are visited. ``finish()`` returns the final partial batch.
+    """
+
+    needs_full_commits = True
+    progress_interval = 20
+    label = "Content search"
+    # Diffing and reading blobs is slow per commit; keep pool jobs short
+    chunk_size = 10
+
+    def __init__(self, searcher: "ContentSearcher", context: SearchContext) -> None:
+        super().__init__(searcher, context)
+        self.searcher: ContentSearcher = searcher
+        self.content_pattern = context.query.content_pattern or ""
+        self.max_results = context.query.max_results or 100
+        self.files_searched = 0
+
+        # Compile the pattern once for the whole search
+        self.matcher = create_content_matcher(
+            self.content_pattern,
+            context.query.case_sensitive,
+            searcher.engine,
+            positional=context.query.positional_query,
+        )
+        # Engines that can batch get many blobs per call instead of one
+        self.batch_size = searcher.batch_size if self.matcher.supports_batching else 1
+        # (commit, file_path, blob_sha) items waiting to be attributed
+        self.pending: list[tuple[Any, str, str]] = []
+        # Blobs read but not yet scanned, keyed by blob SHA
+        self.unread: dict[str, bytes] = {}
+        # Per-search memo: each unique blob is read and scanned at most once
+        self.blob_matches: dict[str, list[dict[str, Any]]] = {}
+        # Diff statistics of matching commits are resolved in bulk
+        self.stats_batch = CommitStatsBatch(context.repo)
+
+    def match(self, commit: Any) -> list[SearchResult]:
+        """Queue the commit's changed blobs, returning results of any full batch."""
+        query = self.context.query
+        results: list[SearchResult] = []
+        # Merge commits show the same blob once per parent; attribute it once
+        commit_blobs: set[tuple[str, str]] = set()
+
+        for parent in commit.parents:
+            for diff in commit.diff(parent):
+                if diff.b_blob is None or diff.b_path is None:
+                    continue
+
+                file_path = diff.b_path
+                self.files_searched += 1
+
+                # Apply file filters
+                if not self.searcher._should_search_file(file_path, query):
+                    continue
+
+                blob_sha = diff.b_blob.hexsha
+                if (file_path, blob_sha) in commit_blobs:
+                    continue
+                commit_blobs.add((file_path, blob_sha))
+
+                if blob_sha not in self.blob_matches and blob_sha not in self.unread:
+                    content = self.searcher._read_blob(diff.b_blob, query)
+                    if content is None:
+                        self.blob_matches[blob_sha] = []
+                        continue
+                    self.unread[blob_sha] = content
+
+                self.pending.append((commit, file_path, blob_sha))
+                if len(self.pending) >= self.batch_size:
+                    results.extend(self._drain(self.results_found + len(results)))
+                    if self.done:
+                        return results
+
+        return results
+
+    def flush(self) -> list[SearchResult]:
+        """Match the final partial batch."""
+        if self.done:
+            return []
+        return self._drain(self.results_found)
+
+    def _drain(self, results_found: int) -> list[SearchResult]:
+        """Match pending items, stopping at the result limit."""
+        results: list[SearchResult] = []
+        for result in self.searcher._match_batch(
+            self.matcher,
+            self.pending,
+            self.unread,
+            self.blob_matches,
+            self.stats_batch,
+            self.content_pattern,
+            self.start_time,
+        ):
+            if results_found + len(results) >= self.max_results:
+                break
+            results.append(result)
+        self.pending = []
+
+        if results_found + len(results) >= self.max_results:
+            self.done = True
+            self.searcher._report_progress(
+                self.context, f"Reached max results limit ({self.max_results})", 1.0
+            )
+        return results
+
+    def record_metrics(self) -> None:
+        """Record the walk's totals, including files searched."""
+        self.searcher._update_metrics(
+            total_commits_searched=self.commits_searched,
+            total_files_searched=self.files_searched,
+            total_results_found=self.results_found,
+        )
+
+    def completion_message(self) -> str:
+        """Progress message reported when the walk ends."""
+        return f"Content search completed: {self.results_found} matches"
+
+    def report_progress(self) -> None:
+        """Report periodic progress including the number of files searched."""
+        progress = min(self.commits_searched / 200, 0.9)
+        self.searcher._report_progress(
+            self.context,
+            f"Searched {self.commits_searched} commits, {self.files_searched} files, "
+            f"found {self.results_found} matches",
+            progress,
+        )
+
+
+@dataclass
+class _RangeScan:
+    """Results of scanning one commit range in a worker process."""
+
+    # Results in history order, without commit info
+    results: list[SearchResult]
+    # Metadata of the commits the results refer to, keyed by hash
+    commits: dict[str, CommitRecord]
+    commits_searched: int
+    files_searched: int
+
+
+def _split_commit_ranges(shas: list[str], processes: int) -> list[list[str]]:
+    """Split commits into contiguous ranges for worker processes."""
+    if not shas:
+        return []
+    count = max(1, min(processes * RANGES_PER_PROCESS, len(shas) // MIN_RANGE_SIZE))
+    size = -(-len(shas) // count)
+    return [shas[offset : offset + size] for offset in range(0, len(shas), size)]
+
+
+def _scan_commit_range(
+    repo_path: str, shas: list[str], query: SearchQuery, engine: str, batch_size: int
+) -> _RangeScan:
+    """Scan one commit range for content matches; runs in a worker process."""
+    searcher = ContentSearcher(engine=engine, batch_size=batch_size)
+    with Repo(repo_path) as repo:
+        visitor = _ContentVisitor(searcher, SearchContext(repo=repo, query=query))
+        results: list[SearchResult] = []
+        for sha in shas:
+            if visitor.done:
+                break
+            results.extend(visitor.visit(repo.commit(sha)))
+        results.extend(visitor.finish())
+
+        # Commit info holds a loader bound to this process's repo; the parent
+        # rebuilds it from the commit metadata
+        commits = {
+            sha: CommitRecord.from_commit(repo.commit(sha))
+            for sha in dict.fromkeys(result.commit_hash for result in results)
+        }
+        return _RangeScan(
+            results=[result.model_copy(update={"commit_info": None}) for result in results],
+            commits=commits,
+            commits_searched=visitor.commits_searched,
+            files_searched=visitor.files_searched,
+        )
@@ -2,7 +2,6 @@
 
 import time
 from collections.abc import AsyncGenerator
-from datetime import datetime
 from typing import Any
 
 try:
@@ -18,8 +17,9 @@ except ImportError:
     fuzz = mock_rapidfuzz.fuzz  # type: ignore[assignment]
     process = mock_rapidfuzz.process  # type: ignore[assignment]
 
-from ..models import CommitInfo, SearchQuery, SearchResult, SearchType
+from ..models import SearchQuery, SearchResult, SearchType
 from .base import CacheableSearcher, SearchContext
+from .commit_stats import CommitStatsBatch, build_commit_info
 
 
 class FuzzySearcher(CacheableSearcher):
@@ -104,45 +104,25 @@ class FuzzySearcher(CacheableSearcher):
 
         # Optimize: Only load file contents if content search is needed
         need_content = context.query.content_pattern is not None
+        # Decoded content per blob SHA, so each unique blob is read once per search
+        blob_contents: dict[str, str | None] = {}
+        # Diff statistics are deferred and resolved in bulk if anyone reads them
+        stats_batch = CommitStatsBatch(context.repo)
 
-        for commit in context.repo.iter_commits(branch):
+        async for commit in self._iter_blocking(context, context.repo.iter_commits(branch)):
             commits_processed += 1
+            if await self._checkpoint(context, commits_processed):
+                break
 
             # Create commit info
-            commit_info = CommitInfo(
-                hash=commit.hexsha,
-                short_hash=commit.hexsha[:8],
-                author_name=commit.author.name,
-                author_email=commit.author.email,
-                committer_name=commit.committer.name,
-                committer_email=commit.committer.email,
-                message=commit.message.strip(),
-                date=datetime.fromtimestamp(commit.committed_date),
-                files_changed=len(commit.stats.files),
-                insertions=commit.stats.total["insertions"],
-                deletions=commit.stats.total["deletions"],
-                parents=[parent.hexsha for parent in commit.parents],
-            )
+            commit_info = build_commit_info(commit, stats_batch)
 
             # Get file content only if needed for content search
             file_contents: list[Any] = []
             if need_content:
-                for parent in commit.parents:
-                    diffs = commit.diff(parent)
-                    for diff in diffs:
-                        if diff.b_blob is None or diff.b_path is None:
-                            continue
-
-                        try:
-                            # Optimize: Limit file size to prevent memory issues
-                            if diff.b_blob.size > 1024 * 1024:  # Skip files > 1MB
-                                continue
-                            content = diff.b_blob.data_stream.read().decode(
-                                "utf-8", errors="ignore"
-                            )
-                            file_contents.append({"path": diff.b_path, "content": content})
-                        except (UnicodeDecodeError, AttributeError):
-                            continue
+                file_contents = await self._run_blocking(
+                    context, self._read_changed_files, commit, blob_contents
+                )
 
             targets.append(
                 {"commit": commit, "commit_info": commit_info, "file_contents": file_contents}
@@ -158,6 +138,47 @@ class FuzzySearcher(CacheableSearcher):
 
         return targets
 
+    @classmethod
+    def _read_changed_files(
+        cls, commit: Any, blob_contents: dict[str, str | None]
+    ) -> list[dict[str, Any]]:
+        """Read the decoded content of the files a commit changed.
+
+        ``blob_contents`` caches content per blob SHA across commits.
+        """
+        file_contents: list[dict[str, Any]] = []
+        # Merge commits show the same blob once per parent; keep it once
+        seen_blobs: set[tuple[str, str]] = set()
+        for parent in commit.parents:
+            diffs = commit.diff(parent)
+            for diff in diffs:
+                if diff.b_blob is None or diff.b_path is None:
+                    continue
+
+                blob_sha = diff.b_blob.hexsha
+                if (diff.b_path, blob_sha) in seen_blobs:
+                    continue
+                seen_blobs.add((diff.b_path, blob_sha))
+
+                if blob_sha not in blob_contents:
+                    blob_contents[blob_sha] = cls._read_blob_text(diff.b_blob)
+                content = blob_contents[blob_sha]
+                if content is not None:
+                    file_contents.append({"path": diff.b_path, "content": content})
+        return file_contents
+
+    @staticmethod
+    def _read_blob_text(blob: Any) -> str | None:
+        """Read and decode blob content, or return None if the blob should be skipped."""
+        try:
+            # Optimize: Limit file size to prevent memory issues
+            if blob.size > 1024 * 1024:  # Skip files > 1MB
+                return None
+            text: str = blob.data_stream.read().decode("utf-8", errors="ignore")
+            return text
+        except (UnicodeDecodeError, AttributeError):
+            return None
+
     async def _fuzzy_search_authors(
         self,
         pattern: str,
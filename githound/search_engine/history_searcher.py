@@ -17,6 +17,7 @@ except ImportError:
 
 from ..models import SearchQuery, SearchResult, SearchType
 from .base import CacheableSearcher, SearchContext
+from .commit_stats import resolve_commit_stats
 
 
 class HistorySearcher(CacheableSearcher):
@@ -106,11 +107,15 @@ class HistorySearcher(CacheableSearcher):
         # Optimize: Use streaming approach - process commits in batches
         batch_size = 100
         current_batch = []
+        batch_commits: list[Any] = []
 
-        for commit in context.repo.iter_commits(branch, since=since, until=until):
+        commits = context.repo.iter_commits(branch, since=since, until=until)
+        async for commit in self._iter_blocking(context, commits):
             commits_processed += 1
             if commits_processed > max_commits:
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             commit_date = datetime.fromtimestamp(commit.committed_date)
 
@@ -121,9 +126,6 @@ class HistorySearcher(CacheableSearcher):
                 "author_email": commit.author.email,
                 "date": commit_date,
                 "message": commit.message.strip(),
-                "files_changed": len(commit.stats.files),
-                "insertions": commit.stats.total.get("insertions", 0),
-                "deletions": commit.stats.total.get("deletions", 0),
                 "hour": commit_date.hour,
                 "day_of_week": commit_date.weekday(),
                 "week": commit_date.isocalendar()[1],
@@ -132,14 +134,22 @@ class HistorySearcher(CacheableSearcher):
                 "quarter": (commit_date.month - 1) // 3 + 1,
             }
             current_batch.append(commit_info)
+            batch_commits.append(commit)
 
             # Process in batches to reduce memory pressure
             if len(current_batch) >= batch_size:
+                await self._run_blocking(
+                    context, self._add_commit_stats, context.repo, batch_commits, current_batch
+                )
                 commits_data.extend(current_batch)
                 current_batch = []
+                batch_commits = []
 
         # Add remaining commits
         if current_batch:
+            await self._run_blocking(
+                context, self._add_commit_stats, context.repo, batch_commits, current_batch
+            )
             commits_data.extend(current_batch)
 
         # Collect tag information for release analysis
@@ -170,6 +180,16 @@ class HistorySearcher(CacheableSearcher):
             "tags": pd.DataFrame(tags_data) if tags_data else pd.DataFrame(),
         }
 
+    @staticmethod
+    def _add_commit_stats(repo: Any, commits: list[Any], rows: list[dict[str, Any]]) -> None:
+        """Fill diff statistics for a batch of commit rows with one ``git log`` call.
+
+        Optimization: Avoids a ``git diff --numstat`` per commit via ``commit.stats``.
+        """
+        stats = resolve_commit_stats(repo, commits)
+        for commit, row in zip(commits, rows, strict=False):
+            row["files_changed"], row["insertions"], row["deletions"] = stats[commit.hexsha]
+
     async def _analyze_activity_trends(
         self, temporal_data: dict[str, Any], context: SearchContext
     ) -> list[SearchResult]:
@@ -0,0 +1,565 @@
+"""Compact, memory-mapped on-disk format for inverted index segments.
+
+A segment file holds one immutable inverted index:
+
+- **Postings**: per term, the documents containing it as varint-encoded,
+  delta-coded integer document ordinals, each followed by the term
+  frequency and the delta-coded token positions. Long postings lists are
+  followed by a skip table holding the last ordinal and end offset of
+  every ``SKIP_INTERVAL`` documents.
+- **Term dictionary**: fixed-width entries sorted by the UTF-8 bytes of the
+  term, so a term is found with a binary search over the mapped file. Each
+  entry also records the term's highest frequency in any one document,
+  which bounds its score for top-k pruning.
+- **Document table**: fixed-width entries pointing at each document's
+  ``[doc_id, field, metadata]`` JSON record, indexed by ordinal.
+- **Info**: a small JSON object with totals, build time and statistics.
+
+Segments are opened with ``mmap``, so opening one costs a header read and a
+query only touches the dictionary pages and postings of its own terms.
+Segments are immutable; ``merge_segments`` combines several into a new one.
+"""
+
+import contextlib
+import heapq
+import itertools
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"GHIDXSEG"
+FORMAT_VERSION = 2
+# Version 1 segments lack frequency bounds and skip tables but are still read
+READABLE_VERSIONS = (1, 2)
+
+# magic, version, term_count, terms_offset, doc_count, docs_offset, info_offset, info_length
+_HEADER = struct.Struct("<8sIQQQQQQ")
+# term_offset, term_length, doc_freq, postings_offset, postings_length,
+# max_frequency, skip_offset, skip_count
+_TERM_ENTRY = struct.Struct("<QIIQQIQI")
+_TERM_ENTRY_V1 = struct.Struct("<QIIQQ")
+# last ordinal of a block of postings, end offset of the block within the postings
+_SKIP_ENTRY = struct.Struct("<QQ")
+
+# Documents per skip block; shorter postings lists get no skip table
+SKIP_INTERVAL = 64
+# record_offset, record_length
+_DOC_ENTRY = struct.Struct("<QI")
+
+# A posting: document ordinal and the sorted token positions in it
+Posting = tuple[int, list[int]]
+
+
+class SegmentFormatError(ValueError):
+    """Raised when a file is not a readable index segment."""
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint to ``out``."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data: Any, pos: int) -> tuple[int, int]:
+    """Decode an unsigned LEB128 varint at ``pos``, returning (value, next_pos)."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_postings(postings: Iterable[Posting], previous_ordinal: int = -1) -> bytes:
+    """Encode postings, which must be sorted by ordinal, as delta varints."""
+    out = bytearray()
+    for ordinal, positions in postings:
+        encode_varint(ordinal - previous_ordinal - 1, out)
+        previous_ordinal = ordinal
+        encode_varint(len(positions), out)
+        previous_position = 0
+        for position in positions:
+            encode_varint(position - previous_position, out)
+            previous_position = position
+    return bytes(out)
+
+
+def decode_postings(data: Any, start: int, end: int) -> Iterator[Posting]:
+    """Decode postings written by ``encode_postings`` from ``data[start:end]``."""
+    pos = start
+    ordinal = -1
+    while pos < end:
+        delta, pos = decode_varint(data, pos)
+        ordinal += delta + 1
+        frequency, pos = decode_varint(data, pos)
+        positions: list[int] = []
+        position = 0
+        for _ in range(frequency):
+            delta, pos = decode_varint(data, pos)
+            position += delta
+            positions.append(position)
+        yield ordinal, positions
+
+
+class PostingsCursor:
+    """Forward-only cursor over one term's encoded postings.
+
+    Documents are visited in ordinal order. ``advance`` skips to a target
+    ordinal without decoding the positions of the documents it passes, so
+    intersecting a rare term with a common one touches few position lists.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        start: int,
+        end: int,
+        doc_freq: int,
+        max_frequency: int | None = None,
+        skip_offset: int = 0,
+        skip_count: int = 0,
+    ) -> None:
+        self._data = data
+        self._start = start
+        self._pos = start
+        self._end = end
+        self.doc_freq = doc_freq
+        # Highest frequency of the term in one document, if the segment records it
+        self.max_frequency = max_frequency
+        self._skip_offset = skip_offset
+        self._skip_count = skip_count
+        # Skip block the cursor was last known to be in
+        self._block = 0
+        # Current document; -1 before the first next() and None once exhausted
+        self.ordinal: int | None = -1
+        self._frequency = 0
+        self._positions_at = start
+
+    def next(self) -> int | None:
+        """Move to the next document, returning its ordinal or None at the end."""
+        if self.ordinal is None:
+            return None
+        if self.ordinal >= 0:
+            self._skip_positions()
+        if self._pos >= self._end:
+            self.ordinal = None
+            return None
+        delta, self._pos = decode_varint(self._data, self._pos)
+        self.ordinal += delta + 1
+        self._frequency, self._pos = decode_varint(self._data, self._pos)
+        self._positions_at = self._pos
+        return self.ordinal
+
+    def advance(self, target: int) -> int | None:
+        """Move to the first document at or after ``target``."""
+        if self.ordinal is not None and self.ordinal < target and self._skip_count:
+            self._skip_blocks(target)
+        while self.ordinal is not None and self.ordinal < target:
+            self.next()
+        return self.ordinal
+
+    def _skip_blocks(self, target: int) -> None:
+        """Jump over whole skip blocks that end before ``target``."""
+        assert self.ordinal is not None
+        block = self._block
+        last = end = -1
+        while block < self._skip_count:
+            block_last, block_end = _SKIP_ENTRY.unpack_from(
+                self._data, self._skip_offset + block * _SKIP_ENTRY.size
+            )
+            if block_last >= target:
+                break
+            last, end = block_last, block_end
+            block += 1
+        self._block = block
+        if last > self.ordinal:
+            # Resume decoding right after the last document of the skipped block
+            self.ordinal = last
+            self._pos = self._positions_at = self._start + end
+            self._frequency = 0
+
+    def _skip_positions(self) -> None:
+        """Step over the current document's positions without decoding them."""
+        data = self._data
+        pos = self._positions_at
+        # Each varint ends at the first byte without the continuation bit
+        remaining = self._frequency
+        while remaining:
+            if data[pos] < 0x80:
+                remaining -= 1
+            pos += 1
+        self._pos = pos
+
+    @property
+    def frequency(self) -> int:
+        """Occurrences of the term in the current document."""
+        return self._frequency
+
+    def positions(self) -> list[int]:
+        """Decode the current document's token positions."""
+        positions: list[int] = []
+        position = 0
+        pos = self._positions_at
+        for _ in range(self._frequency):
+            delta, pos = decode_varint(self._data, pos)
+            position += delta
+            positions.append(position)
+        return positions
+
+
+def _summarize_postings(postings: bytes, doc_freq: int) -> tuple[int, list[tuple[int, int]]]:
+    """Find the highest term frequency and build the skip table of encoded postings."""
+    build_skips = doc_freq >= 2 * SKIP_INTERVAL
+    skips: list[tuple[int, int]] = []
+    max_frequency = 0
+    count = 0
+    ordinal = -1
+    pos = 0
+    while pos < len(postings):
+        delta, pos = decode_varint(postings, pos)
+        ordinal += delta + 1
+        frequency, pos = decode_varint(postings, pos)
+        max_frequency = max(max_frequency, frequency)
+        # Step over the positions; each varint ends at a byte below 0x80
+        for _ in range(frequency):
+            while postings[pos] >= 0x80:
+                pos += 1
+            pos += 1
+        count += 1
+        if build_skips and count % SKIP_INTERVAL == 0:
+            skips.append((ordinal, pos))
+    if build_skips and count % SKIP_INTERVAL:
+        skips.append((ordinal, pos))
+    return max_frequency, skips
+
+
+def write_segment(
+    path: Path,
+    terms: Iterable[tuple[str, int, bytes]],
+    documents: Iterable[tuple[str, str, dict[str, Any] | None]],
+    info: dict[str, Any],
+) -> None:
+    """Write a segment file atomically.
+
+    Args:
+        path: Destination file; replaced only once the new file is complete.
+        terms: ``(term, doc_freq, encoded_postings)`` in sorted order of the
+            terms' UTF-8 bytes.
+        documents: ``(doc_id, field, metadata)`` in ordinal order.
+        info: JSON-serializable segment information; ``total_postings`` is
+            filled in from the terms written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * _HEADER.size)
+
+            # Postings are streamed; only the fixed-width term entries are kept
+            term_entries: list[tuple[bytes, int, int, int, int, int, int]] = []
+            offset = _HEADER.size
+            total_postings = 0
+            for term, doc_freq, postings in terms:
+                max_frequency, skips = _summarize_postings(postings, doc_freq)
+                f.write(postings)
+                skip_offset = offset + len(postings)
+                for skip in skips:
+                    f.write(_SKIP_ENTRY.pack(*skip))
+                term_entries.append(
+                    (
+                        term.encode("utf-8"),
+                        doc_freq,
+                        offset,
+                        len(postings),
+                        max_frequency,
+                        skip_offset,
+                        len(skips),
+                    )
+                )
+                offset = skip_offset + _SKIP_ENTRY.size * len(skips)
+                total_postings += doc_freq
+
+            terms_offset = offset
+            strings_offset = terms_offset + _TERM_ENTRY.size * len(term_entries)
+            string_offset = strings_offset
+            for term_bytes, *entry in term_entries:
+                f.write(_TERM_ENTRY.pack(string_offset, len(term_bytes), *entry))
+                string_offset += len(term_bytes)
+            for term_bytes, *_ in term_entries:
+                f.write(term_bytes)
+
+            records = [
+                json.dumps([doc_id, field, metadata], separators=(",", ":")).encode("utf-8")
+                for doc_id, field, metadata in documents
+            ]
+            docs_offset = string_offset
+            record_offset = docs_offset + _DOC_ENTRY.size * len(records)
+            for record in records:
+                f.write(_DOC_ENTRY.pack(record_offset, len(record)))
+                record_offset += len(record)
+            for record in records:
+                f.write(record)
+
+            info_bytes = json.dumps({**info, "total_postings": total_postings}).encode("utf-8")
+            f.write(info_bytes)
+
+            f.seek(0)
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    len(term_entries),
+                    terms_offset,
+                    len(records),
+                    docs_offset,
+                    record_offset,
+                    len(info_bytes),
+                )
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+def is_segment_file(path: Path) -> bool:
+    """Check whether a file starts with the segment magic bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class IndexSegment:
+    """Read-only view of a segment file through ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        """Open and validate a segment file.
+
+        Raises:
+            SegmentFormatError: If the file is not a supported segment.
+            OSError: If the file cannot be opened.
+        """
+        self.path = path
+        # doc_id -> ordinal, read on first lookup
+        self._ordinals: dict[str, int] | None = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise SegmentFormatError(f"{path} is too small to be an index segment")
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            self.term_count,
+            self._terms_offset,
+            self.doc_count,
+            self._docs_offset,
+            info_offset,
+            info_length,
+        ) = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version not in READABLE_VERSIONS:
+            self.close()
+            raise SegmentFormatError(f"{path} is not a supported index segment")
+        self.version = version
+        self._term_entry_struct = _TERM_ENTRY if version >= 2 else _TERM_ENTRY_V1
+
+        self.info: dict[str, Any] = json.loads(self._data[info_offset : info_offset + info_length])
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._data.close()
+
+    def _term_entry(self, index: int) -> tuple[int, int, int, int, int]:
+        """``(term_offset, term_length, doc_freq, postings_offset, postings_length)``."""
+        entry = self._term_entry_struct.unpack_from(
+            self._data, self._terms_offset + index * self._term_entry_struct.size
+        )
+        return entry[:5]
+
+    def _term_bounds(self, index: int) -> tuple[int | None, int, int]:
+        """``(max_frequency, skip_offset, skip_count)``; version 1 has no bounds."""
+        if self.version < 2:
+            return None, 0, 0
+        entry = _TERM_ENTRY.unpack_from(self._data, self._terms_offset + index * _TERM_ENTRY.size)
+        return entry[5], entry[6], entry[7]
+
+    def _term_bytes(self, index: int) -> bytes:
+        string_offset, length, *_ = self._term_entry(index)
+        return self._data[string_offset : string_offset + length]
+
+    def _find(self, term: str) -> int | None:
+        """Binary search the term dictionary, returning the entry index."""
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term_bytes(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self._term_bytes(low) == key:
+            return low
+        return None
+
+    def __contains__(self, term: str) -> bool:
+        return self._find(term) is not None
+
+    def doc_freq(self, term: str) -> int:
+        """Number of documents containing the term."""
+        index = self._find(term)
+        return 0 if index is None else self._term_entry(index)[2]
+
+    def postings(self, term: str) -> Iterator[Posting]:
+        """Decode the postings of a term, in ordinal order."""
+        index = self._find(term)
+        if index is None:
+            return iter(())
+        _, _, _, offset, length = self._term_entry(index)
+        return decode_postings(self._data, offset, offset + length)
+
+    def cursor(self, term: str) -> PostingsCursor | None:
+        """Open a skipping cursor over a term's postings, or None if it is absent."""
+        index = self._find(term)
+        if index is None:
+            return None
+        _, _, doc_freq, offset, length = self._term_entry(index)
+        max_frequency, skip_offset, skip_count = self._term_bounds(index)
+        return PostingsCursor(
+            self._data, offset, offset + length, doc_freq, max_frequency, skip_offset, skip_count
+        )
+
+    def intersect(self, terms: Sequence[str]) -> Iterator[tuple[int, dict[str, list[int]]]]:
+        """Find the documents containing every term, with each term's positions.
+
+        Cursors leapfrog from the rarest term: each one skips straight to
+        the candidate ordinal, and positions are decoded only for documents
+        that contain every term.
+        """
+        cursors: list[tuple[str, PostingsCursor]] = []
+        for term in dict.fromkeys(terms):
+            cursor = self.cursor(term)
+            if cursor is None:
+                return
+            cursors.append((term, cursor))
+        if not cursors:
+            return
+        cursors.sort(key=lambda item: item[1].doc_freq)
+
+        lead = cursors[0][1]
+        target = lead.next()
+        while target is not None:
+            for _, cursor in cursors[1:]:
+                ordinal = cursor.advance(target)
+                if ordinal is None:
+                    return
+                if ordinal > target:
+                    target = lead.advance(ordinal)
+                    break
+            else:
+                yield target, {term: cursor.positions() for term, cursor in cursors}
+                target = lead.next()
+
+    def postings_at(self, index: int) -> Iterator[Posting]:
+        """Decode the postings of the term at a dictionary index."""
+        _, _, _, offset, length = self._term_entry(index)
+        return decode_postings(self._data, offset, offset + length)
+
+    def raw_postings(self, index: int) -> bytes:
+        """Encoded postings of the term at a dictionary index."""
+        _, _, _, offset, length = self._term_entry(index)
+        return self._data[offset : offset + length]
+
+    def terms(self) -> Iterator[tuple[str, int, int]]:
+        """Iterate ``(term, doc_freq, dictionary_index)`` in sorted order."""
+        for index in range(self.term_count):
+            yield self._term_bytes(index).decode("utf-8"), self._term_entry(index)[2], index
+
+    def document(self, ordinal: int) -> tuple[str, str, dict[str, Any] | None]:
+        """Read the ``(doc_id, field, metadata)`` record of a document."""
+        offset, length = _DOC_ENTRY.unpack_from(
+            self._data, self._docs_offset + ordinal * _DOC_ENTRY.size
+        )
+        doc_id, field, metadata = json.loads(self._data[offset : offset + length])
+        return doc_id, field, metadata
+
+    def doc_id(self, ordinal: int) -> str:
+        """Read the identifier of a document."""
+        return self.document(ordinal)[0]
+
+    def ordinal(self, doc_id: str) -> int | None:
+        """Find a document's ordinal; the first lookup reads the document table."""
+        if self._ordinals is None:
+            self._ordinals = {self.doc_id(i): i for i in range(self.doc_count)}
+        return self._ordinals.get(doc_id)
+
+
+def merge_segments(
+    path: Path,
+    sources: Sequence[tuple[IndexSegment, Collection[int]]],
+    info: dict[str, Any],
+) -> list[dict[int, int]]:
+    """Merge segments into a new segment file, dropping deleted documents.
+
+    Documents keep their relative order: those of the first source come
+    first, then those of the second, and so on.
+
+    Args:
+        path: Destination file.
+        sources: Each segment with the ordinals of its deleted documents.
+        info: JSON-serializable information for the merged segment.
+
+    Returns:
+        For each source, the mapping from its live ordinals to merged ones.
+    """
+    ordinal_maps: list[dict[int, int]] = []
+    next_ordinal = 0
+    for segment, deleted in sources:
+        mapping: dict[int, int] = {}
+        for ordinal in range(segment.doc_count):
+            if ordinal not in deleted:
+                mapping[ordinal] = next_ordinal
+                next_ordinal += 1
+        ordinal_maps.append(mapping)
+
+    def dictionary(source: int) -> Iterator[tuple[bytes, int, str, int]]:
+        for term, _, index in sources[source][0].terms():
+            yield term.encode("utf-8"), source, term, index
+
+    def merged_terms() -> Iterator[tuple[str, int, bytes]]:
+        # k-way merge of the sorted term dictionaries
+        merged = heapq.merge(*(dictionary(source) for source in range(len(sources))))
+        for _, entries in itertools.groupby(merged, key=lambda entry: entry[0]):
+            postings: list[Posting] = []
+            term = ""
+            for _, source, term, index in entries:
+                mapping = ordinal_maps[source]
+                for ordinal, positions in sources[source][0].postings_at(index):
+                    new_ordinal = mapping.get(ordinal)
+                    if new_ordinal is not None:
+                        postings.append((new_ordinal, positions))
+            if postings:
+                yield term, len(postings), encode_postings(postings)
+
+    def merged_documents() -> Iterator[tuple[str, str, dict[str, Any] | None]]:
+        for (segment, _), mapping in zip(sources, ordinal_maps, strict=True):
+            for ordinal in mapping:
+                yield segment.document(ordinal)
+
+    write_segment(path, merged_terms(), merged_documents(), info)
+    return ordinal_maps
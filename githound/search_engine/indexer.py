@@ -5,15 +5,67 @@ to significantly improve search performance.
 """
 
 import hashlib
+import heapq
 import json
+import math
+import os
 import pickle
+import threading
 import time
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from git import Repo
+from git import NULL_TREE, Commit, Repo
+from git.util import hex_to_bin
+
+from .commit_blobs import CommitBlobMap
+from .file_lock import FileLock
+from .index_segment import IndexSegment, PostingsCursor, encode_postings, write_segment
+from .positional_query import parse_positional_query, tokenize
+from .segment_set import DEFAULT_MERGE_POLICY, MergePolicy, SegmentSet
+from .trigram_index import TrigramIndex
+
+# Blobs larger than this are not content-indexed
+MAX_INDEXED_BLOB_SIZE = 1024 * 1024
+
+# Attempts to open a consistent generation while a writer keeps publishing
+LOAD_ATTEMPTS = 5
+
+# Segmented indexes of an IncrementalIndexer, by index type
+SEGMENTED_INDEXES = ("content", "message", "author", "trigram")
+
+
+class _TopK:
+    """The ``limit`` best-scoring documents offered; ties go to the earlier offer."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        # Min-heap of (score, -offer number, document)
+        self._heap: list[tuple[float, int, Any]] = []
+        self._offers = 0
+
+    @property
+    def threshold(self) -> float:
+        """Score a document must exceed to enter, once ``limit`` are held."""
+        if len(self._heap) < self.limit:
+            return -math.inf
+        return self._heap[0][0]
+
+    def offer(self, score: float, doc: Any) -> None:
+        entry = (score, -self._offers, doc)
+        self._offers += 1
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> list[tuple[Any, float]]:
+        """Documents with their scores, best first."""
+        ordered = sorted(self._heap, key=lambda entry: (-entry[0], -entry[1]))
+        return [(doc, score) for score, _, doc in ordered]
 
 
 class InvertedIndex:
@@ -21,23 +73,35 @@ class InvertedIndex:
 
     The inverted index maps terms (words) to documents (commits/files) that contain them,
     enabling O(1) lookup instead of O(n) scanning.
+
+    Saved indexes are segmented (see ``segment_set``): each ``save`` writes
+    the documents added since the previous save as a new immutable segment,
+    and queries search every live segment plus the in-memory buffer.
+    Segments are memory-mapped, so queries decode only the postings of
+    their own terms. Document IDs are expected to be unique across saves;
+    ``delete_document`` tombstones a saved document.
     """
 
     def __init__(self) -> None:
-        # Term -> {commit_hash: [locations]}
-        self.index: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+        # Buffered (unsaved) postings: term -> {doc_id: [positions]}
+        self.index: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
 
-        # Document frequency for each term (used in TF-IDF)
+        # Document frequency of each term among buffered documents
         self.doc_freq: dict[str, int] = defaultdict(int)
 
-        # Total number of documents
+        # Total number of live documents, saved and buffered
         self.total_docs = 0
 
-        # Metadata for each document
+        # Metadata for each buffered document
         self.doc_metadata: dict[str, dict[str, Any]] = {}
 
+        # Field and token count of each buffered document
+        self._doc_fields: dict[str, str] = {}
+        self._doc_lengths: dict[str, int] = {}
+
+        # Memory-mapped segments holding the saved documents
+        self.segments = SegmentSet()
+
         # Index build timestamp
         self.build_time: datetime | None = None
 
@@ -57,6 +121,9 @@ class InvertedIndex:
     ) -> None:
         """Add a document to the index.
 
+        Adding more content to an existing document continues its token
+        positions after the content already indexed.
+
         Args:
             doc_id: Unique document identifier (e.g., commit hash)
             content: Text content to index
@@ -66,62 +133,210 @@ class InvertedIndex:
         # Tokenize content
         tokens = self._tokenize(content)
 
-        # Track unique terms for this document
-        doc_terms = set()
+        if doc_id not in self._doc_lengths:
+            self._doc_lengths[doc_id] = 0
+            self._doc_fields[doc_id] = field
+            self.total_docs += 1
+        base_position = self._doc_lengths[doc_id]
 
         # Add each token to the index
-        for position, token in enumerate(tokens):
-            self.index[token][doc_id].append(
-                {
-                    "position": position,
-                    "field": field,
-                }
-            )
-            doc_terms.add(token)
+        for position, token in enumerate(tokens, base_position):
+            postings = self.index[token]
+            if doc_id not in postings:
+                self.doc_freq[token] += 1
+            postings[doc_id].append(position)
 
-        # Update document frequency
-        for term in doc_terms:
-            self.doc_freq[term] += 1
+        self._doc_lengths[doc_id] = base_position + len(tokens)
 
         # Store metadata
         if metadata:
             self.doc_metadata[doc_id] = metadata
 
-        self.total_docs += 1
+    def delete_document(self, doc_id: str) -> bool:
+        """Remove a document from search results.
+
+        Buffered documents are dropped; saved ones are tombstoned until a
+        merge rewrites their segment.
+
+        Returns:
+            True if the document was indexed
+        """
+        if doc_id in self._doc_lengths:
+            for term in [term for term, postings in self.index.items() if doc_id in postings]:
+                del self.index[term][doc_id]
+                self.doc_freq[term] -= 1
+                if not self.index[term]:
+                    del self.index[term]
+                    del self.doc_freq[term]
+            del self._doc_lengths[doc_id]
+            del self._doc_fields[doc_id]
+            self.doc_metadata.pop(doc_id, None)
+            self.total_docs -= 1
+            return True
+
+        deleted = self.segments.delete(doc_id)
+        self.total_docs -= deleted
+        return deleted > 0
+
+    def document_frequency(self, term: str) -> int:
+        """Number of saved and buffered documents containing a term."""
+        return self.segments.doc_freq(term) + self.doc_freq.get(term, 0)
 
     def search(self, query: str, limit: int = 100) -> list[tuple[str, float]]:
         """Search the index for documents matching the query.
 
+        Documents are scored by TF-IDF. Saved segments are searched with
+        WAND: each term's score is bounded by its highest frequency in the
+        segment, and documents whose bounds cannot beat the current top
+        ``limit`` are skipped without being scored.
+
         Returns:
-            List of (doc_id, score) tuples sorted by relevance
+            List of (doc_id, score) tuples sorted by relevance; equal scores
+            keep index order
         """
         query_tokens = self._tokenize(query)
 
-        if not query_tokens:
+        if not query_tokens or limit <= 0:
             return []
 
-        # Calculate TF-IDF scores for each document
-        doc_scores: dict[str, float] = defaultdict(float)
-
+        # IDF (inverse document frequency) weight of each term, counted once
+        # per occurrence in the query
+        weights: dict[str, float] = {}
         for token in query_tokens:
-            if token not in self.index:
+            if self.document_frequency(token) == 0:
                 continue
+            weights[token] = weights.get(token, 0.0) + self._calculate_idf(token)
+        if not weights:
+            return []
 
-            # Calculate IDF (inverse document frequency)
-            idf = self._calculate_idf(token)
-
-            # Add TF-IDF score for each document containing this token
-            for doc_id, locations in self.index[token].items():
-                # TF (term frequency) is the number of times term appears
-                tf = len(locations)
-
-                # TF-IDF score
-                doc_scores[doc_id] += tf * idf
+        # Saved documents are identified by (segment, ordinal) and only the
+        # top results are resolved to IDs
+        segments = self.segments.snapshot()
+        top = _TopK(limit)
+        for number, (segment, deleted) in enumerate(segments):
+            self._search_segment(segment, deleted, number, weights, top)
+
+        # TF (term frequency) is the number of times the term appears
+        buffered_scores: dict[str, float] = defaultdict(float)
+        for term, weight in weights.items():
+            for doc_id, positions in self.index.get(term, {}).items():
+                buffered_scores[doc_id] += len(positions) * weight
+        for doc_id, score in buffered_scores.items():
+            top.offer(score, doc_id)
+
+        return [
+            (segments[doc[0]][0].doc_id(doc[1]) if isinstance(doc, tuple) else doc, score)
+            for doc, score in top.ranked()
+        ]
+
+    @staticmethod
+    def _search_segment(
+        segment: IndexSegment,
+        deleted: set[int],
+        number: int,
+        weights: dict[str, float],
+        top: "_TopK",
+    ) -> None:
+        """Offer a segment's documents to ``top`` using WAND pruning."""
+        # (cursor, weight, score upper bound, query order) of each term present
+        lists: list[tuple[PostingsCursor, float, float, int]] = []
+        for order, (term, weight) in enumerate(weights.items()):
+            cursor = segment.cursor(term)
+            if cursor is None or cursor.next() is None:
+                continue
+            if cursor.max_frequency is None:
+                # Segments without frequency bounds cannot be pruned
+                bound = math.inf
+            else:
+                bound = max(0.0, cursor.max_frequency * weight)
+            lists.append((cursor, weight, bound, order))
+
+        while lists:
+            lists.sort(key=lambda item: item[0].ordinal)  # type: ignore[arg-type, return-value]
+            threshold = top.threshold
+
+            # The pivot is the first list at which the summed bounds could beat
+            # the threshold; no document before the pivot's can
+            upper = 0.0
+            pivot = None
+            for index, (_, _, bound, _) in enumerate(lists):
+                upper += bound
+                if upper > threshold:
+                    pivot = index
+                    break
+            if pivot is None:
+                return
+            pivot_doc = lists[pivot][0].ordinal
+            assert pivot_doc is not None
+
+            if lists[0][0].ordinal == pivot_doc:
+                current = [item for item in lists if item[0].ordinal == pivot_doc]
+                if pivot_doc not in deleted:
+                    current.sort(key=lambda item: item[3])
+                    score = sum(cursor.frequency * weight for cursor, weight, _, _ in current)
+                    top.offer(score, (number, pivot_doc))
+                for cursor, _, _, _ in current:
+                    cursor.next()
+            else:
+                for cursor, _, _, _ in lists[:pivot]:
+                    cursor.advance(pivot_doc)
+            lists = [item for item in lists if item[0].ordinal is not None]
+
+    def positional_search(self, query: str, limit: int = 100) -> list[tuple[str, float]]:
+        """Search for phrase and proximity matches using token positions.
+
+        ``query`` uses the syntax of ``positional_query``: quoted phrases,
+        ``NEAR/k`` chains and bare terms, all of which must match. Each
+        document is scored by its number of matches times the summed IDF
+        of the query terms.
 
-        # Sort by score and return top results
-        sorted_results = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
+        Returns:
+            List of (doc_id, score) tuples sorted by relevance
 
-        return sorted_results[:limit]
+        Raises:
+            ValueError: If the query is malformed.
+        """
+        parsed = parse_positional_query(query)
+        terms = parsed.terms
+        weight = sum(self._calculate_idf(term) for term in terms)
+
+        segments = self.segments.snapshot()
+        scored: list[tuple[tuple[int, int] | str, float]] = []
+        for number, (segment, deleted) in enumerate(segments):
+            for ordinal, positions in segment.intersect(terms):
+                if ordinal in deleted:
+                    continue
+                spans = parsed.matches(positions)
+                if spans:
+                    scored.append(((number, ordinal), len(spans) * weight))
+
+        # Documents still buffered match only if every term has postings
+        buffered = [self.index[term] for term in terms if term in self.index]
+        if buffered and len(buffered) == len(terms):
+            rarest = min(buffered, key=len)
+            for doc_id in list(rarest):
+                if all(doc_id in postings for postings in buffered):
+                    spans = parsed.matches({term: self.index[term][doc_id] for term in terms})
+                    if spans:
+                        scored.append((doc_id, len(spans) * weight))
+
+        return self._top_documents(scored, segments, limit)
+
+    @staticmethod
+    def _top_documents(
+        scored: list[tuple[tuple[int, int] | str, float]],
+        segments: list[tuple[IndexSegment, set[int]]],
+        limit: int,
+    ) -> list[tuple[str, float]]:
+        """Sort scored documents and resolve the top ``limit`` to IDs.
+
+        Saved documents are identified by (segment, ordinal) until then.
+        """
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [
+            (segments[doc[0]][0].doc_id(doc[1]) if isinstance(doc, tuple) else doc, score)
+            for doc, score in scored[:limit]
+        ]
 
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text into searchable terms.
@@ -129,17 +344,9 @@ class InvertedIndex:
         Optimization: Simple but fast tokenization.
         For better results, could use nltk or spaCy.
         """
-        # Convert to lowercase and split on non-alphanumeric
-        import re
-
-        text = text.lower()
-        tokens = re.findall(r"\b\w+\b", text)
-
-        # Filter out very short tokens and common stop words
-        stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"}
-        tokens = [t for t in tokens if len(t) > 2 and t not in stop_words]
-
-        return tokens
+        # Lowercase word runs without very short tokens and common stop words;
+        # shared with positional queries so their terms line up with postings
+        return tokenize(text)
 
     def _calculate_idf(self, term: str) -> float:
         """Calculate IDF (inverse document frequency) for a term.
@@ -148,51 +355,141 @@ class InvertedIndex:
         """
         import math
 
-        if term not in self.doc_freq or self.total_docs == 0:
+        doc_freq = self.document_frequency(term)
+        if doc_freq == 0 or self.total_docs == 0:
             return 0.0
 
         # Add 1 to avoid division by zero
-        return math.log((self.total_docs + 1) / (self.doc_freq[term] + 1))
+        return math.log((self.total_docs + 1) / (doc_freq + 1))
 
     def update_stats(self) -> None:
-        """Update index statistics."""
-        self.stats["total_terms"] = len(self.index)
-        self.stats["total_postings"] = sum(len(postings) for postings in self.index.values())
+        """Update index statistics.
+
+        Terms are counted once per segment that contains them.
+        """
+        segments = self.segments.snapshot()
+        buffered_postings = sum(len(postings) for postings in self.index.values())
+        new_terms = sum(
+            1 for term in self.index if not any(term in segment for segment, _ in segments)
+        )
+        self.stats["total_terms"] = sum(segment.term_count for segment, _ in segments) + new_terms
+        self.stats["total_postings"] = (
+            sum(segment.info["total_postings"] for segment, _ in segments) + buffered_postings
+        )
         if self.stats["total_terms"] > 0:
             self.stats["avg_postings_per_term"] = (
                 self.stats["total_postings"] / self.stats["total_terms"]
             )
 
     def save(self, path: Path) -> None:
-        """Save index to disk."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {
-            "index": dict(self.index),
-            "doc_freq": dict(self.doc_freq),
-            "total_docs": self.total_docs,
-            "doc_metadata": self.doc_metadata,
+        """Save index to disk.
+
+        Buffered documents are written as a new segment next to ``path``,
+        which then holds the manifest of live segments; the index serves
+        queries from the new segment and drops its buffer.
+        """
+        if self._doc_lengths:
+            segment_path = self.segments.new_segment_path(path)
+            try:
+                write_segment(segment_path, self._buffered_terms(), self._buffered_documents(), {})
+                self.segments.add(segment_path)
+            except BaseException:
+                self.segments.release(segment_path)
+                raise
+            self._clear_buffer()
+
+        self.segments.info = {
             "build_time": self.build_time.isoformat() if self.build_time else None,
             "stats": self.stats,
         }
+        self.segments.save(path)
 
-        with open(path, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    def merge_segments(self, policy: MergePolicy = DEFAULT_MERGE_POLICY) -> int:
+        """Merge saved segments as the policy dictates.
 
-    def load(self, path: Path) -> bool:
+        Returns:
+            Number of merges performed
+        """
+        merges = 0
+        while self.segments.merge(policy):
+            merges += 1
+        return merges
+
+    def _buffered_terms(self) -> Iterator[tuple[str, int, bytes]]:
+        """Buffered postings in term order for ``write_segment``."""
+        ordinals = {doc_id: i for i, doc_id in enumerate(self._doc_lengths)}
+        for term in sorted(self.index, key=lambda term: term.encode("utf-8")):
+            postings = sorted(
+                (ordinals[doc_id], positions) for doc_id, positions in self.index[term].items()
+            )
+            yield term, len(postings), encode_postings(postings)
+
+    def _buffered_documents(self) -> Iterator[tuple[str, str, dict[str, Any] | None]]:
+        """Buffered documents in ordinal order."""
+        for doc_id, field in self._doc_fields.items():
+            yield doc_id, field, self.doc_metadata.get(doc_id)
+
+    def _clear_buffer(self) -> None:
+        """Forget buffered documents."""
+        self.index = defaultdict(lambda: defaultdict(list))
+        self.doc_freq = defaultdict(int)
+        self.doc_metadata = {}
+        self._doc_fields = {}
+        self._doc_lengths = {}
+
+    def close(self) -> None:
+        """Unmap the saved segments."""
+        self.segments.close()
+
+    def load(self, path: Path, manifest: dict[str, Any] | None = None) -> bool:
         """Load index from disk.
 
+        Segment files are memory-mapped rather than read; indexes saved in
+        the earlier pickle format are still read in full.
+
+        Args:
+            path: Manifest path the index was saved to
+            manifest: A manifest to open instead of the one saved at ``path``
+
         Returns:
             True if successful, False otherwise
         """
-        if not path.exists():
+        if manifest is not None:
+            if not self.segments.load(path, manifest):
+                return False
+            self._clear_buffer()
+        elif not path.exists():
             return False
-
+        else:
+            self._clear_buffer()
+            if not self.segments.load(path):
+                return self._load_pickle(path)
+
+        info = self.segments.info
+        self.total_docs = self.segments.live_docs
+        if "stats" in info:
+            self.stats = info["stats"]
+        build_time = info.get("build_time")
+        self.build_time = datetime.fromisoformat(build_time) if build_time else None
+        return True
+
+    def _load_pickle(self, path: Path) -> bool:
+        """Load an index saved in the earlier pickle format into the buffer."""
         try:
             with open(path, "rb") as f:
                 data = pickle.load(f)
 
-            self.index = defaultdict(lambda: defaultdict(list), data["index"])
+            self.close()
+            self._clear_buffer()
+            # Postings were lists of {"position": ..., "field": ...} dicts
+            for term, postings in data["index"].items():
+                for doc_id, locations in postings.items():
+                    positions = sorted(location["position"] for location in locations)
+                    self.index[term][doc_id] = positions
+                    self._doc_fields.setdefault(doc_id, locations[0]["field"])
+                    self._doc_lengths[doc_id] = max(
+                        self._doc_lengths.get(doc_id, 0), positions[-1] + 1
+                    )
             self.doc_freq = defaultdict(int, data["doc_freq"])
             self.total_docs = data["total_docs"]
             self.doc_metadata = data["doc_metadata"]
@@ -211,6 +508,25 @@ class IncrementalIndexer:
 
     This dramatically improves performance by avoiding re-indexing
     of the entire repository on each search.
+
+    The indexer remembers the tip commit it indexed for each ref. An update
+    compares that tip with the ref's current tip: an unchanged tip costs one
+    ref lookup, a fast-forward indexes only ``old_tip..new_tip``, and a tip
+    that is no longer a descendant of the indexed one (a force-push or
+    rewritten history) tombstones the commits only the old tip reached
+    before indexing the new ones.
+
+    Each update is saved as new segments of the segmented indexes, and
+    small segments are merged on a background thread afterwards.
+
+    Several processes can share one index directory. Writers (index
+    updates and merges) serialize on an advisory file lock. Each update
+    publishes a new generation by atomically replacing the state file,
+    which names the segments of every index, so readers memory-map the
+    same segment files and switch to a new generation in one step;
+    ``refresh`` picks up generations published by other processes.
+    Segment files dropped by a generation are removed once the next one is
+    published; readers that still have them mapped keep working.
     """
 
     def __init__(self, repo_path: Path, cache_dir: Path | None = None) -> None:
@@ -218,75 +534,333 @@ class IncrementalIndexer:
         self.cache_dir = cache_dir or (repo_path / ".githound" / "index")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        self._create_indexes()
+
+        # Indexed tip commit of each ref
+        self.ref_tips: dict[str, str] = {}
+        self.indexed_commit_count = 0
+
+        # Published generation and the state file it was read from or written to
+        self.generation = 0
+        self._state_stamp: tuple[int, int, int] | None = None
+        self._state_lock = threading.RLock()
+
+        # Serializes writers across processes; None waits for the lock forever
+        self.write_lock = FileLock(self.get_index_path("write").with_suffix(".lock"))
+
+        # Track last index time
+        self.last_index_time: datetime | None = None
+
+        # Segment merging after each update
+        self.merge_policy = DEFAULT_MERGE_POLICY
+        self.background_merge = True
+        self._merge_thread: threading.Thread | None = None
+
+    def _create_indexes(self) -> None:
+        """Start with empty in-memory indexes."""
         # Main inverted index
         self.content_index = InvertedIndex()
         self.message_index = InvertedIndex()
         self.author_index = InvertedIndex()
 
-        # Track indexed commits
-        self.indexed_commits: set[str] = set()
-
-        # Track last index time
-        self.last_index_time: datetime | None = None
+        # Trigram index of blob contents for regex search
+        self.trigram_index = TrigramIndex()
+
+        # Content indexes are keyed by blob; this maps blobs back to commits
+        self.commit_blobs = CommitBlobMap()
+        self._indexes_loaded = False
+
+        # Readers of the published generation may still map replaced segments
+        for _, index in self._segmented_indexes():
+            index.segments.keep_stale = True
+
+    def _segmented_indexes(
+        self, indexes: dict[str, Any] | None = None
+    ) -> list[tuple[str, InvertedIndex | TrigramIndex]]:
+        """The segmented indexes (by default the current ones) with their index types."""
+        if indexes is None:
+            indexes = {
+                "content": self.content_index,
+                "message": self.message_index,
+                "author": self.author_index,
+                "trigram": self.trigram_index,
+            }
+        return [(index_type, indexes[index_type]) for index_type in SEGMENTED_INDEXES]
+
+    def _reset_indexes(self) -> None:
+        """Discard every indexed commit; files are replaced on the next save."""
+        self.wait_for_merges()
+        for index in (self.content_index, self.message_index, self.author_index):
+            index.close()
+        self.trigram_index.close()
+        self._create_indexes()
+        self.ref_tips = {}
+        self.indexed_commit_count = 0
 
     def get_index_path(self, index_type: str) -> Path:
         """Get the path for a specific index file."""
         repo_hash = hashlib.md5(str(self.repo_path).encode()).hexdigest()[:8]
         return self.cache_dir / f"{repo_hash}_{index_type}.idx"
 
+    def _read_stamp(self) -> tuple[int, int, int] | None:
+        """Identify the current state file; replacing it changes the stamp."""
+        try:
+            stat = os.stat(self.get_index_path("refs"))
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _read_state(self) -> dict[str, Any] | None:
+        """Read the published state, or None if there is none."""
+        try:
+            with open(self.get_index_path("refs")) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _apply_state(self, data: dict[str, Any]) -> None:
+        """Take the ref tips and counters of a published state."""
+        self.ref_tips = dict(data.get("refs", {}))
+        self.indexed_commit_count = data.get("indexed_commits", 0)
+        self.generation = data.get("generation", 0)
+        last_index_time = data.get("last_index_time")
+        self.last_index_time = datetime.fromisoformat(last_index_time) if last_index_time else None
+
     def load_indexes(self) -> bool:
-        """Load existing indexes from disk.
+        """Load the published indexes from disk.
+
+        The indexes are opened into new objects that replace the current
+        ones, so queries already running finish on the previous generation.
+        If a writer publishes while the indexes are being opened, the new
+        generation is opened instead.
 
         Returns:
             True if indexes were loaded successfully
         """
-        success = True
+        with self._state_lock:
+            for attempt in range(LOAD_ATTEMPTS):
+                stamp = self._read_stamp()
+                data = self._read_state()
+                indexes, success = self._open_indexes(data)
+                if self._read_stamp() == stamp or attempt == LOAD_ATTEMPTS - 1:
+                    break
+                for _, index in self._segmented_indexes(indexes):
+                    index.close()
 
-        # Load content index
-        if not self.content_index.load(self.get_index_path("content")):
-            success = False
+            try:
+                if data is None:
+                    raise ValueError("no saved state")
+                self._apply_state(data)
+            except (ValueError, TypeError, AttributeError):
+                self.ref_tips = {}
+                success = False
 
-        # Load message index
-        if not self.message_index.load(self.get_index_path("message")):
-            success = False
+            self.content_index = indexes["content"]
+            self.message_index = indexes["message"]
+            self.author_index = indexes["author"]
+            self.trigram_index = indexes["trigram"]
+            self.commit_blobs = indexes["blobs"]
+            self._state_stamp = stamp
+            self._indexes_loaded = True
+        return success
 
-        # Load author index
-        if not self.author_index.load(self.get_index_path("author")):
-            success = False
+    def _open_indexes(self, data: dict[str, Any] | None) -> tuple[dict[str, Any], bool]:
+        """Open the indexes a published state names.
 
-        # Load indexed commits list
-        commits_path = self.get_index_path("commits")
-        if commits_path.exists():
-            try:
-                with open(commits_path) as f:
-                    data = json.load(f)
-                    self.indexed_commits = set(data.get("commits", []))
-                    if data.get("last_index_time"):
-                        self.last_index_time = datetime.fromisoformat(data["last_index_time"])
-            except Exception:
+        States saved before generations were published don't name the
+        segments, so each index's own manifest is read instead.
+
+        Returns:
+            The opened indexes by index type, and whether all of them opened
+        """
+        manifests = (data or {}).get("indexes") or {}
+        blobs_size = (data or {}).get("blobs_size")
+
+        indexes: dict[str, Any] = {
+            "content": InvertedIndex(),
+            "message": InvertedIndex(),
+            "author": InvertedIndex(),
+            "trigram": TrigramIndex(),
+            "blobs": CommitBlobMap(),
+        }
+        success = True
+        for index_type, index in self._segmented_indexes(indexes):
+            index.segments.keep_stale = True
+            if not index.load(self.get_index_path(index_type), manifests.get(index_type)):
                 success = False
 
-        return success
+        # Chunks appended after the state was published belong to a later generation
+        if not indexes["blobs"].load(self.get_index_path("blobs"), blobs_size):
+            success = False
+        return indexes, success
+
+    def refresh(self) -> bool:
+        """Switch to the latest generation if another process published one.
+
+        Costs one ``stat`` of the state file when nothing changed.
+
+        Returns:
+            True if a newer generation was loaded
+        """
+        with self._state_lock:
+            if not self._indexes_loaded or self._read_stamp() == self._state_stamp:
+                return False
+            return self.load_indexes()
 
     def save_indexes(self) -> None:
-        """Save all indexes to disk."""
+        """Save all indexes to disk and publish them as a new generation."""
         # Save inverted indexes
         self.content_index.save(self.get_index_path("content"))
         self.message_index.save(self.get_index_path("message"))
         self.author_index.save(self.get_index_path("author"))
+        self.trigram_index.save(self.get_index_path("trigram"))
+        self.commit_blobs.save(self.get_index_path("blobs"))
 
-        # Save indexed commits list
-        commits_path = self.get_index_path("commits")
-        with open(commits_path, "w") as f:
-            json.dump(
-                {
-                    "commits": list(self.indexed_commits),
-                    "last_index_time": self.last_index_time.isoformat()
-                    if self.last_index_time
-                    else None,
-                },
-                f,
-            )
+        # Save the indexed ref tips last, once the indexes they describe exist
+        self._save_state()
+
+        # Indexes from before ref tips were tracked listed every commit
+        self.get_index_path("commits").unlink(missing_ok=True)
+
+    def _save_state(self) -> None:
+        """Atomically publish the ref tips and the segments of every index.
+
+        Segment files that the previous generation used and this one does
+        not are removed afterwards.
+        """
+        with self._state_lock:
+            state_path = self.get_index_path("refs")
+            temp_path = state_path.with_suffix(".tmp")
+            with open(temp_path, "w") as f:
+                json.dump(
+                    {
+                        "generation": self.generation + 1,
+                        "refs": self.ref_tips,
+                        "indexed_commits": self.indexed_commit_count,
+                        "last_index_time": self.last_index_time.isoformat()
+                        if self.last_index_time
+                        else None,
+                        "indexes": {
+                            index_type: index.segments.manifest()
+                            for index_type, index in self._segmented_indexes()
+                        },
+                        "blobs_size": self.commit_blobs.saved_size,
+                    },
+                    f,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, state_path)
+            self.generation += 1
+            self._state_stamp = self._read_stamp()
+
+        for index_type, index in self._segmented_indexes():
+            index.segments.remove_stale(self.get_index_path(index_type))
+
+    def _remove_commits(self, commit_shas: Iterable[str]) -> int:
+        """Tombstone commits and the blobs no remaining commit introduced.
+
+        Returns:
+            Number of indexed commits removed
+        """
+        removed = 0
+        for commit_sha in commit_shas:
+            if not self.message_index.delete_document(commit_sha):
+                continue
+            self.author_index.delete_document(commit_sha)
+            for blob_sha in self.commit_blobs.remove_commit(commit_sha):
+                if blob_sha not in self.commit_blobs:
+                    self.content_index.delete_document(blob_sha)
+                    self.trigram_index.delete_blob(blob_sha)
+            removed += 1
+        self.indexed_commit_count -= removed
+        return removed
+
+    def merge_segments(self) -> int:
+        """Merge index segments and compact the commit map as needed.
+
+        Returns:
+            Number of segment merges performed
+        """
+        with self.write_lock:
+            # Another process may have published since this one last did
+            self.refresh()
+            merges = 0
+            for _, index in self._segmented_indexes():
+                merges += index.merge_segments(self.merge_policy)
+            compacted = self.commit_blobs.removed_ratio() > self.merge_policy.max_deleted_ratio
+            if compacted:
+                self.commit_blobs.compact(self.get_index_path("blobs"))
+            if merges or compacted:
+                self._save_state()
+        return merges
+
+    def _start_merge(self) -> None:
+        """Merge segments after an update, on a background thread if enabled."""
+        if not self.background_merge:
+            self.merge_segments()
+            return
+        self.wait_for_merges()
+        self._merge_thread = threading.Thread(
+            target=self.merge_segments, name="githound-index-merge", daemon=True
+        )
+        self._merge_thread.start()
+
+    def wait_for_merges(self, timeout: float | None = None) -> None:
+        """Wait for a background merge to finish."""
+        thread = self._merge_thread
+        if thread is not None:
+            thread.join(timeout)
+            if not thread.is_alive():
+                self._merge_thread = None
+
+    @staticmethod
+    def _exists(repo: Repo, sha: str) -> bool:
+        """Check whether a commit still exists in the repository."""
+        try:
+            repo.commit(sha)
+        except Exception:
+            return False
+        return True
+
+    @classmethod
+    def _is_ancestor(cls, repo: Repo, ancestor: str, descendant: str) -> bool:
+        """Check whether the indexed tip is still in the new tip's history."""
+        if not cls._exists(repo, ancestor):
+            return False
+        try:
+            return repo.is_ancestor(repo.commit(ancestor), repo.commit(descendant))
+        except Exception:
+            return False
+
+    @staticmethod
+    def _changed_blobs(commit: Any) -> Iterator[tuple[str, Any]]:
+        """Yield ``(path, blob)`` for the file versions a commit introduced.
+
+        Root commits are compared with the empty tree, so their files are
+        included too. Merge commits report a file once, even if it differs
+        from several parents.
+        """
+        seen: set[tuple[str, str]] = set()
+        for parent in commit.parents or [NULL_TREE]:
+            try:
+                diffs = commit.diff(parent)
+            except Exception:
+                continue
+            for diff in diffs:
+                # Against a parent the commit is the "a" side, but GitPython
+                # reports diffs against the empty tree the other way round
+                if parent is NULL_TREE:
+                    blob, path = diff.b_blob, diff.b_path
+                else:
+                    blob, path = diff.a_blob, diff.a_path
+                # None for files the commit deleted
+                if blob is None or path is None:
+                    continue
+                if (path, blob.hexsha) not in seen:
+                    seen.add((path, blob.hexsha))
+                    yield path, blob
 
     def build_incremental_index(
         self,
@@ -297,39 +871,111 @@ class IncrementalIndexer:
     ) -> dict[str, Any]:
         """Build or update indexes incrementally.
 
-        Only indexes commits that haven't been indexed yet.
+        Only indexes commits that are not reachable from an indexed ref tip,
+        so an update after ``old_tip`` advanced indexes ``old_tip..new_tip``.
+        Up to ``max_commits`` of the newest such commits are indexed.
+
+        The update holds the index's write lock, so concurrent updates from
+        other processes wait and then continue from what they published.
 
         Returns:
             Statistics about the indexing operation
+
+        Raises:
+            FileLockTimeout: If ``write_lock`` has a timeout and another
+                writer holds the lock longer.
         """
+        # A merge still running here holds the write lock
+        self.wait_for_merges()
+        with self.write_lock:
+            stats = self._update_index(repo, branch, progress_callback, max_commits)
+        if stats["status"] != "up_to_date":
+            self._start_merge()
+        return stats
+
+    def _update_index(
+        self,
+        repo: Repo,
+        branch: str | None,
+        progress_callback: Any | None,
+        max_commits: int,
+    ) -> dict[str, Any]:
+        """Index new commits while holding the write lock."""
         start_time = time.time()
 
-        # Try to load existing indexes
-        self.load_indexes()
+        # Continue from the latest published generation
+        if not self._indexes_loaded or self._read_stamp() != self._state_stamp:
+            indexes_loaded = self.load_indexes()
+        else:
+            indexes_loaded = True
 
         branch = branch or repo.active_branch.name
+        new_tip = repo.commit(branch).hexsha
+        old_tip = self.ref_tips.get(branch)
 
-        # Get all commits
-        all_commits = list(repo.iter_commits(branch, max_count=max_commits))
-
-        # Filter out already indexed commits
-        new_commits = [c for c in all_commits if c.hexsha not in self.indexed_commits]
+        if old_tip == new_tip:
+            return {
+                "indexed_commits": 0,
+                "total_commits": self.indexed_commit_count,
+                "time_seconds": time.time() - start_time,
+                "status": "up_to_date",
+            }
 
-        if not new_commits:
+        status = "updated"
+        removed_count = 0
+        if not self.ref_tips:
+            # Nothing is tracked; indexes on disk, if any, predate tip tracking
+            self._reset_indexes()
+        elif not indexes_loaded:
+            self._reset_indexes()
+        elif old_tip is not None and not self._is_ancestor(repo, old_tip, new_tip):
+            if self._exists(repo, old_tip):
+                # Force-push or rewritten history: tombstone the commits that
+                # only the old tip reached
+                other_tips = [
+                    tip
+                    for ref, tip in self.ref_tips.items()
+                    if ref != branch and self._exists(repo, tip)
+                ]
+                removed = repo.git.rev_list(
+                    old_tip, f"^{new_tip}", *[f"^{tip}" for tip in other_tips]
+                ).split()
+                removed_count = self._remove_commits(removed)
+                status = "rewritten"
+            else:
+                # The old history is gone; nothing tells which commits to drop
+                self._reset_indexes()
+                status = "rebuilt"
+
+        # Index only commits not reachable from any indexed tip
+        revs = [new_tip] + [
+            f"^{tip}" for tip in set(self.ref_tips.values()) if self._exists(repo, tip)
+        ]
+        new_shas = repo.git.rev_list(*revs, max_count=max_commits).split()
+        new_commits = [Commit(repo, hex_to_bin(sha)) for sha in new_shas]
+
+        if not new_commits and status == "updated":
+            # The ref moved within already indexed history
+            self.ref_tips[branch] = new_tip
+            self._save_state()
             return {
                 "indexed_commits": 0,
-                "total_commits": len(all_commits),
+                "total_commits": self.indexed_commit_count,
                 "time_seconds": time.time() - start_time,
                 "status": "up_to_date",
             }
 
         # Index new commits
         indexed_count = 0
-        for i, commit in enumerate(new_commits):
+        indexed_blobs = 0
+        for commit in new_commits:
             # Index commit message
+            message = commit.message
+            if isinstance(message, bytes):
+                message = message.decode("utf-8", errors="replace")
             self.message_index.add_document(
                 doc_id=commit.hexsha,
-                content=commit.message,
+                content=message,
                 metadata={
                     "author": commit.author.name,
                     "date": datetime.fromtimestamp(commit.committed_date).isoformat(),
@@ -349,39 +995,30 @@ class IncrementalIndexer:
                 field="author",
             )
 
-            # Index file content (only for recent commits to avoid memory issues)
-            if i < 1000:  # Only index content for most recent 1000 commits
-                for parent in commit.parents:
-                    try:
-                        diffs = commit.diff(parent)
-                        for diff in diffs:
-                            if diff.b_blob is None or diff.b_path is None:
-                                continue
-
-                            # Skip large files
-                            if diff.b_blob.size > 1024 * 1024:  # 1MB limit
-                                continue
-
-                            try:
-                                content = diff.b_blob.data_stream.read().decode(
-                                    "utf-8", errors="ignore"
-                                )
-                                self.content_index.add_document(
-                                    doc_id=commit.hexsha,
-                                    content=content,
-                                    metadata={
-                                        "file_path": diff.b_path,
-                                        "commit": commit.hexsha,
-                                    },
-                                    field="content",
-                                )
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-
-            # Mark as indexed
-            self.indexed_commits.add(commit.hexsha)
+            # Index the file versions the commit introduced; each unique blob's
+            # content is read and tokenized only the first time it is seen
+            for file_path, blob in self._changed_blobs(commit):
+                self.commit_blobs.add(commit.hexsha, file_path, blob.hexsha)
+                # The trigram index records every blob whose content was indexed
+                if blob.hexsha in self.trigram_index:
+                    continue
+                try:
+                    # Skip large files
+                    if blob.size > MAX_INDEXED_BLOB_SIZE:
+                        continue
+                    data = blob.data_stream.read()
+                except Exception:
+                    continue
+
+                self.trigram_index.add_blob(blob.hexsha, data)
+                self.content_index.add_document(
+                    doc_id=blob.hexsha,
+                    content=data.decode("utf-8", errors="ignore"),
+                    metadata={"file_path": file_path},
+                    field="content",
+                )
+                indexed_blobs += 1
+
             indexed_count += 1
 
             # Progress reporting
@@ -389,6 +1026,9 @@ class IncrementalIndexer:
                 progress = indexed_count / len(new_commits)
                 progress_callback(f"Indexed {indexed_count}/{len(new_commits)} commits", progress)
 
+        self.ref_tips[branch] = new_tip
+        self.indexed_commit_count += indexed_count
+
         # Update statistics
         self.content_index.update_stats()
         self.message_index.update_stats()
@@ -405,18 +1045,40 @@ class IncrementalIndexer:
 
         return {
             "indexed_commits": indexed_count,
-            "total_commits": len(all_commits),
+            "indexed_blobs": indexed_blobs,
+            "removed_commits": removed_count,
+            "total_commits": self.indexed_commit_count,
             "time_seconds": time.time() - start_time,
-            "status": "updated",
+            "status": status,
             "content_index_stats": self.content_index.stats,
             "message_index_stats": self.message_index.stats,
             "author_index_stats": self.author_index.stats,
         }
 
     def search_content(self, query: str, limit: int = 100) -> list[tuple[str, float]]:
-        """Search content index."""
+        """Search content index.
+
+        Returns:
+            ``(blob_sha, score)`` pairs; see ``blob_locations`` for where each
+            blob appears in history
+        """
         return self.content_index.search(query, limit)
 
+    def search_content_positional(self, query: str, limit: int = 100) -> list[tuple[str, float]]:
+        """Search the content index for phrase and proximity matches.
+
+        Returns:
+            ``(blob_sha, score)`` pairs of blobs matching the whole query
+
+        Raises:
+            ValueError: If the query is malformed.
+        """
+        return self.content_index.positional_search(query, limit)
+
+    def blob_locations(self, blob_sha: str) -> list[tuple[str, str]]:
+        """Every ``(commit_sha, path)`` at which an indexed blob was introduced."""
+        return self.commit_blobs.locations(blob_sha)
+
     def search_messages(self, query: str, limit: int = 100) -> list[tuple[str, float]]:
         """Search message index."""
         return self.message_index.search(query, limit)
@@ -425,12 +1087,31 @@ class IncrementalIndexer:
         """Search author index."""
         return self.author_index.search(query, limit)
 
+    def regex_candidates(self, pattern: str) -> list[str] | None:
+        """Find indexed blobs that may match a regex, via the trigram index.
+
+        Returns:
+            SHAs of the candidate blobs to verify, or None if the pattern
+            cannot be narrowed down by trigrams
+        """
+        candidates = self.trigram_index.candidates(pattern)
+        if candidates is None:
+            return None
+        return [blob_sha for blob_sha, _ in candidates]
+
     def get_stats(self) -> dict[str, Any]:
         """Get comprehensive indexing statistics."""
         return {
-            "total_indexed_commits": len(self.indexed_commits),
+            "total_indexed_commits": self.indexed_commit_count,
+            "generation": self.generation,
+            "ref_tips": dict(self.ref_tips),
             "last_index_time": self.last_index_time.isoformat() if self.last_index_time else None,
             "content_index": self.content_index.stats,
             "message_index": self.message_index.stats,
             "author_index": self.author_index.stats,
+            "trigram_index": {"blobs": len(self.trigram_index)},
+            "commit_blobs": {
+                "commits": self.commit_blobs.commit_count,
+                "entries": len(self.commit_blobs),
+            },
         }
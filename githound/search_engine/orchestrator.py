@@ -1,18 +1,75 @@
 """Search orchestrator that coordinates multiple searchers."""
 
 import asyncio
+import contextlib
+import heapq
 import time
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any
 
 from git import Repo
 
 from ..models import SearchMetrics, SearchQuery, SearchResult
-from .base import BaseSearcher, SearchContext
+from ..utils.progress import CancellationToken
+from .base import BaseSearcher, CommitVisitor, SearchContext
+from .commit_reader import iter_commit_records
+from .executor import (
+    GitExecutor,
+    closing_on_lane,
+    get_git_executor,
+    loop_threadsafe,
+    run_blocking,
+)
 
 # mypy: disable-error-code=unreachable
 # Note: mypy incorrectly flags code as unreachable due to dynamic searcher registration
 
+# Results buffered between the searchers and the consumer before searchers block
+RESULT_QUEUE_SIZE = 256
+
+# Seconds between cancellation checks while waiting for results
+CANCEL_POLL_INTERVAL = 0.1
+
+
+class TopKResults:
+    """Bounded min-heap holding the k most relevant results seen so far.
+
+    Ties on relevance keep the earlier result, so a full heap of results with
+    the maximum score is never displaced by later arrivals.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = max(1, k)
+        self._heap: list[tuple[float, int, SearchResult]] = []
+        self._seen = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether k results are held."""
+        return len(self._heap) >= self.k
+
+    @property
+    def min_score(self) -> float:
+        """Lowest relevance score currently held, 0.0 when empty."""
+        return self._heap[0][0] if self._heap else 0.0
+
+    def push(self, result: SearchResult) -> None:
+        """Offer a result, evicting the least relevant one when full."""
+        # Negated arrival order makes later results lose ties
+        entry = (result.relevance_score, -self._seen, result)
+        self._seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def results(self) -> list[SearchResult]:
+        """Held results, most relevant first."""
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
 
 class SearchOrchestrator:
     """Orchestrates multiple searchers to handle complex queries.
@@ -58,6 +115,8 @@ class SearchOrchestrator:
         self._ranking_engine = None
         self._result_processor = None
         self._analytics = None
+        # Worker pool for blocking git I/O; the process-wide default if unset
+        self._executor: GitExecutor | None = None
         self._metrics = SearchMetrics(
             total_commits_searched=0,
             total_files_searched=0,
@@ -98,6 +157,10 @@ class SearchOrchestrator:
         """Set the cache for the orchestrator."""
         self._cache = cache
 
+    def set_executor(self, executor: GitExecutor | None) -> None:
+        """Set the worker pool searchers use for blocking git I/O and matching."""
+        self._executor = executor
+
     def set_ranking_engine(self, ranking_engine: Any) -> None:
         """Set the ranking engine for the orchestrator."""
         self._ranking_engine = ranking_engine
@@ -146,10 +209,24 @@ class SearchOrchestrator:
         progress_callback: Callable[[str, float], None] | None = None,
         cache: dict[str, Any] | None = None,
         max_results: int | None = None,
+        stream: bool = False,
+        stop_score: float = 1.0,
+        cancellation_token: CancellationToken | None = None,
     ) -> AsyncGenerator[SearchResult, None]:
         """
         Perform a search using all applicable searchers.
 
+        By default results are ranked before they are yielded. With
+        ``max_results`` only the current top-k results by relevance are kept,
+        and all searchers are stopped as soon as k results score at least
+        ``stop_score``. With ``stream=True`` results are yielded unranked as
+        soon as a searcher produces them, and searchers are stopped once
+        ``max_results`` results have been yielded.
+
+        Searchers check ``cancellation_token`` inside their commit loops. When
+        it is cancelled, or ``query.timeout_seconds`` passes, all searchers stop
+        and the results found so far are returned.
+
         Args:
             repo: Git repository to search
             query: Search query
@@ -157,12 +234,14 @@ class SearchOrchestrator:
             progress_callback: Optional progress callback
             cache: Optional cache dictionary
             max_results: Maximum number of results to return
+            stream: Yield results in arrival order instead of ranking them
+            stop_score: Relevance score at which a full top-k stops the search
+            cancellation_token: Optional token used to cancel the search
 
         Yields:
             SearchResult objects
         """
         start_time = time.time()
-        results_count = 0
         search_id = None
         all_results_list: list[SearchResult] = []
         searcher_count = 0
@@ -183,12 +262,22 @@ class SearchOrchestrator:
             except Exception:
                 pass  # Ignore if already resolved or other issues
 
+            token = cancellation_token or CancellationToken()
+            if query.timeout_seconds:
+                token.set_timeout(query.timeout_seconds)
+
+            # Blocking git work runs on this search's share of the worker pool
+            lane = (self._executor or get_git_executor()).lane()
+
             context = SearchContext(
                 repo=repo,
                 query=query,
                 branch=branch,
-                progress_callback=progress_callback,
+                # Visitors on pool workers report progress back through the loop
+                progress_callback=loop_threadsafe(progress_callback) if progress_callback else None,
                 cache=effective_cache,
+                cancellation_token=token,
+                executor=lane,
             )
 
             # Find applicable searchers
@@ -204,68 +293,153 @@ class SearchOrchestrator:
 
             searcher_count = len(applicable_searchers)
 
+            # Searchers that provide a commit visitor share a single history walk
+            visitors: dict[BaseSearcher, CommitVisitor] = {}
+            for searcher in applicable_searchers:
+                visitor = self._create_visitor(searcher, context)
+                if visitor is not None:
+                    visitors[searcher] = visitor
+            if len(visitors) < 2:
+                # A lone visitor gains nothing from fan-out; run it on its own
+                visitors = {}
+            standalone_searchers = [s for s in applicable_searchers if s not in visitors]
+
             # Estimate total work for progress reporting
             total_work = 0
             searcher_work: dict[BaseSearcher, int] = {}
-            for searcher in applicable_searchers:
+            for searcher in standalone_searchers:
                 work = await searcher.estimate_work(context)
                 searcher_work[searcher] = work
                 total_work += work
-
-            # Run searchers and collect results
+            shared_work = 0
+            if visitors:
+                # The shared walk traverses history once, so estimate it once
+                shared_work = await next(iter(visitors)).estimate_work(context)
+                total_work += shared_work
+
+            # Searchers run as concurrent producers feeding a bounded queue, so
+            # results can be consumed while the searchers are still walking
             completed_work = 0
+            queue: asyncio.Queue[SearchResult | None] = asyncio.Queue(maxsize=RESULT_QUEUE_SIZE)
+            errors: list[Exception] = []
 
-            async def run_searcher(searcher: BaseSearcher) -> list[SearchResult]:
-                nonlocal completed_work, results_count
-
-                searcher_results: list[SearchResult] = []
-                async for result in searcher.search(context):
-                    searcher_results.append(result)
-                    results_count += 1
-
-                    # Check max results limit
-                    if max_results and results_count >= max_results:
-                        break
-
-                # Update progress
-                completed_work += searcher_work[searcher]
+            def producer_done(name: str, work: int) -> None:
+                nonlocal completed_work
+                completed_work += work
                 if progress_callback and total_work > 0:
-                    progress = completed_work / total_work
-                    progress_callback(f"Completed {searcher.name}", progress)
+                    progress_callback(f"Completed {name}", completed_work / total_work)
 
-                return searcher_results
+            async def produce(
+                results: AsyncGenerator[SearchResult, None], name: str, work: int
+            ) -> None:
+                try:
+                    async with contextlib.aclosing(results):
+                        async for result in results:
+                            await queue.put(result)
+                            # Hand control to the consumer so results stream out
+                            await asyncio.sleep(0)
+                    producer_done(name, work)
+                except Exception as e:
+                    errors.append(e)
+                # End-of-producer marker
+                await queue.put(None)
+
+            # Concurrent producers each get their own repository handle: one may
+            # read commits on the event loop while another's pool job does, and
+            # GitPython's persistent cat-file pipes are not thread-safe
+            producer_count = len(standalone_searchers) + (1 if visitors else 0)
+            handles = [
+                self._open_handle(repo) if producer_count > 1 else None
+                for _ in range(producer_count)
+            ]
+            contexts = [
+                context if handle is None else context.model_copy(update={"repo": handle})
+                for handle in handles
+            ]
+
+            producers = [
+                produce(searcher.search(producer_context), searcher.name, searcher_work[searcher])
+                for searcher, producer_context in zip(standalone_searchers, contexts, strict=False)
+            ]
+            if visitors:
+                names = ", ".join(searcher.name for searcher in visitors)
+                producers.append(
+                    produce(self._walk_commits(contexts[-1], visitors), names, shared_work)
+                )
+            tasks = [asyncio.create_task(producer) for producer in producers]
 
-            # Run all searchers concurrently
-            searcher_tasks = [run_searcher(searcher) for searcher in applicable_searchers]
-            all_results = await asyncio.gather(*searcher_tasks)
+            # Without a limit every result is kept for ranking; with one only the
+            # current top-k is, so memory stays bounded by max_results
+            top_k = TopKResults(max_results) if max_results and not stream else None
+            collected: list[SearchResult] = []
 
-            # Flatten results
-            flattened_results: list[SearchResult] = []
-            for searcher_results in all_results:
-                flattened_results.extend(searcher_results)
+            try:
+                running = len(tasks)
+                while running and not token.is_cancelled:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), CANCEL_POLL_INTERVAL)
+                    except TimeoutError:
+                        continue
+                    if item is None:
+                        running -= 1
+                        if errors:
+                            raise errors[0]
+                        continue
+
+                    if stream:
+                        all_results_list.append(item)
+                        yield item
+                        if max_results and len(all_results_list) >= max_results:
+                            break
+                    elif top_k is not None:
+                        top_k.push(item)
+                        # No later result can displace a full set of good-enough results
+                        if top_k.is_full and top_k.min_score >= stop_score:
+                            break
+                    else:
+                        collected.append(item)
+            finally:
+                # Stop searchers that are still running once enough results are in
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # Pool calls outlive cancelled searchers; let them finish before the
+                # repository is used again
+                await lane.drain()
+                for handle in handles:
+                    if handle is not None:
+                        handle.close()
+
+            if token.is_cancelled and progress_callback:
+                progress_callback(f"Search stopped: {token.reason}", 1.0)
+
+            if stream:
+                return
+
+            ranked_results = top_k.results() if top_k is not None else collected
 
             # Apply ranking if ranking engine is available
-            if self._ranking_engine and flattened_results:
+            if self._ranking_engine and ranked_results:
                 if progress_callback:
                     progress_callback("Ranking results...", 0.9)
-                flattened_results = await self._ranking_engine.rank_results(
-                    flattened_results, query, context
+                ranked_results = await self._ranking_engine.rank_results(
+                    ranked_results, query, context
                 )
             else:
                 # Fallback to simple relevance score sorting
-                flattened_results.sort(key=lambda r: r.relevance_score, reverse=True)
+                ranked_results.sort(key=lambda r: r.relevance_score, reverse=True)
 
             # Apply result processing if processor is available
-            if self._result_processor and flattened_results:
+            if self._result_processor and ranked_results:
                 if progress_callback:
                     progress_callback("Processing results...", 0.95)
-                flattened_results = await self._result_processor.process_results(
-                    flattened_results, query, context
+                ranked_results = await self._result_processor.process_results(
+                    ranked_results, query, context
                 )
 
             # Yield results and collect for analytics
-            for result in flattened_results:
-                if max_results and results_count >= max_results:
+            for result in ranked_results:
+                if max_results and len(all_results_list) >= max_results:
                     break
                 all_results_list.append(result)
                 yield result
@@ -298,6 +472,135 @@ class SearchOrchestrator:
             if progress_callback:
                 progress_callback("Search completed", 1.0)
 
+    @staticmethod
+    def _create_visitor(searcher: BaseSearcher, context: SearchContext) -> CommitVisitor | None:
+        """Get a searcher's commit visitor, or None if it must run on its own."""
+        try:
+            visitor = searcher.create_commit_visitor(context)
+        except Exception:
+            # Setup errors (e.g. an invalid pattern) are reported by search()
+            return None
+        return visitor if isinstance(visitor, CommitVisitor) else None
+
+    async def _walk_commits(
+        self, context: SearchContext, visitors: dict[BaseSearcher, CommitVisitor]
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Walk history once and broadcast every commit to all visitors.
+
+        Full GitPython commits are only loaded when a visitor needs diffs or
+        blobs; otherwise commit metadata is streamed from a single ``git log``
+        pipe. Commits are read and visited in chunks on the search's worker
+        lane. A visitor that fails is dropped without affecting the others.
+
+        Args:
+            context: Search context shared by all visitors.
+            visitors: Visitors keyed by the searcher that created them.
+
+        Yields:
+            Results in the order the visitors produce them.
+        """
+        active = dict(visitors)
+        branch = context.branch or context.repo.active_branch.name
+        needs_full_commits = any(visitor.needs_full_commits for visitor in active.values())
+        # Walk in the smallest chunks any visitor asks for
+        chunk_size = min(visitor.chunk_size for visitor in active.values())
+
+        try:
+            try:
+                if needs_full_commits:
+                    stream: Generator[Any, None, None] = context.repo.iter_commits(branch)
+                else:
+                    stream = iter_commit_records(context.repo, branch)
+
+                # Stop the git process behind the walk when it ends early
+                async with closing_on_lane(context.executor, stream) as commits:
+                    # Commits are read and matched on the git worker pool
+                    exhausted = False
+                    while not exhausted:
+                        results, exhausted = await run_blocking(
+                            context.executor,
+                            self._broadcast_chunk,
+                            context,
+                            active,
+                            commits,
+                            chunk_size,
+                        )
+                        for result in results:
+                            yield result
+
+            except Exception as e:
+                if context.progress_callback:
+                    context.progress_callback(f"Error walking commits: {e}", 1.0)
+
+            # Flush results still buffered by the visitors
+            for result in await run_blocking(
+                context.executor, self._finish_visitors, context, visitors
+            ):
+                yield result
+        finally:
+            # A walk stopped early still records each visitor's metrics
+            for visitor in visitors.values():
+                with contextlib.suppress(Exception):
+                    visitor.close()
+
+    @staticmethod
+    def _open_handle(repo: Any) -> Repo | None:
+        """Open another handle on a repository, with its own git processes.
+
+        Returns None for repositories that cannot be reopened by path (e.g.
+        test doubles); those are shared as they are.
+        """
+        try:
+            return Repo(repo.git_dir)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _broadcast_chunk(
+        context: SearchContext,
+        active: dict[BaseSearcher, CommitVisitor],
+        commits: Any,
+        chunk_size: int,
+    ) -> tuple[list[SearchResult], bool]:
+        """Broadcast up to ``chunk_size`` commits to the active visitors.
+
+        Runs on a worker thread. Visitors that finish or fail are removed
+        from ``active``.
+
+        Returns:
+            The results and whether the walk is over.
+        """
+        results: list[SearchResult] = []
+        for _ in range(chunk_size):
+            if not active or context.is_cancelled:
+                return results, True
+            commit = next(commits, None)
+            if commit is None:
+                return results, True
+
+            for searcher, visitor in list(active.items()):
+                try:
+                    results.extend(visitor.visit(commit))
+                except Exception as e:
+                    searcher._report_progress(context, f"Error in {searcher.name} search: {e}", 1.0)
+                    visitor.done = True
+                if visitor.done:
+                    del active[searcher]
+        return results, not active
+
+    @staticmethod
+    def _finish_visitors(
+        context: SearchContext, visitors: dict[BaseSearcher, CommitVisitor]
+    ) -> list[SearchResult]:
+        """Finish every visitor and collect the results they still buffered."""
+        results: list[SearchResult] = []
+        for searcher, visitor in visitors.items():
+            try:
+                results.extend(visitor.finish())
+            except Exception as e:
+                searcher._report_progress(context, f"Error in {searcher.name} search: {e}", 1.0)
+        return results
+
     async def get_available_searchers(self, query: SearchQuery) -> list[str]:
         """Get list of searcher names that can handle the given query."""
         available: list[str] = []
@@ -136,15 +136,23 @@ class CodePatternSearcher(CacheableSearcher):
         """Perform code pattern detection and analysis."""
         self._report_progress(context, "Starting pattern analysis...", 0.0)
 
-        # Check cache first
+        # Concurrent searches for the same key share one analysis
         cache_key = self._get_cache_key(context, "pattern_analysis")
-        cached_results = await self._get_from_cache(context, cache_key)
-        if cached_results:
+        results, cached = await self._get_or_compute_cached(
+            context, cache_key, lambda: self._run_pattern_analysis(context)
+        )
+        if cached:
             self._report_progress(context, "Using cached pattern results", 1.0)
-            for result in cached_results:
-                yield result
-            return
 
+        # Yield results
+        for result in results:
+            yield result
+
+        if not cached:
+            self._report_progress(context, "Pattern analysis completed", 1.0)
+
+    async def _run_pattern_analysis(self, context: SearchContext) -> list[SearchResult]:
+        """Run the full pattern analysis."""
         # Perform pattern analysis
         results: list[SearchResult] = []
 
@@ -153,14 +161,7 @@ class CodePatternSearcher(CacheableSearcher):
         pattern_results = await self._scan_for_patterns(context)
         results.extend(pattern_results)
 
-        # Cache results
-        await self._set_cache(context, cache_key, results)
-
-        # Yield results
-        for result in results:
-            yield result
-
-        self._report_progress(context, "Pattern analysis completed", 1.0)
+        return results
 
     async def _scan_for_patterns(self, context: SearchContext) -> list[SearchResult]:
         """Scan repository for code patterns."""
@@ -178,7 +179,7 @@ class CodePatternSearcher(CacheableSearcher):
         # Optimization: Add max results limit
         max_results = context.query.max_results if context.query.max_results else 1000
 
-        for commit in context.repo.iter_commits(branch):
+        async for commit in self._iter_blocking(context, context.repo.iter_commits(branch)):
             # Optimization: Early termination on max results
             if len(results) >= max_results:
                 break
@@ -186,9 +187,12 @@ class CodePatternSearcher(CacheableSearcher):
             commits_processed += 1
             if commits_processed > 1000:  # Limit for performance
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             # Analyze files in this commit
-            for file_path in commit.stats.files:
+            changed_files = await self._run_blocking(context, self._changed_files, commit)
+            for file_path in changed_files:
                 # Optimization: Use pre-built set for faster lookup
                 file_ext = Path(file_path).suffix.lower()
                 if file_ext in supported_extensions:
@@ -206,6 +210,17 @@ class CodePatternSearcher(CacheableSearcher):
 
         return results
 
+    @staticmethod
+    def _changed_files(commit: Any) -> list[str]:
+        """List the files a commit changed."""
+        return list(commit.stats.files)
+
+    @staticmethod
+    def _read_file_text(commit: Any, file_path: str) -> str:
+        """Read a file's decoded content at a commit."""
+        text: str = commit.tree[file_path].data_stream.read().decode("utf-8", errors="ignore")
+        return text
+
     def _should_analyze_file(self, file_path: str) -> bool:
         """Determine if a file should be analyzed for patterns.
 
@@ -229,8 +244,8 @@ class CodePatternSearcher(CacheableSearcher):
 
         try:
             # Get file content at this commit
-            file_content = (
-                commit.tree[file_path].data_stream.read().decode("utf-8", errors="ignore")
+            file_content = await self._run_blocking(
+                context, self._read_file_text, commit, file_path
             )
             lines = file_content.split("\n")
             file_ext = Path(file_path).suffix.lower()
@@ -0,0 +1,165 @@
+"""Phrase and proximity queries over token positions.
+
+A positional query is a conjunction of clauses, each a chain of terms with
+a gap constraint between adjacent terms:
+
+- ``"connection pool"`` is a phrase: each term directly follows the
+  previous one.
+- ``retry NEAR/5 timeout`` requires the terms within 5 tokens of each
+  other, in either order (the operator is case-insensitive). Chains such
+  as ``a NEAR/3 b NEAR/10 c`` constrain each adjacent pair, and phrases
+  may be chained: ``"connection pool" NEAR/10 timeout`` measures from the
+  last word of the phrase.
+- Any other word is a clause of its own that only has to occur.
+
+Terms are tokenized exactly like the inverted index tokenizes content:
+lowercased word characters, with short words and stop words dropped.
+Positions count indexed tokens only, so ``"connection to the pool"``
+matches like ``"connection pool"``.
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+# Tokens are runs of word characters; short ones and stop words are not indexed
+TOKEN_PATTERN = re.compile(r"\b\w+\b")
+MIN_TOKEN_LENGTH = 3
+STOP_WORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"})
+
+# Quoted phrases, NEAR/k operators and bare words of a query
+_QUERY_TOKEN = re.compile(
+    r'"(?P<phrase>[^"]*)"|(?P<near>(?i:NEAR)/(?P<distance>\d+))\b|(?P<word>[^\s"]+)'
+)
+
+# (minimum, maximum) offset of a term's position from the previous term's
+Gap = tuple[int, int]
+# Token positions of the first and last term of one match
+Span = tuple[int, int]
+
+PHRASE_GAP: Gap = (1, 1)
+
+
+def tokenize_spans(text: str) -> list[tuple[str, int, int]]:
+    """Indexed tokens of a text with their character offsets.
+
+    Returns:
+        ``(token, start, end)`` for each token, in order; the index of an
+        entry is the token's position.
+    """
+    tokens: list[tuple[str, int, int]] = []
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group().lower()
+        if len(token) >= MIN_TOKEN_LENGTH and token not in STOP_WORDS:
+            tokens.append((token, match.start(), match.end()))
+    return tokens
+
+
+def tokenize(text: str) -> list[str]:
+    """Indexed tokens of a text."""
+    return [token for token, _, _ in tokenize_spans(text)]
+
+
+def is_positional_query(text: str) -> bool:
+    """Whether a query uses phrase or proximity syntax."""
+    return '"' in text or re.search(r"\bNEAR/\d+\b", text, re.IGNORECASE) is not None
+
+
+@dataclass
+class Clause:
+    """A chain of terms; ``gaps[i]`` constrains ``terms[i + 1]`` relative to ``terms[i]``."""
+
+    terms: list[str]
+    gaps: list[Gap] = field(default_factory=list)
+
+    def matches(self, positions: dict[str, list[int]]) -> list[Span]:
+        """Find the spans where the chain occurs.
+
+        Args:
+            positions: Sorted token positions of each term in one document.
+
+        Returns:
+            The first and last token position covered by each match, one
+            match per position of the chain's last term, in order.
+        """
+        # Each reachable position of the current term, mapped to the span of its chain
+        reached = {position: (position, position) for position in positions.get(self.terms[0], ())}
+        for term, (low, high) in zip(self.terms[1:], self.gaps, strict=True):
+            if not reached:
+                return []
+            previous = sorted(reached)
+            following: dict[int, Span] = {}
+            for position in positions.get(term, ()):
+                # Previous positions within [position - high, position - low]
+                index = bisect_left(previous, position - high)
+                if index < len(previous) and previous[index] <= position - low:
+                    first, last = reached[previous[index]]
+                    following[position] = (min(first, position), max(last, position))
+            reached = following
+        return sorted(reached.values())
+
+
+@dataclass
+class PositionalQuery:
+    """A conjunction of phrase and proximity clauses."""
+
+    clauses: list[Clause]
+
+    @property
+    def terms(self) -> list[str]:
+        """Distinct terms of every clause, in query order."""
+        return list(dict.fromkeys(term for clause in self.clauses for term in clause.terms))
+
+    def matches(self, positions: dict[str, list[int]]) -> list[Span]:
+        """Spans matching every clause in one document, or an empty list."""
+        spans: list[Span] = []
+        for clause in self.clauses:
+            found = clause.matches(positions)
+            if not found:
+                return []
+            spans.extend(found)
+        return sorted(spans)
+
+
+def parse_positional_query(text: str) -> PositionalQuery:
+    """Parse a phrase/proximity query.
+
+    Raises:
+        ValueError: If a quote is unbalanced, a ``NEAR/k`` operator lacks an
+            operand, or the query contains no indexable terms.
+    """
+    if text.count('"') % 2:
+        raise ValueError(f"Unbalanced quote in query: {text}")
+
+    clauses: list[Clause] = []
+    # The clause a following NEAR/k operand is chained onto
+    pending_near: int | None = None
+    for match in _QUERY_TOKEN.finditer(text):
+        if match.group("near"):
+            if not clauses or pending_near is not None:
+                raise ValueError(f"NEAR/{match.group('distance')} needs a term on both sides")
+            pending_near = int(match.group("distance"))
+            continue
+
+        phrase = match.group("phrase")
+        terms = tokenize(phrase if phrase is not None else match.group("word"))
+        if not terms:
+            # Only stop words or short words; NEAR skips over them
+            continue
+        # A bare word like "pool.size" is made of adjacent tokens too
+        gaps = [PHRASE_GAP] * (len(terms) - 1)
+
+        if pending_near is not None:
+            clause = clauses[-1]
+            clause.gaps.append((-pending_near, pending_near))
+            clause.terms.extend(terms)
+            clause.gaps.extend(gaps)
+            pending_near = None
+        else:
+            clauses.append(Clause(terms, gaps))
+
+    if pending_near is not None:
+        raise ValueError(f"NEAR/{pending_near} needs a term on both sides")
+    if not clauses:
+        raise ValueError(f"Query has no searchable terms: {text}")
+    return PositionalQuery(clauses)
@@ -135,7 +135,7 @@ class QueryOptimizer:
             specificity += 3
         if query.file_extensions:
             specificity += 1
-        if query.date_after or query.date_before:
+        if query.date_from or query.date_to:
             specificity += 2
 
         # More specific = fewer results needed
@@ -169,7 +169,7 @@ class QueryOptimizer:
                 bool(query.content_pattern),
                 bool(query.file_path_pattern),
                 bool(query.file_extensions),
-                bool(query.date_after or query.date_before),
+                bool(query.date_from or query.date_to),
             ]
         )
 
@@ -201,7 +201,7 @@ class QueryOptimizer:
             )
 
         # Check for cache-unfriendly patterns
-        if query.date_after and not query.date_before:
+        if query.date_from and not query.date_to:
             analysis["can_use_cache"] = False
             analysis["suggested_optimizations"].append("Open-ended date ranges are harder to cache")
 
@@ -242,7 +242,7 @@ class QueryPlanner:
             )
 
         # 2. Date range filter (high selectivity)
-        if query.date_after or query.date_before:
+        if query.date_from or query.date_to:
             steps.append(
                 {
                     "searcher": "date_range",
@@ -217,6 +217,8 @@ class AdvancedSearcher(CacheableSearcher, ParallelSearcher):
             commits_processed += 1
             if commits_processed > 2000:  # Limit for performance
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             author_match = self._match_author(commit, query.author_pattern, query.fuzzy_search)
             if author_match:
@@ -257,6 +259,8 @@ class AdvancedSearcher(CacheableSearcher, ParallelSearcher):
             commits_processed += 1
             if commits_processed > 2000:  # Limit for performance
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             message_match = self._match_message(commit, query.message_pattern, query.fuzzy_search)
             if message_match:
@@ -305,6 +309,8 @@ class AdvancedSearcher(CacheableSearcher, ParallelSearcher):
             commits_processed += 1
             if commits_processed > 2000:  # Limit for performance
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             for file_path in commit.stats.files:
                 file_match = self._match_file_path(
@@ -346,6 +352,8 @@ class AdvancedSearcher(CacheableSearcher, ParallelSearcher):
             commits_processed += 1
             if commits_processed > 2000:  # Limit for performance
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             commit_date = datetime.fromtimestamp(commit.committed_date)
             date_match = self._match_date_range(commit_date, query.date_from, query.date_to)
@@ -516,6 +524,8 @@ class AdvancedSearcher(CacheableSearcher, ParallelSearcher):
             commits_processed += 1
             if commits_processed > 500:  # Limit for manual search
                 break
+            if await self._checkpoint(context, commits_processed):
+                break
 
             for file_path in commit.stats.files:
                 try:
@@ -0,0 +1,372 @@
+"""Segmented storage for the inverted and trigram indexes.
+
+Like Lucene, an index on disk is a set of immutable segment files (see
+``index_segment``) plus a small JSON manifest naming the live ones:
+
+- **Saving** writes only the documents added since the last save, as a new
+  segment, so an update costs time proportional to the change rather than
+  to the whole index.
+- **Queries** run over every live segment.
+- **Deletes** are tombstones: the manifest records the deleted ordinals of
+  each segment, and queries skip them until a merge drops them for good.
+- **Merging** follows a tiered policy: segments are grouped into tiers by
+  size, and once a tier holds ``merge_factor`` segments they are merged into
+  one segment of the next tier. Merges can run on a background thread while
+  the index keeps serving queries and accepting saves.
+
+A segment file saved before manifests existed is loaded as a single-segment
+index and migrated on the next save.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .index_segment import IndexSegment, is_segment_file, merge_segments
+
+MANIFEST_FORMAT = "githound-segments"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class MergePolicy:
+    """Tiered merge policy deciding which segments to merge."""
+
+    # Segments per tier before they are merged into the next tier
+    merge_factor: int = 10
+    # A segment with more deleted documents than this fraction is rewritten
+    max_deleted_ratio: float = 0.3
+
+    def _tier(self, live_docs: int) -> int:
+        """Size tier: 0 below ``merge_factor`` documents, 1 below its square, ..."""
+        factor = max(2, self.merge_factor)
+        tier = 0
+        while live_docs >= factor:
+            live_docs //= factor
+            tier += 1
+        return tier
+
+    def select(self, sizes: list[tuple[int, int]]) -> list[int]:
+        """Pick segments to merge.
+
+        Args:
+            sizes: ``(doc_count, deleted_count)`` of each live segment.
+
+        Returns:
+            Positions of the segments to merge, or an empty list.
+        """
+        for position, (doc_count, deleted) in enumerate(sizes):
+            if doc_count and deleted / doc_count > self.max_deleted_ratio:
+                return [position]
+
+        tiers: dict[int, list[int]] = {}
+        for position, (doc_count, deleted) in enumerate(sizes):
+            tiers.setdefault(self._tier(doc_count - deleted), []).append(position)
+        for tier in sorted(tiers):
+            if len(tiers[tier]) >= max(2, self.merge_factor):
+                return tiers[tier][: max(2, self.merge_factor)]
+        return []
+
+
+DEFAULT_MERGE_POLICY = MergePolicy()
+
+
+class SegmentSet:
+    """The live segments of one index and their tombstones.
+
+    Thread-safe: saves, deletes and merges may run on different threads,
+    and queries work on a consistent ``snapshot()``.
+    """
+
+    def __init__(self) -> None:
+        self.segments: list[IndexSegment] = []
+        # Deleted ordinals of each segment
+        self.deleted: list[set[int]] = []
+        # Index-level information kept in the manifest
+        self.info: dict[str, Any] = {}
+        self.path: Path | None = None
+        self._next_id = 1
+        # A segment file loaded from before manifests existed
+        self._legacy: IndexSegment | None = None
+        # Segment files reserved by saves or merges that are not live yet
+        self._pending: set[str] = set()
+        # Leave replaced segment files in place for readers of an older
+        # manifest; the owner calls remove_stale once they are unreferenced
+        self.keep_stale = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    @property
+    def live_docs(self) -> int:
+        """Number of documents that are not deleted."""
+        with self._lock:
+            return sum(
+                segment.doc_count - len(deleted)
+                for segment, deleted in zip(self.segments, self.deleted, strict=True)
+            )
+
+    def snapshot(self) -> list[tuple[IndexSegment, set[int]]]:
+        """The current segments with their deleted ordinals, for one query."""
+        with self._lock:
+            return list(zip(self.segments, self.deleted, strict=True))
+
+    def doc_freq(self, term: str) -> int:
+        """Number of documents containing a term, tombstones included."""
+        return sum(segment.doc_freq(term) for segment, _ in self.snapshot())
+
+    def locate(self, doc_id: str) -> Iterator[tuple[IndexSegment, int]]:
+        """Yield the segment and ordinal of each live copy of a document."""
+        for segment, deleted in self.snapshot():
+            ordinal = segment.ordinal(doc_id)
+            if ordinal is not None and ordinal not in deleted:
+                yield segment, ordinal
+
+    def __contains__(self, doc_id: str) -> bool:
+        return next(self.locate(doc_id), None) is not None
+
+    def delete(self, doc_id: str) -> int:
+        """Tombstone every live copy of a document.
+
+        Returns:
+            Number of copies deleted; the deletion is saved with the manifest.
+        """
+        deleted = 0
+        with self._lock:
+            for segment, ordinal in list(self.locate(doc_id)):
+                self.deleted[self.segments.index(segment)].add(ordinal)
+                deleted += 1
+        return deleted
+
+    def _segment_path(self, path: Path, segment_id: int) -> Path:
+        return path.with_name(f"{path.name}.{segment_id:06d}.seg")
+
+    def new_segment_path(self, path: Path) -> Path:
+        """Reserve the file name of the next segment of the index at ``path``."""
+        with self._lock:
+            segment_path = self._segment_path(path, self._next_id)
+            self._next_id += 1
+            self._pending.add(segment_path.name)
+        return segment_path
+
+    def release(self, segment_path: Path) -> None:
+        """Give up a reserved segment file name, removing any partial file."""
+        with self._lock:
+            self._pending.discard(segment_path.name)
+        with contextlib.suppress(OSError):
+            segment_path.unlink()
+
+    def add(self, segment_path: Path) -> IndexSegment:
+        """Open a newly written segment and make it live."""
+        segment = IndexSegment(segment_path)
+        with self._lock:
+            self.segments.append(segment)
+            self.deleted.append(set())
+            self._pending.discard(segment_path.name)
+        return segment
+
+    def manifest(self) -> dict[str, Any]:
+        """The manifest naming the live segments and their tombstones."""
+        with self._lock:
+            return {
+                "format": MANIFEST_FORMAT,
+                "version": MANIFEST_VERSION,
+                "next_segment": self._next_id,
+                "segments": [
+                    {"name": segment.path.name, "deleted": sorted(deleted)}
+                    for segment, deleted in zip(self.segments, self.deleted, strict=True)
+                ],
+                "info": self.info,
+            }
+
+    def save(self, path: Path) -> None:
+        """Write the manifest naming the live segments, then drop unused files.
+
+        With ``keep_stale`` set, unused files are left for ``remove_stale``.
+        """
+        with self._lock:
+            if self._legacy is not None:
+                self._migrate_legacy(path)
+            self.path = path
+            _write_atomic(path, json.dumps(self.manifest()).encode("utf-8"))
+        if not self.keep_stale:
+            self.remove_stale(path)
+
+    def remove_stale(self, path: Path) -> None:
+        """Remove segment files of the index at ``path`` that are no longer live."""
+        with self._lock:
+            live = {segment.path.name for segment in self.segments} | self._pending
+
+        # Segments replaced by merges; a failed removal is retried next time
+        for stale in path.parent.glob(f"{path.name}.*.seg"):
+            if stale.name not in live:
+                with contextlib.suppress(OSError):
+                    stale.unlink()
+
+    def _migrate_legacy(self, path: Path) -> None:
+        """Copy a pre-manifest segment file aside before the manifest replaces it."""
+        legacy = self._legacy
+        assert legacy is not None
+        new_path = self.new_segment_path(path)
+        shutil.copyfile(legacy.path, new_path)
+        position = self.segments.index(legacy)
+        self.segments[position] = IndexSegment(new_path)
+        self._pending.discard(new_path.name)
+        legacy.close()
+        self._legacy = None
+
+    def load(self, path: Path, manifest: dict[str, Any] | None = None) -> bool:
+        """Open the segments named by a manifest, or a single legacy segment file.
+
+        Args:
+            path: The index's manifest path (or legacy segment file)
+            manifest: A manifest to open instead of the one saved at ``path``,
+                e.g. one published as part of a larger generation
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if manifest is None and is_segment_file(path):
+            try:
+                segment = IndexSegment(path)
+            except (OSError, ValueError):
+                return False
+            self.close()
+            with self._lock:
+                self.segments = [segment]
+                self.deleted = [set()]
+                self.info = dict(segment.info)
+                self._legacy = segment
+                self.path = path
+            return True
+
+        try:
+            if manifest is None:
+                manifest = json.loads(path.read_bytes())
+            if manifest.get("format") != MANIFEST_FORMAT:
+                return False
+            if manifest.get("version") != MANIFEST_VERSION:
+                return False
+            segments: list[IndexSegment] = []
+            try:
+                for entry in manifest["segments"]:
+                    segments.append(IndexSegment(path.with_name(entry["name"])))
+            except BaseException:
+                for segment in segments:
+                    segment.close()
+                raise
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+
+        self.close()
+        with self._lock:
+            self.segments = segments
+            self.deleted = [set(entry.get("deleted", ())) for entry in manifest["segments"]]
+            self.info = manifest.get("info", {})
+            self._next_id = manifest.get("next_segment", len(segments) + 1)
+            self.path = path
+        return True
+
+    def merge(self, policy: MergePolicy = DEFAULT_MERGE_POLICY) -> bool:
+        """Merge the segments the policy selects, if any.
+
+        The merged segment is written without holding the lock; documents
+        deleted meanwhile are carried over to it before it replaces its
+        sources, and the manifest is then saved.
+
+        Returns:
+            True if segments were merged
+        """
+        with self._lock:
+            path = self.path
+            if path is None or self._legacy is not None:
+                return False
+            positions = policy.select(
+                [
+                    (segment.doc_count, len(deleted))
+                    for segment, deleted in zip(self.segments, self.deleted, strict=True)
+                ]
+            )
+            if not positions:
+                return False
+            sources = [(self.segments[i], set(self.deleted[i])) for i in positions]
+
+        merged_path = self.new_segment_path(path)
+        try:
+            ordinal_maps = merge_segments(merged_path, sources, {"merged_from": len(sources)})
+            merged = IndexSegment(merged_path)
+        except BaseException:
+            self.release(merged_path)
+            raise
+
+        with self._lock:
+            current = [
+                next((i for i, live in enumerate(self.segments) if live is segment), None)
+                for segment, _ in sources
+            ]
+            if None in current or self.path != path:
+                # The index was reset or reloaded while merging
+                merged.close()
+                self.release(merged_path)
+                return False
+
+            deleted: set[int] = set()
+            for (_, merged_deleted), position, mapping in zip(
+                sources, current, ordinal_maps, strict=True
+            ):
+                assert position is not None
+                for ordinal in self.deleted[position] - merged_deleted:
+                    deleted.add(mapping[ordinal])
+
+            # Queries holding a snapshot keep using the sources until they finish
+            keep = [i for i in range(len(self.segments)) if i not in current]
+            insert_at = min(i for i in current if i is not None)
+            segments = [self.segments[i] for i in keep]
+            deleted_sets = [self.deleted[i] for i in keep]
+            position = sum(1 for i in keep if i < insert_at)
+            segments.insert(position, merged)
+            deleted_sets.insert(position, deleted)
+            self.segments = segments
+            self.deleted = deleted_sets
+            self._pending.discard(merged_path.name)
+            self.save(path)
+        return True
+
+    def clear(self) -> None:
+        """Forget every segment; files are replaced on the next save."""
+        with self._lock:
+            self.segments = []
+            self.deleted = []
+            self.info = {}
+            self._legacy = None
+
+    def close(self) -> None:
+        """Unmap every segment."""
+        with self._lock:
+            for segment in self.segments:
+                segment.close()
+            self.clear()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file with new contents, never exposing a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
@@ -12,6 +12,9 @@ from .base import CacheableSearcher, SearchContext
 class TagSearcher(CacheableSearcher):
     """Searcher for tag and release analysis."""
 
+    # Analyses span every branch and tag
+    cache_all_refs = True
+
     def __init__(self) -> None:
         super().__init__("tag", "tag")
 
@@ -50,15 +53,23 @@ class TagSearcher(CacheableSearcher):
         """Perform tag and release analysis."""
         self._report_progress(context, "Starting tag analysis...", 0.0)
 
-        # Check cache first
+        # Concurrent searches for the same key share one analysis
         cache_key = self._get_cache_key(context, "tag_analysis")
-        cached_results = await self._get_from_cache(context, cache_key)
-        if cached_results:
+        results, cached = await self._get_or_compute_cached(
+            context, cache_key, lambda: self._run_tag_analysis(context)
+        )
+        if cached:
             self._report_progress(context, "Using cached tag results", 1.0)
-            for result in cached_results:
-                yield result
-            return
 
+        # Yield results
+        for result in results:
+            yield result
+
+        if not cached:
+            self._report_progress(context, "Tag analysis completed", 1.0)
+
+    async def _run_tag_analysis(self, context: SearchContext) -> list[SearchResult]:
+        """Run the full tag analysis."""
         # Perform tag analysis
         results: list[SearchResult] = []
 
@@ -77,14 +88,7 @@ class TagSearcher(CacheableSearcher):
         timeline_results = await self._analyze_release_timeline(context)
         results.extend(timeline_results)
 
-        # Cache results
-        await self._set_cache(context, cache_key, results)
-
-        # Yield results
-        for result in results:
-            yield result
-
-        self._report_progress(context, "Tag analysis completed", 1.0)
+        return results
 
     async def _analyze_tags(self, context: SearchContext) -> list[SearchResult]:
         """Analyze repository tags."""
@@ -0,0 +1,292 @@
+"""Trigram index for regex content search over indexed blobs.
+
+Like Google Code Search and zoekt, every indexed blob is recorded under each
+three-byte substring (trigram) of its content. A regex is decomposed into an
+AND/OR query over the trigrams any match must contain, which narrows the
+candidate blobs to a handful that are then verified with the real regex.
+
+Trigrams are taken from ASCII-lowercased content, so one index serves both
+case-sensitive and case-insensitive patterns: a query built from lowercased
+literals only ever over-approximates the matching blobs. Postings are stored
+in the segment format from ``index_segment``, keyed by blob SHA.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .index_segment import IndexSegment, Posting, encode_postings, write_segment
+from .segment_set import DEFAULT_MERGE_POLICY, MergePolicy, SegmentSet
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants  # type: ignore[attr-defined]
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_constants
+    import sre_parse
+
+# Query nodes: ("all",), ("tri", trigram), ("and", [nodes]), ("or", [nodes])
+TrigramQuery = tuple[Any, ...]
+
+MATCH_ALL: TrigramQuery = ("all",)
+
+_REPEATS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT),
+}
+
+
+def _trigrams(data: bytes) -> set[str]:
+    """Distinct trigrams of lowercased bytes, as latin-1 strings."""
+    text = data.lower().decode("latin-1")
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _and(parts: Iterable[TrigramQuery]) -> TrigramQuery:
+    """AND of query nodes, dropping unconstrained parts."""
+    nodes = [part for part in parts if part != MATCH_ALL]
+    if not nodes:
+        return MATCH_ALL
+    return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+
+def _or(parts: Iterable[TrigramQuery]) -> TrigramQuery:
+    """OR of query nodes; any unconstrained branch makes the whole OR unconstrained."""
+    nodes = list(parts)
+    if not nodes or MATCH_ALL in nodes:
+        return MATCH_ALL
+    return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+
+def _literal_query(literal: bytes) -> TrigramQuery:
+    """Require every trigram of a literal run."""
+    return _and(("tri", trigram) for trigram in sorted(_trigrams(literal)))
+
+
+def _sequence_query(items: Any) -> TrigramQuery:
+    """Build the query for a parsed regex sequence."""
+    parts: list[TrigramQuery] = []
+    run = bytearray()
+
+    def flush() -> None:
+        if len(run) >= 3:
+            parts.append(_literal_query(bytes(run)))
+        run.clear()
+
+    for op, av in items:
+        if op is sre_constants.LITERAL and av < 0x80:
+            run.append(av)
+            continue
+        if op is sre_constants.AT:
+            # Zero-width assertions do not break a literal run
+            continue
+
+        flush()
+        if op is sre_constants.SUBPATTERN:
+            parts.append(_sequence_query(av[-1]))
+        elif op is sre_constants.BRANCH:
+            parts.append(_or(_sequence_query(branch) for branch in av[1]))
+        elif op in _REPEATS:
+            minimum, _, item = av
+            if minimum >= 1:
+                parts.append(_sequence_query(item))
+        # Anything else (classes, wildcards, non-ASCII literals, ...) is unconstrained
+    flush()
+    return _and(parts)
+
+
+def regex_trigram_query(pattern: str) -> TrigramQuery:
+    """Decompose a regex into the trigram query its matches must satisfy.
+
+    Returns:
+        The query, or ``MATCH_ALL`` when the pattern constrains no trigrams
+        or cannot be parsed.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError, TypeError):
+        return MATCH_ALL
+    return _sequence_query(parsed)
+
+
+class TrigramIndex:
+    """Maps trigrams to the blobs containing them.
+
+    Saved blobs live in segments (see ``segment_set``); blobs added since
+    the last save are buffered in memory and written as a new segment by
+    ``save``.
+    """
+
+    def __init__(self) -> None:
+        # Buffered trigram -> buffer positions of the blobs containing it
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        # Buffered blob SHA -> metadata, and the SHAs in buffer order
+        self._blobs: dict[str, dict[str, Any] | None] = {}
+        self._buffered_shas: list[str] = []
+        self.segments = SegmentSet()
+
+    def __len__(self) -> int:
+        return self.segments.live_docs + len(self._blobs)
+
+    def __contains__(self, blob_sha: str) -> bool:
+        return blob_sha in self._blobs or blob_sha in self.segments
+
+    def add_blob(
+        self, blob_sha: str, content: bytes, metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Index a blob's content once; blobs already indexed are ignored."""
+        if blob_sha in self:
+            return
+        position = len(self._buffered_shas)
+        self._blobs[blob_sha] = metadata
+        self._buffered_shas.append(blob_sha)
+        for trigram in _trigrams(content):
+            self._postings[trigram].append(position)
+
+    def delete_blob(self, blob_sha: str) -> bool:
+        """Stop returning a saved blob as a candidate.
+
+        Returns:
+            True if the blob was indexed
+        """
+        if blob_sha in self._blobs:
+            removed = self._buffered_shas.index(blob_sha)
+            del self._blobs[blob_sha]
+            del self._buffered_shas[removed]
+            # Later buffered blobs move down one position
+            for trigram in list(self._postings):
+                positions = [
+                    position - (position > removed)
+                    for position in self._postings[trigram]
+                    if position != removed
+                ]
+                if positions:
+                    self._postings[trigram] = positions
+                else:
+                    del self._postings[trigram]
+            return True
+        return self.segments.delete(blob_sha) > 0
+
+    def _evaluate(
+        self, query: TrigramQuery, segments: list[tuple[IndexSegment, set[int]]]
+    ) -> set[tuple[int, int]] | None:
+        """Evaluate a query to candidate ``(segment, ordinal)`` pairs, or None for every blob.
+
+        The buffer is numbered as the segment after the last saved one.
+        """
+        kind = query[0]
+        if kind == "all":
+            return None
+        found: set[tuple[int, int]] | None = None
+        if kind == "tri":
+            buffer_number = len(segments)
+            found = {(buffer_number, position) for position in self._postings.get(query[1], ())}
+            for number, (segment, _) in enumerate(segments):
+                found.update((number, ordinal) for ordinal, _ in segment.postings(query[1]))
+            return found
+        if kind == "and":
+            result: set[tuple[int, int]] | None = None
+            for part in query[1]:
+                found = self._evaluate(part, segments)
+                if found is None:
+                    continue
+                result = found if result is None else result & found
+                if not result:
+                    break
+            return result
+        # "or"
+        union: set[tuple[int, int]] = set()
+        for part in query[1]:
+            found = self._evaluate(part, segments)
+            if found is None:
+                return None
+            union |= found
+        return union
+
+    def candidates(self, pattern: str) -> list[tuple[str, dict[str, Any] | None]] | None:
+        """Find the blobs that may match a regex.
+
+        Returns:
+            ``(blob_sha, metadata)`` for each candidate blob, or None if the
+            pattern constrains no trigrams and every blob would have to be
+            scanned.
+        """
+        segments = self.segments.snapshot()
+        found = self._evaluate(regex_trigram_query(pattern), segments)
+        if found is None:
+            return None
+
+        candidates: list[tuple[str, dict[str, Any] | None]] = []
+        for number, ordinal in sorted(found):
+            if number == len(segments):
+                blob_sha = self._buffered_shas[ordinal]
+                candidates.append((blob_sha, self._blobs[blob_sha]))
+                continue
+            segment, deleted = segments[number]
+            if ordinal not in deleted:
+                blob_sha, _, metadata = segment.document(ordinal)
+                candidates.append((blob_sha, metadata))
+        return candidates
+
+    def save(self, path: Path) -> None:
+        """Write buffered blobs as a new segment and save the manifest at ``path``."""
+        if self._buffered_shas:
+            segment_path = self.segments.new_segment_path(path)
+            try:
+                write_segment(segment_path, self._buffered_terms(), self._buffered_documents(), {})
+                self.segments.add(segment_path)
+            except BaseException:
+                self.segments.release(segment_path)
+                raise
+            self._clear_buffer()
+        self.segments.save(path)
+
+    def merge_segments(self, policy: MergePolicy = DEFAULT_MERGE_POLICY) -> int:
+        """Merge saved segments as the policy dictates.
+
+        Returns:
+            Number of merges performed
+        """
+        merges = 0
+        while self.segments.merge(policy):
+            merges += 1
+        return merges
+
+    def _buffered_terms(self) -> Iterator[tuple[str, int, bytes]]:
+        """Buffered postings in trigram order for ``write_segment``."""
+        for trigram in sorted(self._postings, key=lambda term: term.encode("utf-8")):
+            postings: list[Posting] = [(position, []) for position in self._postings[trigram]]
+            yield trigram, len(postings), encode_postings(postings)
+
+    def _buffered_documents(self) -> Iterator[tuple[str, str, dict[str, Any] | None]]:
+        """Buffered blobs in buffer order."""
+        for blob_sha in self._buffered_shas:
+            yield blob_sha, "blob", self._blobs[blob_sha]
+
+    def _clear_buffer(self) -> None:
+        """Forget buffered blobs."""
+        self._postings = defaultdict(list)
+        self._blobs = {}
+        self._buffered_shas = []
+
+    def load(self, path: Path, manifest: dict[str, Any] | None = None) -> bool:
+        """Open the saved trigram segments.
+
+        Args:
+            path: Manifest path the index was saved to
+            manifest: A manifest to open instead of the one saved at ``path``
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.segments.load(path, manifest):
+            return False
+        self._clear_buffer()
+        return True
+
+    def close(self) -> None:
+        """Unmap the saved segments."""
+        self.segments.close()
@@ -1,18 +1,25 @@
-"""Encapsulates the core search logic using the ripgrep (rg) command."""
+"""Encapsulates the core blob content search logic."""
 
-import json
-import subprocess
 from pathlib import Path
 
 # [attr-defined]
 from githound.models import SearchConfig, SearchResult, SearchType
+from githound.search_engine.content_matcher import ContentMatcher, create_content_matcher
 
 
 def search_blob_content(
-    content: bytes, query: str, config: SearchConfig, commit_hash: str, file_path: str
+    content: bytes,
+    query: str,
+    config: SearchConfig,
+    commit_hash: str,
+    file_path: str,
+    matcher: ContentMatcher | None = None,
 ) -> list[SearchResult]:
     """
-    Searches the given content for the query using the ripgrep (rg) command.
+    Searches the given content for the query.
+
+    The matching engine is selected by ``config.content_engine``: the default
+    in-process regex engine, or ripgrep (``rg``) as an opt-in backend.
 
     Args:
         content: The content to search, as bytes.
@@ -20,48 +27,34 @@ def search_blob_content(
         config: The search configuration.
         commit_hash: The hash of the commit being searched.
         file_path: The path of the file being searched.
+        matcher: Matcher for ``query`` built once per search; one is created
+            from ``query`` and ``config`` if not given.
 
     Returns:
         A list of search results.
-    """
-    rg_args = ["rg", "--json", query, "-"]
-    if not config.case_sensitive:  # [attr-defined]
-        rg_args.append("-i")
 
-    try:
-        process = subprocess.run(rg_args, input=content, capture_output=True, check=True, text=True)
-    except subprocess.CalledProcessError as e:
-        # ripgrep exit code 1 means no matches found, which is not an error
-        if e.returncode == 1:
-            return []
-        # Other exit codes are actual errors, re-raise them
-        raise
-    except FileNotFoundError:
-        # ripgrep not found
-        return []
+    Raises:
+        re.error: If the pattern is invalid for the in-process engine.
+        subprocess.CalledProcessError: If ripgrep fails for reasons other than no matches.
+    """
+    if matcher is None:
+        matcher = create_content_matcher(
+            query, config.case_sensitive, config.content_engine  # [attr-defined]
+        )
 
     results: list[SearchResult] = []
-    for line in process.stdout.strip().split("\n"):
-        if not line:
-            continue
-        try:
-            match = json.loads(line)
-        except json.JSONDecodeError:
-            # Skip invalid JSON lines
-            continue
-        if match["type"] == "match":
-            data = match["data"]
-            results.append(
-                SearchResult(
-                    commit_hash=commit_hash,
-                    file_path=Path(file_path),
-                    line_number=data["line_number"],
-                    matching_line=data["lines"]["text"].strip(),
-                    commit_info=None,
-                    search_type=SearchType.CONTENT,
-                    relevance_score=0.0,
-                    match_context=None,
-                    search_time_ms=None,
-                )
+    for match in matcher.search(content):
+        results.append(
+            SearchResult(
+                commit_hash=commit_hash,
+                file_path=Path(file_path),
+                line_number=match["line_number"],
+                matching_line=match["text"],
+                commit_info=None,
+                search_type=SearchType.CONTENT,
+                relevance_score=0.0,
+                match_context=None,
+                search_time_ms=None,
             )
+        )
     return results
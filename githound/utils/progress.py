@@ -21,12 +21,21 @@ from rich.table import Table
 
 
 class CancellationToken:
-    """Thread-safe cancellation token for long-running operations."""
+    """Thread-safe cancellation token for long-running operations.
 
-    def __init__(self) -> None:
+    A token can also carry a deadline, after which it reports itself as
+    cancelled. Checking the token is cheap enough to do once per commit.
+    """
+
+    def __init__(self, timeout_seconds: float | None = None) -> None:
         self._cancelled = threading.Event()
         self._lock = threading.Lock()
         self._reason: str | None = None
+        self._deadline: float | None = None
+        self._timeout_seconds: float | None = None
+        self._timed_out = False
+        if timeout_seconds is not None:
+            self.set_timeout(timeout_seconds)
 
     def cancel(self, reason: str = "Operation cancelled") -> None:
         """Cancel the operation with an optional reason."""
@@ -34,10 +43,35 @@ class CancellationToken:
             self._reason = reason
             self._cancelled.set()
 
+    def set_timeout(self, timeout_seconds: float) -> None:
+        """Cancel automatically once ``timeout_seconds`` have passed.
+
+        An earlier deadline that is already set is kept.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        with self._lock:
+            if self._deadline is None or deadline < self._deadline:
+                self._deadline = deadline
+                self._timeout_seconds = timeout_seconds
+
     @property
     def is_cancelled(self) -> bool:
-        """Check if cancellation has been requested."""
-        return self._cancelled.is_set()
+        """Check if cancellation has been requested or the deadline has passed."""
+        if self._cancelled.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            with self._lock:
+                if not self._cancelled.is_set():
+                    self._timed_out = True
+                    self._reason = f"Operation timed out after {self._timeout_seconds:g} seconds"
+                    self._cancelled.set()
+            return True
+        return False
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether the token was cancelled by its deadline."""
+        return self.is_cancelled and self._timed_out
 
     @property
     def reason(self) -> str | None:
@@ -108,7 +108,12 @@ async def _complete_search(search_id: str, search_request: SearchRequest) -> Non
         if repo is not None:
 
             async def _run_search() -> None:
-                async for result in orchestrator.search(repo, query):
+                async for result in orchestrator.search(
+                    repo,
+                    query,
+                    max_results=query.max_results,
+                    cancellation_token=state.cancellation_token,
+                ):
                     results.append(result)
 
             try:
@@ -145,9 +150,14 @@ async def _complete_search(search_id: str, search_request: SearchRequest) -> Non
             filters_applied={},
         )
         state.set_response(response)
-        state.status = "completed"
+        token = state.cancellation_token
+        if token.is_cancelled and not token.timed_out:
+            # Keep the cancelled status set by cancel_search
+            state.status = "cancelled"
+        else:
+            state.status = "completed"
+            state.message = "Search completed"
         state.progress = 1.0
-        state.message = "Search completed"
         state.completed_at = datetime.utcnow()
 
     except Exception as exc:  # noqa: BLE001 - best effort background task
@@ -268,9 +278,8 @@ async def cancel_search(search_id: str) -> ApiResponse:
             request_id=None,
         )
 
-    state.status = "cancelled"
-    state.progress = 1.0
-    state.message = "Search cancelled"
+    # Stops the searchers at their next commit, not just the tracked state
+    state.cancel("Search cancelled")
     state.completed_at = datetime.utcnow()
 
     return ApiResponse(
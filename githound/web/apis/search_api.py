@@ -20,6 +20,7 @@ from ...git_handler import get_repository
 from ...models import OutputFormat, SearchMetrics, SearchQuery, SearchResult, SearchType
 from ...search_engine import SearchOrchestrator
 from ...utils.export import ExportManager
+from ...utils.progress import CancellationToken
 from ..middleware.rate_limiting import get_limiter
 from ..models.api_models import (
     ActiveSearchState,
@@ -273,6 +274,10 @@ class AdvancedSearchRequest(BaseModel):
     # Search options
     case_sensitive: bool = Field(False, description="Case sensitive search")
     regex_mode: bool = Field(False, description="Interpret patterns as regular expressions")
+    positional_query: bool = Field(
+        False,
+        description='Treat content_pattern as a phrase/proximity query ("a b", a NEAR/k b)',
+    )
     fuzzy_search: bool = Field(False, description="Enable fuzzy matching")
     fuzzy_threshold: float = Field(0.8, ge=0.0, le=1.0, description="Fuzzy match threshold")
     include_globs: list[str] | None = Field(None, description="Include file patterns")
@@ -650,9 +655,8 @@ async def cancel_search_endpoint(
             request_id=request_id,
         )
 
-    state.status = "cancelled"
-    state.progress = 1.0
-    state.message = "Search cancelled"
+    # Stops the searchers at their next commit, not just the tracked state
+    state.cancel("Search cancelled")
     state.completed_at = _utc_now()
     active_searches[search_id] = state
 
@@ -743,6 +747,7 @@ def _convert_to_search_query(
     """Convert search request to internal SearchQuery."""
     payload: dict[str, Any] = {
         "content_pattern": request.content_pattern,
+        "positional_query": request.positional_query,
         "commit_hash": request.commit_hash,
         "author_pattern": request.author_pattern,
         "message_pattern": request.message_pattern,
@@ -771,20 +776,38 @@ def _convert_to_search_query(
 
 
 async def perform_advanced_search_sync(
-    orchestrator: SearchOrchestrator, search_query: SearchQuery, repo_path: str
+    orchestrator: SearchOrchestrator,
+    search_query: SearchQuery,
+    repo_path: str,
+    cancellation_token: CancellationToken | None = None,
 ) -> dict[str, Any]:
-    """Execute a synchronous search and return execution metadata."""
+    """Execute a synchronous search and return execution metadata.
+
+    The search stops early when ``cancellation_token`` is cancelled or the
+    query's ``timeout_seconds`` passes; results found so far are returned.
+    """
     start_time = _utc_now()
     raw_results: list[SearchResult] = []
     result_payload: list[dict[str, Any]] = []
+    token = cancellation_token or CancellationToken()
 
     try:
         repo = get_repository(Path(repo_path))
 
-        async for result in orchestrator.search(repo, search_query):
+        # Rank only the top page and stop searchers once it is filled
+        async for result in orchestrator.search(
+            repo, search_query, max_results=search_query.max_results, cancellation_token=token
+        ):
             raw_results.append(result)
             result_payload.append(SearchResultResponse.from_search_result(result).dict())
 
+        # A timed-out search still returns its partial results
+        status_value = "completed"
+        error_message = None
+        if token.is_cancelled:
+            status_value = "completed" if token.timed_out else "cancelled"
+            error_message = token.reason
+
         metrics_obj = getattr(orchestrator, "metrics", None)
         if isinstance(metrics_obj, SearchMetrics):
             commits_searched = metrics_obj.total_commits_searched
@@ -797,15 +820,15 @@ async def perform_advanced_search_sync(
 
         return {
             "search_id": str(uuid.uuid4()),
-            "status": "completed",
+            "status": status_value,
             "results": result_payload,
             "raw_results": raw_results,
             "total_count": len(raw_results),
             "commits_searched": commits_searched,
             "files_searched": files_searched,
             "search_duration_ms": duration_ms,
-            "error_message": None,
-            "has_more": False,
+            "error_message": error_message,
+            "has_more": token.timed_out,
             "next_page_token": None,
             "query_info": {},
             "filters_applied": {},
@@ -847,7 +870,9 @@ async def perform_advanced_search(
     active_searches[search_id] = state
 
     try:
-        execution = await perform_advanced_search_sync(orchestrator, search_query, repo_path)
+        execution = await perform_advanced_search_sync(
+            orchestrator, search_query, repo_path, state.cancellation_token
+        )
         execution["request"] = state.request or original_request
         _update_state_from_execution(search_id, execution, orchestrator, user_id)
     except Exception as exc:  # noqa: BLE001
@@ -10,6 +10,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from ...models import OutputFormat, SearchMetrics, SearchResult
+from ...utils.progress import CancellationToken
 
 # Base API Models
 
@@ -195,6 +196,15 @@ class ActiveSearchState:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     extra: dict[str, Any] = field(default_factory=dict)
+    # Cancels the running search; checked by searchers inside their commit loops
+    cancellation_token: CancellationToken = field(default_factory=CancellationToken)
+
+    def cancel(self, reason: str = "Search cancelled") -> None:
+        """Mark the search as cancelled and stop its searchers."""
+        self.cancellation_token.cancel(reason)
+        self.status = "cancelled"
+        self.progress = 1.0
+        self.message = reason
 
     def update_results(
         self, results: Sequence[SearchResult | SearchResultResponse | dict[str, Any]] | None
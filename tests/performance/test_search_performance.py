@@ -0,0 +1,274 @@
+"""
+Performance benchmarks for GitHound search engine internals.
+
+These benchmarks compare alternative implementations of hot search paths
+so regressions and improvements are measurable.
+"""
+
+import pickle
+import shutil
+import subprocess
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+from git import Repo
+
+from githound.search_engine.commit_reader import iter_commit_records
+from githound.search_engine.content_matcher import DEFAULT_BATCH_SIZE, create_content_matcher
+from githound.search_engine.indexer import InvertedIndex
+
+
+def _make_blobs(count: int = 200, lines_per_blob: int = 200) -> list[bytes]:
+    """Create synthetic source blobs with a sparse set of matches."""
+    blobs: list[bytes] = []
+    for blob_index in range(count):
+        lines = [
+            f"    value_{line} = compute(item_{line}, offset={blob_index})"
+            for line in range(lines_per_blob)
+        ]
+        if blob_index % 10 == 0:
+            lines[lines_per_blob // 2] = "    # TODO: remove deprecated connection pool"
+        blobs.append("\n".join(lines).encode())
+    return blobs
+
+
+def _make_history(path: Path, commit_count: int) -> Repo:
+    """Create a linear history quickly with git fast-import."""
+    repo = Repo.init(path)
+    stream: list[str] = []
+    for index in range(commit_count):
+        message = f"Commit {index}: update module {index % 50}\n"
+        content = f"value = {index}\n"
+        stream.append("commit refs/heads/master")
+        author = f"Dev {index % 7} <dev{index % 7}@example.com>"
+        stream.append(f"committer {author} {1_600_000_000 + index} +0000")
+        stream.append(f"data {len(message)}\n{message}")
+        stream.append(f"M 644 inline module_{index % 50}.py\ndata {len(content)}\n{content}")
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        input="\n".join(stream).encode(),
+        cwd=path,
+        check=True,
+    )
+    return repo
+
+
+def _make_index(doc_count: int = 5000, tokens_per_doc: int = 80) -> InvertedIndex:
+    """Build an inverted index over synthetic documents with a skewed vocabulary."""
+    index = InvertedIndex()
+    for doc in range(doc_count):
+        words = [f"term{(doc * 31 + i * i) % 4000}" for i in range(tokens_per_doc)]
+        words.extend(["self", "return", f"unique{doc}"])
+        index.add_document(f"{doc:040x}", " ".join(words), {"file_path": f"src/m{doc % 97}.py"})
+    index.update_stats()
+    return index
+
+
+def _save_legacy_pickle(index: InvertedIndex, path: Path) -> None:
+    """Save an index the way the pickle-based format did."""
+    postings: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(dict)
+    for term, docs in index.index.items():
+        for doc_id, positions in docs.items():
+            postings[term][doc_id] = [
+                {"position": position, "field": "content"} for position in positions
+            ]
+    data = {
+        "index": dict(postings),
+        "doc_freq": dict(index.doc_freq),
+        "total_docs": index.total_docs,
+        "doc_metadata": index.doc_metadata,
+        "build_time": None,
+        "stats": index.stats,
+    }
+    with open(path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _time_engine(engine: str, pattern: str, blobs: list[bytes]) -> tuple[float, int]:
+    """Search every blob with the given engine and return (seconds, match count)."""
+    matcher = create_content_matcher(pattern, case_sensitive=False, engine=engine)
+    start = time.perf_counter()
+    match_count = sum(len(matcher.search(blob)) for blob in blobs)
+    return time.perf_counter() - start, match_count
+
+
+class TestContentEnginePerformance:
+    """Benchmark the in-process content engine against ripgrep."""
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("pattern", ["connection pool", r"TODO:\s+\w+"])
+    def test_regex_engine_vs_ripgrep(self, pattern: str) -> None:
+        """Compare per-blob search throughput of both engines."""
+        blobs = _make_blobs()
+
+        regex_seconds, regex_matches = _time_engine("regex", pattern, blobs)
+        print(f"\nregex engine: {len(blobs)} blobs in {regex_seconds * 1000:.1f}ms")
+        assert regex_matches == 20
+
+        # The in-process engine must stay well clear of per-blob process costs
+        assert regex_seconds < 1.0
+
+        if shutil.which("rg") is None:
+            pytest.skip("ripgrep not installed, skipping comparison")
+
+        rg_seconds, rg_matches = _time_engine("ripgrep", pattern, blobs)
+        print(f"ripgrep engine: {len(blobs)} blobs in {rg_seconds * 1000:.1f}ms")
+        print(f"speedup: {rg_seconds / max(regex_seconds, 1e-9):.1f}x")
+
+        assert rg_matches == regex_matches
+        assert regex_seconds < rg_seconds
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_ripgrep_batched_vs_per_blob(self) -> None:
+        """Compare one ripgrep process per blob against batched invocations."""
+        if shutil.which("rg") is None:
+            pytest.skip("ripgrep not installed")
+
+        blobs = _make_blobs()
+        pattern = "connection pool"
+
+        per_blob_seconds, per_blob_matches = _time_engine("ripgrep", pattern, blobs)
+
+        matcher = create_content_matcher(pattern, case_sensitive=False, engine="ripgrep")
+        start = time.perf_counter()
+        batched_matches = 0
+        for offset in range(0, len(blobs), DEFAULT_BATCH_SIZE):
+            batch = blobs[offset : offset + DEFAULT_BATCH_SIZE]
+            batched_matches += sum(len(matches) for matches in matcher.search_batch(batch))
+        batched_seconds = time.perf_counter() - start
+
+        print(f"\nripgrep per blob: {len(blobs)} blobs in {per_blob_seconds * 1000:.1f}ms")
+        print(f"ripgrep batched: {len(blobs)} blobs in {batched_seconds * 1000:.1f}ms")
+        print(f"speedup: {per_blob_seconds / max(batched_seconds, 1e-9):.1f}x")
+
+        assert batched_matches == per_blob_matches == 20
+        assert batched_seconds < per_blob_seconds
+
+
+class TestCommitReaderPerformance:
+    """Benchmark streaming git log records against GitPython commit objects."""
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_record_stream_vs_iter_commits(self, tmp_path: Path) -> None:
+        """Compare reading author and message metadata for a whole history."""
+        repo = _make_history(tmp_path, 2000)
+
+        start = time.perf_counter()
+        gitpython = [(c.author.email, c.message) for c in repo.iter_commits("master")]
+        gitpython_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        streamed = [(r.author.email, r.message) for r in iter_commit_records(repo, "master")]
+        streamed_seconds = time.perf_counter() - start
+
+        print(f"\niter_commits: {len(gitpython)} commits in {gitpython_seconds * 1000:.1f}ms")
+        print(f"git log stream: {len(streamed)} commits in {streamed_seconds * 1000:.1f}ms")
+        print(f"speedup: {gitpython_seconds / max(streamed_seconds, 1e-9):.1f}x")
+
+        assert streamed == gitpython
+        assert streamed_seconds < gitpython_seconds
+
+
+class TestIndexFormatPerformance:
+    """Benchmark the memory-mapped segment format against the pickle format."""
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_segment_vs_pickle_size_and_cold_load(self, tmp_path: Path) -> None:
+        """Compare file size and cold-load time (segment: open and answer a first query)."""
+        index = _make_index()
+        expected = index.search("term7 unique42", limit=10)
+
+        pickle_path = tmp_path / "legacy.idx"
+        _save_legacy_pickle(index, pickle_path)
+        segment_path = tmp_path / "segment.idx"
+        index.save(segment_path)
+        index.close()
+
+        timings: dict[str, float] = {}
+        # The pickle format had to be unpickled in full before any query
+        start = time.perf_counter()
+        with open(pickle_path, "rb") as f:
+            legacy = pickle.load(f)
+        timings["pickle"] = time.perf_counter() - start
+        assert legacy["total_docs"] == 5000
+
+        start = time.perf_counter()
+        loaded = InvertedIndex()
+        assert loaded.load(segment_path)
+        results = loaded.search("term7 unique42", limit=10)
+        timings["segment"] = time.perf_counter() - start
+        loaded.close()
+        assert results == expected
+
+        pickle_size = pickle_path.stat().st_size
+        # The manifest lists the segment files holding the index
+        segment_size = sum(path.stat().st_size for path in tmp_path.glob("segment.idx.*.seg"))
+        print(
+            f"\npickle format: {pickle_size / 1024:.0f} KiB, cold load in "
+            f"{timings['pickle'] * 1000:.1f}ms"
+        )
+        print(
+            f"segment format: {segment_size / 1024:.0f} KiB, cold query in "
+            f"{timings['segment'] * 1000:.1f}ms"
+        )
+        print(
+            f"size ratio: {pickle_size / segment_size:.1f}x, "
+            f"load speedup: {timings['pickle'] / max(timings['segment'], 1e-9):.1f}x"
+        )
+
+        assert segment_size < pickle_size
+        assert timings["segment"] < timings["pickle"]
+
+
+def _exhaustive_top_k(index: InvertedIndex, query: str, limit: int) -> list[tuple[str, float]]:
+    """Score every posting of every query term, then sort, as search did before pruning."""
+    scores: dict[str, float] = defaultdict(float)
+    for token in index._tokenize(query):
+        idf = index._calculate_idf(token)
+        for segment, deleted in index.segments.snapshot():
+            for ordinal, positions in segment.postings(token):
+                if ordinal not in deleted:
+                    scores[segment.doc_id(ordinal)] += len(positions) * idf
+    return sorted(scores.items(), key=lambda item: -item[1])[:limit]
+
+
+class TestTopKSearchPerformance:
+    """Benchmark WAND top-k pruning against exhaustive scoring."""
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark
+    def test_wand_vs_exhaustive_common_terms(self, tmp_path: Path) -> None:
+        """Common-term queries stop scoring once no remaining document can enter the top 10."""
+        index = _make_index(doc_count=20000, tokens_per_doc=20)
+        index.save(tmp_path / "content.idx")
+
+        timings: dict[str, float] = {}
+        for name, search in (
+            ("exhaustive", lambda query: _exhaustive_top_k(index, query, 10)),
+            ("wand", lambda query: index.search(query, limit=10)),
+        ):
+            start = time.perf_counter()
+            for query in ("self return", "self", "return term7"):
+                results = search(query)
+                assert len(results) == 10
+            timings[name] = time.perf_counter() - start
+
+        for query in ("self return", "return term7", "term7 term11 unique42"):
+            wand_scores = [round(score, 9) for _, score in index.search(query, limit=10)]
+            exhaustive = _exhaustive_top_k(index, query, 10)
+            assert wand_scores == [round(score, 9) for _, score in exhaustive]
+        index.close()
+
+        print(
+            f"\nexhaustive: {timings['exhaustive'] * 1000:.1f}ms, "
+            f"wand: {timings['wand'] * 1000:.1f}ms, "
+            f"speedup: {timings['exhaustive'] / max(timings['wand'], 1e-9):.1f}x"
+        )
+        assert timings["wand"] < timings["exhaustive"]
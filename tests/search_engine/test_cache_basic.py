@@ -1,10 +1,19 @@
 """Basic tests for GitHound search engine cache module."""
 
 import asyncio
+import time
 
 import pytest
 
-from githound.search_engine.cache import CacheBackend, MemoryCache, RedisCache, SearchCache
+from githound.search_engine.cache import (
+    CacheBackend,
+    MemoryCache,
+    RedisCache,
+    SearchCache,
+    SingleFlight,
+    SQLiteCache,
+    TieredCache,
+)
 
 
 class TestCacheBackend:
@@ -124,6 +133,103 @@ class TestMemoryCache:
         # Should only keep the most recent items
         assert len(small_cache._cache) <= 3
 
+    @pytest.mark.asyncio
+    async def test_eviction_follows_recent_use(self) -> None:
+        """Reading an entry protects it from the next eviction."""
+        small_cache = MemoryCache(max_size=3)
+        for i in range(3):
+            await small_cache.set(f"key_{i}", f"value_{i}")
+
+        await small_cache.get("key_0")
+        await small_cache.set("key_3", "value_3")
+
+        assert await small_cache.keys() == ["key_2", "key_0", "key_3"]
+
+    @pytest.mark.asyncio
+    async def test_memory_limit_counts_nested_results(self) -> None:
+        """Sizes include the results inside a cached list, so the memory limit holds."""
+        from githound.models import SearchResult, SearchType
+
+        def results(n: int) -> list[SearchResult]:
+            return [
+                SearchResult(
+                    commit_hash=f"{n:040x}",
+                    file_path=f"src/module_{n}_{i}.py",
+                    line_number=i,
+                    matching_line="x" * 200,
+                    search_type=SearchType.CONTENT,
+                    relevance_score=0.5,
+                )
+                for i in range(50)
+            ]
+
+        cache = MemoryCache(max_size=1000, max_memory_mb=1)
+        entry_size = cache._estimate_size(results(0))
+        # Shallow sizing would only count the list's pointer array
+        assert entry_size > 50 * 400
+
+        for n in range(200):
+            await cache.set(f"query_{n}", results(n))
+
+        assert cache.memory_bytes <= 1024 * 1024
+        assert cache.memory_bytes == sum(cache._size_estimates.values())
+        assert len(cache._cache) < 200
+        assert await cache.get("query_199") is not None
+
+        await cache.clear()
+        assert cache.memory_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_cached(self) -> None:
+        """A value larger than the whole memory limit is refused without evicting anything."""
+        cache = MemoryCache(max_memory_mb=1)
+        await cache.set("small", "value")
+
+        assert await cache.set("huge", "x" * (2 * 1024 * 1024)) is False
+        assert await cache.exists("small")
+        assert not await cache.exists("huge")
+
+    @pytest.mark.asyncio
+    async def test_tinylfu_keeps_popular_entries(self) -> None:
+        """One-off entries don't displace frequently requested ones."""
+        cache = MemoryCache(max_size=3, admission="tinylfu")
+        for i in range(3):
+            await cache.set(f"popular_{i}", i)
+            for _ in range(3):
+                await cache.get(f"popular_{i}")
+
+        for i in range(20):
+            assert await cache.get(f"scan_{i}") is None
+            assert await cache.set(f"scan_{i}", i) is False
+
+        assert sorted(await cache.keys()) == ["popular_0", "popular_1", "popular_2"]
+        assert cache.rejections == 20
+
+        # A key requested repeatedly earns its place
+        for _ in range(6):
+            await cache.get("rising")
+        assert await cache.set("rising", "value") is True
+        assert await cache.exists("rising")
+
+    @pytest.mark.asyncio
+    async def test_rejected_update_keeps_previous_value(self) -> None:
+        """An update the admission policy rejects leaves the cached value in place."""
+        cache = MemoryCache(max_memory_mb=1, admission="tinylfu")
+        await cache.set("popular", "p" * (400 * 1024))
+        for _ in range(5):
+            await cache.get("popular")
+        await cache.set("key", "old")
+
+        assert await cache.set("key", "n" * (700 * 1024)) is False
+        assert cache.rejections == 1
+        assert await cache.get("key") == "old"
+        assert await cache.exists("popular")
+
+    def test_unknown_admission_policy(self) -> None:
+        """Only known admission policies are accepted."""
+        with pytest.raises(ValueError):
+            MemoryCache(admission="random")  # type: ignore[arg-type]
+
 
 @pytest.mark.skipif(
     not hasattr(pytest, "redis_available") or not pytest.redis_available,
@@ -330,3 +436,383 @@ class TestCacheIntegration:
 
         stats = cache.get_stats()
         assert stats["sets"] >= 50
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent cache misses."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self) -> None:
+        """Concurrent requests for one key share a single computation."""
+        cache = SearchCache(backend=MemoryCache())
+        calls = 0
+
+        async def compute() -> list[str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return ["result"]
+
+        values = await asyncio.gather(*(cache.get_or_compute(compute, "query") for _ in range(10)))
+
+        assert calls == 1
+        assert values == [["result"]] * 10
+        assert await cache.get("query") == ["result"]
+        assert await cache.get_or_compute(compute, "query") == ["result"]
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter(self) -> None:
+        """A failed computation is reported to all waiters and not cached."""
+        flights = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("search failed")
+
+        outcomes = await asyncio.gather(
+            *(flights.do("key", fail) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_cancelled_computation(self) -> None:
+        """If the computing caller is cancelled, a waiter computes instead."""
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def compute() -> str:
+            started.set()
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.create_task(flights.do("key", compute))
+        await started.wait()
+        waiter = asyncio.create_task(flights.do("key", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == "value"
+        assert leader.cancelled()
+
+
+class TestTieredCache:
+    """Test the memory tier in front of a shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_reads_promote_into_memory(self) -> None:
+        """Values found only in the shared tier are copied into the memory tier."""
+        shared = MemoryCache()
+        cache = TieredCache(MemoryCache(), shared)
+        await shared.set("key", "value")
+
+        assert await cache.get("key") == "value"
+        assert await cache.l1.exists("key")
+
+    @pytest.mark.asyncio
+    async def test_writes_and_deletes_reach_both_tiers(self) -> None:
+        """Another process sees writes through the shared tier."""
+        shared = MemoryCache()
+        first = TieredCache(MemoryCache(), shared)
+        second = TieredCache(MemoryCache(), shared)
+
+        await first.set("key", "value")
+        assert await second.get("key") == "value"
+
+        await first.delete("key")
+        assert not await shared.exists("key")
+        assert not await first.exists("key")
+
+    @pytest.mark.asyncio
+    async def test_memory_copies_expire_early(self) -> None:
+        """Memory copies live at most l1_ttl seconds."""
+        cache = TieredCache(MemoryCache(), MemoryCache(), l1_ttl=5)
+        await cache.set("key", "value", ttl=3600)
+
+        assert cache.l1._cache["key"]["expires_at"] <= time.time() + 5
+
+    @pytest.mark.asyncio
+    async def test_invalidation_messages(self) -> None:
+        """Messages from other processes drop memory copies; a process ignores its own."""
+        cache = TieredCache(MemoryCache(), MemoryCache())
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        await cache.apply_invalidation(f"{cache._origin} delete a")
+        assert await cache.l1.exists("a")
+
+        await cache.apply_invalidation("other-process delete a")
+        assert not await cache.l1.exists("a")
+        assert await cache.get("a") == 1  # Refetched from the shared tier
+
+        await cache.apply_invalidation("other-process clear ")
+        assert await cache.l1.keys() == []
+
+    def test_invalidation_requires_redis(self) -> None:
+        """Pub/sub invalidation is only available with a Redis shared tier."""
+        with pytest.raises(ValueError):
+            TieredCache(MemoryCache(), MemoryCache(), invalidation_channel="githound:invalidate")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_analysis(self, temp_repo) -> None:
+        """Identical concurrent searches run the searcher's analysis once."""
+        from githound.models import SearchQuery
+        from githound.search_engine import BranchSearcher, SearchContext
+
+        searcher = BranchSearcher()
+        analyze = searcher._run_branch_analysis
+        runs = 0
+
+        async def counting_analysis(context: SearchContext):  # type: ignore[no-untyped-def]
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.05)
+            return await analyze(context)
+
+        searcher._run_branch_analysis = counting_analysis  # type: ignore[method-assign]
+        context = SearchContext(
+            repo=temp_repo,
+            query=SearchQuery(branch_analysis=True),
+            cache=SearchCache(backend=TieredCache(MemoryCache(), MemoryCache())),
+        )
+
+        async def search() -> list[str]:
+            return [result.matching_line async for result in searcher.search(context)]
+
+        outputs = await asyncio.gather(*(search() for _ in range(5)))
+
+        assert runs == 1
+        assert outputs[0] and all(output == outputs[0] for output in outputs)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shared", [True, False], ids=["search_cache", "dict"])
+    async def test_cancelled_analysis_is_not_cached(self, temp_repo, shared: bool) -> None:
+        """Results of a search cancelled part-way are returned but not cached."""
+        from githound.models import SearchQuery
+        from githound.search_engine import BranchSearcher, SearchContext
+        from githound.utils.progress import CancellationToken
+
+        searcher = BranchSearcher()
+        analyze = searcher._run_branch_analysis
+        token = CancellationToken()
+
+        async def cancelled_analysis(context: SearchContext):  # type: ignore[no-untyped-def]
+            token.cancel("stopped")
+            return []
+
+        searcher._run_branch_analysis = cancelled_analysis  # type: ignore[method-assign]
+        query = SearchQuery(branch_analysis=True)
+        cache = SearchCache(backend=MemoryCache()) if shared else {}
+        context = SearchContext(repo=temp_repo, query=query, cache=cache, cancellation_token=token)
+        assert [result async for result in searcher.search(context)] == []
+
+        searcher._run_branch_analysis = analyze  # type: ignore[method-assign]
+        context = SearchContext(repo=temp_repo, query=query, cache=cache)
+        assert [result async for result in searcher.search(context)]
+
+
+class FakeRedis:
+    """In-process stand-in for the parts of the asyncio Redis client RedisCache uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+        self.calls: list[str] = []
+
+    @staticmethod
+    def _key(key: str | bytes) -> bytes:
+        return key.encode() if isinstance(key, str) else key
+
+    async def get(self, key: str) -> bytes | None:
+        self.calls.append("get")
+        return self.data.get(self._key(key))
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.calls.append("mget")
+        return [self.data.get(self._key(key)) for key in keys]
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.calls.append("setex")
+        self.data[self._key(key)] = value
+
+    async def unlink(self, *keys: str | bytes) -> int:
+        self.calls.append("unlink")
+        return sum(self.data.pop(self._key(key), None) is not None for key in keys)
+
+    async def scan_iter(self, match: str, count: int):  # type: ignore[no-untyped-def]
+        import fnmatch
+
+        self.calls.append("scan")
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key.decode(), match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        self.calls.append("pipeline")
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute()."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+        self.commands: list[tuple[str, int, bytes]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.commands.append((key, ttl, value))
+
+    async def execute(self) -> None:
+        for key, _, value in self.commands:
+            self.client.data[FakeRedis._key(key)] = value
+
+
+class TestRedisBatching:
+    """Test RedisCache's batched commands against an in-process client."""
+
+    def setup_method(self) -> None:
+        self.cache = RedisCache(prefix="test:")
+        self.client = FakeRedis()
+        self.cache._client = self.client  # type: ignore[assignment]
+
+    @pytest.mark.asyncio
+    async def test_many_keys_use_one_round_trip(self) -> None:
+        """set_many pipelines its writes and get_many reads with one MGET."""
+        items = {f"key_{i}": [i] for i in range(50)}
+
+        assert await self.cache.set_many(items) == 50
+        values = await self.cache.get_many([*items, "missing"])
+
+        assert values == items
+        assert self.client.calls == ["pipeline", "mget"]
+
+    @pytest.mark.asyncio
+    async def test_invalidation_scans_and_unlinks_in_batches(self) -> None:
+        """Pattern deletes walk the keyspace with SCAN and UNLINK batch by batch."""
+        self.cache.delete_batch_size = 10
+        await self.cache.set_many({f"query:{i}": i for i in range(25)} | {"other": 0})
+        self.client.data[b"elsewhere:query:1"] = b""
+
+        search_cache = SearchCache(backend=self.cache)
+        assert await search_cache.invalidate_pattern("query:*") == 25
+
+        assert self.client.calls.count("unlink") == 3
+        assert "keys" not in self.client.calls
+        assert await self.cache.keys() == ["other"]
+        assert search_cache.get_stats()["deletes"] == 25
+
+        assert await self.cache.clear()
+        assert list(self.client.data) == [b"elsewhere:query:1"]
+
+    @pytest.mark.asyncio
+    async def test_pickled_values_are_misses(self) -> None:
+        """Values pickled by earlier releases are not loaded."""
+        import pickle
+
+        self.client.data[b"test:old"] = b"\x00" + pickle.dumps(["value"])
+
+        assert await self.cache.get("old") is None
+        assert await self.cache.get_many(["old"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_values_the_codec_cannot_encode_are_not_cached(self) -> None:
+        """Arbitrary objects are refused instead of pickled."""
+        assert await self.cache.set("key", object()) is False
+        assert await self.cache.set_many({"a": 1, "b": object()}) == 1
+        assert await self.cache.get("a") == 1
+
+
+class TestSQLiteCache:
+    """Test the on-disk cache backend."""
+
+    @pytest.mark.asyncio
+    async def test_entries_outlive_the_process(self, tmp_path) -> None:
+        """A new cache on the same file sees what an earlier one stored."""
+        from githound.models import SearchResult, SearchType
+
+        results = [
+            SearchResult(commit_hash="a" * 40, file_path="a.py", search_type=SearchType.CONTENT)
+        ]
+        first = SQLiteCache(tmp_path / "cache.sqlite3")
+        assert await first.set("query", results)
+        await first.close()
+
+        second = SQLiteCache(tmp_path / "cache.sqlite3")
+        assert await second.get("query") == results
+        assert await second.keys("que*") == ["query"]
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, tmp_path) -> None:
+        """Entries are not returned after their TTL."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        await cache.set("key", "value", ttl=1)
+        cache._connect().execute("UPDATE entries SET expires_at = ?", (time.time() - 1,))
+
+        assert not await cache.exists("key")
+        assert await cache.get("key") is None
+        assert await cache.size_bytes() == 0
+
+    @pytest.mark.asyncio
+    async def test_size_limit_evicts_least_recently_read(self, tmp_path) -> None:
+        """Past the size limit the entries read longest ago are dropped."""
+        import secrets
+
+        cache = SQLiteCache(tmp_path / "cache.sqlite3", max_size_mb=1)
+
+        def value(kib: int) -> str:
+            # Hex digits compress to a little over half their length
+            return secrets.token_hex(kib * 1024)
+
+        for i in range(3):
+            assert await cache.set(f"key_{i}", value(250))
+            await asyncio.sleep(0.01)
+        await cache.get("key_0")
+        await cache.set("key_3", value(250))
+
+        assert sorted(await cache.keys()) == ["key_0", "key_2", "key_3"]
+        assert await cache.size_bytes() <= cache.max_bytes
+        assert await cache.set("huge", value(2048)) is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers(self, tmp_path) -> None:
+        """Several processes can write to one cache file at the same time."""
+        import subprocess
+        import sys
+
+        path = tmp_path / "cache.sqlite3"
+        script = (
+            "import asyncio, sys\n"
+            "from githound.search_engine.cache import SQLiteCache\n"
+            "async def main():\n"
+            "    cache = SQLiteCache(sys.argv[1])\n"
+            "    for i in range(50):\n"
+            "        assert await cache.set(f'{sys.argv[2]}_{i}', [i])\n"
+            "asyncio.run(main())\n"
+        )
+        workers = [
+            subprocess.Popen([sys.executable, "-c", script, str(path), f"w{n}"]) for n in range(4)
+        ]
+        assert all(worker.wait() == 0 for worker in workers)
+
+        cache = SQLiteCache(path)
+        assert len(await cache.keys()) == 200
+        assert await cache.get("w3_49") == [49]
+        assert await cache.delete_pattern("w1_*") == 50
+        assert await cache.size_bytes() == sum(
+            len(row[0]) for row in cache._connect().execute("SELECT value FROM entries")
+        )
+
+    def test_repo_cache_is_ignored_by_git(self, tmp_path) -> None:
+        """The repository's cache directory keeps itself out of git status."""
+        cache = SQLiteCache.for_repo(tmp_path)
+
+        assert cache.path == tmp_path / ".githound" / "cache.sqlite3"
+        assert (tmp_path / ".githound" / ".gitignore").read_text() == "*\n"
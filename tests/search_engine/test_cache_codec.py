@@ -0,0 +1,112 @@
+"""Tests for the encoding of values in shared caches."""
+
+import pickle
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from githound.models import CommitInfo, SearchResult, SearchType
+from githound.search_engine.cache_codec import (
+    FORMAT_JSON,
+    FORMAT_JSON_ZLIB,
+    CodecError,
+    decode_value,
+    encode_value,
+)
+
+
+def _results(n: int) -> list[SearchResult]:
+    commit = CommitInfo(
+        hash="a" * 40,
+        short_hash="aaaaaaa",
+        author_name="Ada",
+        author_email="ada@example.com",
+        committer_name="Ada",
+        committer_email="ada@example.com",
+        message="Add pool",
+        date=datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+        files_changed=2,
+        insertions=10,
+        parents=["b" * 40],
+    )
+    return [
+        SearchResult(
+            commit_hash="a" * 40,
+            file_path=Path(f"src/pool_{i}.py"),
+            line_number=i,
+            matching_line=f"pool = Pool({i})",
+            commit_info=commit if i % 2 else None,
+            search_type=SearchType.CONTENT,
+            relevance_score=0.5,
+            match_context={"before": ["x"], "after": []},
+        )
+        for i in range(n)
+    ]
+
+
+class TestCodec:
+    """Tests for encoding and decoding cached values."""
+
+    def test_search_results_round_trip(self) -> None:
+        """Search results decode to equal models, including nested commit info."""
+        results = _results(5)
+
+        decoded = decode_value(encode_value(results))
+
+        assert decoded == results
+        assert isinstance(decoded[1].commit_info, CommitInfo)
+        assert decoded[1].commit_info.date == results[1].commit_info.date
+        # Commit info shared by several results is stored and rebuilt once
+        assert decoded[3].commit_info is decoded[1].commit_info
+
+    def test_results_are_columnar_and_smaller_than_pickle(self) -> None:
+        """Field names are stored once, so results encode smaller than pickled models."""
+        results = _results(200)
+
+        encoded = encode_value(results)
+
+        assert encoded[0] == FORMAT_JSON_ZLIB
+        assert len(encoded) < len(pickle.dumps(results))
+        small = encode_value(_results(1)[:1])
+        assert small[0] == FORMAT_JSON
+        # search_time_ms is empty for every result and left out
+        assert b"search_time_ms" not in small
+
+    def test_other_values_round_trip(self) -> None:
+        """Plain data, dicts with non-string keys, datetimes, paths and models are kept."""
+        value = {
+            "count": 3,
+            "ratio": 0.5,
+            "names": ["a", "b"],
+            "nested": {"$special": 1, 2: "two"},
+            "model": _results(1)[0],
+            "empty": [],
+            "when": datetime(2024, 5, 1, tzinfo=UTC),
+            "where": Path("src/pool.py"),
+        }
+
+        assert decode_value(encode_value(value)) == value
+
+    def test_unsupported_values_are_refused(self) -> None:
+        """Arbitrary objects cannot be encoded."""
+        with pytest.raises(CodecError):
+            encode_value({"value": object()})
+
+    def test_unknown_and_legacy_formats_are_refused(self) -> None:
+        """Pickled values from earlier releases and unknown formats are never loaded."""
+        legacy = b"\x00" + pickle.dumps(["value"])
+
+        with pytest.raises(CodecError):
+            decode_value(legacy)
+        with pytest.raises(CodecError):
+            decode_value(b"\x7f{}")
+        with pytest.raises(CodecError):
+            decode_value(bytes([FORMAT_JSON_ZLIB]) + b"not zlib")
+
+    def test_models_outside_githound_are_refused(self) -> None:
+        """Decoding does not import classes named by the stored data."""
+        payload = b'{"$model":"os:system","data":{}}'
+
+        with pytest.raises(CodecError):
+            decode_value(bytes([FORMAT_JSON]) + payload)
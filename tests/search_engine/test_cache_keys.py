@@ -0,0 +1,261 @@
+"""Tests for stable, ref-aware result cache keys."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from githound.models import SearchQuery, SearchResult, SearchType
+from githound.search_engine.base import SearchContext
+from githound.search_engine.branch_searcher import BranchSearcher
+from githound.search_engine.cache_keys import query_digest, resolve_tip
+from githound.search_engine.commit_searcher import CommitHashSearcher, MessageSearcher
+from githound.search_engine.enhanced_orchestrator import EnhancedSearchOrchestrator
+from githound.search_engine.file_searcher import FilePathSearcher
+
+
+def _commit_file(repo: Repo, name: str, content: str, message: str) -> str:
+    (Path(repo.working_dir) / name).write_text(content)
+    repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+class TestQueryDigest:
+    """Tests for digesting queries."""
+
+    def test_stable_across_processes(self) -> None:
+        """The digest does not depend on per-process hash randomization."""
+        script = (
+            "from githound.models import SearchQuery\n"
+            "from githound.search_engine.cache_keys import query_digest\n"
+            "print(query_digest(SearchQuery(content_pattern='pool', file_extensions=['py'])))\n"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        query = SearchQuery(content_pattern="pool", file_extensions=["py"])
+        assert digests == {query_digest(query)}
+
+    def test_only_result_fields_count(self) -> None:
+        """Execution settings don't change the digest; search criteria do."""
+        base = query_digest(SearchQuery(content_pattern="pool"))
+
+        assert query_digest(SearchQuery(content_pattern="pool", max_workers=8)) == base
+        assert query_digest(SearchQuery(content_pattern="pool", timeout_seconds=5)) == base
+        assert query_digest(SearchQuery(content_pattern="pool", case_sensitive=True)) != base
+
+
+class TestRefAwareKeys:
+    """Tests for keys that follow ref tips."""
+
+    def test_moving_a_ref_only_changes_its_keys(self, temp_repo: Repo) -> None:
+        """A new commit on one branch leaves keys for other branches alone."""
+        searcher = MessageSearcher()
+        query = SearchQuery(message_pattern="update")
+        main = temp_repo.active_branch.name
+        temp_repo.create_head("feature")
+
+        def key(branch: str) -> str:
+            context = SearchContext(repo=temp_repo, query=query, branch=branch)
+            return searcher._get_cache_key(context)
+
+        main_key, feature_key = key(main), key("feature")
+        assert main_key != feature_key
+        assert temp_repo.head.commit.hexsha in main_key
+
+        _commit_file(temp_repo, "new.txt", "new", "New commit")
+
+        assert key(main) != main_key
+        assert key("feature") == feature_key
+        assert resolve_tip(temp_repo, main) == temp_repo.head.commit.hexsha
+
+    def test_all_ref_analyses_follow_every_ref(self, temp_repo: Repo) -> None:
+        """Branch analysis results are keyed on every ref tip."""
+        searcher = BranchSearcher()
+        context = SearchContext(repo=temp_repo, query=SearchQuery(branch_analysis=True))
+        temp_repo.create_head("feature")
+        before = searcher._get_cache_key(context)
+
+        temp_repo.heads.feature.checkout()
+        _commit_file(temp_repo, "feature.txt", "feature", "Feature commit")
+
+        assert searcher._get_cache_key(context) != before
+
+
+@pytest.mark.asyncio
+async def test_enhanced_search_cache_follows_head(temp_repo: Repo, tmp_path: Path) -> None:
+    """Results are served from the cache until the searched branch moves."""
+    orchestrator = EnhancedSearchOrchestrator(enable_monitoring=False)
+    orchestrator.initialize_indexer(Path(temp_repo.working_dir), tmp_path / "index")
+    await orchestrator.build_index(temp_repo)
+    query = SearchQuery(content_pattern="Features")
+
+    first = [result async for result in orchestrator.search(temp_repo, query)]
+    assert first
+    assert len(orchestrator.result_cache) == 1
+    again = [result async for result in orchestrator.search(temp_repo, query)]
+    assert [r.commit_hash for r in again] == [r.commit_hash for r in first]
+    assert len(orchestrator.result_cache) == 1
+
+    _commit_file(temp_repo, "notes.md", "More Features", "Add notes")
+    await orchestrator.build_index(temp_repo)
+    [result async for result in orchestrator.search(temp_repo, query)]
+
+    assert len(orchestrator.result_cache) == 2
+
+
+class TestIncrementalReuse:
+    """Tests for extending cached results after a branch advances."""
+
+    @staticmethod
+    def _orchestrator() -> tuple[EnhancedSearchOrchestrator, list[str | None]]:
+        """An orchestrator with a message searcher that records the searched revisions."""
+        orchestrator = EnhancedSearchOrchestrator()
+        orchestrator.use_indexing = False
+        searcher = MessageSearcher()
+        searched: list[str | None] = []
+        search = searcher.search
+
+        def recording_search(context: SearchContext):  # type: ignore[no-untyped-def]
+            searched.append(context.branch)
+            return search(context)
+
+        searcher.search = recording_search  # type: ignore[method-assign]
+        orchestrator.register_searcher(searcher)
+        return orchestrator, searched
+
+    @pytest.mark.asyncio
+    async def test_searches_only_new_commits(self, temp_repo: Repo) -> None:
+        """After a fast-forward only old_tip..new_tip is searched and merged in."""
+        orchestrator, searched = self._orchestrator()
+        query = SearchQuery(message_pattern="add")
+        old_tip = temp_repo.head.commit.hexsha
+
+        first = [r.commit_hash async for r in orchestrator.search(temp_repo, query)]
+        assert len(first) == 1
+        new_tip = _commit_file(temp_repo, "notes.md", "notes", "Add notes")
+        second = [r.commit_hash async for r in orchestrator.search(temp_repo, query)]
+
+        assert searched == [None, f"{old_tip}..{new_tip}"]
+        assert sorted(second) == sorted(first + [new_tip])
+        assert orchestrator.monitor is not None
+        assert orchestrator.monitor.counters["incremental_searches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rewritten_branch_is_searched_in_full(self, temp_repo: Repo) -> None:
+        """A tip that doesn't descend from the cached one gets a full search."""
+        orchestrator, searched = self._orchestrator()
+        query = SearchQuery(message_pattern="add")
+
+        [r async for r in orchestrator.search(temp_repo, query)]
+        temp_repo.head.reset("HEAD~1", index=True, working_tree=True)
+        _commit_file(temp_repo, "other.txt", "other", "Add other file")
+        results = [r.commit_hash async for r in orchestrator.search(temp_repo, query)]
+
+        assert searched == [None, None]
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_delta_is_not_cached(self, temp_repo: Repo) -> None:
+        """A delta search cut short by its timeout leaves the new tip uncached."""
+        orchestrator, searched = self._orchestrator()
+        query = SearchQuery(message_pattern="add")
+        [r async for r in orchestrator.search(temp_repo, query)]
+        new_tip = _commit_file(temp_repo, "notes.md", "notes", "Add notes")
+
+        searcher = orchestrator.get_searcher_by_name("message")
+        assert searcher is not None
+        search = searcher.search
+
+        async def stalled_search(context: SearchContext):  # type: ignore[no-untyped-def]
+            searched.append(context.branch)
+            while not context.is_cancelled:
+                await asyncio.sleep(0.01)
+            return
+            yield
+
+        searcher.search = stalled_search  # type: ignore[method-assign]
+        timed_out = SearchQuery(message_pattern="add", timeout_seconds=1)
+        partial = [r.commit_hash async for r in orchestrator.search(temp_repo, timed_out)]
+        searcher.search = search  # type: ignore[method-assign]
+        results = [r.commit_hash async for r in orchestrator.search(temp_repo, query)]
+
+        assert new_tip not in partial
+        assert new_tip in results
+        assert len(searched) == 3
+
+    @staticmethod
+    async def _keys(
+        orchestrator: EnhancedSearchOrchestrator, repo: Repo, query: SearchQuery
+    ) -> list:
+        return sorted(
+            [
+                (r.search_type, r.commit_hash, str(r.file_path), r.line_number)
+                async for r in orchestrator.search(repo, query)
+            ]
+        )
+
+    @staticmethod
+    def _full_orchestrator() -> EnhancedSearchOrchestrator:
+        orchestrator = EnhancedSearchOrchestrator()
+        orchestrator.use_indexing = False
+        for searcher in (CommitHashSearcher(), FilePathSearcher(), MessageSearcher()):
+            orchestrator.register_searcher(searcher)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query",
+        [
+            SearchQuery(commit_hash="HEAD"),
+            SearchQuery(file_path_pattern=r"f\.py"),
+            SearchQuery(file_path_pattern=r"f\.py", message_pattern="f"),
+        ],
+        ids=["commit_hash", "file_path", "mixed"],
+    )
+    async def test_history_wide_searchers_match_fresh_search(
+        self, temp_repo: Repo, query: SearchQuery
+    ) -> None:
+        """Searchers that don't yield results per commit are never extended."""
+        _commit_file(temp_repo, "f.py", "one", "Add f")
+        if query.commit_hash:
+            query = query.model_copy(update={"commit_hash": temp_repo.head.commit.hexsha})
+        orchestrator = self._full_orchestrator()
+        await self._keys(orchestrator, temp_repo, query)
+        _commit_file(temp_repo, "f.py", "two", "Update f")
+
+        results = await self._keys(orchestrator, temp_repo, query)
+
+        assert results == await self._keys(self._full_orchestrator(), temp_repo, query)
+        assert len(results) == len(set(results))
+        assert orchestrator.monitor is not None
+        assert orchestrator.monitor.counters.get("incremental_searches", 0) == 0
+
+    def test_merge_drops_results_found_again(self) -> None:
+        """Results of the new commits that repeat cached ones are kept once."""
+        cached = [
+            SearchResult(
+                commit_hash="a" * 40,
+                file_path=Path("f.py"),
+                search_type=SearchType.CONTENT,
+                relevance_score=0.5,
+                line_number=3,
+            )
+        ]
+        again = cached[0].model_copy(update={"relevance_score": 0.9})
+
+        merged = EnhancedSearchOrchestrator._merge_results(cached, [again], None)
+
+        assert merged == [again]
@@ -0,0 +1,58 @@
+"""Tests for the streaming git log commit reader."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from git import GitCommandError, Repo
+
+from githound.search_engine.commit_reader import CommitRecord, iter_commit_records
+
+
+def test_records_match_gitpython(temp_repo: Repo) -> None:
+    """Test that streamed records agree with GitPython commit objects."""
+    temp_repo.index.commit("Multi-line message\n\nwith a body\nand\ttabs\n")
+
+    records = list(iter_commit_records(temp_repo, "HEAD"))
+    commits = list(temp_repo.iter_commits("HEAD"))
+
+    assert [record.hexsha for record in records] == [commit.hexsha for commit in commits]
+    for record, commit in zip(records, commits, strict=True):
+        assert record.author == (commit.author.name, commit.author.email)
+        assert record.committer == (commit.committer.name, commit.committer.email)
+        assert record.committed_date == commit.committed_date
+        assert record.message == commit.message
+        assert [p.hexsha for p in record.parents] == [p.hexsha for p in commit.parents]
+
+
+def test_max_count_and_early_stop(temp_repo: Repo) -> None:
+    """Test max_count and that closing the generator early is safe."""
+    assert len(list(iter_commit_records(temp_repo, max_count=2))) == 2
+
+    records = iter_commit_records(temp_repo)
+    first = next(records)
+    records.close()
+    assert first.hexsha == temp_repo.head.commit.hexsha
+
+
+def test_unknown_revision_raises(temp_repo: Repo) -> None:
+    """Test that git errors surface like repo.iter_commits()."""
+    with pytest.raises(GitCommandError):
+        list(iter_commit_records(temp_repo, "no-such-branch"))
+
+
+def test_falls_back_to_iter_commits() -> None:
+    """Test that repositories without a usable git pipe use iter_commits()."""
+    commit = Mock()
+    commit.hexsha = "a" * 40
+    commit.author.name = commit.committer.name = "Author"
+    commit.author.email = commit.committer.email = "author@example.com"
+    commit.committed_date = int(datetime.now().timestamp())
+    commit.parents = [Mock(hexsha="b" * 40)]
+    commit.message = "Fix bug\n"
+
+    repo = Mock(spec=Repo)
+    repo.iter_commits.return_value = [commit]
+
+    assert list(iter_commit_records(repo, "main")) == [CommitRecord.from_commit(commit)]
+    repo.iter_commits.assert_called_once_with("main")
@@ -1,6 +1,9 @@
 """Tests for GitHound commit-based searchers."""
 
+import asyncio
+import threading
 from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -13,7 +16,11 @@ from githound.search_engine import (
     DateRangeSearcher,
     MessageSearcher,
     SearchContext,
+    commit_searcher,
 )
+from githound.search_engine.commit_reader import CommitRecord
+from githound.search_engine.executor import get_git_executor
+from githound.utils.progress import CancellationToken
 
 
 @pytest.fixture
@@ -138,6 +145,93 @@ class TestAuthorSearcher:
 
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_author_searcher_stops_when_cancelled(
+        self, mock_repo, sample_search_query
+    ) -> None:
+        """Test AuthorSearcher stops walking history once cancelled."""
+        token = CancellationToken()
+        token.cancel("Test cancellation")
+        context = SearchContext(
+            repo=mock_repo, query=sample_search_query, branch="main", cancellation_token=token
+        )
+        searcher = AuthorSearcher()
+
+        results = [result async for result in searcher.search(context)]
+
+        assert results == []
+        assert searcher.metrics.total_commits_searched == 0
+
+    @pytest.mark.asyncio
+    async def test_author_searcher_closes_commit_stream(
+        self, mock_repo, sample_search_query, monkeypatch
+    ) -> None:
+        """Test that the git log stream is closed when the search stops early."""
+        streams: list[Any] = []
+
+        def iter_records(repo: Any, rev: str | None = None) -> Any:
+            def records() -> Any:
+                for commit in mock_repo.iter_commits.return_value:
+                    yield CommitRecord.from_commit(commit)
+
+            stream = records()
+            # Keep the stream alive so only an explicit close() ends it
+            streams.append(stream)
+            return stream
+
+        monkeypatch.setattr(commit_searcher, "iter_commit_records", iter_records)
+        token = CancellationToken()
+        token.cancel("Test cancellation")
+        context = SearchContext(
+            repo=mock_repo, query=sample_search_query, branch="main", cancellation_token=token
+        )
+
+        results = [result async for result in AuthorSearcher().search(context)]
+
+        assert results == []
+        assert len(streams) == 1
+        assert streams[0].gi_frame is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_search_closes_stream_after_pending_read(
+        self, mock_repo, sample_search_query, monkeypatch
+    ) -> None:
+        """Test that a search cancelled mid-chunk closes its stream once the worker is done."""
+        reading = threading.Event()
+        release = threading.Event()
+        closed: list[bool] = []
+
+        def iter_records(repo: Any, rev: str | None = None) -> Any:
+            try:
+                reading.set()
+                release.wait(5)
+                for commit in mock_repo.iter_commits.return_value:
+                    yield CommitRecord.from_commit(commit)
+            finally:
+                closed.append(True)
+
+        monkeypatch.setattr(commit_searcher, "iter_commit_records", iter_records)
+        context = SearchContext(
+            repo=mock_repo,
+            query=sample_search_query,
+            branch="main",
+            executor=get_git_executor().lane(),
+        )
+
+        async def collect() -> list[Any]:
+            return [result async for result in AuthorSearcher().search(context)]
+
+        task = asyncio.create_task(collect())
+        await asyncio.to_thread(reading.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert closed == []
+
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed == [True]
+
     def test_author_searcher_name(self) -> None:
         """Test AuthorSearcher name property."""
         searcher = AuthorSearcher()
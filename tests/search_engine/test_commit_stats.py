@@ -0,0 +1,63 @@
+"""Tests for deferred and batched commit statistics."""
+
+from unittest.mock import Mock, patch
+
+from git import Repo
+
+from githound.search_engine.commit_stats import (
+    CommitStatsBatch,
+    build_commit_info,
+    load_commit_stats,
+    parse_numstat_log,
+    resolve_commit_stats,
+    stats_from_commit,
+)
+
+
+def test_parse_numstat_log() -> None:
+    """Test parsing of batched numstat output, including binary files and empty commits."""
+    output = "\x00aaa\n\n3\t1\tsrc/app.py\n-\t-\tlogo.png\n\x00bbb\n\n\x00ccc\n\n0\t4\tREADME.md\n"
+
+    assert parse_numstat_log(output) == {
+        "aaa": (2, 3, 1),
+        "bbb": (0, 0, 0),
+        "ccc": (1, 0, 4),
+    }
+
+
+def test_load_commit_stats_matches_commit_stats(temp_repo: Repo) -> None:
+    """Test that one batched git log call agrees with GitPython's per-commit stats."""
+    commits = list(temp_repo.iter_commits())
+
+    stats = load_commit_stats(temp_repo, [commit.hexsha for commit in commits])
+
+    assert stats == {commit.hexsha: stats_from_commit(commit) for commit in commits}
+
+
+def test_resolve_commit_stats_falls_back_to_commit_stats() -> None:
+    """Test that commits the batch call cannot resolve fall back to commit.stats."""
+    repo = Mock(spec=Repo)
+    commit = Mock(hexsha="a" * 40)
+    commit.stats.files = {"a.py": {}, "b.py": {}}
+    commit.stats.total = {"insertions": 5, "deletions": 1}
+
+    assert resolve_commit_stats(repo, [commit]) == {"a" * 40: (2, 5, 1)}
+
+
+def test_build_commit_info_defers_stats(temp_repo: Repo) -> None:
+    """Test that CommitInfo stats are resolved lazily, in one batch for many commits."""
+    commits = list(temp_repo.iter_commits())
+    stats_batch = CommitStatsBatch(temp_repo)
+
+    with patch(
+        "githound.search_engine.commit_stats.load_commit_stats", wraps=load_commit_stats
+    ) as mock_load:
+        infos = [build_commit_info(commit, stats_batch) for commit in commits]
+        assert mock_load.call_count == 0
+        assert not any(info.stats_loaded for info in infos)
+
+        resolved = [(info.files_changed, info.insertions, info.deletions) for info in infos]
+
+    assert mock_load.call_count == 1
+    assert resolved == [stats_from_commit(commit) for commit in commits]
+    assert infos[0].message == commits[0].message.strip()
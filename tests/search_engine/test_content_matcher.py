@@ -0,0 +1,209 @@
+"""Tests for GitHound content matching engines."""
+
+import json
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from githound.search_engine.content_matcher import (
+    CONTENT_ENGINES,
+    RegexContentMatcher,
+    RipgrepContentMatcher,
+    create_content_matcher,
+    parse_ripgrep_json,
+)
+
+SAMPLE = b"def test_function() -> None:\n    test_var = 'test'\n    return test_var\n"
+
+
+class TestRegexContentMatcher:
+    """Tests for the in-process regex engine."""
+
+    def test_literal_fast_path(self) -> None:
+        """Test that plain literals use the literal path and report ripgrep-style matches."""
+        matcher = RegexContentMatcher("test")
+
+        assert matcher.is_literal is True
+        assert matcher.search(SAMPLE) == [
+            {
+                "line_number": 1,
+                "text": "def test_function() -> None:",
+                "column_start": 4,
+                "column_end": 8,
+            },
+            {"line_number": 2, "text": "test_var = 'test'", "column_start": 4, "column_end": 8},
+            {"line_number": 3, "text": "return test_var", "column_start": 11, "column_end": 15},
+        ]
+
+    def test_regex_path(self) -> None:
+        """Test regex patterns with case-insensitive matching."""
+        matcher = RegexContentMatcher(r"TEST_\w+", case_sensitive=False)
+
+        assert matcher.is_literal is False
+        matches = matcher.search(SAMPLE)
+        assert [m["line_number"] for m in matches] == [1, 2, 3]
+        assert matches[0]["column_start"] == 4
+        assert matches[0]["column_end"] == 17
+
+    def test_case_sensitive_literal(self) -> None:
+        """Test that case sensitive literals do not fold case."""
+        assert RegexContentMatcher("TEST", case_sensitive=True).search(SAMPLE) == []
+        assert len(RegexContentMatcher("TEST", case_sensitive=False).search(SAMPLE)) == 3
+
+    def test_anchors_are_per_line(self) -> None:
+        """Test that ^ and $ anchor to line boundaries like ripgrep."""
+        matches = RegexContentMatcher(r"^\s+return").search(SAMPLE)
+        assert [m["line_number"] for m in matches] == [3]
+
+    def test_line_without_trailing_newline(self) -> None:
+        """Test matching on a final line without a newline."""
+        matches = RegexContentMatcher("last").search(b"first\nlast line")
+        assert matches == [
+            {"line_number": 2, "text": "last line", "column_start": 0, "column_end": 4}
+        ]
+
+    def test_non_ascii_content(self) -> None:
+        """Test that columns are byte offsets and text is decoded."""
+        matches = RegexContentMatcher("ok").search("héllo ok\n".encode())
+        assert matches[0]["text"] == "héllo ok"
+        assert matches[0]["column_start"] == 7
+
+    def test_binary_and_empty_content(self) -> None:
+        """Test that binary and empty blobs produce no matches."""
+        assert RegexContentMatcher("IHDR").search(b"\x89PNG\r\n\x1a\n\x00\x00IHDR") == []
+        assert RegexContentMatcher("a*").search(b"") == []
+
+    def test_invalid_pattern(self) -> None:
+        """Test that invalid patterns fail at construction."""
+        import re
+
+        with pytest.raises(re.error):
+            RegexContentMatcher("(unclosed")
+
+
+class TestRipgrepContentMatcher:
+    """Tests for the opt-in ripgrep engine."""
+
+    def test_parses_ripgrep_output(self) -> None:
+        """Test that ripgrep JSON output is mapped to match dictionaries."""
+        rg_output = {
+            "type": "match",
+            "data": {
+                "lines": {"text": "def test_function() -> None:\n"},
+                "line_number": 1,
+                "submatches": [{"match": {"text": "test"}, "start": 4, "end": 8}],
+            },
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(stdout=json.dumps(rg_output).encode() + b"\n")
+            matches = RipgrepContentMatcher("test").search(SAMPLE)
+
+        assert matches == [
+            {
+                "line_number": 1,
+                "text": "def test_function() -> None:",
+                "column_start": 4,
+                "column_end": 8,
+            }
+        ]
+        # Blob bytes must be piped in binary mode
+        assert mock_run.call_args.kwargs["input"] == SAMPLE
+        assert "text" not in mock_run.call_args.kwargs
+
+    def test_no_matches_and_missing_binary(self) -> None:
+        """Test exit code 1 and a missing rg binary both yield no matches."""
+        with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "rg")):
+            assert RipgrepContentMatcher("x").search(SAMPLE) == []
+
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert RipgrepContentMatcher("x").search(SAMPLE) == []
+
+    def test_search_batch_single_process(self) -> None:
+        """Test that a batch runs one ripgrep process and maps paths back to blobs."""
+
+        def fake_run(args: list[str], **kwargs: object) -> Mock:
+            batch_dir = args[-1]
+            events = [
+                {"type": "begin", "data": {"path": {"text": f"{batch_dir}/2"}}},
+                {
+                    "type": "match",
+                    "data": {
+                        "path": {"text": f"{batch_dir}/2"},
+                        "lines": {"text": "a test\n"},
+                        "line_number": 4,
+                        "submatches": [{"start": 2, "end": 6}],
+                    },
+                },
+                {
+                    "type": "match",
+                    "data": {
+                        "path": {"text": f"{batch_dir}/0"},
+                        "lines": {"text": "test\n"},
+                        "line_number": 1,
+                        "submatches": [{"start": 0, "end": 4}],
+                    },
+                },
+            ]
+            return Mock(returncode=0, stdout="\n".join(json.dumps(e) for e in events).encode())
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            results = RipgrepContentMatcher("test").search_batch([b"x", b"y", b"z"])
+
+        assert mock_run.call_count == 1
+        assert [len(matches) for matches in results] == [1, 0, 1]
+        assert results[2][0] == {
+            "line_number": 4,
+            "text": "a test",
+            "column_start": 2,
+            "column_end": 6,
+        }
+
+    def test_search_batch_errors(self) -> None:
+        """Test batch exit codes: 1 is no matches, other failures raise."""
+        with patch("subprocess.run", return_value=Mock(returncode=1, stdout=b"")):
+            assert RipgrepContentMatcher("x").search_batch([b"a", b"b"]) == [[], []]
+
+        with patch("subprocess.run", return_value=Mock(returncode=2, stdout=b"", stderr=b"")):
+            with pytest.raises(subprocess.CalledProcessError):
+                RipgrepContentMatcher("(").search_batch([b"a"])
+
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert RipgrepContentMatcher("x").search_batch([b"a"]) == [[]]
+
+    def test_parse_skips_invalid_lines(self) -> None:
+        """Test that non-JSON and non-match lines are ignored."""
+        assert parse_ripgrep_json('not json\n{"type": "begin", "data": {}}\n') == []
+
+
+class TestCreateContentMatcher:
+    """Tests for the matcher factory."""
+
+    def test_engines(self) -> None:
+        """Test that every advertised engine can be created."""
+        for engine in CONTENT_ENGINES:
+            matcher = create_content_matcher("test", engine=engine)
+            assert matcher.name == engine
+
+    def test_unknown_engine(self) -> None:
+        """Test that unknown engines are rejected."""
+        with pytest.raises(ValueError):
+            create_content_matcher("test", engine="grep")
+
+    @pytest.mark.parametrize("pattern", ["test", r"test_\w+", r"^\s+return", "var = '"])
+    def test_engines_agree(self, pattern: str) -> None:
+        """Test that the in-process engine matches ripgrep when it is installed."""
+        import shutil
+
+        if shutil.which("rg") is None:
+            pytest.skip("ripgrep not installed")
+
+        regex_matches = create_content_matcher(pattern, engine="regex").search(SAMPLE)
+        ripgrep_matches = create_content_matcher(pattern, engine="ripgrep").search(SAMPLE)
+        assert regex_matches == ripgrep_matches
+
+        blobs = [SAMPLE, b"nothing here\n", SAMPLE.upper()]
+        regex_batch = create_content_matcher(pattern, engine="regex").search_batch(blobs)
+        ripgrep_batch = create_content_matcher(pattern, engine="ripgrep").search_batch(blobs)
+        assert regex_batch == ripgrep_batch
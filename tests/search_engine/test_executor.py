@@ -0,0 +1,204 @@
+"""Tests for the git I/O worker pool."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from git import Repo
+
+from githound.models import SearchEngineConfig, SearchQuery
+from githound.search_engine import (
+    AuthorSearcher,
+    GitExecutor,
+    SearchEngineFactory,
+    SearchOrchestrator,
+    get_git_executor,
+)
+from githound.search_engine.executor import run_blocking, take
+
+
+@pytest.fixture
+def executor() -> Any:
+    """Create a small executor that is shut down after the test."""
+    executor = GitExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+def _slow_repo(commit_count: int, delay: float) -> Any:
+    """Create a mock repository whose commit walk blocks for ``delay`` per commit."""
+    repo = Mock(spec=Repo)
+    repo.working_dir = "/test/repo"
+    repo.active_branch.name = "main"
+
+    def iter_commits(*args: Any, **kwargs: Any) -> Any:
+        for i in range(commit_count):
+            time.sleep(delay)
+            commit = Mock()
+            commit.hexsha = f"{i:040d}"
+            commit.author.name = "Alice"
+            commit.author.email = "alice@example.com"
+            commit.committer.name = "Alice"
+            commit.committer.email = "alice@example.com"
+            commit.message = f"Commit {i}"
+            commit.committed_date = 1_700_000_000 + i
+            commit.parents = []
+            yield commit
+
+    repo.iter_commits.side_effect = iter_commits
+    return repo
+
+
+class TestSearchLane:
+    """Tests for per-search lanes on the shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_calls_on_worker_threads(self, executor) -> None:
+        """Blocking calls run on the pool, not the event loop thread."""
+        lane = executor.lane()
+
+        name = await lane.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("githound-git")
+        assert name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_calls_per_search(self, executor) -> None:
+        """A lane never has more calls in flight than its limit."""
+        lane = executor.lane()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(lane.run(work) for _ in range(6)))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_searches_share_the_pool(self, executor) -> None:
+        """A busy search does not keep another search's calls off the pool."""
+        busy_lane = executor.lane()
+        other_lane = executor.lane()
+        release = threading.Event()
+
+        busy = asyncio.gather(*(busy_lane.run(release.wait, 5) for _ in range(10)))
+        # Only one of the busy search's calls occupies a worker
+        assert await asyncio.wait_for(other_lane.run(lambda: "done"), 2) == "done"
+
+        release.set()
+        await busy
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_abandoned_calls(self, executor) -> None:
+        """Calls whose caller was cancelled still finish before drain returns."""
+        lane = executor.lane()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def work() -> None:
+            started.set()
+            time.sleep(0.05)
+            finished.set()
+
+        task = asyncio.create_task(lane.run(work))
+        await asyncio.to_thread(started.wait, 2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await lane.drain()
+
+        assert finished.is_set()
+
+    @pytest.mark.asyncio
+    async def test_runs_inline_without_lane(self) -> None:
+        """Without a lane, calls run on the calling thread."""
+        name = await run_blocking(None, lambda: threading.current_thread().name)
+
+        assert name == threading.current_thread().name
+
+
+def test_take_reports_exhaustion() -> None:
+    """take() pulls chunks and reports when the iterator runs out."""
+    items = iter(range(5))
+
+    assert take(items, 3) == ([0, 1, 2], False)
+    assert take(items, 3) == ([3, 4], True)
+
+
+def test_shared_executor_per_configuration() -> None:
+    """Orchestrators with the same pool configuration share one executor."""
+    assert get_git_executor(3, 1) is get_git_executor(3, 1)
+    assert get_git_executor(3, 1) is not get_git_executor(5, 1)
+
+
+def test_factory_configures_executor() -> None:
+    """The factory hands orchestrators the pool sized by the engine config."""
+    config = SearchEngineConfig(io_workers=3, io_workers_per_search=2)
+    orchestrator = SearchEngineFactory(config).create_orchestrator()
+
+    executor = orchestrator._executor
+    assert executor is get_git_executor(3, 2)
+    assert executor.max_workers == 3
+    assert executor.per_search_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_search() -> None:
+    """The event loop keeps running other tasks while a search walks history."""
+    repo = _slow_repo(commit_count=20, delay=0.01)
+    orchestrator = SearchOrchestrator()
+    orchestrator.register_searcher(AuthorSearcher())
+    ticks = 0
+    searching = True
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while searching:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    try:
+        query = SearchQuery(author_pattern="Alice")
+        results = [r async for r in orchestrator.search(repo=repo, query=query)]
+    finally:
+        searching = False
+        await heartbeat_task
+
+    assert len(results) == 20
+    # The walk blocks for ~200ms; inline it would starve the heartbeat
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported_on_the_event_loop() -> None:
+    """Progress from visitors on pool workers is delivered on the loop thread."""
+    repo = _slow_repo(commit_count=250, delay=0)
+    orchestrator = SearchOrchestrator()
+    orchestrator.register_searcher(AuthorSearcher())
+    threads: list[int] = []
+    messages: list[str] = []
+
+    def progress(message: str, _: float) -> None:
+        threads.append(threading.get_ident())
+        messages.append(message)
+
+    query = SearchQuery(author_pattern="Alice")
+    [r async for r in orchestrator.search(repo=repo, query=query, progress_callback=progress)]
+    await asyncio.sleep(0)
+
+    assert any(message.endswith("Searched 100 commits, found 100 matches") for message in messages)
+    assert set(threads) == {threading.get_ident()}
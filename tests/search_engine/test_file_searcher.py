@@ -1,7 +1,8 @@
 """Tests for GitHound file-based searchers."""
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 from git import Repo
@@ -296,3 +297,184 @@ class TestContentSearcher:
         async for result in searcher.search(context_with_limit):
             results.append(result)
         assert isinstance(results, list)
+
+    @pytest.mark.asyncio
+    async def test_content_searcher_batches_blobs(self) -> None:
+        """Test that batching engines receive many blobs per call and results keep order."""
+        commits: list[Any] = []
+        for i in range(3):
+            commit = Mock()
+            commit.hexsha = f"{i:040d}"
+            commit.author.name = commit.committer.name = "Author"
+            commit.author.email = commit.committer.email = "author@example.com"
+            commit.message = f"Commit {i}"
+            commit.committed_date = int(datetime.now().timestamp())
+            commit.stats.files = {}
+            commit.stats.total = {"insertions": 0, "deletions": 0}
+            commit.parents = [Mock(hexsha="f" * 40)]
+
+            diffs: list[Any] = []
+            for j in range(2):
+                diff = Mock()
+                diff.b_path = f"src/file{i}_{j}.py"
+                diff.b_blob.size = 10
+                diff.b_blob.data_stream.read.return_value = f"test {i} {j}\n".encode()
+                diffs.append(diff)
+            commit.diff.return_value = diffs
+            commits.append(commit)
+
+        repo = Mock(spec=Repo)
+        repo.iter_commits.return_value = commits
+
+        batch_sizes: list[int] = []
+
+        def search_batch(blobs: list[bytes]) -> list[list[dict[str, Any]]]:
+            batch_sizes.append(len(blobs))
+            return [
+                [{"line_number": 1, "text": blob.decode().strip(), "column_start": 0}]
+                for blob in blobs
+            ]
+
+        matcher = Mock(supports_batching=True)
+        matcher.search_batch.side_effect = search_batch
+
+        searcher = ContentSearcher(engine="ripgrep", batch_size=4)
+        context = SearchContext(
+            repo=repo, query=SearchQuery(content_pattern="test"), branch="main", cache={}
+        )
+
+        with patch(
+            "githound.search_engine.file_searcher.create_content_matcher", return_value=matcher
+        ):
+            results = [result async for result in searcher.search(context)]
+
+        assert batch_sizes == [4, 2]
+        assert [result.matching_line for result in results] == [
+            "test 0 0",
+            "test 0 1",
+            "test 1 0",
+            "test 1 1",
+            "test 2 0",
+            "test 2 1",
+        ]
+        assert results[0].commit_info is results[1].commit_info
+
+    @pytest.mark.asyncio
+    async def test_content_searcher_reads_each_blob_once(self) -> None:
+        """Test that repeated blobs are scanned once and re-attributed to each commit."""
+        blob = Mock(hexsha="b" * 40, size=20)
+        blob.data_stream.read.return_value = b"def test():\n    pass\n"
+
+        def make_commit(index: int, file_path: str, parent_count: int) -> Mock:
+            commit = Mock()
+            commit.hexsha = f"{index:040d}"
+            commit.author.name = commit.committer.name = "Author"
+            commit.author.email = commit.committer.email = "author@example.com"
+            commit.message = f"Commit {index}"
+            commit.committed_date = int(datetime.now().timestamp())
+            commit.stats.files = {}
+            commit.stats.total = {"insertions": 0, "deletions": 0}
+            commit.parents = [Mock(hexsha=f"{p}" * 40) for p in range(parent_count)]
+            commit.diff.return_value = [Mock(b_path=file_path, b_blob=blob)]
+            return commit
+
+        # A merge commit diffs against both parents, then the blob is copied elsewhere
+        merge = make_commit(1, "src/app.py", parent_count=2)
+        copy = make_commit(2, "src/copy.py", parent_count=1)
+
+        repo = Mock(spec=Repo)
+        repo.iter_commits.return_value = [merge, copy]
+
+        searcher = ContentSearcher()
+        context = SearchContext(
+            repo=repo, query=SearchQuery(content_pattern="test"), branch="main", cache={}
+        )
+        results = [result async for result in searcher.search(context)]
+
+        assert blob.data_stream.read.call_count == 1
+        assert [(r.commit_hash, str(r.file_path)) for r in results] == [
+            (merge.hexsha, "src/app.py"),
+            (copy.hexsha, "src/copy.py"),
+        ]
+
+
+class TestPartitionedContentSearch:
+    """Tests for multi-process content search over commit ranges."""
+
+    @pytest.fixture
+    def history_repo(self, temp_dir) -> Any:
+        """Create a repository with enough history to split into several ranges."""
+        repo = Repo.init(temp_dir)
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Test User")
+            config.set_value("user", "email", "test@example.com")
+
+        for index in range(24):
+            path = temp_dir / f"module{index % 4}.py"
+            marker = "needle" if index % 3 == 0 else "hay"
+            path.write_text(f"# revision {index}\nvalue = '{marker} {index}'\n")
+            repo.index.add([str(path)])
+            repo.index.commit(f"Commit {index}")
+
+        yield repo
+        repo.close()
+
+    @staticmethod
+    async def _search(repo: Repo, searcher: ContentSearcher, **query: Any) -> list[Any]:
+        context = SearchContext(
+            repo=repo, query=SearchQuery(content_pattern="needle", **query), branch="HEAD"
+        )
+        return [result async for result in searcher.search(context)]
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_search_in_history_order(self, history_repo) -> None:
+        """Results merged from worker processes equal a sequential search."""
+        expected = await self._search(history_repo, ContentSearcher())
+
+        with patch("githound.search_engine.file_searcher.MIN_RANGE_SIZE", 5):
+            searcher = ContentSearcher(processes=2)
+            results = await self._search(history_repo, searcher)
+
+        assert len(expected) == 7
+        assert [(r.commit_hash, str(r.file_path), r.line_number) for r in results] == [
+            (r.commit_hash, str(r.file_path), r.line_number) for r in expected
+        ]
+        assert results[0].commit_info.author_name == "Test User"
+        assert results[0].commit_info.files_changed == 1
+        assert searcher.metrics.total_commits_searched == 24
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_results(self, history_repo) -> None:
+        """The merge stops once max_results results are yielded."""
+        expected = await self._search(history_repo, ContentSearcher(), max_results=3)
+
+        with patch("githound.search_engine.file_searcher.MIN_RANGE_SIZE", 5):
+            results = await self._search(history_repo, ContentSearcher(processes=2), max_results=3)
+
+        assert [r.commit_hash for r in results] == [r.commit_hash for r in expected]
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_history_is_not_an_error(self, history_repo) -> None:
+        """A revision range without commits yields nothing and reports no error."""
+        messages: list[str] = []
+        context = SearchContext(
+            repo=history_repo,
+            query=SearchQuery(content_pattern="needle"),
+            branch="HEAD..HEAD",
+            progress_callback=lambda message, _: messages.append(message),
+        )
+        searcher = ContentSearcher(processes=2)
+
+        results = [result async for result in searcher.search(context)]
+
+        assert results == []
+        assert not any("Error" in message for message in messages)
+        assert searcher.metrics.total_commits_searched == 0
+
+    def test_process_mode_skips_shared_walk(self) -> None:
+        """Multi-process content search runs on its own, not as a walk visitor."""
+        context = SearchContext(repo=Mock(spec=Repo), query=SearchQuery(content_pattern="x"))
+
+        assert ContentSearcher(processes=4).create_commit_visitor(context) is None
+        assert ContentSearcher().create_commit_visitor(context) is not None
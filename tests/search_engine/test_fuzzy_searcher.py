@@ -282,3 +282,26 @@ class TestFuzzySearcher:
             content_pattern="test", fuzzy_search=True, fuzzy_threshold=1.0
         )
         assert await searcher.can_handle(query_max_threshold) is True
+
+    @pytest.mark.asyncio
+    async def test_build_search_targets_reads_each_blob_once(self, mock_repo) -> None:
+        """Test that a blob shared by several diffs and commits is read once."""
+        blob = Mock(hexsha="b" * 40, size=20)
+        blob.data_stream.read.return_value = b"shared content line\n"
+
+        commits = mock_repo.iter_commits.return_value
+        for commit in commits:
+            commit.parents = [Mock(hexsha="a" * 40), Mock(hexsha="c" * 40)]
+            commit.diff.return_value = [Mock(b_path="shared.py", b_blob=blob)]
+
+        searcher = FuzzySearcher()
+        context = SearchContext(
+            repo=mock_repo,
+            query=SearchQuery(content_pattern="shared", fuzzy_search=True),
+            branch="main",
+            cache={},
+        )
+        targets = await searcher._build_search_targets(context)
+
+        assert blob.data_stream.read.call_count == 1
+        assert [len(target["file_contents"]) for target in targets] == [1] * len(commits)
@@ -0,0 +1,419 @@
+"""Tests for the inverted index and its on-disk segment format."""
+
+import json
+import pickle
+import struct
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from githound.search_engine.commit_blobs import CommitBlobMap
+from githound.search_engine.index_segment import (
+    IndexSegment,
+    SegmentFormatError,
+    decode_postings,
+    decode_varint,
+    encode_postings,
+    encode_varint,
+    is_segment_file,
+    write_segment,
+)
+from githound.search_engine.indexer import IncrementalIndexer, InvertedIndex
+
+
+def _sample_index() -> InvertedIndex:
+    index = InvertedIndex()
+    index.add_document("doc1", "connection pool timeout", {"file_path": "db.py"})
+    index.add_document("doc2", "connection retry connection", {"file_path": "net.py"})
+    index.add_document("doc3", "unrelated words only")
+    index.update_stats()
+    return index
+
+
+class TestSegmentEncoding:
+    """Tests for varint and postings encoding."""
+
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**32, 2**63])
+    def test_varint_round_trip(self, value: int) -> None:
+        """Varints decode to the encoded value and consume every byte."""
+        out = bytearray()
+        encode_varint(value, out)
+
+        assert decode_varint(out, 0) == (value, len(out))
+
+    def test_postings_round_trip(self) -> None:
+        """Delta-coded postings decode to the original ordinals and positions."""
+        postings = [(0, [0, 4, 9]), (3, [2]), (1000, [1, 100000])]
+        data = encode_postings(postings)
+
+        assert list(decode_postings(data, 0, len(data))) == postings
+
+    def test_postings_continue_after_previous_ordinal(self) -> None:
+        """Postings appended to an existing list are coded from its last ordinal."""
+        head = encode_postings([(2, [0])])
+        tail = encode_postings([(5, [1])], previous_ordinal=2)
+        data = head + tail
+
+        assert list(decode_postings(data, 0, len(data))) == [(2, [0]), (5, [1])]
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """Files without the segment header are rejected."""
+        path = tmp_path / "other.idx"
+        path.write_bytes(b"not a segment" * 10)
+
+        assert not is_segment_file(path)
+        with pytest.raises(SegmentFormatError):
+            IndexSegment(path)
+
+
+class TestSkipTables:
+    """Tests for frequency bounds and skip tables of long postings lists."""
+
+    def test_cursor_skips_blocks(self, tmp_path: Path) -> None:
+        """Advancing across skip blocks lands on the right document."""
+        postings = [(ordinal * 3, [0] * (1 + ordinal % 5)) for ordinal in range(1000)]
+        path = tmp_path / "segment.seg"
+        write_segment(
+            path,
+            iter([("common", 1000, encode_postings(postings))]),
+            iter((f"doc{i}", "content", None) for i in range(3000)),
+            {},
+        )
+        segment = IndexSegment(path)
+        cursor = segment.cursor("common")
+        assert cursor is not None
+        assert cursor.max_frequency == 5
+
+        for target in (1, 400, 401, 1500, 2997):
+            assert cursor.advance(target) == -(-target // 3) * 3
+            assert cursor.frequency == 1 + cursor.ordinal // 3 % 5
+        assert cursor.advance(2998) is None
+        segment.close()
+
+    def test_reads_version_1_segments(self, tmp_path: Path) -> None:
+        """Segments without bounds or skip tables are still searchable."""
+        postings = encode_postings([(0, [0, 3])])
+        term = b"alpha"
+        record = json.dumps(["doc1", "content", None]).encode()
+        info = b"{}"
+        header = struct.Struct("<8sIQQQQQQ")
+        terms_offset = header.size + len(postings)
+        strings_offset = terms_offset + struct.calcsize("<QIIQQ")
+        docs_offset = strings_offset + len(term)
+        record_offset = docs_offset + struct.calcsize("<QI")
+        info_offset = record_offset + len(record)
+        path = tmp_path / "v1.seg"
+        path.write_bytes(
+            header.pack(b"GHIDXSEG", 1, 1, terms_offset, 1, docs_offset, info_offset, len(info))
+            + postings
+            + struct.pack("<QIIQQ", strings_offset, len(term), 1, header.size, len(postings))
+            + term
+            + struct.pack("<QI", record_offset, len(record))
+            + record
+            + info
+        )
+
+        segment = IndexSegment(path)
+        cursor = segment.cursor("alpha")
+        assert cursor is not None
+        assert cursor.max_frequency is None
+        assert list(segment.postings("alpha")) == [(0, [0, 3])]
+        segment.close()
+
+
+class TestTopKSearch:
+    """Tests for WAND top-k search over saved segments."""
+
+    @staticmethod
+    def _exhaustive(index: InvertedIndex, query: str, limit: int) -> list[tuple[str, float]]:
+        """Score every document containing a query term."""
+        scores: dict[str, float] = {}
+        for token in index._tokenize(query):
+            idf = index._calculate_idf(token)
+            for segment, deleted in index.segments.snapshot():
+                for ordinal, positions in segment.postings(token):
+                    if ordinal not in deleted:
+                        doc_id = segment.doc_id(ordinal)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + len(positions) * idf
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        return ranked[:limit]
+
+    def test_matches_exhaustive_scoring(self, tmp_path: Path) -> None:
+        """Pruned top-k results have the scores of the exhaustive top-k."""
+        path = tmp_path / "content.idx"
+        index = InvertedIndex()
+        for batch in range(3):
+            for doc in range(batch * 300, (batch + 1) * 300):
+                words = ["self"] * (1 + doc % 3) + ["return"]
+                words += [f"rare{doc % 40}"] * (1 + doc % 4)
+                index.add_document(f"doc{doc}", " ".join(words))
+            index.save(path)
+        index.delete_document("doc5")
+
+        for query in ("self return", "rare7", "self rare7 rare9", "return return"):
+            results = index.search(query, limit=10)
+            expected = self._exhaustive(index, query, 10)
+            assert [round(score, 9) for _, score in results] == [
+                round(score, 9) for _, score in expected
+            ]
+            assert "doc5" not in {doc for doc, _ in results}
+        index.close()
+
+    def test_ties_keep_index_order(self) -> None:
+        """Documents with equal scores are returned in the order they were indexed."""
+        index = InvertedIndex()
+        for doc in range(20):
+            index.add_document(f"doc{doc}", "shared words")
+
+        assert [doc for doc, _ in index.search("shared", limit=3)] == ["doc0", "doc1", "doc2"]
+        assert index.search("shared", limit=0) == []
+
+
+class TestInvertedIndexPersistence:
+    """Tests for saving and loading inverted indexes."""
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """A loaded segment answers queries like the index that saved it."""
+        index = _sample_index()
+        expected = index.search("connection pool")
+        path = tmp_path / "content.idx"
+        index.save(path)
+
+        loaded = InvertedIndex()
+        assert loaded.load(path)
+
+        assert len(loaded.segments) == 1
+        assert is_segment_file(loaded.segments.segments[0].path)
+        assert loaded.search("connection pool") == expected
+        assert loaded.total_docs == 3
+        assert loaded.document_frequency("connection") == 2
+        # Nothing is decoded into memory until queried
+        assert not loaded.index
+        loaded.close()
+
+    def test_documents_added_after_load_form_a_new_segment(self, tmp_path: Path) -> None:
+        """Buffered documents are searched with saved ones and saved as a new segment."""
+        path = tmp_path / "content.idx"
+        _sample_index().save(path)
+
+        index = InvertedIndex()
+        index.load(path)
+        index.add_document("doc4", "connection pool pool", {"file_path": "pool.py"})
+
+        assert index.document_frequency("pool") == 2
+        assert index.search("pool")[0][0] == "doc4"
+
+        index.save(path)
+        reloaded = InvertedIndex()
+        reloaded.load(path)
+
+        assert reloaded.total_docs == 4
+        assert [doc for doc, _ in reloaded.search("pool")] == ["doc4", "doc1"]
+        assert len(reloaded.segments) == 2
+        newest = reloaded.segments.segments[1]
+        assert newest.document(0) == ("doc4", "content", {"file_path": "pool.py"})
+        index.close()
+        reloaded.close()
+
+    def test_positions_continue_across_additions(self, tmp_path: Path) -> None:
+        """Content added to the same document keeps increasing positions."""
+        index = InvertedIndex()
+        index.add_document("doc", "alpha beta")
+        index.add_document("doc", "alpha gamma")
+        path = tmp_path / "content.idx"
+        index.save(path)
+
+        assert index.total_docs == 1
+        assert list(index.segments.segments[0].postings("alpha")) == [(0, [0, 2])]
+        index.close()
+
+    def test_loads_legacy_pickle_format(self, tmp_path: Path) -> None:
+        """Indexes saved as pickle are still readable and re-saved as segments."""
+        path = tmp_path / "legacy.idx"
+        legacy = {
+            "index": {
+                "connection": {"doc1": [{"position": 0, "field": "content"}]},
+                "pool": {"doc1": [{"position": 1, "field": "content"}]},
+            },
+            "doc_freq": {"connection": 1, "pool": 1},
+            "total_docs": 1,
+            "doc_metadata": {"doc1": {"file_path": "db.py"}},
+            "build_time": None,
+            "stats": {"total_terms": 2, "total_postings": 2, "avg_postings_per_term": 1.0},
+        }
+        path.write_bytes(pickle.dumps(legacy))
+
+        index = InvertedIndex()
+        assert index.load(path)
+        assert index.search("pool")[0][0] == "doc1"
+
+        index.save(path)
+        assert len(index.segments) == 1
+        assert index.search("connection pool")[0][0] == "doc1"
+        index.close()
+
+
+class TestCommitBlobMap:
+    """Tests for the commit -> (path, blob) map."""
+
+    def test_expands_blobs_to_every_location(self, tmp_path: Path) -> None:
+        """A blob introduced by several commits maps back to each of them."""
+        blob_map = CommitBlobMap()
+        blob_map.add("1" * 40, "a.py", "a" * 40)
+        blob_map.add("2" * 40, "b.py", "b" * 40)
+        blob_map.add("3" * 40, "renamed/a.py", "a" * 40)
+
+        assert blob_map.locations("a" * 40) == [("1" * 40, "a.py"), ("3" * 40, "renamed/a.py")]
+        assert blob_map.files("2" * 40) == [("b.py", "b" * 40)]
+        assert blob_map.locations("c" * 40) == []
+
+        path = tmp_path / "blobs.idx"
+        blob_map.save(path)
+        loaded = CommitBlobMap()
+        assert loaded.load(path)
+        assert len(loaded) == 3
+        assert loaded.commit_count == 3
+        assert loaded.locations("a" * 40) == blob_map.locations("a" * 40)
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """Files that are not blob maps are not loaded."""
+        path = tmp_path / "blobs.idx"
+        path.write_bytes(b"garbage")
+
+        assert not CommitBlobMap().load(path)
+
+
+def test_incremental_indexer_persists_segments(temp_repo: Repo, tmp_path: Path) -> None:
+    """The incremental indexer saves segment files and reloads them."""
+    indexer = IncrementalIndexer(Path(temp_repo.working_dir), tmp_path / "index")
+    stats = indexer.build_incremental_index(temp_repo)
+    assert stats["status"] == "updated"
+
+    message_path = indexer.get_index_path("message")
+    assert [path.name for path in message_path.parent.glob(f"{message_path.name}.*.seg")]
+    reloaded = IncrementalIndexer(Path(temp_repo.working_dir), tmp_path / "index")
+    assert reloaded.load_indexes()
+    assert reloaded.search_messages("initial")
+
+
+def test_incremental_indexer_indexes_each_blob_once(temp_repo: Repo, tmp_path: Path) -> None:
+    """Content is indexed per unique blob and expanded to every commit that introduced it."""
+    root = Path(temp_repo.working_dir)
+    readme = root / "README.md"
+    original = temp_repo.commit("HEAD~2").tree["README.md"].data_stream.read()
+    # Reverting README reintroduces the blob from the first commit
+    readme.write_bytes(original)
+    temp_repo.index.add([str(readme)])
+    revert = temp_repo.index.commit("Revert README")
+
+    indexer = IncrementalIndexer(root, tmp_path / "index")
+    stats = indexer.build_incremental_index(temp_repo)
+
+    # README (two versions) and src/main.py, across four commits
+    assert stats["indexed_commits"] == 4
+    assert stats["indexed_blobs"] == 3
+    assert indexer.content_index.total_docs == 3
+
+    blob_sha = revert.tree["README.md"].hexsha
+    assert indexer.blob_locations(blob_sha) == [
+        (revert.hexsha, "README.md"),
+        (temp_repo.commit("HEAD~3").hexsha, "README.md"),
+    ]
+    blob, _ = indexer.search_content("features")[0]
+    assert indexer.blob_locations(blob)[0] == (temp_repo.commit("HEAD~1").hexsha, "README.md")
+
+
+def _commit_file(repo: Repo, name: str, content: str, message: str) -> str:
+    path = Path(repo.working_dir) / name
+    path.write_text(content)
+    repo.index.add([str(path)])
+    return repo.index.commit(message).hexsha
+
+
+class TestRefTipUpdates:
+    """Tests for updates driven by the indexed tip of each ref."""
+
+    def test_unchanged_tip_does_not_walk_history(
+        self, temp_repo: Repo, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An update with an unchanged tip returns without listing commits."""
+        root = Path(temp_repo.working_dir)
+        IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("history walked for a no-op update")
+
+        monkeypatch.setattr(Repo, "iter_commits", fail)
+        stats = IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+
+        assert stats["status"] == "up_to_date"
+        assert stats["total_commits"] == 3
+
+    def test_fast_forward_indexes_only_new_commits(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """Advancing a ref indexes only old_tip..new_tip."""
+        root = Path(temp_repo.working_dir)
+        indexer = IncrementalIndexer(root, tmp_path / "index")
+        indexer.build_incremental_index(temp_repo)
+        new_tip = _commit_file(temp_repo, "notes.txt", "release notes", "Add release notes")
+
+        stats = IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+
+        assert stats["indexed_commits"] == 1
+        assert stats["total_commits"] == 4
+        reloaded = IncrementalIndexer(root, tmp_path / "index")
+        reloaded.load_indexes()
+        assert reloaded.ref_tips == {temp_repo.active_branch.name: new_tip}
+        assert reloaded.search_messages("release")[0][0] == new_tip
+        assert reloaded.search_messages("initial")
+        assert not indexer.get_index_path("commits").exists()
+
+    def test_rewritten_history_tombstones_dropped_commits(
+        self, temp_repo: Repo, tmp_path: Path
+    ) -> None:
+        """A force-push drops commits that are no longer in the ref's history."""
+        root = Path(temp_repo.working_dir)
+        IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+        temp_repo.head.reset("HEAD~1", index=True, working_tree=True)
+        _commit_file(temp_repo, "other.txt", "rewritten", "Rewritten history")
+
+        stats = IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+
+        # Only the replaced commit is removed and only its replacement indexed
+        assert stats["status"] == "rewritten"
+        assert stats["removed_commits"] == 1
+        assert stats["indexed_commits"] == 1
+        assert stats["total_commits"] == 3
+        reloaded = IncrementalIndexer(root, tmp_path / "index")
+        reloaded.load_indexes()
+        assert reloaded.search_messages("rewritten")
+        assert not reloaded.search_messages("features")
+        assert not reloaded.search_content("features")
+        assert reloaded.regex_candidates("Features") == []
+
+    def test_missing_old_tip_rebuilds_indexes(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """A tip that no longer exists leaves nothing to diff against, so indexes are rebuilt."""
+        root = Path(temp_repo.working_dir)
+        indexer = IncrementalIndexer(root, tmp_path / "index")
+        indexer.build_incremental_index(temp_repo)
+        indexer.ref_tips[temp_repo.active_branch.name] = "f" * 40
+        indexer._save_state()
+
+        stats = IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+
+        assert stats["status"] == "rebuilt"
+        assert stats["indexed_commits"] == 3
+
+    def test_new_branch_skips_shared_history(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """A second ref indexes only commits not reachable from indexed tips."""
+        root = Path(temp_repo.working_dir)
+        IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+        temp_repo.create_head("feature").checkout()
+        _commit_file(temp_repo, "feature.py", "x = 1", "Feature work")
+
+        stats = IncrementalIndexer(root, tmp_path / "index").build_incremental_index(
+            temp_repo, branch="feature"
+        )
+
+        assert stats["indexed_commits"] == 1
+        assert stats["total_commits"] == 4
@@ -1,8 +1,11 @@
 """Tests for GitHound search orchestrator."""
 
+import asyncio
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from git import Repo
@@ -13,9 +16,15 @@ from githound.search_engine import (
     BaseSearcher,
     CommitHashSearcher,
     ContentSearcher,
+    MessageSearcher,
     SearchContext,
     SearchOrchestrator,
 )
+from githound.search_engine.commit_reader import iter_commit_records
+from githound.search_engine.enhanced_orchestrator import EnhancedSearchOrchestrator
+from githound.search_engine.executor import get_git_executor
+from githound.search_engine.orchestrator import TopKResults
+from githound.utils.progress import CancellationToken
 
 
 @pytest.fixture
@@ -254,6 +263,414 @@ class TestSearchOrchestrator:
         assert isinstance(results, list)
 
 
+class TestSharedCommitWalk:
+    """Tests for the orchestrator's shared history walk."""
+
+    @staticmethod
+    async def _collect(orchestrator: SearchOrchestrator, repo: Repo, query: SearchQuery) -> list:
+        return [result async for result in orchestrator.search(repo=repo, query=query)]
+
+    @staticmethod
+    def _result_keys(results: list) -> set:
+        return {(r.search_type, r.commit_hash, str(r.file_path), r.line_number) for r in results}
+
+    @pytest.mark.asyncio
+    async def test_multi_criteria_query_walks_history_once(self, temp_repo) -> None:
+        """Author, message and content searchers share one history traversal."""
+        query = SearchQuery(
+            author_pattern="Test User", message_pattern="README", content_pattern="Test"
+        )
+
+        orchestrator = SearchOrchestrator()
+        for searcher in (AuthorSearcher(), MessageSearcher(), ContentSearcher()):
+            orchestrator.register_searcher(searcher)
+
+        walks: list[Any] = []
+        original_iter_commits = temp_repo.iter_commits
+
+        def counting_iter_commits(*args: Any, **kwargs: Any) -> Any:
+            # Work estimation samples a bounded prefix; only count full walks
+            if "max_count" not in kwargs:
+                walks.append(args)
+            return original_iter_commits(*args, **kwargs)
+
+        def counting_records(repo: Repo, rev: Any = None, max_count: Any = None) -> Any:
+            walks.append(rev)
+            return iter_commit_records(repo, rev, max_count)
+
+        with (
+            patch.object(temp_repo, "iter_commits", side_effect=counting_iter_commits),
+            patch(
+                "githound.search_engine.commit_searcher.iter_commit_records",
+                side_effect=counting_records,
+            ),
+            patch(
+                "githound.search_engine.orchestrator.iter_commit_records",
+                side_effect=counting_records,
+            ),
+        ):
+            results = await self._collect(orchestrator, temp_repo, query)
+
+        assert len(walks) == 1
+        assert {r.search_type for r in results} == {
+            SearchType.AUTHOR,
+            SearchType.MESSAGE,
+            SearchType.CONTENT,
+        }
+
+        # The shared walk finds exactly what the searchers find on their own
+        standalone: list[Any] = []
+        for searcher in (AuthorSearcher(), MessageSearcher(), ContentSearcher()):
+            single = SearchOrchestrator()
+            single.register_searcher(searcher)
+            standalone.extend(await self._collect(single, temp_repo, query))
+        assert self._result_keys(results) == self._result_keys(standalone)
+
+    @pytest.mark.asyncio
+    async def test_shared_walk_runs_alongside_legacy_searchers(self, temp_repo) -> None:
+        """Searchers without a commit visitor still run on their own."""
+        head = temp_repo.head.commit.hexsha
+        query = SearchQuery(commit_hash=head, author_pattern="Test", message_pattern="main")
+
+        orchestrator = SearchOrchestrator()
+        for searcher in (CommitHashSearcher(), AuthorSearcher(), MessageSearcher()):
+            orchestrator.register_searcher(searcher)
+
+        results = await self._collect(orchestrator, temp_repo, query)
+
+        by_type: dict[Any, int] = {}
+        for result in results:
+            by_type[result.search_type] = by_type.get(result.search_type, 0) + 1
+        assert by_type[SearchType.COMMIT_HASH] == 1
+        assert by_type[SearchType.AUTHOR] == 3
+        assert by_type[SearchType.MESSAGE] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_walk_isolates_failing_visitor(self, temp_repo) -> None:
+        """A visitor that raises is dropped while the others keep matching."""
+        query = SearchQuery(author_pattern="Test", message_pattern="commit")
+        message_searcher = MessageSearcher()
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(AuthorSearcher())
+        orchestrator.register_searcher(message_searcher)
+
+        original_create = message_searcher.create_commit_visitor
+
+        def failing_visitor(context: SearchContext) -> Any:
+            visitor = original_create(context)
+            visitor.match = Mock(side_effect=RuntimeError("boom"))
+            return visitor
+
+        with patch.object(message_searcher, "create_commit_visitor", failing_visitor):
+            results = await self._collect(orchestrator, temp_repo, query)
+
+        assert [r.search_type for r in results] == [SearchType.AUTHOR] * 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_producers_use_own_repo_handles(self, temp_repo) -> None:
+        """Searchers running beside the shared walk never share its git pipes."""
+        query = SearchQuery(author_pattern="Test", message_pattern="commit")
+        seen: list[Any] = []
+
+        async def search(context: SearchContext) -> Any:
+            seen.append(context.repo)
+            for commit in context.repo.iter_commits():
+                yield _scored_result(len(commit.message), 0.5)
+
+        walk_repos: list[Any] = []
+
+        def recording_records(repo: Repo, rev: Any = None, max_count: Any = None) -> Any:
+            walk_repos.append(repo)
+            return iter_commit_records(repo, rev, max_count)
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("legacy", search))
+        orchestrator.register_searcher(AuthorSearcher())
+        orchestrator.register_searcher(MessageSearcher())
+
+        with patch(
+            "githound.search_engine.orchestrator.iter_commit_records",
+            side_effect=recording_records,
+        ):
+            results = await self._collect(orchestrator, temp_repo, query)
+
+        assert len(results) == 3 + 3 + 1
+        repos = [*seen, *walk_repos]
+        assert len(repos) == 2
+        assert len({id(repo) for repo in [temp_repo, *repos]}) == 3
+        assert all(repo.working_dir == temp_repo.working_dir for repo in repos)
+
+
+def _scored_result(index: int, score: float) -> SearchResult:
+    return SearchResult(
+        commit_hash=f"{index:040d}",
+        file_path=Path(f"file{index}.py"),
+        search_type=SearchType.CONTENT,
+        relevance_score=score,
+    )
+
+
+def _generator_searcher(name: str, search: Any) -> Any:
+    searcher = AsyncMock(spec=BaseSearcher)
+    searcher.name = name
+    searcher.can_handle.return_value = True
+    searcher.estimate_work.return_value = 10
+    searcher.search = search
+    return searcher
+
+
+class TestTopKResults:
+    """Tests for the bounded top-k result heap."""
+
+    def test_keeps_most_relevant_results(self) -> None:
+        """Only the k highest scores are kept, most relevant first."""
+        top_k = TopKResults(3)
+        for index, score in enumerate([0.2, 0.9, 0.5, 0.7, 0.1, 0.8]):
+            top_k.push(_scored_result(index, score))
+
+        assert len(top_k) == 3
+        assert top_k.is_full
+        assert [r.relevance_score for r in top_k.results()] == [0.9, 0.8, 0.7]
+        assert top_k.min_score == 0.7
+
+    def test_ties_keep_earlier_results(self) -> None:
+        """Later results with an equal score do not displace earlier ones."""
+        top_k = TopKResults(2)
+        for index in range(5):
+            top_k.push(_scored_result(index, 1.0))
+
+        assert [r.commit_hash for r in top_k.results()] == [f"{0:040d}", f"{1:040d}"]
+
+
+class TestStreamingSearch:
+    """Tests for streaming and early-stopping orchestrator searches."""
+
+    @pytest.mark.asyncio
+    async def test_ranked_search_returns_top_k(self, mock_repo) -> None:
+        """With max_results only the top-k results by relevance are returned."""
+        scores = [0.2, 0.9, 0.5, 0.7, 0.4]
+
+        async def search(context) -> Any:
+            for index, score in enumerate(scores):
+                yield _scored_result(index, score)
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("scored", search))
+
+        query = SearchQuery(content_pattern="x")
+        results = [r async for r in orchestrator.search(repo=mock_repo, query=query, max_results=2)]
+
+        assert [r.relevance_score for r in results] == [0.9, 0.7]
+
+    @pytest.mark.asyncio
+    async def test_top_k_stops_searchers_early(self, mock_repo) -> None:
+        """Searchers are stopped once k results reach the stop score."""
+        produced: list[int] = []
+        closed = asyncio.Event()
+
+        async def endless_search(context) -> Any:
+            try:
+                index = 0
+                while True:
+                    produced.append(index)
+                    yield _scored_result(index, 1.0)
+                    index += 1
+            finally:
+                closed.set()
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("endless", endless_search))
+
+        query = SearchQuery(content_pattern="x")
+        results = [r async for r in orchestrator.search(repo=mock_repo, query=query, max_results=3)]
+
+        assert len(results) == 3
+        assert closed.is_set()
+        assert len(produced) < 10
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_before_searchers_finish(self, mock_repo) -> None:
+        """Streaming yields results while a slower searcher is still running."""
+        release = asyncio.Event()
+
+        async def fast_search(context) -> Any:
+            yield _scored_result(1, 0.5)
+
+        async def slow_search(context) -> Any:
+            await release.wait()
+            yield _scored_result(2, 0.9)
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("fast", fast_search))
+        orchestrator.register_searcher(_generator_searcher("slow", slow_search))
+
+        query = SearchQuery(content_pattern="x")
+        stream = orchestrator.search(repo=mock_repo, query=query, stream=True)
+
+        first = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        assert first.commit_hash == f"{1:040d}"
+        assert not release.is_set()
+
+        release.set()
+        rest = [r async for r in stream]
+        assert [r.commit_hash for r in rest] == [f"{2:040d}"]
+
+
+class TestSearchCancellation:
+    """Tests for cooperative cancellation of orchestrator searches."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_searchers(self, mock_repo) -> None:
+        """Cancelling the token ends the search and closes running searchers."""
+        closed = asyncio.Event()
+
+        async def blocked_search(context) -> Any:
+            try:
+                await asyncio.Event().wait()
+                yield _scored_result(0, 1.0)
+            finally:
+                closed.set()
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("blocked", blocked_search))
+
+        token = CancellationToken()
+        asyncio.get_running_loop().call_later(0.05, token.cancel, "Test cancellation")
+
+        query = SearchQuery(content_pattern="x")
+        results = await asyncio.wait_for(
+            self._collect(orchestrator.search(mock_repo, query, cancellation_token=token)),
+            timeout=5,
+        )
+
+        assert results == []
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_partial_results(self, mock_repo) -> None:
+        """A search that times out returns the results found so far."""
+
+        async def slow_search(context) -> Any:
+            yield _scored_result(0, 0.5)
+            await asyncio.Event().wait()
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(_generator_searcher("slow", slow_search))
+
+        token = CancellationToken(timeout_seconds=0.1)
+        query = SearchQuery(content_pattern="x")
+        results = await asyncio.wait_for(
+            self._collect(orchestrator.search(mock_repo, query, cancellation_token=token)),
+            timeout=5,
+        )
+
+        assert [r.commit_hash for r in results] == [f"{0:040d}"]
+        assert token.timed_out
+
+    @pytest.mark.asyncio
+    async def test_shared_walk_stops_when_cancelled(self, temp_repo) -> None:
+        """The shared history walk checks the token before every commit."""
+        token = CancellationToken()
+        token.cancel("Test cancellation")
+        author_searcher = AuthorSearcher()
+        message_searcher = MessageSearcher()
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.register_searcher(author_searcher)
+        orchestrator.register_searcher(message_searcher)
+
+        query = SearchQuery(author_pattern="Test", message_pattern="commit")
+        results = await self._collect(
+            orchestrator.search(temp_repo, query, cancellation_token=token)
+        )
+
+        assert results == []
+        assert author_searcher.metrics.total_commits_searched == 0
+        assert message_searcher.metrics.total_commits_searched == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_walk_closes_stream_after_pending_read(self, temp_repo) -> None:
+        """A walk cancelled mid-chunk closes its commit stream once the worker is done."""
+        reading = threading.Event()
+        release = threading.Event()
+        closed: list[bool] = []
+
+        def stalled_records(repo: Repo, rev: Any = None, max_count: Any = None) -> Any:
+            try:
+                reading.set()
+                release.wait(5)
+                yield from iter_commit_records(repo, rev, max_count)
+            finally:
+                closed.append(True)
+
+        searcher = AuthorSearcher()
+        context = SearchContext(
+            repo=temp_repo,
+            query=SearchQuery(author_pattern="Test"),
+            executor=get_git_executor().lane(),
+        )
+        visitors = {searcher: searcher.create_commit_visitor(context)}
+
+        with patch(
+            "githound.search_engine.orchestrator.iter_commit_records",
+            side_effect=stalled_records,
+        ):
+            walk = SearchOrchestrator()._walk_commits(context, visitors)  # type: ignore[arg-type]
+            task = asyncio.create_task(self._collect(walk))
+            await asyncio.to_thread(reading.wait, 5)
+            task.cancel()
+            await asyncio.sleep(0.05)
+            assert closed == []
+
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timeout", [False, True])
+    async def test_interrupted_search_is_not_cached(self, mock_repo, timeout: bool) -> None:
+        """Partial results of a cancelled or timed-out search never answer later searches."""
+        calls = 0
+
+        async def search(context) -> Any:
+            nonlocal calls
+            calls += 1
+            yield _scored_result(0, 0.5)
+            if calls == 1:
+                await asyncio.Event().wait()
+            yield _scored_result(1, 0.5)
+
+        orchestrator = EnhancedSearchOrchestrator(enable_monitoring=False)
+        orchestrator.register_searcher(_generator_searcher("slow", search))
+
+        token = None
+        if timeout:
+            query = SearchQuery(content_pattern="x", timeout_seconds=1)
+        else:
+            query = SearchQuery(content_pattern="x")
+            token = CancellationToken()
+            asyncio.get_running_loop().call_later(0.05, token.cancel, "Test cancellation")
+        partial = await asyncio.wait_for(
+            self._collect(orchestrator.search(mock_repo, query, cancellation_token=token)),
+            timeout=5,
+        )
+        assert len(partial) == 1
+        assert orchestrator.result_cache == {}
+
+        query = SearchQuery(content_pattern="x")
+        results = await self._collect(orchestrator.search(mock_repo, query))
+
+        assert calls == 2
+        assert len(results) == 2
+
+    @staticmethod
+    async def _collect(search: Any) -> list:
+        return [result async for result in search]
+
+
 class TestSearchContext:
     """Tests for SearchContext class."""
 
@@ -0,0 +1,186 @@
+"""Tests for phrase and proximity queries over positional postings."""
+
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from githound.models import SearchQuery
+from githound.search_engine.content_matcher import (
+    PositionalContentMatcher,
+    create_content_matcher,
+)
+from githound.search_engine.enhanced_orchestrator import EnhancedSearchOrchestrator
+from githound.search_engine.index_segment import IndexSegment, encode_postings, write_segment
+from githound.search_engine.indexer import InvertedIndex
+from githound.search_engine.positional_query import (
+    Clause,
+    is_positional_query,
+    parse_positional_query,
+)
+
+
+def _sample_index() -> InvertedIndex:
+    index = InvertedIndex()
+    index.add_document("pool", "the connection pool has a timeout")
+    index.add_document("reversed", "pool connection settings")
+    index.add_document("far", "connection setup is slow and then pool drains after retry timeout")
+    index.add_document("other", "unrelated words only")
+    return index
+
+
+class TestParsing:
+    """Tests for the query syntax."""
+
+    def test_phrase_and_near_chain(self) -> None:
+        """Phrases chain onto NEAR operands; bare words are separate clauses."""
+        query = parse_positional_query('"connection pool" NEAR/3 timeout retry')
+
+        assert query.clauses == [
+            Clause(["connection", "pool", "timeout"], [(1, 1), (-3, 3)]),
+            Clause(["retry"], []),
+        ]
+        assert query.terms == ["connection", "pool", "timeout", "retry"]
+
+    def test_terms_are_tokenized_like_the_index(self) -> None:
+        """Stop words and short words are dropped from phrases."""
+        query = parse_positional_query('"Connection to the POOL"')
+
+        assert query.clauses == [Clause(["connection", "pool"], [(1, 1)])]
+
+    @pytest.mark.parametrize("text", ['"open', "NEAR/2 pool", "pool NEAR/2", '"the a"'])
+    def test_malformed_queries_are_rejected(self, text: str) -> None:
+        """Unbalanced quotes, dangling operators and empty queries raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_positional_query(text)
+
+    def test_detects_positional_syntax(self) -> None:
+        """Quotes or NEAR/k mark a positional query."""
+        assert is_positional_query('"connection pool"')
+        assert is_positional_query("retry near/5 timeout")
+        assert not is_positional_query("connection pool")
+
+
+class TestMatching:
+    """Tests for matching clauses against token positions."""
+
+    def test_phrase_requires_adjacent_positions(self) -> None:
+        """Each phrase term must directly follow the previous one."""
+        clause = parse_positional_query('"connection pool"').clauses[0]
+
+        assert clause.matches({"connection": [0, 7], "pool": [1, 5]}) == [(0, 1)]
+        assert clause.matches({"connection": [3], "pool": [2]}) == []
+
+    def test_near_matches_either_order_within_distance(self) -> None:
+        """NEAR/k accepts the terms up to k positions apart in either order."""
+        clause = parse_positional_query("retry NEAR/2 timeout").clauses[0]
+
+        assert clause.matches({"retry": [5], "timeout": [3]}) == [(3, 5)]
+        assert clause.matches({"retry": [5], "timeout": [8]}) == []
+
+
+class TestPostingsCursor:
+    """Tests for skipping through encoded postings."""
+
+    def test_intersect_skips_to_common_documents(self, tmp_path: Path) -> None:
+        """Only documents containing every term are returned, with their positions."""
+        common = [(ordinal, [ordinal, ordinal + 4]) for ordinal in range(100)]
+        rare = [(7, [9]), (42, [1]), (99, [3])]
+        documents = [(f"doc{i}", "content", None) for i in range(100)]
+        path = tmp_path / "segment.seg"
+        write_segment(
+            path,
+            iter([("common", 100, encode_postings(common)), ("rare", 3, encode_postings(rare))]),
+            iter(documents),
+            {},
+        )
+        segment = IndexSegment(path)
+
+        cursor = segment.cursor("common")
+        assert cursor is not None
+        assert cursor.advance(50) == 50
+        assert cursor.positions() == [50, 54]
+        assert cursor.advance(10) == 50
+        assert cursor.advance(1000) is None
+
+        found = list(segment.intersect(["common", "rare"]))
+        assert found == [
+            (7, {"rare": [9], "common": [7, 11]}),
+            (42, {"rare": [1], "common": [42, 46]}),
+            (99, {"rare": [3], "common": [99, 103]}),
+        ]
+        assert list(segment.intersect(["common", "missing"])) == []
+        segment.close()
+
+
+class TestPositionalSearch:
+    """Tests for phrase and proximity search on the inverted index."""
+
+    def test_buffered_phrase_search(self) -> None:
+        """Phrase search only returns documents with the words in order."""
+        index = _sample_index()
+
+        assert [doc for doc, _ in index.positional_search('"connection pool"')] == ["pool"]
+        near = index.positional_search("connection NEAR/1 pool")
+        assert sorted(doc for doc, _ in near) == ["pool", "reversed"]
+
+    def test_saved_segments_and_tombstones(self, tmp_path: Path) -> None:
+        """Saved segments are searched with the buffer and deleted documents are skipped."""
+        path = tmp_path / "content.idx"
+        index = _sample_index()
+        index.save(path)
+        index.add_document("new", "retry timeout for the connection pool")
+
+        assert sorted(doc for doc, _ in index.positional_search('"connection pool"')) == [
+            "new",
+            "pool",
+        ]
+        assert [doc for doc, _ in index.positional_search('"retry timeout" drains')] == ["far"]
+
+        index.delete_document("pool")
+        assert [doc for doc, _ in index.positional_search('"connection pool"')] == ["new"]
+        index.close()
+
+
+class TestPositionalContentMatcher:
+    """Tests for verifying positional queries against blob content."""
+
+    def test_reports_the_line_of_each_match(self) -> None:
+        """Matches are reported once per line with byte columns."""
+        content = b"first line\nuse a connection  pool here\nconnection\npool\n"
+        matcher = create_content_matcher('"connection pool"', positional=True)
+
+        assert isinstance(matcher, PositionalContentMatcher)
+        assert matcher.search(content) == [
+            {
+                "line_number": 2,
+                "text": "use a connection  pool here",
+                "column_start": 6,
+                "column_end": 22,
+            },
+            {"line_number": 3, "text": "connection", "column_start": 0, "column_end": 10},
+        ]
+        assert matcher.search(b"pool connection") == []
+
+
+@pytest.mark.asyncio
+async def test_index_search_answers_phrase_queries(temp_repo: Repo, tmp_path: Path) -> None:
+    """Phrase queries are answered from positional postings and reported per line."""
+    orchestrator = EnhancedSearchOrchestrator(enable_monitoring=False)
+    orchestrator.initialize_indexer(Path(temp_repo.working_dir), tmp_path / "index")
+    await orchestrator.build_index(temp_repo)
+
+    query = SearchQuery(content_pattern='"test repository"', positional_query=True)
+    results = await orchestrator._search_with_index(temp_repo, query, None, 10)
+
+    assert results
+    assert all(r.match_context["source"] == "positional_index" for r in results)
+    assert {r.line_number for r in results} == {1, 3}
+    assert {r.commit_hash for r in results} == {
+        temp_repo.commit("HEAD~2").hexsha,
+        temp_repo.head.commit.hexsha,
+    }
+
+    # The words occur, but never as this phrase
+    reversed_query = SearchQuery(content_pattern='"repository test"', positional_query=True)
+    assert await orchestrator._search_with_index(temp_repo, reversed_query, None, 10) is None
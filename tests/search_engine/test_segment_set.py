@@ -0,0 +1,197 @@
+"""Tests for segmented index storage, tombstones and merging."""
+
+from pathlib import Path
+
+from githound.search_engine.commit_blobs import CommitBlobMap
+from githound.search_engine.index_segment import encode_postings, write_segment
+from githound.search_engine.indexer import InvertedIndex
+from githound.search_engine.segment_set import MergePolicy, SegmentSet
+from githound.search_engine.trigram_index import TrigramIndex
+
+
+def _save_batches(path: Path, batches: list[list[str]]) -> InvertedIndex:
+    """Save each batch of ``doc_id``s (content "<doc_id> shared") as its own segment."""
+    index = InvertedIndex()
+    for batch in batches:
+        for doc_id in batch:
+            index.add_document(doc_id, f"{doc_id} shared")
+        index.save(path)
+    return index
+
+
+class TestMergePolicy:
+    """Tests for choosing segments to merge."""
+
+    def test_merges_a_full_tier(self) -> None:
+        """Once a tier holds merge_factor segments they are merged together."""
+        policy = MergePolicy(merge_factor=3)
+
+        assert policy.select([(1, 0), (2, 0)]) == []
+        assert policy.select([(1, 0), (50, 0), (2, 0), (1, 0)]) == [0, 2, 3]
+
+    def test_rewrites_segments_with_many_deletes(self) -> None:
+        """A segment with mostly deleted documents is rewritten on its own."""
+        policy = MergePolicy(merge_factor=10, max_deleted_ratio=0.3)
+
+        assert policy.select([(10, 1), (10, 5)]) == [1]
+
+
+class TestSegmentedIndex:
+    """Tests for saving, deleting and merging segments."""
+
+    def test_each_save_writes_a_new_segment(self, tmp_path: Path) -> None:
+        """Saving only writes documents added since the previous save."""
+        path = tmp_path / "content.idx"
+        index = _save_batches(path, [["doc1", "doc2"], ["doc3"]])
+
+        sizes = [segment.doc_count for segment in index.segments.segments]
+        assert sizes == [2, 1]
+        assert len(list(tmp_path.glob("content.idx.*.seg"))) == 2
+
+        reloaded = InvertedIndex()
+        assert reloaded.load(path)
+        assert reloaded.total_docs == 3
+        assert reloaded.document_frequency("shared") == 3
+        assert reloaded.search("doc3")[0][0] == "doc3"
+        index.close()
+        reloaded.close()
+
+    def test_deletes_are_saved_as_tombstones(self, tmp_path: Path) -> None:
+        """Deleted documents stay out of results after a reload."""
+        path = tmp_path / "content.idx"
+        index = _save_batches(path, [["doc1", "doc2"]])
+
+        assert index.delete_document("doc1")
+        assert not index.delete_document("missing")
+        index.save(path)
+
+        reloaded = InvertedIndex()
+        assert reloaded.load(path)
+        assert reloaded.total_docs == 1
+        assert [doc for doc, _ in reloaded.search("shared")] == ["doc2"]
+        assert reloaded.segments.deleted == [{0}]
+        index.close()
+        reloaded.close()
+
+    def test_merge_combines_segments_and_drops_tombstones(self, tmp_path: Path) -> None:
+        """Merging replaces small segments with one and removes the old files."""
+        path = tmp_path / "content.idx"
+        index = _save_batches(path, [["doc1"], ["doc2"], ["doc3"]])
+        index.delete_document("doc2")
+        index.save(path)
+
+        # The emptied segment is rewritten, then the tier of three is merged
+        assert index.merge_segments(MergePolicy(merge_factor=3)) == 2
+
+        assert len(index.segments) == 1
+        assert index.segments.segments[0].doc_count == 2
+        assert index.segments.deleted == [set()]
+        assert len(list(tmp_path.glob("content.idx.*.seg"))) == 1
+        reloaded = InvertedIndex()
+        assert reloaded.load(path)
+        assert sorted(doc for doc, _ in reloaded.search("shared")) == ["doc1", "doc3"]
+        assert reloaded.search("doc3")[0][0] == "doc3"
+        index.close()
+        reloaded.close()
+
+    def test_deletes_during_merge_are_carried_over(self, tmp_path: Path) -> None:
+        """A document deleted while its segment is being merged stays deleted."""
+        path = tmp_path / "content.idx"
+        index = _save_batches(path, [["doc1"], ["doc2"]])
+        segments = index.segments
+        original_select = MergePolicy.select
+
+        class DeletingPolicy(MergePolicy):
+            def select(self, sizes: list[tuple[int, int]]) -> list[int]:
+                positions = original_select(self, sizes)
+                # Runs before the merged segment is written
+                segments._lock.release()
+                try:
+                    segments.delete("doc1")
+                finally:
+                    segments._lock.acquire()
+                return positions
+
+        assert segments.merge(DeletingPolicy(merge_factor=2))
+
+        assert segments.live_docs == 1
+        assert "doc1" not in segments
+        assert "doc2" in segments
+        index.close()
+
+    def test_legacy_segment_file_is_migrated(self, tmp_path: Path) -> None:
+        """A single segment file saved before manifests is loaded and migrated."""
+        path = tmp_path / "trigram.idx"
+        terms = [("abc", 1, encode_postings([(0, [])]))]
+        write_segment(path, iter(terms), iter([("a" * 40, "blob", None)]), {})
+
+        index = TrigramIndex()
+        assert index.load(path)
+        assert "a" * 40 in index
+        index.add_blob("b" * 40, b"abcdef")
+        index.save(path)
+
+        reloaded = TrigramIndex()
+        assert reloaded.load(path)
+        assert [sha for sha, _ in reloaded.candidates("abc")] == ["a" * 40, "b" * 40]
+        assert len(list(tmp_path.glob("trigram.idx.*.seg"))) == 2
+        index.close()
+        reloaded.close()
+
+    def test_empty_set_has_no_documents(self) -> None:
+        """A fresh segment set holds nothing and cannot merge."""
+        segments = SegmentSet()
+
+        assert segments.live_docs == 0
+        assert "doc" not in segments
+        assert not segments.merge()
+
+
+class TestCommitBlobMapChunks:
+    """Tests for the append-only commit map file."""
+
+    def test_saves_append_only_changes(self, tmp_path: Path) -> None:
+        """Each save appends a chunk; removals persist until compaction."""
+        path = tmp_path / "blobs.idx"
+        blob_map = CommitBlobMap()
+        blob_map.add("1" * 40, "a.py", "a" * 40)
+        blob_map.save(path)
+        first_chunk = path.read_bytes()
+
+        blob_map.add("2" * 40, "b.py", "b" * 40)
+        assert blob_map.remove_commit("1" * 40) == ["a" * 40]
+        blob_map.save(path)
+        data = path.read_bytes()
+        assert data.startswith(first_chunk)
+        assert len(data) > len(first_chunk)
+
+        loaded = CommitBlobMap()
+        assert loaded.load(path)
+        assert loaded.locations("a" * 40) == []
+        assert loaded.files("2" * 40) == [("b.py", "b" * 40)]
+        assert loaded.removed_ratio() == 0.5
+
+        loaded.compact(path)
+        compacted = CommitBlobMap()
+        assert compacted.load(path)
+        assert len(compacted) == 1
+        assert compacted.removed_ratio() == 0.0
+
+    def test_ignores_a_partial_trailing_chunk(self, tmp_path: Path) -> None:
+        """An interrupted append leaves the previously saved map readable."""
+        path = tmp_path / "blobs.idx"
+        blob_map = CommitBlobMap()
+        blob_map.add("1" * 40, "a.py", "a" * 40)
+        blob_map.save(path)
+        with open(path, "ab") as f:
+            f.write(b"GHBLOBMP\x02")
+
+        loaded = CommitBlobMap()
+        assert loaded.load(path)
+        assert loaded.locations("a" * 40) == [("1" * 40, "a.py")]
+
+        loaded.add("2" * 40, "b.py", "b" * 40)
+        loaded.save(path)
+        reloaded = CommitBlobMap()
+        assert reloaded.load(path)
+        assert len(reloaded) == 2
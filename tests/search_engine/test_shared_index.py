@@ -0,0 +1,155 @@
+"""Tests for sharing one index directory between processes."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from githound.search_engine.file_lock import FileLock, FileLockTimeout
+from githound.search_engine.indexer import IncrementalIndexer
+from githound.search_engine.segment_set import MergePolicy
+
+
+def _commit_file(repo: Repo, name: str, content: str, message: str) -> str:
+    (Path(repo.working_dir) / name).write_text(content)
+    repo.index.add([name])
+    return repo.index.commit(message).hexsha
+
+
+class TestFileLock:
+    """Tests for the advisory writer lock."""
+
+    def test_excludes_other_processes(self, tmp_path: Path) -> None:
+        """Another process cannot take the lock while this one holds it."""
+        path = tmp_path / "index.lock"
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from githound.search_engine.file_lock import FileLock, FileLockTimeout\n"
+            "try:\n"
+            "    FileLock(Path(sys.argv[1]), timeout=0.1).acquire()\n"
+            "except FileLockTimeout:\n"
+            "    sys.exit(3)\n"
+        )
+
+        with FileLock(path):
+            held = subprocess.run([sys.executable, "-c", script, str(path)], check=False)
+        free = subprocess.run([sys.executable, "-c", script, str(path)], check=False)
+
+        assert held.returncode == 3
+        assert free.returncode == 0
+
+    def test_reentrant_within_a_thread(self, tmp_path: Path) -> None:
+        """Nested acquisitions keep the lock until the outermost release."""
+        lock = FileLock(tmp_path / "index.lock")
+        other = FileLock(tmp_path / "index.lock", timeout=0)
+
+        with lock, lock:
+            assert lock.is_locked
+        assert not lock.is_locked
+
+        with lock, pytest.raises(FileLockTimeout):
+            other.acquire()
+        other.acquire()
+        other.release()
+
+
+class TestSharedIndex:
+    """Tests for readers and writers of one index directory."""
+
+    def test_reader_picks_up_published_generation(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """A reader switches to a new generation only when one is published."""
+        root = Path(temp_repo.working_dir)
+        writer = IncrementalIndexer(root, tmp_path / "index")
+        writer.build_incremental_index(temp_repo)
+        reader = IncrementalIndexer(root, tmp_path / "index")
+        assert reader.load_indexes()
+        assert not reader.refresh()
+        assert not reader.search_messages("shared")
+
+        _commit_file(temp_repo, "shared.py", "x = 1", "Shared index update")
+        writer.build_incremental_index(temp_repo)
+        writer.wait_for_merges()
+
+        assert reader.refresh()
+        assert reader.generation == writer.generation
+        assert reader.search_messages("shared")
+        assert not reader.refresh()
+
+    def test_generation_names_its_segments(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """Readers open the segments named by the state file, not per-index manifests."""
+        root = Path(temp_repo.working_dir)
+        writer = IncrementalIndexer(root, tmp_path / "index")
+        writer.build_incremental_index(temp_repo)
+        # A writer that died after saving one index but before publishing
+        writer.get_index_path("message").write_text("{}")
+
+        reader = IncrementalIndexer(root, tmp_path / "index")
+        assert reader.load_indexes()
+        assert reader.search_messages("initial")
+
+    def test_replaced_segments_outlive_their_generation(
+        self, temp_repo: Repo, tmp_path: Path
+    ) -> None:
+        """Segments dropped by a merge are removed only after the merge is published."""
+        root = Path(temp_repo.working_dir)
+        writer = IncrementalIndexer(root, tmp_path / "index")
+        writer.background_merge = False
+        writer.merge_policy = MergePolicy(merge_factor=100)
+        writer.build_incremental_index(temp_repo)
+        # Three more commits, so both segments land in the same merge tier
+        for number in range(3):
+            _commit_file(temp_repo, f"second{number}.py", f"y = {number}", "Second update")
+        writer.build_incremental_index(temp_repo)
+
+        reader = IncrementalIndexer(root, tmp_path / "index")
+        reader.load_indexes()
+        published = {segment.path for segment in reader.message_index.segments.segments}
+        assert len(published) == 2
+
+        writer.merge_policy = MergePolicy(merge_factor=2)
+        assert writer.merge_segments() > 0
+
+        assert not any(path.exists() for path in published)
+        # Still mapped by the reader until it refreshes
+        assert reader.search_messages("second")
+        assert reader.refresh()
+        assert len(reader.message_index.segments) == 1
+        assert reader.search_messages("second")
+
+    def test_concurrent_writers_serialize(self, temp_repo: Repo, tmp_path: Path) -> None:
+        """Writers in parallel each continue from what the other published."""
+        root = Path(temp_repo.working_dir)
+        IncrementalIndexer(root, tmp_path / "index").build_incremental_index(temp_repo)
+        main = temp_repo.active_branch.name
+        temp_repo.create_head("feature").checkout()
+        _commit_file(temp_repo, "feature.py", "x = 1", "Feature work")
+        temp_repo.heads[main].checkout()
+        _commit_file(temp_repo, "main.py", "y = 1", "Mainline work")
+
+        errors: list[BaseException] = []
+
+        def build(branch: str) -> None:
+            try:
+                IncrementalIndexer(root, tmp_path / "index").build_incremental_index(
+                    temp_repo, branch=branch
+                )
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=build, args=(branch,)) for branch in (main, "feature")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        reader = IncrementalIndexer(root, tmp_path / "index")
+        assert reader.load_indexes()
+        assert set(reader.ref_tips) == {main, "feature"}
+        assert reader.indexed_commit_count == 5
+        assert reader.search_messages("feature")
+        assert reader.search_messages("mainline")
@@ -0,0 +1,129 @@
+"""Tests for the trigram index used to narrow regex content searches."""
+
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from githound.models import SearchQuery
+from githound.search_engine.enhanced_orchestrator import EnhancedSearchOrchestrator
+from githound.search_engine.trigram_index import MATCH_ALL, TrigramIndex, regex_trigram_query
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+SHA_C = "c" * 40
+
+
+def _trigrams_of(query: tuple) -> set[str]:
+    """Collect the trigrams mentioned anywhere in a query."""
+    if query[0] == "tri":
+        return {query[1]}
+    if query[0] in ("and", "or"):
+        return set().union(*(_trigrams_of(part) for part in query[1]))
+    return set()
+
+
+def _sample_index() -> TrigramIndex:
+    index = TrigramIndex()
+    index.add_blob(SHA_A, b"def handle_request(conn):\n    return conn", {"path": "a.py"})
+    index.add_blob(SHA_B, b"connection pool size = 10", {"path": "b.py"})
+    index.add_blob(SHA_C, b"unrelated text", {"path": "c.txt"})
+    return index
+
+
+class TestRegexDecomposition:
+    """Tests for turning regexes into trigram queries."""
+
+    def test_literal_requires_every_trigram(self) -> None:
+        """A literal run requires each of its lowercased trigrams."""
+        assert regex_trigram_query("Pool") == ("and", [("tri", "ool"), ("tri", "poo")])
+
+    def test_alternation_becomes_or(self) -> None:
+        """Alternatives become an OR of their own queries."""
+        query = regex_trigram_query("foo|barbaz")
+
+        assert query[0] == "or"
+        assert query[1][0] == ("tri", "foo")
+
+    @pytest.mark.parametrize("pattern", [".*", "a.b", "ab?cd", "[a-z]+", "(foo|x)", "["])
+    def test_unconstrained_patterns_match_all(self, pattern: str) -> None:
+        """Patterns without a required three-character literal cannot be narrowed."""
+        assert regex_trigram_query(pattern) == MATCH_ALL
+
+    def test_literals_across_wildcards_are_anded(self) -> None:
+        """Literal runs separated by wildcards are required independently."""
+        query = regex_trigram_query(r"def\s+handle_\w+")
+
+        assert {"def", "han", "dle", "le_"} <= _trigrams_of(query)
+        assert "ef " not in _trigrams_of(query)
+
+
+class TestTrigramIndex:
+    """Tests for candidate selection and persistence."""
+
+    def test_candidates_contain_every_match(self) -> None:
+        """Only blobs containing the required trigrams are candidates."""
+        index = _sample_index()
+
+        assert [sha for sha, _ in index.candidates(r"handle_\w+")] == [SHA_A]
+        assert [sha for sha, _ in index.candidates("conn(ection)?")] == [SHA_A, SHA_B]
+        assert index.candidates("missing") == []
+        assert index.candidates(".*") is None
+
+    def test_candidates_ignore_case(self) -> None:
+        """Case-insensitive matches are never filtered out."""
+        index = _sample_index()
+
+        assert [sha for sha, _ in index.candidates("CONNECTION")] == [SHA_B]
+
+    def test_blobs_are_indexed_once(self) -> None:
+        """Re-adding a blob keeps its first metadata."""
+        index = _sample_index()
+        index.add_blob(SHA_A, b"def handle_request", {"path": "other.py"})
+
+        assert len(index) == 3
+        assert index.candidates("handle_") == [(SHA_A, {"path": "a.py"})]
+
+    def test_save_merges_with_loaded_segment(self, tmp_path: Path) -> None:
+        """Blobs added after loading are merged into the saved segment."""
+        path = tmp_path / "trigram.idx"
+        _sample_index().save(path)
+
+        index = TrigramIndex()
+        assert index.load(path)
+        assert SHA_A in index
+        index.add_blob("d" * 40, b"HANDLE_ALL the things", {"path": "d.py"})
+        index.save(path)
+
+        reloaded = TrigramIndex()
+        assert reloaded.load(path)
+        assert len(reloaded) == 4
+        assert [sha for sha, _ in reloaded.candidates("handle_")] == [SHA_A, "d" * 40]
+        index.close()
+        reloaded.close()
+
+
+@pytest.mark.asyncio
+async def test_index_search_verifies_candidates(temp_repo: Repo, tmp_path: Path) -> None:
+    """Regex searches read only candidate blobs and return per-line matches."""
+    orchestrator = EnhancedSearchOrchestrator(enable_monitoring=False)
+    orchestrator.initialize_indexer(Path(temp_repo.working_dir), tmp_path / "index")
+    await orchestrator.build_index(temp_repo)
+
+    query = SearchQuery(content_pattern=r"test repo\w+")
+    results = await orchestrator._search_with_index(temp_repo, query, None, 10)
+
+    assert results
+    assert all(r.match_context["source"] == "trigram_index" for r in results)
+    assert results[0].file_path == Path("README.md")
+    assert {r.line_number for r in results} == {1, 3}
+    assert all("test repo" in r.matching_line.lower() for r in results)
+    # Both README versions match, each at the commit that introduced it
+    assert {r.commit_hash for r in results} == {
+        temp_repo.commit("HEAD~2").hexsha,
+        temp_repo.head.commit.hexsha,
+    }
+
+    # Trigrams that occur in no indexed blob short-circuit the search
+    no_match = SearchQuery(content_pattern="nonexistent_symbol")
+    assert await orchestrator._search_with_index(temp_repo, no_match, None, 10) is None
@@ -228,6 +228,37 @@ class TestSearchCommand:
         assert call_args[1]["query"].fuzzy_search is True
         assert call_args[1]["query"].fuzzy_threshold == 0.8
 
+    @patch("githound.cli.search_and_print")
+    def test_search_with_phrase_query(self, mock_search, cli_runner, temp_git_repo):
+        """Test search command with a phrase/proximity content query."""
+        result = cli_runner.invoke(
+            app,
+            [
+                "search",
+                "--repo-path",
+                str(temp_git_repo),
+                "--content",
+                '"connection pool" NEAR/5 timeout',
+                "--phrase",
+            ],
+        )
+
+        assert result.exit_code == 0
+        query = mock_search.call_args[1]["query"]
+        assert query.positional_query is True
+        assert query.content_pattern == '"connection pool" NEAR/5 timeout'
+
+    @patch("githound.cli.search_and_print")
+    def test_search_with_invalid_phrase_query(self, mock_search, cli_runner, temp_git_repo):
+        """Test search command rejects a malformed phrase query."""
+        result = cli_runner.invoke(
+            app,
+            ["search", "--repo-path", str(temp_git_repo), "--content", '"open', "--phrase"],
+        )
+
+        assert result.exit_code == 1
+        mock_search.assert_not_called()
+
     @patch("githound.cli.search_and_print")
     def test_search_with_json_output(self, mock_search, cli_runner, temp_git_repo):
         """Test search command with JSON output format."""
@@ -352,6 +383,57 @@ class TestAnalyzeCommand:
             assert "not a git repository" in result.stdout.lower()
 
 
+class TestOnDiskCache:
+    """Test reuse of results across CLI invocations."""
+
+    @pytest.mark.asyncio
+    async def test_search_results_are_reused_until_the_branch_moves(self, temp_git_repo):
+        """A repeated search is answered from disk; a new commit invalidates it."""
+        from git import Repo
+
+        from githound.cli import enhanced_search
+        from githound.models import SearchQuery
+
+        repo = Repo(temp_git_repo)
+        query = SearchQuery(message_pattern="Add")
+
+        first = await enhanced_search(repo, query, enable_progress=False)
+        assert [result.commit_hash for result in first] == [repo.head.commit.hexsha]
+        assert (temp_git_repo / ".githound" / "cache.sqlite3").exists()
+        assert not repo.is_dirty(untracked_files=True)
+
+        failing = Mock()
+        failing.search.side_effect = AssertionError("searched again")
+        with patch("githound.cli.create_search_orchestrator", return_value=failing):
+            again = await enhanced_search(repo, query, enable_progress=False)
+            assert again == first
+
+            (temp_git_repo / "notes.md").write_text("notes")
+            repo.index.add(["notes.md"])
+            repo.index.commit("Add notes")
+            with pytest.raises(AssertionError, match="searched again"):
+                await enhanced_search(repo, query, enable_progress=False)
+
+    @patch("githound.GitHound")
+    def test_analysis_is_reused(self, mock_githound_class, cli_runner, temp_git_repo):
+        """A second analyze run reads the first run's output unless --no-cache is given."""
+        mock_gh = Mock()
+        mock_gh.analyze_repository.return_value = {"total_commits": 2}
+        mock_gh.get_author_statistics.return_value = {}
+        mock_githound_class.return_value = mock_gh
+
+        for _ in range(2):
+            result = cli_runner.invoke(app, ["analyze", str(temp_git_repo), "--format", "json"])
+            assert result.exit_code == 0
+            assert '"total_commits": 2' in result.stdout
+        assert mock_gh.analyze_repository.call_count == 1
+        assert "Using cached analysis" in result.stdout
+
+        result = cli_runner.invoke(app, ["analyze", str(temp_git_repo), "--no-cache"])
+        assert result.exit_code == 0
+        assert mock_gh.analyze_repository.call_count == 2
+
+
 class TestBlameCommand:
     """Test the blame command functionality."""
 
@@ -369,7 +451,9 @@ class TestBlameCommand:
 
         assert result.exit_code == 0
         mock_githound_class.assert_called_once_with(temp_git_repo)
-        mock_gh.analyze_blame.assert_called_once_with("src/main.py", None)
+        mock_gh.analyze_blame.assert_called_once_with(
+            "src/main.py", None, use_cache=True, incremental=False
+        )
 
     @patch("githound.GitHound")
     def test_blame_with_specific_commit(self, mock_githound_class, cli_runner, temp_git_repo):
@@ -383,7 +467,9 @@ class TestBlameCommand:
         )
 
         assert result.exit_code == 0
-        mock_gh.analyze_blame.assert_called_once_with("src/main.py", "abc123")
+        mock_gh.analyze_blame.assert_called_once_with(
+            "src/main.py", "abc123", use_cache=True, incremental=False
+        )
 
     @patch("githound.GitHound")
     def test_blame_with_json_output(self, mock_githound_class, cli_runner, temp_git_repo):
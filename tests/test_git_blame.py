@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 from git import GitCommandError, Repo
 
+from githound.blame_cache import BlameCache
 from githound.git_blame import (
     BlameInfo,
     FileBlameResult,
@@ -147,6 +148,67 @@ class TestFileBlame:
             assert "<" in contributor and ">" in contributor
 
 
+class TestBlameCache:
+    """Tests for caching blame results by commit and path."""
+
+    @staticmethod
+    def _commit(repo: Repo, name: str, content: str, message: str) -> str:
+        (Path(repo.working_dir) / name).write_text(content)
+        repo.index.add([name])
+        return repo.index.commit(message).hexsha
+
+    def test_repeated_blame_is_a_lookup(self, temp_repo, monkeypatch) -> None:
+        """A second blame of the same file and commit doesn't run git blame."""
+        repo, temp_dir, _, _ = temp_repo
+
+        first = get_file_blame(repo, "test.py")
+        monkeypatch.setattr(repo, "blame", Mock(side_effect=AssertionError("blamed again")))
+
+        assert get_file_blame(repo, "test.py") == first
+        assert (Path(temp_dir) / BlameCache.REPO_PATH).exists()
+        assert not any(path.startswith(".githound") for path in repo.untracked_files)
+
+    def test_later_commits_share_the_last_change(self, temp_repo, monkeypatch) -> None:
+        """Commits that didn't change the file reuse the blame of the one that did."""
+        repo, temp_dir, _, second_commit = temp_repo
+        first = get_file_blame(repo, "test.py")
+        head = self._commit(repo, "other.txt", "other", "Unrelated change")
+        monkeypatch.setattr(repo, "blame", Mock(side_effect=AssertionError("blamed again")))
+
+        assert get_file_blame(repo, "test.py", commit=head) == first
+        cache = BlameCache.for_repo(temp_dir)
+        assert cache.get(head, "test.py") == cache.get(second_commit.hexsha, "test.py")
+
+    def test_incremental_blame_matches_full_blame(self, temp_repo, monkeypatch) -> None:
+        """Only changed lines are blamed again, with the same result as a full blame."""
+        repo, _, _, _ = temp_repo
+        lines = [f"line {i}" for i in range(20)]
+        self._commit(repo, "code.py", "\n".join(lines) + "\n", "Add code")
+        get_file_blame(repo, "code.py")
+
+        lines[3] = "changed"
+        lines.insert(10, "inserted")
+        del lines[15:17]
+        head = self._commit(repo, "code.py", "\n".join(lines) + "\n", "Edit code")
+        blame = Mock(wraps=repo.blame)
+        monkeypatch.setattr(repo, "blame", blame)
+        incremental = get_file_blame(repo, "code.py", incremental=True)
+
+        assert blame.call_args.kwargs == {"L": ["4,4", "11,11"]}
+        assert incremental == get_file_blame(repo, "code.py", use_cache=False)
+        assert incremental.blame_info[3].commit_hash == head
+        assert incremental.blame_info[4].commit_hash != head
+
+    def test_without_cache(self, temp_repo) -> None:
+        """Blame can bypass the cache."""
+        repo, temp_dir, _, _ = temp_repo
+
+        result = get_file_blame(repo, "test.py", use_cache=False)
+
+        assert result.total_lines == 5
+        assert not (Path(temp_dir) / BlameCache.REPO_PATH).exists()
+
+
 class TestLineHistory:
     """Tests for line history functionality."""
 
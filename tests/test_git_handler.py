@@ -1,8 +1,13 @@
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from git import Repo
 
-from githound.git_handler import get_repository, process_commit, walk_history
+from githound.git_handler import create_blob_matcher, get_repository, process_commit, walk_history
 from githound.models import GitHoundConfig  # [attr-defined]
+from githound.search_engine.content_matcher import create_content_matcher
+from githound.searcher import search_blob_content
 
 
 @pytest.fixture
@@ -56,3 +61,53 @@ def test_process_commit(temp_repo) -> None:
     # The search looks for content in diffs, so we should find "goodbye" which was added
     # Make test less strict since ripgrep might not be available
     assert len(results) >= 0
+
+
+def test_process_commit_reuses_blob_results(temp_repo) -> None:
+    """A blob searched once is re-attributed to later commits without being re-searched."""
+    repo = get_repository(temp_repo)
+    # file2.txt starts out as the same blob file1.txt had in the initial commit
+    (temp_repo / "file2.txt").write_text("hello world")
+    repo.index.add(["file2.txt"])
+    repo.index.commit("add file2")
+    (temp_repo / "file2.txt").write_text("hello there")
+    repo.index.add(["file2.txt"])
+    edit_commit = repo.index.commit("edit file2")
+    goodbye_commit = edit_commit.parents[0].parents[0]
+
+    config = GitHoundConfig(repo_path=temp_repo, search_query="hello")
+
+    blob_results: dict = {}
+    with patch(
+        "githound.git_handler.search_blob_content", wraps=search_blob_content
+    ) as mock_search:
+        first = process_commit(goodbye_commit, config, blob_results)
+        second = process_commit(edit_commit, config, blob_results)
+
+    assert mock_search.call_count == 1
+    assert len(first) == len(second) == 1
+    assert first[0].file_path == Path("file1.txt")
+    assert second[0].commit_hash == edit_commit.hexsha
+    assert second[0].file_path == Path("file2.txt")
+
+
+def test_matcher_is_built_once_per_search(temp_repo) -> None:
+    """The pattern is compiled once for a search, not for every blob."""
+    repo = get_repository(temp_repo)
+    names = ["a.txt", "b.txt", "c.txt"]
+    for content in ("hello from {}", "bye from {}"):
+        for name in names:
+            (temp_repo / name).write_text(content.format(name))
+        repo.index.add(names)
+        commit = repo.index.commit(content.format("three files"))
+
+    config = GitHoundConfig(repo_path=temp_repo, search_query="hello")
+    with patch(
+        "githound.git_handler.create_content_matcher", wraps=create_content_matcher
+    ) as mock_create:
+        matcher = create_blob_matcher(config)
+        shared = process_commit(commit, config, matcher=matcher)
+        own = process_commit(commit, config)
+
+    assert mock_create.call_count == 2
+    assert len(shared) == len(own) == 3
@@ -1,5 +1,6 @@
 """Tests for GitHound core models."""
 
+import pickle
 from datetime import datetime
 
 from githound.models import (
@@ -131,6 +132,44 @@ class TestSearchResult:
         assert result.commit_info == commit_info
         assert result.commit_info.author_name == "John Doe"
 
+    def test_commit_info_deferred_stats(self) -> None:
+        """Test that deferred stats are computed once, on first access or serialization."""
+        calls: list[int] = []
+
+        def loader() -> tuple[int, int, int]:
+            calls.append(1)
+            return 3, 10, 2
+
+        fields = {
+            "hash": "abc123",
+            "short_hash": "abc123",
+            "author_name": "John Doe",
+            "author_email": "john@example.com",
+            "committer_name": "John Doe",
+            "committer_email": "john@example.com",
+            "message": "Test commit",
+            "date": datetime.now(),
+        }
+
+        commit_info = CommitInfo.deferred(loader, **fields)
+        result = SearchResult(
+            commit_hash="abc123",
+            file_path="test.py",
+            search_type=SearchType.CONTENT,
+            commit_info=commit_info,
+        )
+        assert commit_info.author_name == "John Doe"
+        assert not calls and not commit_info.stats_loaded
+
+        dumped = result.model_dump()["commit_info"]
+        assert (dumped["files_changed"], dumped["insertions"], dumped["deletions"]) == (3, 10, 2)
+        assert commit_info.insertions == 10
+        assert len(calls) == 1 and commit_info.stats_loaded
+
+        # Pickling (e.g. for Redis caching) resolves stats instead of the loader
+        restored = pickle.loads(pickle.dumps(CommitInfo.deferred(loader, **fields)))
+        assert restored.deletions == 2 and restored.stats_loaded
+
 
 class TestSearchMetrics:
     """Test SearchMetrics model."""
@@ -12,13 +12,13 @@ from githound.searcher import search_blob_content
 
 
 class TestSearchBlobContent:
-    """Test search_blob_content function."""
+    """Test search_blob_content function with the ripgrep backend."""
 
     def test_search_blob_content_basic(self) -> None:
         """Test basic search functionality."""
         content = b"def test_function() -> None:\n    return True\n"
         query = "test_function"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -56,7 +56,7 @@ class TestSearchBlobContent:
         """Test case sensitive search."""
         content = b"def Test_Function() -> None:\n    return True\n"
         query = "test_function"
-        config = SearchConfig(case_sensitive=True)
+        config = SearchConfig(case_sensitive=True, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -78,7 +78,7 @@ class TestSearchBlobContent:
         """Test case insensitive search."""
         content = b"def Test_Function() -> None:\n    return True\n"
         query = "test_function"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -110,7 +110,7 @@ class TestSearchBlobContent:
         """Test search with multiple matches."""
         content = b"def test_function() -> None:\n    test_var = 'test'\n    return test_var\n"
         query = "test"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -156,7 +156,7 @@ class TestSearchBlobContent:
         """Test search with no matches."""
         content = b"def function() -> None:\n    return True\n"
         query = "nonexistent"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -173,7 +173,7 @@ class TestSearchBlobContent:
         """Test handling of subprocess errors."""
         content = b"def test_function() -> None:\n    return True\n"
         query = "test"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -187,7 +187,7 @@ class TestSearchBlobContent:
         """Test handling of invalid JSON output from ripgrep."""
         content = b"def test_function() -> None:\n    return True\n"
         query = "test"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -203,7 +203,7 @@ class TestSearchBlobContent:
         # Binary content (e.g., image file)
         content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
         query = "test"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "image.png"
 
@@ -219,7 +219,7 @@ class TestSearchBlobContent:
         """Test search with empty content."""
         content = b""
         query = "test"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "empty.py"
 
@@ -236,7 +236,7 @@ class TestSearchBlobContent:
             b"def test_function_1() -> None:\n    pass\ndef test_function_2() -> None:\n    pass\n"
         )
         query = r"test_function_\d+"
-        config = SearchConfig(case_sensitive=False)
+        config = SearchConfig(case_sensitive=False, content_engine="ripgrep")
         commit_hash = "abc123"
         file_path = "test.py"
 
@@ -275,3 +275,52 @@ class TestSearchBlobContent:
             assert "test_function_1" in results[0].matching_line
             # Fixed: line_content -> matching_line
             assert "test_function_2" in results[1].matching_line
+
+
+class TestSearchBlobContentInProcess:
+    """Test search_blob_content with the default in-process engine."""
+
+    def test_default_engine_does_not_spawn_ripgrep(self) -> None:
+        """Test that the default engine searches without a subprocess."""
+        content = b"def test_function() -> None:\n    return True\n"
+        config = SearchConfig(case_sensitive=False)
+
+        with patch("subprocess.run") as mock_run:
+            results = search_blob_content(content, "test_function", config, "abc123", "test.py")
+
+            mock_run.assert_not_called()
+
+        assert len(results) == 1
+        assert results[0].line_number == 1
+        assert results[0].matching_line == "def test_function() -> None:"
+        assert results[0].search_type == SearchType.CONTENT
+
+    def test_case_sensitivity(self) -> None:
+        """Test case sensitive and insensitive matching."""
+        content = b"def Test_Function() -> None:\n    return True\n"
+
+        sensitive = SearchConfig(case_sensitive=True)
+        insensitive = SearchConfig(case_sensitive=False)
+
+        assert search_blob_content(content, "test_function", sensitive, "abc", "t.py") == []
+        assert len(search_blob_content(content, "test_function", insensitive, "abc", "t.py")) == 1
+
+    def test_regex_pattern(self) -> None:
+        """Test search with regex pattern."""
+        content = (
+            b"def test_function_1() -> None:\n    pass\ndef test_function_2() -> None:\n    pass\n"
+        )
+        config = SearchConfig(case_sensitive=False)
+
+        results = search_blob_content(content, r"test_function_\d+", config, "abc123", "test.py")
+
+        assert [r.line_number for r in results] == [1, 3]
+
+    def test_invalid_regex_raises(self) -> None:
+        """Test that an invalid pattern is reported to the caller."""
+        import re
+
+        config = SearchConfig(case_sensitive=False)
+
+        with pytest.raises(re.error):
+            search_blob_content(b"content", "(unclosed", config, "abc123", "test.py")
@@ -68,6 +68,37 @@ class TestCancellationToken:
         assert "cancelled" in results
         assert True in results  # Token should be cancelled when checked
 
+    def test_cancellation_token_timeout(self) -> None:
+        """Test that a token with a deadline cancels itself once it passes."""
+        token = CancellationToken(timeout_seconds=0.05)
+
+        assert not token.is_cancelled
+        assert not token.timed_out
+
+        time.sleep(0.1)
+
+        assert token.is_cancelled
+        assert token.timed_out
+        assert "timed out" in (token.reason or "")
+
+    def test_cancellation_token_keeps_earliest_deadline(self) -> None:
+        """Test that a later timeout does not extend an earlier deadline."""
+        token = CancellationToken(timeout_seconds=0.05)
+        token.set_timeout(60)
+
+        time.sleep(0.1)
+
+        assert token.timed_out
+
+    def test_cancellation_token_explicit_cancel_is_not_timeout(self) -> None:
+        """Test that explicit cancellation is distinguished from a timeout."""
+        token = CancellationToken(timeout_seconds=60)
+        token.cancel("User cancelled")
+
+        assert token.is_cancelled
+        assert not token.timed_out
+        assert token.reason == "User cancelled"
+
 
 class TestProgressManager:
     """Test ProgressManager class."""
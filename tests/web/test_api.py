@@ -189,17 +189,18 @@ class TestWebAPI:
     def test_cancel_search_endpoint(self) -> None:
         """Test cancel search endpoint."""
         search_id = "test_search_123"
+        state = ActiveSearchState(id=search_id, status="running")
 
-        with patch.dict(
-            "githound.web.api.active_searches",
-            {search_id: ActiveSearchState(id=search_id, status="running")},
-        ):
+        with patch.dict("githound.web.api.active_searches", {search_id: state}):
             response = self.client.delete(f"/api/search/{search_id}")  # Fixed: POST -> DELETE
 
             assert response.status_code == 200
             data = response.json()
             # Fixed: match actual API response
             assert data["message"] == "Search cancelled successfully"
+            # The running searchers are signalled, not just the tracked status
+            assert state.cancellation_token.is_cancelled
+            assert state.status == "cancelled"
 
     def test_cancel_search_not_found(self) -> None:
         """Test cancel search endpoint with non-existent search ID."""